@@ -0,0 +1,336 @@
+"""Microbenchmark suite for the block engine's per-hop overhead.
+
+Every leaf does no work, so timings are what the framework itself costs per
+child execution: request construction, transition evaluation, recovery and
+stats recording. Results are printed as a table, optionally written as JSON,
+and compared against regression thresholds; the exit status is 1 when any
+threshold is exceeded, so the script can gate CI.
+
+Examples:
+    python scripts/bench_block_engine.py --output bench.json
+    python scripts/bench_block_engine.py --baseline bench.json --max-regression 0.2
+    python scripts/bench_block_engine.py --threshold linear_chain=40
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from chaos.domain.block import Block
+from chaos.domain.messages import Request, Response
+from chaos.domain.policy import RepairPolicy, RetryPolicy
+from chaos.engine.conditions import ConditionRegistry
+from chaos.engine.registry import RepairRegistry
+from chaos.stats.block_stats_store import BlockStatsStore
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+from chaos.stats.json_block_stats_store import JsonBlockStatsStore
+from chaos.stats.statistics import quantile
+
+RESULT_VERSION = 1
+BRANCH_CONDITION = "bench_take_left"
+REPAIR_FUNCTION = "bench_mark_repaired"
+
+
+class NoopBlock(Block):
+    """Leaf block doing no work so the benchmark measures engine overhead."""
+
+    def _execute_primitive(self, request: Request) -> Response:
+        return Response(success=True)
+
+    def build(self) -> None:
+        pass
+
+
+class FlakyBlock(NoopBlock):
+    """Leaf failing every other call; recovered by a retry policy."""
+
+    def __init__(self, name: str, **kwargs: Any) -> None:
+        super().__init__(name, side_effect_class="none", **kwargs)
+        self._calls = 0
+
+    def _execute_primitive(self, request: Request) -> Response:
+        self._calls += 1
+        if self._calls % 2:
+            return Response(success=False, reason="flaky")
+        return Response(success=True)
+
+    def get_policy_stack(self, error_type: Any) -> List[Any]:
+        return [RetryPolicy(max_attempts=2)]
+
+
+class RepairableBlock(NoopBlock):
+    """Leaf failing until a repair marks the request payload."""
+
+    def __init__(self, name: str, **kwargs: Any) -> None:
+        super().__init__(name, side_effect_class="none", **kwargs)
+
+    def _execute_primitive(self, request: Request) -> Response:
+        if request.payload.get("repaired"):
+            return Response(success=True)
+        return Response(success=False, reason="needs_repair")
+
+    def get_policy_stack(self, error_type: Any) -> List[Any]:
+        return [RepairPolicy(repair_function=REPAIR_FUNCTION)]
+
+
+class GraphBlock(Block):
+    """Composite configured entirely through constructor arguments."""
+
+    def build(self) -> None:
+        pass
+
+
+@ConditionRegistry.register(BRANCH_CONDITION)
+def _take_left(response: Response) -> bool:
+    """Branch condition evaluated on every node of the branching scenario."""
+
+    return response.success
+
+
+@RepairRegistry.register(REPAIR_FUNCTION)
+def _mark_repaired(request: Request, failure: Response) -> Request:
+    """Repair that lets ``RepairableBlock`` succeed on its next attempt."""
+
+    repaired = request.model_copy(deep=False)
+    repaired.metadata = dict(request.metadata)
+    repaired.payload = {**request.payload, "repaired": True}
+    return repaired
+
+
+def build_chain(
+    length: int,
+    store: BlockStatsStore,
+    leaf: Callable[..., Block] = NoopBlock,
+) -> Block:
+    """Build a linear chain of ``length`` leaves sharing ``store``."""
+
+    names = [f"n{index}" for index in range(length)]
+    return GraphBlock(
+        "chain",
+        nodes={name: leaf(name, stats_store=store) for name in names},
+        entry_point=names[0],
+        transitions=dict(zip(names, names[1:])),
+        max_steps=length,
+        stats_store=store,
+    )
+
+
+def build_branching(layers: int, store: BlockStatsStore) -> Block:
+    """Build ``layers`` decision nodes, each branching to a left/right leaf.
+
+    Every decision evaluates the registered condition before falling back to
+    ``default``, so each layer costs two hops and one condition lookup.
+    """
+
+    nodes: Dict[str, Block] = {}
+    transitions: Dict[str, Any] = {}
+    for layer in range(layers):
+        decide, left, right = f"d{layer}", f"l{layer}", f"r{layer}"
+        for name in (decide, left, right):
+            nodes[name] = NoopBlock(name, stats_store=store)
+        transitions[decide] = [
+            {"condition": BRANCH_CONDITION, "target": left},
+            {"condition": "default", "target": right},
+        ]
+        if layer + 1 < layers:
+            transitions[left] = f"d{layer + 1}"
+            transitions[right] = f"d{layer + 1}"
+    return GraphBlock(
+        "branching",
+        nodes=nodes,
+        entry_point="d0",
+        transitions=transitions,
+        max_steps=2 * layers,
+        stats_store=store,
+    )
+
+
+def build_scenarios(
+    length: int, stats_dir: Path
+) -> Dict[str, Tuple[Callable[[], Block], int]]:
+    """Return scenario name -> (block factory, hops per execution).
+
+    Args:
+        length: Nodes per chain (layers for branching).
+        stats_dir: Directory for the JSON stats store files.
+    """
+
+    def memory() -> BlockStatsStore:
+        return InMemoryBlockStatsStore()
+
+    def json_store() -> BlockStatsStore:
+        path = Path(tempfile.mkstemp(dir=stats_dir, suffix=".json")[1])
+        return JsonBlockStatsStore(path)
+
+    return {
+        "noop": (lambda: NoopBlock("noop", stats_store=memory()), 1),
+        "linear_chain": (lambda: build_chain(length, memory()), length),
+        "branching": (lambda: build_branching(length, memory()), 2 * length),
+        "retry": (lambda: build_chain(length, memory(), FlakyBlock), 2 * length),
+        "repair": (lambda: build_chain(length, memory(), RepairableBlock), 2 * length),
+        "stats_in_memory": (lambda: build_chain(length, memory()), length),
+        "stats_json": (lambda: build_chain(length, json_store()), length),
+    }
+
+
+def measure(factory: Callable[[], Block], hops: int, iterations: int) -> Dict:
+    """Time repeated executions of fresh blocks and summarize per-hop cost.
+
+    Args:
+        factory: Builds the block to execute; construction is not timed.
+        hops: Child executions performed per run.
+        iterations: Number of timed runs (after one warm-up run).
+
+    Returns:
+        Summary with median/p95 microseconds per hop and hops per second.
+    """
+
+    factory().execute(Request())
+    per_hop_us: List[float] = []
+    elapsed = 0.0
+    for _ in range(iterations):
+        block = factory()
+        start = perf_counter()
+        response = block.execute(Request())
+        duration = perf_counter() - start
+        if not response.success:
+            raise RuntimeError(f"benchmark run failed: {response.reason}")
+        elapsed += duration
+        per_hop_us.append(duration * 1e6 / hops)
+    return {
+        "hops": hops,
+        "iterations": iterations,
+        "us_per_hop_median": median(per_hop_us),
+        "us_per_hop_p95": quantile(per_hop_us, 0.95),
+        "hops_per_second": hops * iterations / elapsed if elapsed else float("inf"),
+    }
+
+
+def run_suite(length: int, iterations: int, only: Optional[List[str]]) -> Dict:
+    """Run the selected scenarios and return the machine-readable result."""
+
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory() as stats_dir:
+        for name, (factory, hops) in build_scenarios(length, Path(stats_dir)).items():
+            if only and name not in only:
+                continue
+            results[name] = measure(factory, hops, iterations)
+    return {
+        "version": RESULT_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "length": length,
+        "scenarios": results,
+    }
+
+
+def parse_thresholds(values: List[str]) -> Dict[str, float]:
+    """Parse ``NAME=MICROSECONDS`` arguments into a ceiling per scenario."""
+
+    thresholds: Dict[str, float] = {}
+    for value in values:
+        name, separator, limit = value.partition("=")
+        if not separator:
+            raise argparse.ArgumentTypeError(f"expected NAME=US, got {value!r}")
+        thresholds[name] = float(limit)
+    return thresholds
+
+
+def find_regressions(
+    result: Dict,
+    thresholds: Dict[str, float],
+    baseline: Optional[Dict],
+    max_regression: float,
+) -> List[str]:
+    """Return a message for every scenario exceeding a threshold.
+
+    Args:
+        result: Output of ``run_suite``.
+        thresholds: Absolute median us/hop ceiling per scenario.
+        baseline: Earlier ``run_suite`` output to compare against, if any.
+        max_regression: Allowed fractional slowdown against the baseline.
+
+    Returns:
+        Human-readable violations; empty when every check passes.
+    """
+
+    violations: List[str] = []
+    scenarios = result["scenarios"]
+    for name, limit in thresholds.items():
+        measured = scenarios.get(name, {}).get("us_per_hop_median")
+        if measured is not None and measured > limit:
+            violations.append(f"{name}: {measured:.2f}us/hop > limit {limit:.2f}us")
+    for name, previous in (baseline or {}).get("scenarios", {}).items():
+        measured = scenarios.get(name, {}).get("us_per_hop_median")
+        allowed = previous["us_per_hop_median"] * (1 + max_regression)
+        if measured is not None and measured > allowed:
+            violations.append(
+                f"{name}: {measured:.2f}us/hop > baseline "
+                f"{previous['us_per_hop_median']:.2f}us +{max_regression:.0%}"
+            )
+    return violations
+
+
+def main() -> int:
+    """Parse arguments, run the suite, and report regressions."""
+
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--length", type=int, default=64)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument(
+        "--scenario", action="append", help="Run only this scenario (repeatable)."
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results here.")
+    parser.add_argument(
+        "--json", action="store_true", help="Print JSON instead of a table."
+    )
+    parser.add_argument(
+        "--threshold",
+        action="append",
+        default=[],
+        help="Fail if NAME's median us/hop exceeds US (NAME=US, repeatable).",
+    )
+    parser.add_argument("--baseline", type=Path, help="Earlier --output file.")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="Allowed fractional slowdown against --baseline (default 0.25).",
+    )
+    args = parser.parse_args()
+
+    thresholds = parse_thresholds(args.threshold)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    result = run_suite(max(2, args.length), max(1, args.iterations), args.scenario)
+
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2, sort_keys=True))
+    if args.json:
+        print(json.dumps(result, indent=2, sort_keys=True))
+    else:
+        for name, summary in result["scenarios"].items():
+            print(
+                f"{name:<16} hops={summary['hops']:<5} "
+                f"median={summary['us_per_hop_median']:8.2f}us/hop "
+                f"p95={summary['us_per_hop_p95']:8.2f}us/hop "
+                f"{summary['hops_per_second']:>12,.0f} hops/s"
+            )
+
+    violations = find_regressions(result, thresholds, baseline, args.max_regression)
+    for violation in violations:
+        print(f"REGRESSION {violation}", file=sys.stderr)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
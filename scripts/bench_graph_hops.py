@@ -0,0 +1,122 @@
+"""Microbenchmark of composite graph hops per second."""
+
+from __future__ import annotations
+
+import argparse
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+from chaos.domain.block import Block
+from chaos.domain.messages import Request, Response
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+
+
+class NoopBlock(Block):
+    """Leaf block doing no work so the benchmark measures engine overhead."""
+
+    def _execute_primitive(self, request: Request) -> Response:
+        return Response(success=True)
+
+    def build(self) -> None:
+        pass
+
+
+class GraphBlock(Block):
+    """Composite configured entirely through constructor arguments."""
+
+    def build(self) -> None:
+        pass
+
+
+def build_chain(length: int, conditional: bool) -> Block:
+    """Build a linear chain of ``length`` nodes.
+
+    Args:
+        length: Number of nodes.
+        conditional: Use single "default" condition branches instead of
+            plain string transitions.
+
+    Returns:
+        The composite block.
+    """
+
+    store = InMemoryBlockStatsStore()
+    names = [f"n{index}" for index in range(length)]
+    nodes = {name: NoopBlock(name, stats_store=store) for name in names}
+    transitions: Dict[str, Any] = {}
+    for current, following in zip(names, names[1:]):
+        transitions[current] = (
+            [{"condition": "default", "target": following}]
+            if conditional
+            else following
+        )
+    return GraphBlock(
+        "chain",
+        nodes=nodes,
+        entry_point=names[0],
+        transitions=transitions,
+        max_steps=length,
+        stats_store=store,
+    )
+
+
+def build_loop(max_steps: int) -> Block:
+    """Build a two-node cycle that runs until ``max_steps`` is exceeded."""
+
+    store = InMemoryBlockStatsStore()
+    nodes = {name: NoopBlock(name, stats_store=store) for name in ("a", "b")}
+    return GraphBlock(
+        "loop",
+        nodes=nodes,
+        entry_point="a",
+        transitions={"a": "b", "b": [{"condition": "default", "target": "a"}]},
+        max_steps=max_steps,
+        stats_store=store,
+    )
+
+
+def measure(factory: Callable[[], Block], hops: int, iterations: int) -> float:
+    """Return hops per second for repeated executions of a fresh graph.
+
+    Args:
+        factory: Builds the composite to execute.
+        hops: Child executions performed per run.
+        iterations: Number of runs.
+
+    Returns:
+        Hops per second.
+    """
+
+    block = factory()
+    block.execute(Request())
+    elapsed = 0.0
+    for _ in range(iterations):
+        block = factory()
+        start = perf_counter()
+        block.execute(Request())
+        elapsed += perf_counter() - start
+    return hops * iterations / elapsed if elapsed else float("inf")
+
+
+def main() -> int:
+    """Run the benchmark and print one line per scenario."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-steps", type=int, default=128)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    steps = max(2, args.max_steps)
+    scenarios = {
+        "chain": (lambda: build_chain(steps, conditional=False), steps),
+        "conditional_chain": (lambda: build_chain(steps, conditional=True), steps),
+        "loop": (lambda: build_loop(steps), steps),
+    }
+    for label, (factory, hops) in scenarios.items():
+        rate = measure(factory, hops, args.iterations)
+        print(f"{label:<18} hops={hops:<6} {rate:,.0f} hops/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+"""Throughput and memory benchmark of request propagation on deep graphs."""
+
+from __future__ import annotations
+
+import argparse
+import tracemalloc
+from time import perf_counter
+from typing import Any, Dict
+
+from chaos.domain.block import Block
+from chaos.domain.messages import Request, Response
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+
+
+class NoopBlock(Block):
+    """Leaf block doing no work so the benchmark measures engine overhead."""
+
+    def _execute_primitive(self, request: Request) -> Response:
+        return Response(success=True)
+
+    def build(self) -> None:
+        pass
+
+
+class GraphBlock(Block):
+    """Composite configured entirely through constructor arguments."""
+
+    def build(self) -> None:
+        pass
+
+
+def build_chain(depth: int) -> Block:
+    """Build a linear chain of ``depth`` no-op nodes."""
+
+    store = InMemoryBlockStatsStore()
+    names = [f"n{index}" for index in range(depth)]
+    return GraphBlock(
+        "chain",
+        nodes={name: NoopBlock(name, stats_store=store) for name in names},
+        entry_point=names[0],
+        transitions=dict(zip(names, names[1:])),
+        max_steps=depth,
+        stats_store=store,
+    )
+
+
+def build_request(documents: int, document_size: int) -> Request:
+    """Build a request carrying a large retrieved-documents context."""
+
+    context: Dict[str, Any] = {
+        f"doc_{index}": "x" * document_size for index in range(documents)
+    }
+    return Request(payload={"prompt": "hello"}, context=context)
+
+
+def run(depth: int, documents: int, document_size: int, iterations: int) -> None:
+    """Print hops/s, child-request construction rate, and peak memory."""
+
+    request = build_request(documents, document_size)
+    block = build_chain(depth)
+    block.execute(request)
+
+    elapsed = 0.0
+    for _ in range(iterations):
+        block = build_chain(depth)
+        start = perf_counter()
+        block.execute(request)
+        elapsed += perf_counter() - start
+    print(f"graph_hops         {depth * iterations / elapsed:,.0f} hops/s")
+
+    child = NoopBlock("child")
+    parent = block._with_base_metadata(request)
+    count = 10_000
+    start = perf_counter()
+    for attempt in range(count):
+        block._build_child_request(parent, child, "child", attempt)
+    rate = count / (perf_counter() - start)
+    print(f"child_requests     {rate:,.0f} requests/s")
+
+    block = build_chain(depth)
+    tracemalloc.start()
+    block.execute(request)
+    _, peak = tracemalloc.get_traced_memory()
+    held = [
+        block._build_child_request(parent, child, "child", attempt)
+        for attempt in range(depth)
+    ]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"peak_memory        {peak / 1024:,.0f} KiB per run")
+    print(f"held_children      {current / 1024:,.0f} KiB for {len(held)} requests")
+
+
+def main() -> int:
+    """Parse arguments and run the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=128)
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--document-size", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    run(args.depth, args.documents, args.document_size, args.iterations)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
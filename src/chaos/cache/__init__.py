@@ -0,0 +1 @@
+"""Result memoization for side-effect-free blocks."""
@@ -0,0 +1,246 @@
+import copy
+import importlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from pydantic import BaseModel
+
+from chaos.cache.sqlite_result_store import SqliteResultStore
+from chaos.domain.messages import Response
+from chaos.domain.response_metadata_keys import (
+    CACHE_STATUS_HIT,
+    CACHE_STATUS_KEY,
+    CACHE_TIER_KEY,
+)
+
+logger = logging.getLogger(__name__)
+
+CORRELATION_KEYS = frozenset(
+    {
+        "id",
+        "trace_id",
+        "run_id",
+        "span_id",
+        "parent_span_id",
+        "attempt",
+        "block_name",
+        "node_name",
+        "duration_ms",
+        CACHE_STATUS_KEY,
+        CACHE_TIER_KEY,
+    }
+)
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_json_native(value: Any) -> bool:
+    """Return True if ``value`` survives a JSON round trip unchanged."""
+
+    if isinstance(value, _JSON_SCALARS):
+        return True
+    if isinstance(value, list):
+        return all(_is_json_native(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _is_json_native(item)
+            for key, item in value.items()
+        )
+    return False
+
+
+def _data_type_name(data: Any) -> Optional[str]:
+    """Return the importable name of a pydantic ``data`` model, or None.
+
+    Raises:
+        TypeError: If ``data`` would change type on a JSON round trip.
+    """
+
+    if isinstance(data, BaseModel):
+        data_type = type(data)
+        if "<locals>" not in data_type.__qualname__:
+            return f"{data_type.__module__}:{data_type.__qualname__}"
+    elif _is_json_native(data):
+        return None
+    raise TypeError(f"{type(data).__name__} data cannot be restored from JSON")
+
+
+def _load_data_type(name: str) -> type[BaseModel]:
+    """Import the pydantic model named by ``_data_type_name``."""
+
+    module_name, qualname = name.split(":", 1)
+    value: Any = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        value = getattr(value, attribute)
+    return value
+
+
+class BlockResultCache:
+    """LRU + TTL cache of successful block responses.
+
+    The in-memory tier is bounded by ``max_entries`` and evicts least recently
+    used entries; entries older than ``ttl_seconds`` are treated as misses.
+    An optional SqliteResultStore acts as a persistent second tier whose hits
+    are promoted into memory. Only successful responses are cached, stripped
+    of per-attempt correlation metadata.
+
+    Stored and returned responses are deep copies, so callers may mutate
+    them freely. The persistent tier only stores responses whose ``data`` is
+    JSON-native or a pydantic model defined at module level; models are
+    revalidated into their own type when loaded.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = None,
+        persistent: Optional[SqliteResultStore] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of in-memory entries.
+            ttl_seconds: Entry lifetime; None keeps entries until evicted.
+            persistent: Optional persistent tier.
+            clock: Wall-clock source in seconds (injectable for tests).
+        """
+
+        self._max_entries = max(1, int(max_entries))
+        self._ttl_seconds = ttl_seconds
+        self._persistent = persistent
+        self._clock = clock
+        self._entries: OrderedDict[str, Tuple[Optional[float], Response]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, cache_key: str) -> Optional[Response]:
+        """Look up a cached response.
+
+        Args:
+            cache_key: Memoization key.
+
+        Returns:
+            A fresh Response copy whose metadata records the hit and the tier
+            that served it, or None on a miss.
+        """
+
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                expires_at, response = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(cache_key)
+                    return self._copy(response, "memory")
+                del self._entries[cache_key]
+
+        if self._persistent is None:
+            return None
+        try:
+            stored = self._persistent.get(cache_key, now)
+            if stored is None:
+                return None
+            response = self._loads(stored)
+        except Exception as exc:
+            logger.warning(f"Failed to read persistent result cache: {exc}")
+            return None
+        self._remember(cache_key, response, now)
+        return self._copy(response, "sqlite")
+
+    def put(self, cache_key: str, block_name: str, response: Response) -> None:
+        """Store a successful response.
+
+        Args:
+            cache_key: Memoization key.
+            block_name: Block that produced the response.
+            response: Response to store; failures are ignored.
+        """
+
+        if response.success is not True:
+            return
+        stored = Response(
+            success=True,
+            data=copy.deepcopy(response.data),
+            metadata=copy.deepcopy(
+                {
+                    key: value
+                    for key, value in response.metadata.items()
+                    if key not in CORRELATION_KEYS
+                }
+            ),
+        )
+        now = self._clock()
+        self._remember(cache_key, stored, now)
+        if self._persistent is None:
+            return
+        try:
+            self._persistent.put(
+                cache_key,
+                block_name,
+                self._dumps(stored),
+                self._expires_at(now),
+            )
+        except Exception as exc:
+            logger.warning(f"Failed to persist block result for {block_name}: {exc}")
+
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of in-memory entries."""
+
+        return len(self._entries)
+
+    def _remember(self, cache_key: str, response: Response, now: float) -> None:
+        """Insert into the in-memory tier with LRU eviction."""
+
+        with self._lock:
+            self._entries[cache_key] = (self._expires_at(now), response)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _expires_at(self, now: float) -> Optional[float]:
+        """Return the absolute expiry time for an entry stored now."""
+
+        if self._ttl_seconds is None:
+            return None
+        return now + self._ttl_seconds
+
+    @staticmethod
+    def _dumps(response: Response) -> str:
+        """Serialize a response for the persistent tier, with its data type."""
+
+        data_type = _data_type_name(response.data)
+        return json.dumps(
+            {"data_type": data_type, "response": response.model_dump(mode="json")}
+        )
+
+    @staticmethod
+    def _loads(stored: str) -> Response:
+        """Restore a response serialized by ``_dumps``."""
+
+        entry = json.loads(stored)
+        response = Response.model_validate(entry["response"])
+        if entry["data_type"] is not None:
+            data_type = _load_data_type(entry["data_type"])
+            response.data = data_type.model_validate(response.data)
+        return response
+
+    @staticmethod
+    def _copy(response: Response, tier: str) -> Response:
+        """Return a deep response copy marked as a cache hit from ``tier``."""
+
+        copied = response.model_copy(deep=True)
+        copied.metadata[CACHE_STATUS_KEY] = CACHE_STATUS_HIT
+        copied.metadata[CACHE_TIER_KEY] = tier
+        return copied
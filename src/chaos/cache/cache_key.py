@@ -0,0 +1,72 @@
+import hashlib
+import json
+from typing import Any, Mapping, Optional
+
+from pydantic import BaseModel
+
+from chaos.stats.block_stats_identity import BlockStatsIdentity
+
+
+def _canonical_default(value: Any) -> Any:
+    """Convert non-JSON values into a canonical JSON-compatible form.
+
+    Args:
+        value: Value json could not encode.
+
+    Returns:
+        A JSON-compatible representation.
+
+    Raises:
+        TypeError: When the value has no stable representation.
+    """
+
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return sorted(
+            json.dumps(item, sort_keys=True, default=_canonical_default)
+            for item in value
+        )
+    if isinstance(value, bytes):
+        return value.hex()
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    raise TypeError(f"Unhashable cache input: {type(value).__name__}")
+
+
+def build_cache_key(
+    identity: BlockStatsIdentity,
+    payload: Mapping[str, Any],
+    context: Mapping[str, Any],
+    extras: Optional[Mapping[str, Any]] = None,
+) -> Optional[str]:
+    """Build a canonical memoization key for a block execution.
+
+    Args:
+        identity: Stable block identity.
+        payload: Request payload.
+        context: Request context.
+        extras: Block-specific inputs that affect the result (model, prompt).
+
+    Returns:
+        A SHA-256 hex digest, or None when an input cannot be hashed
+        canonically (the execution is then not memoized).
+    """
+
+    document = {
+        "block": [identity.block_name, identity.block_type, identity.version],
+        "payload": payload,
+        "context": context,
+        "extras": extras or {},
+    }
+    try:
+        encoded = json.dumps(
+            document,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=_canonical_default,
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
@@ -0,0 +1,111 @@
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteResultStore:
+    """Persistent tier for memoized block results.
+
+    Entries survive process restarts, so identical executions across runs are
+    served from disk. Values are serialized Response JSON documents.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the store and create its schema.
+
+        Args:
+            path: SQLite database file.
+        """
+
+        self._path = path
+        if str(path) != ":memory:":
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS block_results (
+                  cache_key TEXT PRIMARY KEY,
+                  block_name TEXT NOT NULL,
+                  response_json TEXT NOT NULL,
+                  expires_at REAL
+                )
+                """)
+
+    def get(self, cache_key: str, now: float) -> Optional[str]:
+        """Return the stored response JSON if present and not expired.
+
+        Args:
+            cache_key: Memoization key.
+            now: Current wall-clock time in seconds.
+
+        Returns:
+            Response JSON, or None on a miss.
+        """
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response_json, expires_at FROM block_results "
+                "WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= now:
+                with self._connection:
+                    self._connection.execute(
+                        "DELETE FROM block_results WHERE cache_key = ?", (cache_key,)
+                    )
+                return None
+        return row[0]
+
+    def put(
+        self,
+        cache_key: str,
+        block_name: str,
+        response_json: str,
+        expires_at: Optional[float],
+    ) -> None:
+        """Insert or replace a stored response.
+
+        Args:
+            cache_key: Memoization key.
+            block_name: Block that produced the response.
+            response_json: Serialized Response.
+            expires_at: Absolute expiry time in seconds, or None.
+        """
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO block_results "
+                "(cache_key, block_name, response_json, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (cache_key, block_name, response_json, expires_at),
+            )
+
+    def purge_expired(self, now: float) -> int:
+        """Delete expired entries.
+
+        Args:
+            now: Current wall-clock time in seconds.
+
+        Returns:
+            Number of deleted entries.
+        """
+
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM block_results "
+                "WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (now,),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+
+        self._connection.close()
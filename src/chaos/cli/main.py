@@ -1,11 +1,24 @@
+import hashlib
+import re
 import typer
 from rich.console import Console
+from rich.tree import Tree
 from pathlib import Path
+from typing import Optional
 from chaos.config import Config, DEFAULT_CHAOS_DIR
 from chaos.config_provider import ConfigProvider
 from chaos.core.agent import Agent
+from chaos.infra.knowledge import KnowledgeLibrary
+from chaos.infra.knowledge_sync import DEFAULT_SYNC_WORKERS, KnowledgeSync
+from chaos.trace.otel_json_trace_sink import OtelJsonTraceSink
+from chaos.trace.span_tree import SpanTree
+from chaos.trace.trace_span import TraceSpan
 
 app = typer.Typer()
+knowledge_app = typer.Typer(help="Manage the shared knowledge base.")
+app.add_typer(knowledge_app, name="knowledge")
+trace_app = typer.Typer(help="Inspect exported block execution traces.")
+app.add_typer(trace_app, name="trace")
 console = Console()
 IDENTITY_PATH_HELP = (
     "Agent id (stored as "
@@ -133,5 +146,116 @@ def dream(
             agent_obj.close()
 
 
+def _knowledge_manifest_path(directory: Path, domain: str, config: Config) -> Path:
+    """Returns the sync manifest path for a directory/domain pair.
+
+    The domain appears in the file name only as a slug, so separators and
+    ``..`` cannot leave the manifest directory; the hash covers the exact
+    domain, keeping domains with the same slug apart.
+    """
+
+    key = f"{directory.resolve()}\0{domain}"
+    pair_hash = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    slug = re.sub(r"[^A-Za-z0-9_-]+", "_", domain)[:64]
+    return config.get_knowledge_manifest_dir() / f"{slug}-{pair_hash[:12]}.json"
+
+
+@knowledge_app.command("sync")
+def knowledge_sync(
+    directory: Path = typer.Argument(
+        ..., exists=True, file_okay=False, help="Directory of markdown/text files."
+    ),
+    domain: str = typer.Option(..., "--domain", "-d", help="Knowledge domain."),
+    workers: int = typer.Option(
+        DEFAULT_SYNC_WORKERS, "--workers", "-w", help="File processing workers."
+    ),
+):
+    """
+    Incrementally sync a directory into a knowledge domain.
+    """
+    try:
+        config = ConfigProvider().load()
+        library = KnowledgeLibrary.from_config(config)
+        report = KnowledgeSync(library, max_workers=workers).sync(
+            directory,
+            domain,
+            _knowledge_manifest_path(directory, domain, config),
+        )
+        console.print(
+            f"[green]Synced {report.scanned} files into '{domain}':[/green] "
+            f"{report.added} added, {report.updated} updated, "
+            f"{report.removed} removed, {report.unchanged} unchanged, "
+            f"{report.failed} failed "
+            f"({report.chunks_written} chunks written, "
+            f"{report.chunks_deleted} deleted) in {report.duration_ms:.0f}ms"
+        )
+        if report.failed:
+            raise typer.Exit(code=1)
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(code=1)
+
+
+def _span_label(span: TraceSpan, critical: bool) -> str:
+    """Returns the tree label for a span."""
+
+    outcome = "[green]ok[/green]" if span.success else f"[red]{span.reason}[/red]"
+    label = f"{span.name} #{span.attempt} {span.duration_ms:.1f}ms {outcome}"
+    if span.node_name and span.node_name != span.block_name:
+        label += f" [dim]({span.block_name})[/dim]"
+    if span.input_tokens is not None or span.output_tokens is not None:
+        label += f" tokens={span.input_tokens or 0}/{span.output_tokens or 0}"
+    if span.hedge:
+        label += " [dim]hedge[/dim]"
+    if critical:
+        label = f"[bold yellow]*[/bold yellow] [bold]{label}[/bold]"
+    return label
+
+
+def _add_span(
+    parent: Tree, tree: SpanTree, span: TraceSpan, critical: set[str]
+) -> None:
+    """Adds ``span`` and its descendants under ``parent``."""
+
+    node = parent.add(_span_label(span, span.span_id in critical))
+    for child in tree.children(span):
+        _add_span(node, tree, child, critical)
+
+
+@trace_app.command("show")
+def trace_show(
+    run_id: str = typer.Argument(..., help="Run id of the exported trace."),
+    trace_dir: Optional[Path] = typer.Option(
+        None, "--dir", help="Trace directory (defaults to the configured one)."
+    ),
+):
+    """
+    Print a run's span tree with durations and its critical path.
+    """
+    try:
+        directory = trace_dir or ConfigProvider().load().get_trace_dir()
+        spans = OtelJsonTraceSink(directory).load(run_id)
+        tree = SpanTree(spans)
+        for root in tree.roots:
+            path = tree.critical_path(root)
+            rendered = Tree(f"[bold]run {run_id}[/bold]")
+            _add_span(rendered, tree, root, {span.span_id for span in path})
+            console.print(rendered)
+            console.print(
+                "Critical path: "
+                + " -> ".join(
+                    f"{span.name} ({span.duration_ms:.1f}ms)" for span in path
+                )
+            )
+    except FileNotFoundError:
+        console.print(f"[red]Error:[/red] no trace exported for run {run_id}")
+        raise typer.Exit(code=1)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(code=1)
+
+
 if __name__ == "__main__":
     app()
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -46,9 +46,44 @@ class Config(BaseSettings):
     block_stats_path: Optional[Path] = Field(
         default=None, description="Path to the block stats JSON store."
     )
+    block_stats_backend: Literal["json", "sqlite"] = Field(
+        default="json", description="Storage backend for block execution stats."
+    )
+    block_stats_db_path: Optional[Path] = Field(
+        default=None, description="Path to the block stats SQLite store."
+    )
+    block_stats_window_size: Optional[int] = Field(
+        default=None,
+        description="Most recent attempts per block used for SQLite estimates.",
+    )
+    block_stats_window_seconds: Optional[float] = Field(
+        default=None,
+        description="Age limit in seconds for attempts used in SQLite estimates.",
+    )
+    knowledge_partitioned: bool = Field(
+        default=False,
+        description="Store each knowledge domain in its own Chroma collection.",
+    )
+    knowledge_manifest_dir: Optional[Path] = Field(
+        default=None, description="Directory for knowledge sync manifests."
+    )
+    knowledge_hybrid_search: bool = Field(
+        default=False,
+        description="Fuse BM25 lexical ranking with vector knowledge search.",
+    )
+    knowledge_lexical_index_path: Optional[Path] = Field(
+        default=None, description="Path to the knowledge FTS5 lexical index."
+    )
     tool_root: Optional[Path] = Field(
         default=None, description="Root directory for file tool access."
     )
+    tracing_enabled: bool = Field(
+        default=False,
+        description="Export block execution spans as OpenTelemetry JSON files.",
+    )
+    trace_dir: Optional[Path] = Field(
+        default=None, description="Directory for exported run traces."
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", extra="forbid"
@@ -102,6 +137,28 @@ class Config(BaseSettings):
             self.block_stats_path = self._resolve_relative_path(
                 self.block_stats_path, self.chaos_dir
             )
+        if self.block_stats_db_path is None:
+            self.block_stats_db_path = base_db_dir / "block_stats.sqlite"
+        else:
+            self.block_stats_db_path = self._resolve_relative_path(
+                self.block_stats_db_path, self.chaos_dir
+            )
+        if self.knowledge_manifest_dir is None:
+            self.knowledge_manifest_dir = base_db_dir / "knowledge_manifests"
+        else:
+            self.knowledge_manifest_dir = self._resolve_relative_path(
+                self.knowledge_manifest_dir, self.chaos_dir
+            )
+        if self.knowledge_lexical_index_path is None:
+            self.knowledge_lexical_index_path = base_db_dir / "knowledge_fts.sqlite"
+        else:
+            self.knowledge_lexical_index_path = self._resolve_relative_path(
+                self.knowledge_lexical_index_path, self.chaos_dir
+            )
+        if self.trace_dir is None:
+            self.trace_dir = self.chaos_dir / "traces"
+        else:
+            self.trace_dir = self._resolve_relative_path(self.trace_dir, self.chaos_dir)
         if self.tool_root is None:
             self.tool_root = Path.cwd().resolve()
         if self.litellm_use_proxy and not self.litellm_proxy_url:
@@ -156,6 +213,16 @@ class Config(BaseSettings):
 
         return self.litellm_use_proxy
 
+    def use_knowledge_partitions(self) -> bool:
+        """Returns whether knowledge domains are stored in separate collections."""
+
+        return self.knowledge_partitioned
+
+    def use_knowledge_hybrid_search(self) -> bool:
+        """Returns whether knowledge search fuses lexical and vector rankings."""
+
+        return self.knowledge_hybrid_search
+
     def get_litellm_proxy_url(self) -> Optional[str]:
         """Returns the configured LiteLLM proxy base URL."""
 
@@ -208,6 +275,60 @@ class Config(BaseSettings):
             raise ValueError("Block stats path is not configured.")
         return self.block_stats_path
 
+    def get_block_stats_db_path(self) -> Path:
+        """Returns the path to the block stats SQLite store.
+
+        Returns:
+            A path to the block stats SQLite database.
+        """
+
+        if self.block_stats_db_path is None:
+            raise ValueError("Block stats database path is not configured.")
+        return self.block_stats_db_path
+
+    def use_sqlite_block_stats(self) -> bool:
+        """Returns whether block stats are stored in SQLite."""
+
+        return self.block_stats_backend == "sqlite"
+
+    def get_knowledge_manifest_dir(self) -> Path:
+        """Returns the directory holding knowledge sync manifests.
+
+        Returns:
+            A path to the knowledge manifest directory.
+        """
+
+        if self.knowledge_manifest_dir is None:
+            raise ValueError("Knowledge manifest directory is not configured.")
+        return self.knowledge_manifest_dir
+
+    def get_knowledge_lexical_index_path(self) -> Path:
+        """Returns the path to the knowledge FTS5 lexical index.
+
+        Returns:
+            A path to the lexical index SQLite database.
+        """
+
+        if self.knowledge_lexical_index_path is None:
+            raise ValueError("Knowledge lexical index path is not configured.")
+        return self.knowledge_lexical_index_path
+
+    def get_trace_dir(self) -> Path:
+        """Returns the directory holding exported run traces.
+
+        Returns:
+            A path to the trace directory.
+        """
+
+        if self.trace_dir is None:
+            raise ValueError("Trace directory is not configured.")
+        return self.trace_dir
+
+    def use_tracing(self) -> bool:
+        """Returns whether block execution spans are exported."""
+
+        return self.tracing_enabled
+
     def get_tool_root(self) -> Path:
         """
         Returns the root directory for file tool operations.
@@ -37,7 +37,7 @@ class Agent:
         self.actor_memory = self.memory.actor_view()
         self.subconscious_memory = self.memory.subconscious_view()
         self.skills_lib = SkillsLibrary()
-        self.knowledge_lib = KnowledgeLibrary(self.config)
+        self.knowledge_lib = KnowledgeLibrary.from_config(self.config)
 
         # Initialize ToolLibrary and register default tools
         self.tool_lib = ToolLibrary()
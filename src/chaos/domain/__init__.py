@@ -1,5 +1,6 @@
 from chaos.domain.identity import Identity, SCHEMA_VERSION, agent_id_from_path
 from chaos.domain.instructions import Instructions
+from chaos.domain.knowledge_search_weights import KnowledgeSearchWeights
 from chaos.domain.memory_config import MemoryConfig
 from chaos.domain.memory_persona_config import MemoryPersonaConfig
 from chaos.domain.profile import Profile
@@ -10,6 +11,7 @@ from chaos.domain.tuning_policy import TuningPolicy
 __all__ = [
     "Identity",
     "Instructions",
+    "KnowledgeSearchWeights",
     "MemoryConfig",
     "MemoryPersonaConfig",
     "Profile",
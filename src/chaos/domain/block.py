@@ -1,36 +1,175 @@
 from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Mapping
+import copy
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+import io
 import logging
-from time import perf_counter, sleep
-from typing import Any, Dict, List, Optional, Type
+import pickle
+import threading
+from time import perf_counter, sleep, time_ns
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 from uuid import uuid4
 
-from chaos.domain.block_estimate import BlockEstimate
+from chaos.cache.block_result_cache import BlockResultCache
+from chaos.cache.cache_key import build_cache_key
+from chaos.domain.block_estimate import BlockEstimate, EstimateSource
+from chaos.domain.chunk_stream import ChunkStream
+from chaos.domain.deadline import (
+    DEADLINE_EXCEEDED_REASON,
+    deadline_exceeded_response,
+    remaining_seconds,
+)
 from chaos.domain.error_sanitizer import build_exception_details
+from chaos.domain.execution_step import (
+    ExecutionStep,
+    Handle,
+    Steps,
+    blocking_step,
+    cancel_step,
+    drive,
+    drive_async,
+    gather_step,
+    spawn_step,
+    wait_first_step,
+)
+from chaos.domain.frozen_dict import FrozenDict
+from chaos.domain.execution_plan import (
+    CompiledBranch,
+    CompiledChoice,
+    CompiledParallel,
+    CompiledTransition,
+    ExecutionPlan,
+)
 from chaos.domain.messages import Request, Response
 from chaos.domain.response_metadata_keys import (
+    BRANCH_DECISIONS_KEY,
+    CACHE_STATUS_HIT,
+    CACHE_STATUS_KEY,
+    CACHE_STATUS_MISS,
+    CACHE_TIER_KEY,
+    COALESCED_KEY,
     COMPOSITE_LAST_NODE_KEY,
     COMPOSITE_NAME_KEY,
+    COMPOSITE_PARALLEL_BRANCHES_KEY,
     COMPOSITE_SOURCE_KEY,
+    GRAPH_PATH_KEY,
+    HEDGE_COUNT_KEY,
+    HEDGE_KEY,
+    HEDGE_WON_KEY,
+    NODE_PATH_KEY,
+    WORKER_DURATION_KEY,
+    WORKER_PID_KEY,
 )
 from chaos.domain.side_effect_class import SideEffectClass
+from chaos.domain.span_ids import new_span_id
 from chaos.domain.policy import (
     BubblePolicy,
+    CircuitBreakerPolicy,
+    HedgePolicy,
     RecoveryPolicy,
     RecoveryType,
     RepairPolicy,
     RetryPolicy,
 )
 from chaos.domain.state import BlockState
+from chaos.engine.admission_controller import AdmissionController
+from chaos.engine.circuit_breaker import CIRCUIT_OPEN_REASON
+from chaos.engine.circuit_breaker_registry import CircuitBreakerRegistry
 from chaos.engine.conditions import ConditionRegistry
 from chaos.engine.policy_handlers import PolicyHandler
+from chaos.engine.primitive_process_pool import PrimitiveProcessPool, WorkerResult
+from chaos.engine.reducers import ReducerRegistry
 from chaos.engine.registry import RepairRegistry
+from chaos.engine.single_flight import SingleFlight
+from chaos.ledger.checkpoint_ledger import CheckpointLedger
+from chaos.ledger.graph_checkpoint import GraphCheckpoint
 from chaos.stats.block_attempt_record import BlockAttemptRecord
 from chaos.stats.block_stats_store import BlockStatsStore
 from chaos.stats.block_stats_identity import BlockStatsIdentity
+from chaos.stats.graph_estimate_builder import build_graph_estimate, expected_attempts
+from chaos.stats.statistics import quantile
 from chaos.stats.store_registry import get_default_store
+from chaos.trace.sink_registry import get_default_sink
+from chaos.trace.trace_span import TraceSpan
 
 logger = logging.getLogger(__name__)
 
+_UNRECOVERABLE_REASONS = frozenset({DEADLINE_EXCEEDED_REASON, CIRCUIT_OPEN_REASON})
+
+DEFAULT_MAX_PARALLEL_WORKERS = 8
+DEFAULT_PARALLEL_REDUCER = "collect"
+DEFAULT_STREAM_BUFFER = 16
+CHOICE_OBJECTIVES = ("cost", "time")
+_T = TypeVar("_T")
+_StatsKey = Tuple[str, str, Optional[str]]
+
+
+def _run_coroutine_sync(coroutine: Coroutine[Any, Any, _T]) -> _T:
+    """Run ``coroutine`` to completion from synchronous code.
+
+    Uses a private event loop in the calling thread. When that thread already
+    runs a loop (sync ``execute`` called from async code), the private loop
+    runs on a short-lived helper thread instead, since loops cannot nest.
+    """
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as helper:
+        return helper.submit(asyncio.run, coroutine).result()
+
+
+def _detached_store() -> None:
+    """Unpickle a stats store left in the parent process as None."""
+
+    return None
+
+
+class _WorkerPickler(pickle.Pickler):
+    """Pickler for worker snapshots that leaves every stats store behind.
+
+    Nested blocks then record to the worker's default store, whose attempts
+    are returned to the parent with each result.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, BlockStatsStore):
+            return _detached_store, ()
+        return NotImplemented
+
+
+CHILD_ONLY_METADATA_KEYS = frozenset(
+    {
+        CACHE_STATUS_KEY,
+        CACHE_TIER_KEY,
+        BRANCH_DECISIONS_KEY,
+        GRAPH_PATH_KEY,
+        HEDGE_COUNT_KEY,
+        HEDGE_WON_KEY,
+        WORKER_PID_KEY,
+        WORKER_DURATION_KEY,
+        COALESCED_KEY,
+    }
+)
+
 
 class Block(ABC):
     """Base class defining the contract and default behavior for all blocks.
@@ -40,6 +179,9 @@ class Block(ABC):
     2. A Primitive Block: Has no `nodes` and executes atomic work (overrides _execute_primitive).
     """
 
+    HEDGE_DELAY_REFRESH_SECONDS = 1.0
+    DEADLINE_ESTIMATE_REFRESH_SECONDS = 1.0
+
     def __init__(
         self,
         name: str,
@@ -52,6 +194,14 @@ class Block(ABC):
         condition_registry: type[ConditionRegistry] = ConditionRegistry,
         repair_registry: type[RepairRegistry] = RepairRegistry,
         policy_handler: type[PolicyHandler] = PolicyHandler,
+        reducer_registry: type[ReducerRegistry] = ReducerRegistry,
+        max_parallel_workers: int = DEFAULT_MAX_PARALLEL_WORKERS,
+        result_cache: Optional[BlockResultCache] = None,
+        checkpoint_ledger: Optional[CheckpointLedger] = None,
+        admission_controller: Optional[AdmissionController] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        cpu_bound: bool = False,
+        single_flight: bool = False,
     ):
         """Initialize a block.
 
@@ -67,6 +217,22 @@ class Block(ABC):
             condition_registry: Optional override for condition lookup.
             repair_registry: Optional override for repair lookup.
             policy_handler: Optional override for policy handling.
+            reducer_registry: Optional override for parallel fan-in reducers.
+            max_parallel_workers: Upper bound on concurrently running branches
+                for a parallel transition.
+            result_cache: Optional cache enabling memoization of successful
+                results for memoizable blocks (opt-in).
+            checkpoint_ledger: Optional ledger checkpointing each completed
+                graph node so composite runs can be resumed by run_id.
+            admission_controller: Optional controller that admits, queues, or
+                rejects runs based on this block's estimate.
+            hedge_policy: Optional policy hedging slow attempts of this block
+                when it runs as a composite node.
+            cpu_bound: Run ``_execute_primitive`` in the shared process pool
+                so pure-Python work does not serialize on the GIL. The block
+                must be picklable; it is snapshotted on first dispatch.
+            single_flight: Coalesce concurrent executions of this block with
+                identical inputs into one underlying attempt.
         """
         self._name = name
         self._state = BlockState.READY
@@ -79,8 +245,22 @@ class Block(ABC):
         self._condition_registry = condition_registry
         self._repair_registry = repair_registry
         self._policy_handler = policy_handler
+        self._reducer_registry = reducer_registry
+        self._max_parallel_workers = max(1, int(max_parallel_workers))
+        self._result_cache = result_cache
+        self._checkpoint_ledger = checkpoint_ledger
+        self._admission_controller = admission_controller
+        self._hedge_policy = hedge_policy
+        self._cpu_bound = cpu_bound
+        self._single_flight = single_flight
+        self._worker_key: Optional[str] = None
+        self._worker_payload: Optional[bytes] = None
+        self._worker_stores: Dict[_StatsKey, BlockStatsStore] = {}
+        self._hedge_delay_cache: Optional[Tuple[float, Optional[float]]] = None
+        self._deadline_estimate_cache: Optional[Tuple[float, BlockEstimate]] = None
         self._graph_validated = False
         self._graph_validation: Optional[Response] = None
+        self._plan: Optional[ExecutionPlan] = None
 
         # Allow subclasses to configure the graph
         self.build()
@@ -112,6 +292,7 @@ class Block(ABC):
         self._transitions = transitions or {}
         self._graph_validated = False
         self._graph_validation = None
+        self._plan = None
 
     @property
     def name(self) -> str:
@@ -143,53 +324,616 @@ class Block(ABC):
 
         return self._side_effect_class
 
-    def execute(self, request: Request) -> Response:
+    @property
+    def cpu_bound(self) -> bool:
+        """Whether primitive work runs in the shared process pool."""
+
+        return self._cpu_bound
+
+    def execute(
+        self, request: Request, resume_run_id: Optional[str] = None
+    ) -> Response:
         """Execute the block.
 
         If this block has nodes, it acts as a composite block and runs the graph loop.
         If it has no nodes, it calls _execute_primitive() for atomic work.
+
+        A request deadline is checked before the run, each node and each
+        retry, but a primitive that is already running is never interrupted:
+        a hung ``_execute_primitive`` blocks the call past the deadline. Use
+        ``execute_async``, which cancels primitives at the deadline, or bound
+        the primitive's own I/O (as ``LLMPrimitive`` does).
+
+        Args:
+            request: Request to execute.
+            resume_run_id: Run to resume. Composites with a checkpoint ledger
+                continue after the run's last completed node instead of
+                starting at the entry point.
         """
-        self._state = BlockState.BUSY
-        start_time = perf_counter()
+        return drive(self._execution_steps(request, resume_run_id))
+
+    async def execute_async(
+        self,
+        request: Request,
+        resume_run_id: Optional[str] = None,
+        *,
+        sink: Optional[ChunkStream] = None,
+        source: Optional[ChunkStream] = None,
+    ) -> Response:
+        """Execute the block on the running event loop.
+
+        Runs the same execution steps as ``execute``: metadata, stats
+        recording, recovery, failure, and resume semantics are identical.
+        Blocking work is awaited instead (primitives run
+        ``_execute_primitive_async``), and primitives are additionally
+        cancelled when the request deadline passes.
+
+        Args:
+            request: Request to execute.
+            resume_run_id: Run to resume (see ``execute``).
+            sink: Stream receiving a streaming primitive's chunks as they are
+                produced.
+            source: Upstream stream consumed by a stream-consuming primitive;
+                such executions are never served from the result cache.
+        """
+        return await drive_async(
+            self._execution_steps(request, resume_run_id, sink, source)
+        )
+
+    def _execution_steps(
+        self,
+        request: Request,
+        resume_run_id: Optional[str],
+        sink: Optional[ChunkStream] = None,
+        source: Optional[ChunkStream] = None,
+    ) -> Steps[Response]:
+        """Execute the block as steps performed by ``execute`` or ``execute_async``.
+
+        Args:
+            request: Request to execute.
+            resume_run_id: Run to resume, if any.
+            sink: Stream receiving a streaming primitive's chunks (async only).
+            source: Upstream stream for a stream-consuming primitive (async only).
+
+        Returns:
+            The block's response.
+        """
+        request = self._resume_request(request, resume_run_id)
+        rejection = self._deadline_rejection(request)
+        if rejection is not None:
+            return rejection
+        admitted: Optional[BlockEstimate] = None
+        if self._admission_controller is not None:
+            rejection, admitted = yield blocking_step(self._admit, request)
+            if rejection is not None:
+                return rejection
+        request_for_execution, start_time = self._begin_execution(request)
         response: Optional[Response] = None
-        request_for_execution = self._with_base_metadata(request)
         try:
-            if self._nodes is not None:
-                response = self._execute_graph(request_for_execution)
-            else:
-                response = self._execute_primitive(request_for_execution)
-        except Exception as e:
-            metadata = request_for_execution.metadata
-            logger.exception(
-                "Block execution failed",
-                extra={
-                    "block_name": self.name,
-                    "node_name": metadata.get("node_name"),
-                    "request_id": metadata.get("id"),
-                    "trace_id": metadata.get("trace_id"),
-                    "run_id": metadata.get("run_id"),
-                    "span_id": metadata.get("span_id"),
-                    "parent_span_id": metadata.get("parent_span_id"),
-                    "attempt": metadata.get("attempt"),
-                },
-            )
-            response = Response(
-                success=False,
-                reason="internal_error",
-                details=build_exception_details(e),
-                error_type=type(e),
+            cache_key = (
+                self._memo_key(request_for_execution) if source is None else None
             )
+            response = self._memo_lookup(cache_key)
+            if response is None:
+                streaming = sink is not None or source is not None
+                flight_key = (
+                    self._flight_key(request_for_execution)
+                    if resume_run_id is None and not streaming
+                    else None
+                )
+                compute = self._compute_steps(
+                    request_for_execution, resume_run_id, cache_key, sink, source
+                )
+                if flight_key is None:
+                    response = yield from compute
+                else:
+                    response = yield from self._coalesced_steps(
+                        request_for_execution, flight_key, compute
+                    )
+        except asyncio.CancelledError:
+            # Record the abandoned attempt (e.g. a losing hedge) as its own span.
+            response = Response(success=False, reason="cancelled")
+            raise
+        except Exception as e:
+            response = self._internal_error_response(request_for_execution, e)
         finally:
-            self._state = BlockState.READY
-            duration_ms = (perf_counter() - start_time) * 1000
-            if response is not None:
-                self._attach_correlation_metadata(request_for_execution, response)
-                response.metadata["duration_ms"] = duration_ms
-                self._record_attempt(
-                    request=request_for_execution,
-                    response=response,
-                    duration_ms=duration_ms,
+            self._release_admission(admitted)
+            self._finish_execution(request_for_execution, response, start_time)
+        return self._ensure_response(response)
+
+    def _compute_steps(
+        self,
+        request: Request,
+        resume_run_id: Optional[str],
+        cache_key: Optional[str],
+        sink: Optional[ChunkStream],
+        source: Optional[ChunkStream],
+    ) -> Steps[Response]:
+        """Run the graph or the primitive and cache the fresh response."""
+
+        if self._nodes is not None:
+            fresh = yield from self._graph_steps(request, resume_run_id is not None)
+        else:
+            fresh = yield ExecutionStep(
+                partial(self._run_primitive, request),
+                lambda: self._await_within_deadline(
+                    self._run_primitive_async(request, sink, source), request
+                ),
+            )
+        self._memo_store(cache_key, fresh)
+        return fresh
+
+    def execute_many(
+        self,
+        requests: Sequence[Request],
+        max_concurrency: int = DEFAULT_MAX_PARALLEL_WORKERS,
+        fail_fast: bool = False,
+        trace_id: Optional[str] = None,
+    ) -> List[Response]:
+        """Execute independent requests on a bounded thread pool.
+
+        All requests join one trace (a shared ``trace_id``) while each keeps
+        its own ``run_id``. Every request is a full ``execute`` call, so spans,
+        stats, and recovery behave exactly as for single executions.
+
+        Args:
+            requests: Requests to execute.
+            max_concurrency: Maximum number of requests in flight.
+            fail_fast: When True, requests that have not started once a failure
+                is observed are skipped with a ``batch_cancelled`` failure.
+            trace_id: Trace shared by the batch; a new one is generated if
+                omitted.
+
+        Returns:
+            One response per request, in input order.
+        """
+        batch = self._prepare_batch(requests, trace_id)
+        if not batch:
+            return []
+        failed = threading.Event()
+
+        def run(index: int) -> Response:
+            if fail_fast and failed.is_set():
+                return self._batch_cancelled_response(batch[index], index)
+            response = self.execute(batch[index])
+            if response.success is False:
+                failed.set()
+            return response
+
+        workers = min(len(batch), max(1, int(max_concurrency)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(run, range(len(batch))))
+
+    async def execute_many_async(
+        self,
+        requests: Sequence[Request],
+        max_concurrency: int = DEFAULT_MAX_PARALLEL_WORKERS,
+        fail_fast: bool = False,
+        trace_id: Optional[str] = None,
+    ) -> List[Response]:
+        """Execute independent requests as semaphore-bounded tasks.
+
+        Async counterpart of ``execute_many`` with identical ordering, trace,
+        and fail-fast semantics.
+        """
+        batch = self._prepare_batch(requests, trace_id)
+        semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+        failed = False
+
+        async def run(index: int) -> Response:
+            nonlocal failed
+            async with semaphore:
+                if fail_fast and failed:
+                    return self._batch_cancelled_response(batch[index], index)
+                response = await self.execute_async(batch[index])
+                if response.success is False:
+                    failed = True
+                return response
+
+        return list(await asyncio.gather(*(run(i) for i in range(len(batch)))))
+
+    @staticmethod
+    def _prepare_batch(
+        requests: Sequence[Request], trace_id: Optional[str]
+    ) -> List[Request]:
+        """Copy batch requests onto one shared trace with distinct runs.
+
+        Args:
+            requests: Caller requests (not mutated).
+            trace_id: Shared trace id, or None to generate one.
+
+        Returns:
+            Request copies carrying the shared ``trace_id`` and a ``run_id``.
+        """
+        shared_trace_id = trace_id or str(uuid4())
+        batch: List[Request] = []
+        for request in requests:
+            copied = request.model_copy(deep=False)
+            copied.metadata = dict(request.metadata)
+            copied.metadata["trace_id"] = shared_trace_id
+            copied.metadata.setdefault("run_id", str(uuid4()))
+            batch.append(copied)
+        return batch
+
+    @staticmethod
+    def _batch_cancelled_response(request: Request, index: int) -> Response:
+        """Build the failure for a batch request skipped by fail-fast."""
+
+        return Response(
+            success=False,
+            reason="batch_cancelled",
+            details={"index": index},
+            error_type=Exception,
+            metadata={
+                "trace_id": request.metadata["trace_id"],
+                "run_id": request.metadata["run_id"],
+            },
+        )
+
+    def _deadline_rejection(self, request: Request) -> Optional[Response]:
+        """Reject a request whose deadline has passed or cannot be met.
+
+        The budget is judged insufficient when it is exhausted, or when a
+        stats-backed estimate predicts a mean duration longer than the time
+        left. Only root executions are estimated: a composite's estimate
+        already covers its children, so child hops (requests carrying a
+        ``parent_span_id``) only check the remaining budget. Prior and
+        heuristic estimates are guesses and never reject. Rejected requests
+        do no work and are not recorded as attempts.
+
+        The estimate is reused for ``DEADLINE_ESTIMATE_REFRESH_SECONDS``, so
+        a stream of runs does not re-read the stats history of every node
+        before each one starts.
+
+        Args:
+            request: Incoming request.
+
+        Returns:
+            A ``deadline_exceeded`` Response, or None to proceed.
+        """
+
+        remaining = remaining_seconds(request.metadata)
+        if remaining is None:
+            return None
+        details: Dict[str, Any] = {"remaining_ms": remaining * 1000}
+        if remaining > 0:
+            if request.metadata.get("parent_span_id") is not None:
+                return None
+            try:
+                estimate = self._deadline_estimate(request)
+            except Exception:
+                return None
+            if (
+                estimate.estimate_source != EstimateSource.STATS
+                or estimate.time_ms_mean <= remaining * 1000
+            ):
+                return None
+            details["estimated_ms"] = estimate.time_ms_mean
+
+        return self._rejected(request, deadline_exceeded_response(details))
+
+    def _deadline_estimate(self, request: Request) -> BlockEstimate:
+        """Return this block's estimate, recomputed at most once per refresh."""
+
+        now = perf_counter()
+        cached = self._deadline_estimate_cache
+        if (
+            cached is not None
+            and now - cached[0] < self.DEADLINE_ESTIMATE_REFRESH_SECONDS
+        ):
+            return cached[1]
+        estimate = self.estimate_execution(request)
+        self._deadline_estimate_cache = (now, estimate)
+        return estimate
+
+    def _admit(
+        self, request: Request
+    ) -> tuple[Optional[Response], Optional[BlockEstimate]]:
+        """Pass the run through the admission controller, if configured.
+
+        May block while the run is queued for in-flight capacity; queueing
+        never outlasts the request deadline.
+
+        Args:
+            request: Incoming request.
+
+        Returns:
+            Tuple of (rejection Response, estimate reserved by the controller).
+        """
+
+        controller = self._admission_controller
+        if controller is None:
+            return None, None
+        estimate = self.estimate_execution(request)
+        rejection = controller.acquire(estimate, remaining_seconds(request.metadata))
+        if rejection is not None:
+            return self._rejected(request, rejection), None
+        return None, estimate
+
+    def _release_admission(self, estimate: Optional[BlockEstimate]) -> None:
+        """Release capacity reserved by ``_admit``."""
+
+        if estimate is not None and self._admission_controller is not None:
+            self._admission_controller.release(estimate)
+
+    def _rejected(self, request: Request, response: Response) -> Response:
+        """Attach correlation metadata to a response for a run never started."""
+
+        self._attach_correlation_metadata(self._with_base_metadata(request), response)
+        return response
+
+    @staticmethod
+    async def _await_within_deadline(
+        awaitable: Awaitable[Response], request: Request
+    ) -> Response:
+        """Await primitive work, cancelling it when the deadline passes.
+
+        Args:
+            awaitable: Primitive execution to await.
+            request: Request carrying the optional deadline.
+
+        Returns:
+            The primitive's response, or ``deadline_exceeded`` on timeout.
+        """
+
+        remaining = remaining_seconds(request.metadata)
+        if remaining is None:
+            return await awaitable
+        timeout = asyncio.timeout(remaining)
+        try:
+            async with timeout:
+                return await awaitable
+        except TimeoutError:
+            if not timeout.expired():
+                raise
+            return deadline_exceeded_response({"timeout_ms": remaining * 1000})
+
+    @staticmethod
+    def _retry_deadline_failure(
+        request: Request, policy: RetryPolicy, current_failure: Response
+    ) -> Optional[Response]:
+        """Return a failure when the next retry would start past the deadline.
+
+        Args:
+            request: Parent request carrying the optional deadline.
+            policy: Retry policy about to schedule another attempt.
+            current_failure: Latest failure response.
+
+        Returns:
+            A ``deadline_exceeded`` Response, or None when the retry fits.
+        """
+
+        remaining = remaining_seconds(request.metadata)
+        if remaining is None or remaining > policy.delay_seconds:
+            return None
+        return deadline_exceeded_response(
+            {
+                "remaining_ms": remaining * 1000,
+                "last_failure_reason": current_failure.reason,
+            }
+        )
+
+    def is_memoizable(self) -> bool:
+        """Return True if results may be served from the result cache.
+
+        Only side-effect-free blocks qualify by default. Subclasses may widen
+        this for deterministic work (see LLMPrimitive).
+        """
+
+        return self._side_effect_class == SideEffectClass.NONE
+
+    def memo_key_extras(self) -> Dict[str, Any]:
+        """Return block configuration that affects results, for cache keys."""
+
+        return {}
+
+    def _memo_key(self, request: Request) -> Optional[str]:
+        """Return the memoization key for a request, or None if not cached.
+
+        Args:
+            request: Request being executed.
+
+        Returns:
+            Cache key when a result cache is configured and the block and its
+            inputs are memoizable, otherwise None.
+        """
+
+        if self._result_cache is None or not self.is_memoizable():
+            return None
+        return build_cache_key(
+            self.stats_identity(),
+            request.payload,
+            request.context,
+            self.memo_key_extras(),
+        )
+
+    def _memo_lookup(self, cache_key: Optional[str]) -> Optional[Response]:
+        """Return a cached response for ``cache_key``, if any."""
+
+        if cache_key is None or self._result_cache is None:
+            return None
+        return self._result_cache.get(cache_key)
+
+    def _memo_store(self, cache_key: Optional[str], response: Response) -> None:
+        """Cache a freshly computed response and mark it as a miss."""
+
+        if cache_key is None or self._result_cache is None:
+            return
+        self._result_cache.put(cache_key, self.name, response)
+        response.metadata[CACHE_STATUS_KEY] = CACHE_STATUS_MISS
+
+    def is_coalescable(self) -> bool:
+        """Return True if concurrent identical executions may share one attempt.
+
+        Requires ``single_flight=True`` and a side-effect class of ``none`` or
+        ``idempotent``: followers receive the leader's result instead of
+        running, which is only safe when running once is equivalent.
+        """
+
+        return self._single_flight and self._side_effect_class in {
+            SideEffectClass.NONE,
+            SideEffectClass.IDEMPOTENT,
+        }
+
+    def _flight_key(self, request: Request) -> Optional[str]:
+        """Return the single-flight key for a request, or None to not coalesce.
+
+        The key hashes the block identity, payload, context and
+        ``memo_key_extras`` exactly like the result-cache key.
+        """
+
+        if not self.is_coalescable() or HEDGE_KEY in request.metadata:
+            return None
+        return build_cache_key(
+            self.stats_identity(),
+            request.payload,
+            request.context,
+            self.memo_key_extras(),
+        )
+
+    def _coalesced_steps(
+        self,
+        request: Request,
+        flight_key: str,
+        compute: Steps[Response],
+    ) -> Steps[Response]:
+        """Run ``compute`` once per in-flight key; followers share its result.
+
+        Followers wait without blocking the event loop under ``execute_async``,
+        and their own deadline or cancellation never cancels the shared
+        attempt. If the leader is cancelled, followers run the block
+        themselves.
+
+        Args:
+            request: Request being executed (for the follower's deadline).
+            flight_key: Single-flight key.
+            compute: Executes the block and returns its fresh response.
+
+        Returns:
+            The fresh response (leader) or a coalesced copy (follower).
+        """
+
+        future, leader = SingleFlight.join(flight_key)
+        if not leader:
+            remaining = remaining_seconds(request.metadata)
+            try:
+                shared = yield ExecutionStep(
+                    partial(future.result, timeout=remaining),
+                    lambda: asyncio.wait_for(
+                        asyncio.shield(asyncio.wrap_future(future)), remaining
+                    ),
                 )
+            except TimeoutError:
+                return deadline_exceeded_response({"timeout_ms": remaining * 1000})
+            if shared is not None:
+                return self._coalesced_copy(shared)
+            return (yield from compute)
+        try:
+            response = yield from compute
+        except asyncio.CancelledError:
+            SingleFlight.finish(flight_key, future, None)
+            raise
+        except BaseException as exc:
+            SingleFlight.finish(flight_key, future, error=exc)
+            raise
+        SingleFlight.finish(flight_key, future, self._flight_snapshot(response))
+        return response
+
+    @staticmethod
+    def _flight_snapshot(response: Response) -> Response:
+        """Return a copy of the leader's response that followers can share.
+
+        The leader keeps mutating its own response metadata while finishing,
+        so followers copy from this private snapshot instead.
+        """
+
+        snapshot = response.model_copy(deep=False)
+        snapshot.metadata = {
+            key: value
+            for key, value in response.metadata.items()
+            if key not in (CACHE_STATUS_KEY, CACHE_TIER_KEY)
+        }
+        return snapshot
+
+    @staticmethod
+    def _coalesced_copy(shared: Response) -> Response:
+        """Return a follower's copy of the shared response."""
+
+        copied = shared.model_copy(deep=False)
+        copied.metadata = dict(shared.metadata)
+        copied.metadata[COALESCED_KEY] = True
+        return copied
+
+    def _begin_execution(self, request: Request) -> tuple[Request, float]:
+        """Mark the block busy and prepare the request for execution.
+
+        Args:
+            request: Incoming request.
+
+        Returns:
+            Tuple of (request with base metadata, start time).
+        """
+
+        self._state = BlockState.BUSY
+        return self._with_base_metadata(request), perf_counter()
+
+    def _internal_error_response(self, request: Request, error: Exception) -> Response:
+        """Log an unexpected execution error and build a failure response.
+
+        Args:
+            request: Request being executed.
+            error: The unexpected exception.
+
+        Returns:
+            An internal_error Response.
+        """
+
+        metadata = request.metadata
+        logger.exception(
+            "Block execution failed",
+            extra={
+                "block_name": self.name,
+                "node_name": metadata.get("node_name"),
+                "request_id": metadata.get("id"),
+                "trace_id": metadata.get("trace_id"),
+                "run_id": metadata.get("run_id"),
+                "span_id": metadata.get("span_id"),
+                "parent_span_id": metadata.get("parent_span_id"),
+                "attempt": metadata.get("attempt"),
+            },
+        )
+        return Response(
+            success=False,
+            reason="internal_error",
+            details=build_exception_details(error),
+            error_type=type(error),
+        )
+
+    def _finish_execution(
+        self, request: Request, response: Optional[Response], start_time: float
+    ) -> None:
+        """Mark the block ready and record the attempt.
+
+        Args:
+            request: Request that was executed.
+            response: Response produced, if any.
+            start_time: perf_counter value captured at the start.
+        """
+
+        self._state = BlockState.READY
+        duration_ms = (perf_counter() - start_time) * 1000
+        if response is not None:
+            self._attach_correlation_metadata(request, response)
+            response.metadata["duration_ms"] = duration_ms
+            self._record_attempt(
+                request=request,
+                response=response,
+                duration_ms=duration_ms,
+            )
+
+    @staticmethod
+    def _ensure_response(response: Optional[Response]) -> Response:
+        """Return the response, or a failure when none was produced."""
 
         if response is None:
             return Response(
@@ -205,9 +949,208 @@ class Block(ABC):
         # Default implementation for "empty" blocks
         return Response(success=True, data=None)
 
+    async def _execute_primitive_async(self, request: Request) -> Response:
+        """Execute atomic work asynchronously.
+
+        The default runs ``_execute_primitive`` in a worker thread so blocking
+        primitives do not stall the event loop. Override this for primitives
+        with native async I/O.
+        """
+        return await asyncio.to_thread(self._execute_primitive, request)
+
+    def supports_streaming(self) -> bool:
+        """Return True if this primitive yields chunks (``_stream_primitive_async``)."""
+
+        return type(self)._stream_primitive_async is not Block._stream_primitive_async
+
+    def accepts_stream(self) -> bool:
+        """Return True if this primitive consumes chunks (``_consume_stream_async``)."""
+
+        return type(self)._consume_stream_async is not Block._consume_stream_async
+
+    def _stream_primitive_async(self, request: Request) -> AsyncIterator[Any]:
+        """Yield output chunks incrementally. Override for streaming primitives.
+
+        The chunks are assembled into the final Response by
+        ``_assemble_stream``.
+        """
+        raise NotImplementedError("Block does not stream")
+
+    async def _consume_stream_async(
+        self, request: Request, chunks: ChunkStream
+    ) -> Response:
+        """Execute while consuming an upstream node's chunks.
+
+        Override for primitives that can start work before their predecessor
+        in a ``{"stream": ...}`` transition has finished.
+        """
+        raise NotImplementedError("Block does not consume streams")
+
+    def _assemble_stream(self, request: Request, chunks: List[Any]) -> Response:
+        """Build the final Response of a streaming primitive.
+
+        The default concatenates string chunks and returns other chunks as a
+        list.
+
+        Args:
+            request: Request that was executed.
+            chunks: All chunks yielded, in order.
+
+        Returns:
+            The assembled Response.
+        """
+
+        if all(isinstance(chunk, str) for chunk in chunks):
+            return Response(success=True, data="".join(chunks))
+        return Response(success=True, data=chunks)
+
+    async def _produce_stream_async(
+        self, request: Request, sink: Optional[ChunkStream]
+    ) -> Response:
+        """Run ``_stream_primitive_async``, forwarding chunks to ``sink``.
+
+        Args:
+            request: Request to execute.
+            sink: Optional stream receiving each chunk (waits when full).
+
+        Returns:
+            The assembled Response.
+        """
+
+        chunks: List[Any] = []
+        async for chunk in self._stream_primitive_async(request):
+            chunks.append(chunk)
+            if sink is not None:
+                await sink.put(chunk)
+        return self._assemble_stream(request, chunks)
+
+    def _run_primitive(self, request: Request) -> Response:
+        """Execute primitive work synchronously.
+
+        Streaming primitives are drained on a private event loop (on a helper
+        thread when the calling thread is already running one).
+        """
+
+        if self.supports_streaming():
+            return _run_coroutine_sync(self._produce_stream_async(request, None))
+        if self._cpu_bound:
+            future = self._submit_to_process_pool(request)
+            return self._apply_worker_result(future.result())
+        return self._execute_primitive(request)
+
+    async def _run_primitive_async(
+        self,
+        request: Request,
+        sink: Optional[ChunkStream] = None,
+        source: Optional[ChunkStream] = None,
+    ) -> Response:
+        """Dispatch primitive work to the consuming, streaming or plain hook."""
+
+        if source is not None:
+            return await self._consume_stream_async(request, source)
+        if self.supports_streaming():
+            return await self._produce_stream_async(request, sink)
+        if self._cpu_bound:
+            future = self._submit_to_process_pool(request)
+            return self._apply_worker_result(await asyncio.wrap_future(future))
+        return await self._execute_primitive_async(request)
+
+    def _submit_to_process_pool(self, request: Request) -> Future:
+        """Queue ``_execute_primitive`` on the shared process pool.
+
+        The block is pickled once, without its stats store, caches, ledger
+        and controller, which stay in this process. Workers keep using that
+        snapshot until ``invalidate_worker_snapshot`` is called.
+        """
+
+        if self._worker_payload is None:
+            snapshot = copy.copy(self)
+            snapshot.__dict__.update(
+                _stats_store=None,
+                _result_cache=None,
+                _checkpoint_ledger=None,
+                _admission_controller=None,
+                _plan=None,
+                _worker_payload=None,
+                _worker_stores={},
+                _hedge_delay_cache=None,
+                _deadline_estimate_cache=None,
+                _state=BlockState.READY,
+            )
+            buffer = io.BytesIO()
+            _WorkerPickler(buffer).dump(snapshot)
+            self._worker_stores = self._nested_stats_stores()
+            self._worker_key = new_span_id()
+            self._worker_payload = buffer.getvalue()
+        return PrimitiveProcessPool.submit(
+            self._worker_key, self._worker_payload, request
+        )
+
+    def invalidate_worker_snapshot(self) -> None:
+        """Re-pickle this block on its next process-pool dispatch.
+
+        A ``cpu_bound`` block is pickled on first dispatch and workers cache
+        the copy, so later changes to its attributes (or to the blocks it
+        holds) are not seen by workers until this is called.
+        """
+
+        self._worker_payload = None
+        self._worker_key = None
+        self._worker_stores = {}
+
+    def _nested_stats_stores(self) -> Dict[_StatsKey, BlockStatsStore]:
+        """Map the identities of blocks held by this block to their stores.
+
+        Blocks are found through attributes, including lists, tuples, sets
+        and mappings of blocks. Blocks without a store of their own are left
+        out; their attempts go to the default store, as they would in this
+        process.
+        """
+
+        stores: Dict[_StatsKey, BlockStatsStore] = {}
+        seen: Set[int] = set()
+        pending: List[Any] = list(self.__dict__.values())
+        while pending:
+            value = pending.pop()
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            if isinstance(value, Block):
+                identity = value.stats_identity()
+                if value._stats_store is not None:
+                    key = (identity.block_name, identity.block_type, identity.version)
+                    stores.setdefault(key, value._stats_store)
+                pending.extend(value.__dict__.values())
+            elif isinstance(value, Mapping):
+                pending.extend(value.values())
+            elif isinstance(value, (list, tuple, set, frozenset)):
+                pending.extend(value)
+        return stores
+
+    def _apply_worker_result(self, result: WorkerResult) -> Response:
+        """Forward worker-recorded attempts and annotate the worker response.
+
+        Each attempt goes to the store of the nested block that recorded it,
+        or to the default store for blocks without one (e.g. blocks created
+        inside ``_execute_primitive``).
+        """
+
+        response, records, pid, duration_ms = result
+        for record in records:
+            key = (record.block_name, record.block_type, record.version)
+            store = self._worker_stores.get(key) or get_default_store()
+            store.record_attempt(record)
+        response.metadata[WORKER_PID_KEY] = pid
+        response.metadata[WORKER_DURATION_KEY] = duration_ms
+        return response
+
     def estimate_execution(self, request: Request) -> BlockEstimate:
         """Return a side-effect-free estimate for this block.
 
+        Composites with a valid graph are estimated by walking the graph:
+        child estimates are weighted by the transition frequencies observed
+        in past runs and by each child's expected attempts per visit.
+
         Args:
             request: Request to estimate.
 
@@ -217,148 +1160,685 @@ class Block(ABC):
 
         identity = self.stats_identity()
         store = self._stats_store or get_default_store()
+        if self._nodes is not None and self._validate_graph() is None:
+            return self._estimate_graph(request, identity, store)
         return store.estimate(identity)
 
-    def _execute_graph(self, request: Request) -> Response:
-        """Execute the graph of child nodes."""
+    def _estimate_graph(
+        self,
+        request: Request,
+        identity: BlockStatsIdentity,
+        store: BlockStatsStore,
+    ) -> BlockEstimate:
+        """Estimate a composite from its children and learned transitions."""
+
+        plan = cast(ExecutionPlan, self._plan)
+        components: Dict[str, BlockEstimate] = {}
+        retry_factors: Dict[str, float] = {}
+        for name, node in zip(plan.node_names, plan.nodes):
+            components[name] = node.estimate_execution(request)
+            node_store = node._stats_store or get_default_store()
+            retry_factors[name] = expected_attempts(
+                node_store.records(node.stats_identity())
+            )
+        paths = [record.path for record in store.records(identity) if record.path]
+        return build_graph_estimate(
+            identity,
+            plan,
+            components,
+            retry_factors,
+            paths,
+            self._max_steps,
+            len(paths),
+        )
+
+    def _graph_steps(self, request: Request, resume: bool = False) -> Steps[Response]:
+        """Execute the graph of child nodes.
+
+        Args:
+            request: Composite request.
+            resume: Continue from the run's last checkpoint, if any.
+        """
         validation_failure = self._validate_graph()
         if validation_failure is not None:
             return validation_failure
+        plan = cast(ExecutionPlan, self._plan)
+
+        node_names = plan.node_names
+        nodes = plan.nodes
+        transitions = plan.transitions
+        max_steps = self._max_steps
+        index, steps, finished = self._graph_start(request, plan, resume)
+        if finished is not None:
+            return finished
+        decisions: List[Dict[str, Any]] = []
+        path: List[str] = []
+        hedges = 0
+        streamed: Optional[Response] = None
+        # The first node of a resumed run is where it stopped; if that node is
+        # a composite, it resumes from its own checkpoints.
+        resume_child = resume
+
+        while index is not None:
+            steps += 1
+            if steps > max_steps:
+                return self._max_steps_response(node_names[index])
+
+            node = nodes[index]
+            node_name = node_names[index]
+            path.append(node_name)
+            if streamed is not None:
+                # Consumer of a streamed pair: it already ran with its producer.
+                response, streamed = streamed, None
+            elif transitions[index].stream_buffer is not None:
+                pair = partial(self._execute_stream_pair_async, request, plan, index)
+                response, streamed = yield ExecutionStep(
+                    lambda: _run_coroutine_sync(pair()), pair
+                )
+            else:
+                # Execute the child with recovery logic
+                response = yield from self._child_steps(
+                    node, request, node_name, resume=resume_child
+                )
+            resume_child = False
 
-        # Ensure nodes dict exists for lookup
-        nodes = self._nodes or {}
+            if response.success is False:
+                # If a child fails (and wasn't recovered), the graph fails.
+                return response
+            hedges += response.metadata.get(HEDGE_COUNT_KEY, 0)
 
-        current_node_name = self._entry_point
-        current_request = request
+            # If success, check transitions
+            transition = transitions[index]
+            parallel = transition.parallel
+            if parallel is not None:
+                steps += len(parallel.branches)
+                if steps > max_steps:
+                    return self._max_steps_response(node_name)
+                response = yield from self._parallel_steps(request, plan, parallel)
+                if response.success is False:
+                    return response
+                next_index = parallel.target
+            elif transition.choice is not None:
+                next_index = self._choose_successor(
+                    request, plan, node_name, transition.choice, decisions
+                )
+            elif transition.branches:
+                next_index, failure = self._select_next_index(
+                    node_name, transition, response
+                )
+                if failure is not None:
+                    return failure
+            else:
+                next_index = transition.target
 
-        steps = 0
+            if next_index is None:
+                # Terminal state: the run no longer needs its checkpoints.
+                self._clear_checkpoints(request)
+                return self._finalize_graph_response(
+                    response, node, node_name, decisions, path, hedges
+                )
+            if streamed is None:
+                self._save_checkpoint(request, plan, index, next_index, steps, response)
+            index = next_index
 
-        while current_node_name:
-            steps += 1
-            if steps > self._max_steps:
-                return Response(
+        return self._graph_ended_response()
+
+    async def _execute_stream_pair_async(
+        self, request: Request, plan: ExecutionPlan, index: int
+    ) -> tuple[Response, Optional[Response]]:
+        """Run a producer node and its streaming consumer concurrently.
+
+        The consumer starts immediately and reads the producer's chunks through
+        a bounded ChunkStream. Both first attempts record their own spans and
+        stats. If the producer fails, the consumer is cancelled and the
+        producer is recovered without streaming; a consumer run after
+        recovery, or retried by its own policies, receives a replay of the
+        producer's final ``data`` as a single chunk.
+
+        Args:
+            request: Composite request.
+            plan: Compiled graph plan.
+            index: Index of the producer node.
+
+        Returns:
+            Tuple of (producer response, consumer response). The consumer
+            response is None when the producer could not be recovered.
+        """
+
+        transition = plan.transitions[index]
+        target = cast(int, transition.target)
+        producer, consumer = plan.nodes[index], plan.nodes[target]
+        producer_name, consumer_name = plan.node_names[index], plan.node_names[target]
+        stream = ChunkStream(cast(int, transition.stream_buffer))
+        producer_request = self._build_child_request(
+            request, producer, producer_name, attempt=1
+        )
+        consumer_request = self._build_child_request(
+            request, consumer, consumer_name, attempt=1
+        )
+        producer_task = asyncio.ensure_future(
+            producer.execute_async(producer_request, sink=stream)
+        )
+        consumer_task = asyncio.ensure_future(
+            consumer.execute_async(consumer_request, source=stream)
+        )
+        consumer_response: Optional[Response] = None
+        try:
+            done, _ = await asyncio.wait(
+                {producer_task, consumer_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if consumer_task in done:
+                # The consumer stopped early; let the producer finish unblocked.
+                await stream.close()
+            producer_response = await producer_task
+            if producer_response.success is True:
+                if producer_response.metadata.get(CACHE_STATUS_KEY) == CACHE_STATUS_HIT:
+                    await stream.put(producer_response.data)
+                await stream.close()
+                consumer_response = await consumer_task
+        finally:
+            for task in (producer_task, consumer_task):
+                task.cancel()
+            await asyncio.gather(producer_task, consumer_task, return_exceptions=True)
+
+        if producer_response.success is not True:
+            producer_response = await drive_async(
+                self._recovery_steps(
+                    producer,
+                    request,
+                    producer_name,
+                    producer_request,
+                    producer_response,
+                )
+            )
+            if producer_response.success is not True:
+                return producer_response, None
+
+        data = producer_response.data
+
+        def replay() -> ChunkStream:
+            return ChunkStream.replay([data])
+
+        if consumer_response is None:
+            consumer_response = await drive_async(
+                self._child_steps(consumer, request, consumer_name, replay)
+            )
+        else:
+            consumer_response = await drive_async(
+                self._recovery_steps(
+                    consumer,
+                    request,
+                    consumer_name,
+                    consumer_request,
+                    consumer_response,
+                    replay,
+                )
+            )
+        return producer_response, consumer_response
+
+    @staticmethod
+    def _resume_request(request: Request, resume_run_id: Optional[str]) -> Request:
+        """Return a request copy bound to ``resume_run_id``, if one is given."""
+
+        if resume_run_id is None:
+            return request
+        resumed = request.model_copy(deep=False)
+        resumed.metadata = dict(request.metadata)
+        resumed.metadata["run_id"] = resume_run_id
+        return resumed
+
+    def _graph_start(
+        self, request: Request, plan: ExecutionPlan, resume: bool
+    ) -> tuple[Optional[int], int, Optional[Response]]:
+        """Determine where a graph run starts.
+
+        Fresh runs start at the entry point and discard stale checkpoints of
+        the same run. Resumed runs continue after the latest checkpoint.
+
+        Args:
+            request: Composite request carrying the run_id.
+            plan: Compiled graph plan.
+            resume: Whether the caller asked to resume the run.
+
+        Returns:
+            Tuple of (start node index, steps already consumed, failure
+            Response when the checkpoint cannot be resumed).
+        """
+
+        ledger = self._checkpoint_ledger
+        if ledger is None:
+            return plan.entry, 0, None
+        if not resume:
+            self._clear_checkpoints(request)
+            return plan.entry, 0, None
+
+        run_id = str(request.metadata["run_id"])
+        checkpoint = ledger.latest(run_id, self.name, self._checkpoint_path(request))
+        if checkpoint is None:
+            return plan.entry, 0, None
+        positions = {name: index for index, name in enumerate(plan.node_names)}
+        if (
+            checkpoint.node_name not in positions
+            or checkpoint.next_node not in positions
+        ):
+            return (
+                None,
+                checkpoint.steps,
+                Response(
                     success=False,
-                    reason="max_steps_exceeded",
-                    details={"max_steps": self._max_steps, "node": current_node_name},
+                    reason="invalid_checkpoint",
+                    details={
+                        "run_id": run_id,
+                        "node": checkpoint.node_name,
+                        "next_node": checkpoint.next_node,
+                    },
                     error_type=Exception,
+                ),
+            )
+
+        logger.info(
+            "Resuming composite run",
+            extra={
+                "block_name": self.name,
+                "run_id": run_id,
+                "node_name": checkpoint.node_name,
+                "steps": checkpoint.steps,
+            },
+        )
+        return positions[checkpoint.next_node], checkpoint.steps, None
+
+    @staticmethod
+    def _checkpoint_path(request: Request) -> str:
+        """Return the composite's node path in its run, scoping its checkpoints.
+
+        Hedged duplicates get a scope of their own so they never interleave
+        with the primary attempt's checkpoints.
+        """
+
+        path = request.metadata.get(NODE_PATH_KEY, "")
+        hedge = request.metadata.get(HEDGE_KEY)
+        return f"{path}#{hedge}" if hedge else path
+
+    def _clear_checkpoints(self, request: Request) -> None:
+        """Discard this composite's checkpoints for the request's run.
+
+        The root composite of a run (empty node path) discards every
+        checkpoint of the run, including those of nested composites. Ledger
+        failures are logged and do not fail the run.
+        """
+
+        ledger = self._checkpoint_ledger
+        if ledger is None:
+            return
+        run_id = str(request.metadata["run_id"])
+        node_path = self._checkpoint_path(request)
+        try:
+            if node_path:
+                ledger.clear(run_id, self.name, node_path)
+            else:
+                ledger.clear(run_id)
+        except Exception as exc:
+            logger.warning(
+                "Failed to clear graph checkpoints",
+                extra={
+                    "block_name": self.name,
+                    "run_id": run_id,
+                    "node_path": node_path,
+                    "error": build_exception_details(exc),
+                },
+            )
+
+    def _save_checkpoint(
+        self,
+        request: Request,
+        plan: ExecutionPlan,
+        index: int,
+        next_index: int,
+        steps: int,
+        response: Response,
+    ) -> None:
+        """Checkpoint a completed, non-terminal node when a ledger is configured.
+
+        Ledger write failures are logged and do not fail the run; they only
+        make it less resumable.
+        """
+
+        ledger = self._checkpoint_ledger
+        if ledger is None:
+            return
+        try:
+            ledger.save(
+                GraphCheckpoint(
+                    run_id=str(request.metadata["run_id"]),
+                    block_name=self.name,
+                    node_path=self._checkpoint_path(request),
+                    node_name=plan.node_names[index],
+                    next_node=plan.node_names[next_index],
+                    steps=steps,
+                    response=response,
                 )
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to save graph checkpoint",
+                extra={
+                    "block_name": self.name,
+                    "run_id": request.metadata.get("run_id"),
+                    "node_name": plan.node_names[index],
+                    "error": build_exception_details(exc),
+                },
+            )
 
-            node = nodes.get(current_node_name)
-            if not node:
-                return Response(
+    @staticmethod
+    def _select_next_index(
+        node_name: str,
+        transition: CompiledTransition,
+        response: Response,
+    ) -> tuple[Optional[int], Optional[Response]]:
+        """Choose the next node index for a conditional transition.
+
+        Args:
+            node_name: Node that just completed.
+            transition: Its compiled conditional transition.
+            response: The node's successful response.
+
+        Returns:
+            Tuple of (next node index, failure Response).
+        """
+
+        for branch in transition.branches:
+            try:
+                condition_result = branch.condition(response)
+            except Exception as exc:
+                return None, Response(
                     success=False,
-                    reason="unknown_node",
+                    reason="condition_execution_error",
                     details={
-                        "error": f"Entry point/Node '{current_node_name}' not found"
+                        "condition": branch.condition_name,
+                        "error": build_exception_details(exc),
                     },
                     error_type=Exception,
                 )
 
-            # Execute the child with recovery logic
-            response = self._execute_child_with_recovery(
-                node=node,
-                request=current_request,
-                node_name=current_node_name,
-            )
+            if condition_result:
+                return branch.target, None
 
-            if response.success is False:
-                # If a child fails (and wasn't recovered), the graph fails.
-                return response
+        return None, Response(
+            success=False,
+            reason="no_transition",
+            details={"node": node_name},
+            error_type=Exception,
+        )
 
-            # If success, check transitions
-            transition_config = self._transitions.get(current_node_name)
-            next_node_name = None
+    def _max_steps_response(self, node_name: str) -> Response:
+        """Build the failure returned when max_steps is exceeded."""
 
-            if isinstance(transition_config, str):
-                next_node_name = transition_config
-            elif isinstance(transition_config, list):
-                for branch in transition_config:
-                    condition_name = branch.get("condition", "default")
-                    target = branch.get("target")
+        return Response(
+            success=False,
+            reason="max_steps_exceeded",
+            details={"max_steps": self._max_steps, "node": node_name},
+            error_type=Exception,
+        )
 
-                    try:
-                        condition_func = self._condition_registry.get(condition_name)
-                    except ValueError as exc:
-                        return Response(
-                            success=False,
-                            reason="condition_resolution_error",
-                            details={"error": str(exc), "condition": condition_name},
-                            error_type=Exception,
-                        )
+    @staticmethod
+    def _graph_ended_response() -> Response:
+        """Build the failure returned when the graph loop exits without a result."""
 
-                    try:
-                        condition_result = condition_func(response)
-                    except Exception as exc:
-                        return Response(
-                            success=False,
-                            reason="condition_execution_error",
-                            details={
-                                "condition": condition_name,
-                                "error": build_exception_details(exc),
-                            },
-                            error_type=Exception,
-                        )
+        return Response(
+            success=False,
+            reason="graph_execution_ended_unexpectedly",
+            details={},
+            error_type=Exception,
+        )
+
+    def _finalize_graph_response(
+        self,
+        response: Response,
+        node: "Block",
+        node_name: str,
+        decisions: Optional[List[Dict[str, Any]]] = None,
+        path: Optional[List[str]] = None,
+        hedges: int = 0,
+    ) -> Response:
+        """Copy a terminal response and attach composite metadata.
+
+        Args:
+            response: The terminal node (or fan-in) response.
+            node: The last node executed by the graph loop.
+            node_name: Composite node name of that node.
+            decisions: Estimate-driven successor choices made during the run.
+            path: Node names executed by the run, in order.
+            hedges: Hedged duplicate attempts launched by the run's nodes.
+
+        Returns:
+            A shallow copy of the response with composite metadata. The
+            child's cache status, path, decisions, and hedge counts are
+            dropped; they describe the child only.
+        """
+
+        final = response.model_copy(deep=False)
+        final.metadata = {
+            **{
+                key: value
+                for key, value in (final.metadata or {}).items()
+                if key not in CHILD_ONLY_METADATA_KEYS
+            },
+            COMPOSITE_SOURCE_KEY: node.name,
+            COMPOSITE_NAME_KEY: self.name,
+            COMPOSITE_LAST_NODE_KEY: node_name,
+        }
+        if decisions:
+            final.metadata[BRANCH_DECISIONS_KEY] = decisions
+        if path:
+            final.metadata[GRAPH_PATH_KEY] = path
+        if hedges:
+            final.metadata[HEDGE_COUNT_KEY] = hedges
+        return final
+
+    def _choose_successor(
+        self,
+        request: Request,
+        plan: ExecutionPlan,
+        node_name: str,
+        choice: CompiledChoice,
+        decisions: List[Dict[str, Any]],
+    ) -> int:
+        """Choose among equivalent successors using their estimates.
+
+        Candidates are ranked by the objective (``cost`` then time, or
+        ``time`` then cost); candidates whose estimated time exceeds the
+        remaining deadline are only chosen when none fits. Ties keep
+        declaration order. The decision is appended to ``decisions``.
+
+        Args:
+            request: Composite request (also used for estimation).
+            plan: Compiled graph plan.
+            node_name: Node whose transition is being resolved.
+            choice: Compiled choice transition.
+            decisions: Decision log for the run.
+
+        Returns:
+            Index of the selected successor.
+        """
+
+        remaining = remaining_seconds(request.metadata)
+        budget_ms = None if remaining is None else remaining * 1000
+        ranked: List[tuple[bool, float, float, int, int]] = []
+        candidates: Dict[str, Dict[str, Any]] = {}
+        for position, candidate in enumerate(choice.candidates):
+            name = plan.node_names[candidate]
+            try:
+                estimate = plan.nodes[candidate].estimate_execution(request)
+            except Exception as exc:
+                logger.warning(
+                    "Failed to estimate branch candidate",
+                    extra={
+                        "block_name": self.name,
+                        "node_name": name,
+                        "error": build_exception_details(exc),
+                    },
+                )
+                continue
+            time_ms, cost_usd = estimate.time_ms_mean, estimate.cost_usd_mean
+            candidates[name] = {
+                "time_ms": time_ms,
+                "cost_usd": cost_usd,
+                "estimate_source": estimate.estimate_source.value,
+            }
+            primary, secondary = (
+                (cost_usd, time_ms)
+                if choice.objective == "cost"
+                else (time_ms, cost_usd)
+            )
+            too_slow = budget_ms is not None and time_ms > budget_ms
+            ranked.append((too_slow, primary, secondary, position, candidate))
+
+        selected = min(ranked)[-1] if ranked else choice.candidates[0]
+        decisions.append(
+            {
+                "node": node_name,
+                "selected": plan.node_names[selected],
+                "objective": choice.objective,
+                "candidates": candidates,
+            }
+        )
+        return selected
+
+    def _parallel_steps(
+        self, request: Request, plan: ExecutionPlan, parallel: CompiledParallel
+    ) -> Steps[Response]:
+        """Run branch nodes concurrently and join them with a reducer.
 
-                    if condition_result:
-                        next_node_name = target
-                        break
+        Each branch runs the same child steps as a sequential node, so
+        recovery policies, child spans, and stats recording behave exactly as
+        for sequential nodes. Branches run on a bounded thread pool under
+        ``execute`` (branches that have not started are cancelled on the
+        first unrecovered failure, in declaration order) and as tasks bounded
+        by the same limit under ``execute_async``.
 
-            if transition_config is not None and next_node_name is None:
-                return Response(
-                    success=False,
-                    reason="no_transition",
-                    details={"node": current_node_name},
-                    error_type=Exception,
-                )
+        Args:
+            request: Parent request each branch derives its child request from.
+            plan: Compiled graph plan.
+            parallel: Compiled parallel transition.
 
-            if next_node_name:
-                current_node_name = next_node_name
-                # Optional: Update metadata to trace path
-            else:
-                # Terminal state
-                final = response.model_copy(deep=False)
-                final.metadata = {
-                    **dict(final.metadata or {}),
-                    COMPOSITE_SOURCE_KEY: node.name,
-                    COMPOSITE_NAME_KEY: self.name,
-                    COMPOSITE_LAST_NODE_KEY: current_node_name,
-                }
-                return final
+        Returns:
+            The reduced Response, or the first failing branch response.
+        """
 
-        return Response(
-            success=False,
-            reason="graph_execution_ended_unexpectedly",
-            details={},
-            error_type=Exception,
+        results = yield gather_step(
+            [
+                partial(
+                    self._child_steps,
+                    plan.nodes[branch],
+                    request,
+                    plan.node_names[branch],
+                )
+                for branch in parallel.branches
+            ],
+            parallel.max_workers,
+            stop=lambda response: response.success is False,
         )
+        responses: Dict[str, Response] = {}
+        for branch, response in zip(parallel.branches, results):
+            if response.success is False:
+                return response
+            responses[plan.node_names[branch]] = response
+        return self._reduce_branches(parallel, responses)
+
+    @staticmethod
+    def _reduce_branches(
+        parallel: CompiledParallel, responses: Dict[str, Response]
+    ) -> Response:
+        """Join successful branch responses with the compiled reducer.
+
+        Args:
+            parallel: Compiled parallel transition.
+            responses: Branch responses in declaration order.
+
+        Returns:
+            The reduced Response, or a reducer_execution_error failure.
+        """
+
+        try:
+            reduced = parallel.reducer(responses)
+        except Exception as exc:
+            return Response(
+                success=False,
+                reason="reducer_execution_error",
+                details={
+                    "reducer": parallel.reducer_name,
+                    "error": build_exception_details(exc),
+                },
+                error_type=Exception,
+            )
+        reduced.metadata[COMPOSITE_PARALLEL_BRANCHES_KEY] = list(responses)
+        return reduced
 
-    def _execute_child_with_recovery(
+    def _child_steps(
         self,
         node: "Block",
         request: Request,
         node_name: str,
-    ) -> Response:
+        stream_source: Optional[Callable[[], ChunkStream]] = None,
+        resume: bool = False,
+    ) -> Steps[Response]:
         """Execute a child node and apply its recovery policies on failure.
 
         Args:
             node: Child block to execute.
             request: Parent-pruned request to execute against.
             node_name: Composite node name used to execute this child.
+            stream_source: Factory of the upstream stream fed to every attempt
+                of a stream-consuming child.
+            resume: Resume the run in the child's first attempt (composite
+                children continue from their own checkpoints).
 
         Returns:
             A Response indicating success or failure for the node execution.
         """
-        attempt = 1
-        last_child_request, response = self._execute_child_attempt(
+        last_child_request, response = yield from self._attempt_steps(
             node=node,
             request=request,
             node_name=node_name,
-            attempt=attempt,
+            attempt=1,
             source_request=None,
+            stream_source=stream_source,
+            resume=resume,
         )
-
         if response.success is True:
             return response
+        return (
+            yield from self._recovery_steps(
+                node, request, node_name, last_child_request, response, stream_source
+            )
+        )
+
+    def _recovery_steps(
+        self,
+        node: "Block",
+        request: Request,
+        node_name: str,
+        last_child_request: Request,
+        response: Response,
+        stream_source: Optional[Callable[[], ChunkStream]] = None,
+    ) -> Steps[Response]:
+        """Apply a child's recovery policies after its first attempt.
+
+        Args:
+            node: Child block that was executed.
+            request: Parent-pruned request to execute against.
+            node_name: Composite node name used to execute this child.
+            last_child_request: Request of the first attempt.
+            response: Response of the first attempt.
+            stream_source: Factory of the upstream stream for consumers.
+
+        Returns:
+            The first attempt's response if it succeeded or is unrecoverable,
+            otherwise the outcome of the policy stack.
+        """
+        attempt = 1
+        if response.success is True or response.reason in _UNRECOVERABLE_REASONS:
+            return response
 
         error_type = response.error_type or Exception
         policies = node.get_policy_stack(error_type)
@@ -366,18 +1846,25 @@ class Block(ABC):
 
         for policy in policies:
             if isinstance(policy, RetryPolicy):
-                attempt, last_child_request, current_failure = self._apply_retry_policy(
-                    node=node,
-                    request=request,
-                    node_name=node_name,
-                    policy=policy,
-                    attempt=attempt,
-                    last_child_request=last_child_request,
-                    current_failure=current_failure,
+                attempt, last_child_request, current_failure = (
+                    yield from self._retry_steps(
+                        node=node,
+                        request=request,
+                        node_name=node_name,
+                        policy=policy,
+                        attempt=attempt,
+                        last_child_request=last_child_request,
+                        current_failure=current_failure,
+                        stream_source=stream_source,
+                    )
+                )
+            elif isinstance(policy, CircuitBreakerPolicy):
+                current_failure = self._apply_circuit_breaker_policy(
+                    node, policy, current_failure
                 )
             elif isinstance(policy, RepairPolicy):
                 attempt, last_child_request, current_failure = (
-                    self._apply_repair_policy(
+                    yield from self._repair_steps(
                         node=node,
                         request=request,
                         node_name=node_name,
@@ -385,28 +1872,39 @@ class Block(ABC):
                         attempt=attempt,
                         last_child_request=last_child_request,
                         current_failure=current_failure,
+                        stream_source=stream_source,
                     )
                 )
             else:
-                current_failure = self._apply_custom_policy(
-                    policy, node, last_child_request, current_failure
+                # Policy handlers are synchronous and may re-execute the node.
+                current_failure = yield blocking_step(
+                    self._apply_custom_policy,
+                    policy,
+                    node,
+                    last_child_request,
+                    current_failure,
                 )
 
             if current_failure.success is True:
                 return current_failure
-            if policy.type == RecoveryType.BUBBLE:
+            if (
+                policy.type == RecoveryType.BUBBLE
+                or current_failure.reason in _UNRECOVERABLE_REASONS
+            ):
                 return current_failure
 
         return current_failure
 
-    def _execute_child_attempt(
+    def _attempt_steps(
         self,
         node: "Block",
         request: Request,
         node_name: str,
         attempt: int,
         source_request: Optional[Request],
-    ) -> tuple[Request, Response]:
+        stream_source: Optional[Callable[[], ChunkStream]] = None,
+        resume: bool = False,
+    ) -> Steps[tuple[Request, Response]]:
         """Execute a single child attempt and return request + response.
 
         Args:
@@ -415,6 +1913,9 @@ class Block(ABC):
             node_name: Composite node name used to execute this child.
             attempt: Attempt number.
             source_request: Optional request that supplies payload/context.
+            stream_source: Factory of the upstream stream for consumers;
+                streamed attempts are not hedged.
+            resume: Execute the child as a resume of the request's run.
 
         Returns:
             Tuple of (child request, child response).
@@ -427,10 +1928,190 @@ class Block(ABC):
             attempt=attempt,
             source_request=source_request,
         )
-        response = node.execute(child_request)
+        breaker = CircuitBreakerRegistry.get(
+            CircuitBreakerRegistry.key(node.stats_identity())
+        )
+        if breaker is not None:
+            rejection = breaker.before_call()
+            if rejection is not None:
+                return child_request, rejection
+        hedge_delay = (
+            self._hedge_delay_seconds(node, child_request)
+            if stream_source is None
+            else None
+        )
+        resume_run_id = str(child_request.metadata["run_id"]) if resume else None
+        if hedge_delay is None:
+            # The child's steps run inline, under whichever driver runs ours.
+            response = yield from node._execution_steps(
+                child_request,
+                resume_run_id,
+                source=None if stream_source is None else stream_source(),
+            )
+        else:
+            response = yield from self._hedged_steps(
+                node, child_request, hedge_delay, resume_run_id
+            )
+        if breaker is not None:
+            breaker.record(response.success is True)
         return child_request, response
 
-    def _apply_retry_policy(
+    @staticmethod
+    def _node_step(
+        node: "Block", request: Request, resume_run_id: Optional[str] = None
+    ) -> ExecutionStep[Response]:
+        """Return a step executing ``node`` once, for running it concurrently."""
+
+        return ExecutionStep(
+            partial(node.execute, request, resume_run_id),
+            partial(node.execute_async, request, resume_run_id),
+        )
+
+    def _hedge_delay_seconds(self, node: "Block", request: Request) -> Optional[float]:
+        """Return how long to wait before hedging an attempt of ``node``.
+
+        Args:
+            node: Child block about to be executed.
+            request: Child request for the attempt.
+
+        Returns:
+            The hedge delay in seconds, or None when the attempt should not be
+            hedged (no policy, unsafe side effects, too little latency data, or
+            a deadline that would pass first).
+        """
+
+        policy = node._hedge_policy
+        if policy is None or not self._is_recoverable_via_retry(node):
+            return None
+        delay_ms = node._hedge_delay_ms(policy)
+        if delay_ms is None:
+            return None
+        delay = max(delay_ms, policy.min_delay_ms) / 1000
+        remaining = remaining_seconds(request.metadata)
+        if remaining is not None and remaining <= delay:
+            return None
+        return delay
+
+    def _hedge_delay_ms(self, policy: HedgePolicy) -> Optional[float]:
+        """Return the latency quantile this block's attempts are hedged at.
+
+        The quantile is recomputed from the stats store at most once every
+        ``HEDGE_DELAY_REFRESH_SECONDS``, so hedged attempts do not sort the
+        block's whole history each time.
+
+        Args:
+            policy: The block's hedge policy.
+
+        Returns:
+            The delay in milliseconds before ``min_delay_ms`` is applied, or
+            None when there is too little latency data and no fallback.
+        """
+
+        now = perf_counter()
+        cached = self._hedge_delay_cache
+        if cached is not None and now - cached[0] < self.HEDGE_DELAY_REFRESH_SECONDS:
+            return cached[1]
+        store = self._stats_store or get_default_store()
+        durations = [
+            record.duration_ms
+            for record in store.records(self.stats_identity())
+            if record.success and record.cache_hit is not True and not record.hedge
+        ]
+        if len(durations) >= max(1, policy.min_samples):
+            delay_ms: Optional[float] = quantile(durations, policy.quantile)
+        else:
+            delay_ms = policy.fallback_delay_ms
+        self._hedge_delay_cache = (now, delay_ms)
+        return delay_ms
+
+    @staticmethod
+    def _hedge_request(request: Request, hedge: int) -> Request:
+        """Return a copy of ``request`` for a duplicate attempt with its own span."""
+
+        duplicate = request.model_copy(deep=False)
+        duplicate.metadata = dict(request.metadata)
+        duplicate.metadata["id"] = new_span_id()
+        duplicate.metadata["span_id"] = new_span_id()
+        duplicate.metadata[HEDGE_KEY] = hedge
+        return duplicate
+
+    @staticmethod
+    def _hedge_result(
+        launched: int, winner: Optional[int], responses: Dict[int, Response]
+    ) -> Response:
+        """Pick the hedged response and annotate it with hedge metadata.
+
+        Args:
+            launched: Number of attempts launched, including the primary.
+            winner: Index of the first successful attempt, if any.
+            responses: Finished responses by attempt index.
+
+        Returns:
+            The winning response, or the primary's failure when no attempt
+            succeeded.
+        """
+
+        response = responses[0 if winner is None else winner]
+        response.metadata[HEDGE_COUNT_KEY] = launched - 1
+        response.metadata[HEDGE_WON_KEY] = bool(winner)
+        return response
+
+    def _hedged_steps(
+        self,
+        node: "Block",
+        request: Request,
+        delay: float,
+        resume_run_id: Optional[str] = None,
+    ) -> Steps[Response]:
+        """Execute ``node`` with hedging.
+
+        A duplicate attempt is launched each time ``delay`` passes without a
+        successful response, up to the policy's ``max_hedges``. Under
+        ``execute_async`` losing attempts are cancelled; under ``execute``
+        they run on threads, which cannot be interrupted, so they run to
+        completion in the background and record their own spans.
+
+        Args:
+            node: Child block to execute.
+            request: Child request for the primary attempt.
+            delay: Seconds to wait before launching each duplicate.
+            resume_run_id: Run the primary attempt resumes, if any.
+
+        Returns:
+            The first successful response, annotated with hedge metadata.
+        """
+
+        policy = cast(HedgePolicy, node._hedge_policy)
+        max_attempts = 1 + max(0, policy.max_hedges)
+        # Mark the primary too, so no attempt coalesces onto another.
+        request.metadata[HEDGE_KEY] = 0
+        primary = yield spawn_step(self._node_step(node, request, resume_run_id))
+        pending: Dict[Handle, int] = {primary: 0}
+        responses: Dict[int, Response] = {}
+        launched = 1
+        winner: Optional[int] = None
+        try:
+            while pending and winner is None:
+                done = yield wait_first_step(
+                    list(pending), delay if launched < max_attempts else None
+                )
+                if not done:
+                    duplicate = self._hedge_request(request, launched)
+                    handle = yield spawn_step(self._node_step(node, duplicate))
+                    pending[handle] = launched
+                    launched += 1
+                    continue
+                for handle in done:
+                    index = pending.pop(handle)
+                    responses[index] = handle.result()
+                    if winner is None and responses[index].success is True:
+                        winner = index
+        finally:
+            if pending:
+                yield cancel_step(list(pending))
+        return self._hedge_result(launched, winner, responses)
+
+    def _retry_steps(
         self,
         node: "Block",
         request: Request,
@@ -439,9 +2120,13 @@ class Block(ABC):
         attempt: int,
         last_child_request: Request,
         current_failure: Response,
-    ) -> tuple[int, Request, Response]:
+        stream_source: Optional[Callable[[], ChunkStream]] = None,
+    ) -> Steps[tuple[int, Request, Response]]:
         """Apply a retry policy and return updated attempt state.
 
+        Retry delays block the thread under ``execute`` and use
+        ``asyncio.sleep`` under ``execute_async``.
+
         Args:
             node: Child block to execute.
             request: Parent request to derive from.
@@ -450,6 +2135,7 @@ class Block(ABC):
             attempt: Current attempt number.
             last_child_request: Last child request sent.
             current_failure: Latest failure response.
+            stream_source: Factory of the upstream stream for consumers.
 
         Returns:
             Tuple of (attempt, last_child_request, latest response).
@@ -464,23 +2150,32 @@ class Block(ABC):
 
         remaining_attempts = max(policy.max_attempts - attempt, 0)
         for _ in range(remaining_attempts):
+            deadline_failure = self._retry_deadline_failure(
+                request, policy, current_failure
+            )
+            if deadline_failure is not None:
+                return attempt, last_child_request, deadline_failure
             attempt += 1
             if policy.delay_seconds > 0:
-                sleep(policy.delay_seconds)
-            last_child_request, response = self._execute_child_attempt(
+                yield ExecutionStep(
+                    partial(sleep, policy.delay_seconds),
+                    partial(asyncio.sleep, policy.delay_seconds),
+                )
+            last_child_request, response = yield from self._attempt_steps(
                 node=node,
                 request=request,
                 node_name=node_name,
                 attempt=attempt,
                 source_request=last_child_request,
+                stream_source=stream_source,
             )
-            if response.success is True:
+            if response.success is True or response.reason == CIRCUIT_OPEN_REASON:
                 return attempt, last_child_request, response
             current_failure = response
 
         return attempt, last_child_request, current_failure
 
-    def _apply_repair_policy(
+    def _repair_steps(
         self,
         node: "Block",
         request: Request,
@@ -489,7 +2184,8 @@ class Block(ABC):
         attempt: int,
         last_child_request: Request,
         current_failure: Response,
-    ) -> tuple[int, Request, Response]:
+        stream_source: Optional[Callable[[], ChunkStream]] = None,
+    ) -> Steps[tuple[int, Request, Response]]:
         """Apply a repair policy and return updated attempt state.
 
         Args:
@@ -500,6 +2196,7 @@ class Block(ABC):
             attempt: Current attempt number.
             last_child_request: Last child request sent.
             current_failure: Latest failure response.
+            stream_source: Factory of the upstream stream for consumers.
 
         Returns:
             Tuple of (attempt, last_child_request, latest response).
@@ -512,34 +2209,54 @@ class Block(ABC):
                 self._unsafe_to_retry_response(node, current_failure),
             )
 
-        try:
-            repair_func = self._repair_registry.get(policy.repair_function)
-        except Exception as exc:
-            return (
-                attempt,
-                last_child_request,
-                Response(
-                    success=False,
-                    reason="repair_execution_failed",
-                    details={
-                        "repair_function": policy.repair_function,
-                        "error": build_exception_details(exc),
-                    },
-                    error_type=Exception,
-                ),
-            )
+        repaired, failure = self._repair_request(
+            policy, last_child_request, current_failure
+        )
+        if failure is not None:
+            return attempt, last_child_request, failure
 
-        repaired = repair_func(last_child_request, current_failure)
         attempt += 1
-        last_child_request, response = self._execute_child_attempt(
+        last_child_request, response = yield from self._attempt_steps(
             node=node,
             request=request,
             node_name=node_name,
             attempt=attempt,
             source_request=repaired,
+            stream_source=stream_source,
         )
         return attempt, last_child_request, response
 
+    @staticmethod
+    def _apply_circuit_breaker_policy(
+        node: "Block",
+        policy: CircuitBreakerPolicy,
+        current_failure: Response,
+    ) -> Response:
+        """Track the child's failures and stop recovery while its circuit is open.
+
+        The breaker is created on the first failure handled by the policy;
+        from then on every attempt of the child is gated and recorded by
+        ``_attempt_steps``.
+
+        Args:
+            node: Child block that failed.
+            policy: Circuit breaker policy to apply.
+            current_failure: Latest failure response.
+
+        Returns:
+            A ``circuit_open`` failure if the circuit is open, otherwise
+            ``current_failure`` unchanged.
+        """
+
+        if current_failure.reason == CIRCUIT_OPEN_REASON:
+            return current_failure
+        breaker, created = CircuitBreakerRegistry.get_or_create(
+            CircuitBreakerRegistry.key(node.stats_identity()), policy
+        )
+        if created:
+            breaker.record(False)
+        return breaker.rejection() or current_failure
+
     def _apply_custom_policy(
         self,
         policy: RecoveryPolicy,
@@ -563,6 +2280,37 @@ class Block(ABC):
             policy, node, last_child_request, current_failure
         )
 
+    def _repair_request(
+        self,
+        policy: RepairPolicy,
+        last_child_request: Request,
+        current_failure: Response,
+    ) -> tuple[Optional[Request], Optional[Response]]:
+        """Resolve the repair function and build the repaired request.
+
+        Args:
+            policy: Repair policy to apply.
+            last_child_request: Last child request sent.
+            current_failure: Latest failure response.
+
+        Returns:
+            Tuple of (repaired request, failure Response if resolution failed).
+        """
+
+        try:
+            repair_func = self._repair_registry.get(policy.repair_function)
+        except Exception as exc:
+            return None, Response(
+                success=False,
+                reason="repair_execution_failed",
+                details={
+                    "repair_function": policy.repair_function,
+                    "error": build_exception_details(exc),
+                },
+                error_type=Exception,
+            )
+        return repair_func(last_child_request, current_failure), None
+
     def _validate_graph(self) -> Optional[Response]:
         """Validate composite graph configuration.
 
@@ -664,6 +2412,19 @@ class Block(ABC):
                         return response
                 continue
 
+            if isinstance(transition, dict):
+                if "choose" in transition:
+                    response = self._validate_choice_transition(from_node, transition)
+                elif "stream" in transition:
+                    response = self._validate_stream_transition(from_node, transition)
+                else:
+                    response = self._validate_parallel_transition(from_node, transition)
+                if response is not None:
+                    self._graph_validated = True
+                    self._graph_validation = response
+                    return response
+                continue
+
             response = Response(
                 success=False,
                 reason="invalid_graph",
@@ -674,10 +2435,216 @@ class Block(ABC):
             self._graph_validation = response
             return response
 
+        self._plan = self._compile_plan()
         self._graph_validated = True
         self._graph_validation = None
         return None
 
+    def _compile_plan(self) -> ExecutionPlan:
+        """Compile the validated graph into an index-based execution plan.
+
+        Conditions and reducers are resolved once here, so registry lookups
+        (and the fresh lambda returned for "default") are not repeated per
+        hop. Must only be called after validation succeeded.
+
+        Returns:
+            The immutable ExecutionPlan.
+        """
+
+        nodes = self._nodes or {}
+        node_names = tuple(nodes)
+        index_of = {name: index for index, name in enumerate(node_names)}
+        compiled: List[CompiledTransition] = []
+        for name in node_names:
+            transition = self._transitions.get(name)
+            if transition is None:
+                compiled.append(CompiledTransition())
+            elif isinstance(transition, str):
+                compiled.append(CompiledTransition(target=index_of[transition]))
+            elif isinstance(transition, dict) and "stream" in transition:
+                compiled.append(
+                    CompiledTransition(
+                        target=index_of[transition["stream"]],
+                        stream_buffer=transition.get("buffer", DEFAULT_STREAM_BUFFER),
+                    )
+                )
+            elif isinstance(transition, dict) and "choose" in transition:
+                compiled.append(
+                    CompiledTransition(
+                        choice=CompiledChoice(
+                            candidates=tuple(
+                                index_of[candidate]
+                                for candidate in transition["choose"]
+                            ),
+                            objective=transition.get("objective", "cost"),
+                        )
+                    )
+                )
+            elif isinstance(transition, dict):
+                reducer_name = transition.get("reducer", DEFAULT_PARALLEL_REDUCER)
+                branches = tuple(index_of[branch] for branch in transition["parallel"])
+                limit = min(
+                    transition.get("max_workers") or self._max_parallel_workers,
+                    self._max_parallel_workers,
+                )
+                target = transition.get("target")
+                compiled.append(
+                    CompiledTransition(
+                        parallel=CompiledParallel(
+                            branches=branches,
+                            reducer_name=reducer_name,
+                            reducer=self._reducer_registry.get(reducer_name),
+                            target=index_of[target] if target else None,
+                            max_workers=min(len(branches), limit),
+                        )
+                    )
+                )
+            else:
+                compiled.append(
+                    CompiledTransition(
+                        branches=tuple(
+                            CompiledBranch(
+                                condition_name=branch.get("condition", "default"),
+                                condition=self._condition_registry.get(
+                                    branch.get("condition", "default")
+                                ),
+                                target=index_of[branch["target"]],
+                            )
+                            for branch in transition
+                        )
+                    )
+                )
+        return ExecutionPlan(
+            node_names=node_names,
+            nodes=tuple(nodes[name] for name in node_names),
+            entry=index_of[self._entry_point],
+            transitions=tuple(compiled),
+        )
+
+    def _validate_choice_transition(
+        self, from_node: str, transition: Dict[str, Any]
+    ) -> Optional[Response]:
+        """Validate an estimate-driven choice transition.
+
+        Args:
+            from_node: Node owning the transition.
+            transition: Choice transition configuration.
+
+        Returns:
+            Failed Response if invalid, otherwise None.
+        """
+
+        nodes = self._nodes or {}
+        candidates = transition.get("choose")
+        objective = transition.get("objective", "cost")
+        error: Optional[str] = None
+        if not isinstance(candidates, list) or not candidates:
+            error = f"choice transition for '{from_node}' needs a candidate list"
+        elif objective not in CHOICE_OBJECTIVES:
+            error = f"invalid choice objective '{objective}' for '{from_node}'"
+        else:
+            for candidate in candidates:
+                if candidate not in nodes:
+                    error = f"transition target '{candidate}' not found"
+                    break
+        if error is None:
+            return None
+        return Response(
+            success=False,
+            reason="invalid_graph",
+            details={"error": error},
+            error_type=Exception,
+        )
+
+    def _validate_stream_transition(
+        self, from_node: str, transition: Dict[str, Any]
+    ) -> Optional[Response]:
+        """Validate a streaming transition.
+
+        Args:
+            from_node: Node owning the transition.
+            transition: Streaming transition configuration.
+
+        Returns:
+            Failed Response if invalid, otherwise None.
+        """
+
+        nodes = self._nodes or {}
+        target = transition.get("stream")
+        buffer = transition.get("buffer", DEFAULT_STREAM_BUFFER)
+        error: Optional[str] = None
+        if target not in nodes:
+            error = f"transition target '{target}' not found"
+        elif not nodes[from_node].supports_streaming():
+            error = f"node '{from_node}' does not stream"
+        elif not nodes[target].accepts_stream():
+            error = f"node '{target}' does not consume streams"
+        elif not isinstance(buffer, int) or buffer < 1:
+            error = f"invalid stream buffer for '{from_node}'"
+        if error is None:
+            return None
+        return Response(
+            success=False,
+            reason="invalid_graph",
+            details={"error": error},
+            error_type=Exception,
+        )
+
+    def _validate_parallel_transition(
+        self, from_node: str, transition: Dict[str, Any]
+    ) -> Optional[Response]:
+        """Validate a parallel (fan-out/fan-in) transition.
+
+        Args:
+            from_node: Node owning the transition.
+            transition: Parallel transition configuration.
+
+        Returns:
+            Failed Response if invalid, otherwise None.
+        """
+
+        nodes = self._nodes or {}
+        branches = transition.get("parallel")
+        error: Optional[str] = None
+        if not isinstance(branches, list) or not branches:
+            error = f"parallel transition for '{from_node}' needs a branch list"
+        elif len(set(branches)) != len(branches):
+            error = f"duplicate parallel branch for '{from_node}'"
+        else:
+            for branch in branches:
+                if branch not in nodes:
+                    error = f"parallel branch '{branch}' not found"
+                elif branch in (self._transitions or {}):
+                    error = f"parallel branch '{branch}' must not define transitions"
+                if error:
+                    break
+        target = transition.get("target")
+        max_workers = transition.get("max_workers")
+        if error is None and target is not None and target not in nodes:
+            error = f"transition target '{target}' not found"
+        if error is None and max_workers is not None:
+            if not isinstance(max_workers, int) or max_workers < 1:
+                error = f"invalid max_workers for '{from_node}'"
+        if error is not None:
+            return Response(
+                success=False,
+                reason="invalid_graph",
+                details={"error": error},
+                error_type=Exception,
+            )
+
+        reducer_name = transition.get("reducer", DEFAULT_PARALLEL_REDUCER)
+        try:
+            self._reducer_registry.get(reducer_name)
+        except ValueError as e:
+            return Response(
+                success=False,
+                reason="reducer_resolution_error",
+                details={"error": str(e), "reducer": reducer_name},
+                error_type=Exception,
+            )
+        return None
+
     def stats_identity(self) -> BlockStatsIdentity:
         """Return the stable stats identity for this block."""
 
@@ -717,6 +2684,13 @@ class Block(ABC):
             reason=response.reason,
             error_type=error_type_name,
             duration_ms=duration_ms,
+            path=response.metadata.get(GRAPH_PATH_KEY),
+            hedge=True if metadata.get(HEDGE_KEY) else None,
+            hedge_cancelled=(
+                True
+                if HEDGE_KEY in metadata and response.reason == "cancelled"
+                else None
+            ),
         )
 
     def _record_attempt(
@@ -731,6 +2705,32 @@ class Block(ABC):
         """
 
         record = self._build_attempt_record(request, response, duration_ms)
+        cache_status = response.metadata.get(CACHE_STATUS_KEY)
+        if cache_status == CACHE_STATUS_HIT:
+            # Hits did no real work; keep them out of cost/latency estimates.
+            record = record.model_copy(
+                update={
+                    "cache_hit": True,
+                    "llm_calls": 0,
+                    "input_tokens": None,
+                    "output_tokens": None,
+                    "cost_usd": None,
+                }
+            )
+        elif response.metadata.get(COALESCED_KEY):
+            # The leader's attempt did (and records) the real work.
+            record = record.model_copy(
+                update={
+                    "coalesced": True,
+                    "llm_calls": 0,
+                    "input_tokens": None,
+                    "output_tokens": None,
+                    "cost_usd": None,
+                }
+            )
+        elif cache_status == CACHE_STATUS_MISS:
+            record = record.model_copy(update={"cache_hit": False})
+        self._trace_attempt(request, record)
         try:
             store = self._stats_store or get_default_store()
             store.record_attempt(record)
@@ -751,20 +2751,58 @@ class Block(ABC):
                 },
             )
 
+    def _trace_attempt(self, request: Request, record: BlockAttemptRecord) -> None:
+        """Hand the finished attempt to the default trace sink, if tracing is on.
+
+        Args:
+            request: Request executed by the block.
+            record: Attempt record; the span ends now and spans its duration.
+        """
+
+        sink = get_default_sink()
+        if sink is None:
+            return
+        try:
+            # Executions started by a composite carry a node path; the run's
+            # top-level execution does not.
+            run_root = True if NODE_PATH_KEY not in request.metadata else None
+            sink.record_span(TraceSpan.from_record(record, time_ns(), run_root))
+        except Exception as exc:
+            metadata = request.metadata
+            logger.exception(
+                "Failed to trace block attempt",
+                extra={
+                    "block_name": self.name,
+                    "node_name": metadata.get("node_name"),
+                    "trace_id": metadata.get("trace_id"),
+                    "run_id": metadata.get("run_id"),
+                    "span_id": metadata.get("span_id"),
+                    "error": build_exception_details(exc),
+                },
+            )
+
     def _with_base_metadata(self, request: Request) -> Request:
         """Return a request copy with minimal base metadata populated.
 
-        This method does not mutate the input request.
+        Payload and context are frozen (copied once at the root of a run and
+        shared by every descendant). This method does not mutate the input
+        request.
         """
 
         cloned = request.model_copy(deep=False)
         cloned.metadata = dict(request.metadata)
+        cloned.payload = FrozenDict.of(request.payload)
+        cloned.context = FrozenDict.of(request.context)
         md = cloned.metadata
 
-        md.setdefault("id", str(uuid4()))
-        md.setdefault("trace_id", str(uuid4()))
-        md.setdefault("run_id", str(uuid4()))
-        md.setdefault("span_id", str(uuid4()))
+        if "id" not in md:
+            md["id"] = new_span_id()
+        if "trace_id" not in md:
+            md["trace_id"] = str(uuid4())
+        if "run_id" not in md:
+            md["run_id"] = str(uuid4())
+        if "span_id" not in md:
+            md["span_id"] = new_span_id()
         md.setdefault("block_name", self.name)
         md.setdefault("attempt", 1)
         return cloned
@@ -802,7 +2840,10 @@ class Block(ABC):
     ) -> Request:
         """Construct a child request, propagating correlation metadata.
 
-        This method does not mutate the input request.
+        Payload and context are shared as FrozenDicts rather than copied, so
+        building a child request costs O(1) regardless of their size. Only the
+        small metadata dict is copied. This method does not mutate the input
+        request.
         """
 
         cloned = parent_request.model_copy(deep=False)
@@ -813,18 +2854,22 @@ class Block(ABC):
         context_source = (
             source_request.context if source_request else parent_request.context
         )
-        cloned.payload = dict(payload_source)
-        cloned.context = dict(context_source)
+        cloned.payload = FrozenDict.of(payload_source)
+        cloned.context = FrozenDict.of(context_source)
         md = cloned.metadata
 
-        md["id"] = str(uuid4())
-        md.setdefault("trace_id", str(uuid4()))
-        md.setdefault("run_id", str(uuid4()))
+        md["id"] = new_span_id()
+        if "trace_id" not in md:
+            md["trace_id"] = str(uuid4())
+        if "run_id" not in md:
+            md["run_id"] = str(uuid4())
         md["parent_span_id"] = md.get("span_id")
-        md["span_id"] = str(uuid4())
+        md["span_id"] = new_span_id()
         md["attempt"] = attempt
         md["block_name"] = child.name
         md["node_name"] = node_name
+        parent_path = md.get(NODE_PATH_KEY)
+        md[NODE_PATH_KEY] = f"{parent_path}/{node_name}" if parent_path else node_name
         return cloned
 
     def _is_recoverable_via_retry(self, block: "Block") -> bool:
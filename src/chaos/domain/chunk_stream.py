@@ -0,0 +1,86 @@
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Iterable
+
+
+class ChunkStream:
+    """Bounded async channel carrying output chunks from one node to the next.
+
+    The producer ``put``s chunks and waits while ``max_buffered`` chunks are
+    unconsumed (backpressure). The consumer iterates with ``async for`` until
+    the stream is closed. Closing is idempotent; chunks put after close are
+    dropped, so a producer whose consumer stopped early runs to completion
+    without blocking.
+    """
+
+    def __init__(self, max_buffered: int = 16) -> None:
+        """Initialize an open, empty stream.
+
+        Args:
+            max_buffered: Maximum number of unconsumed chunks.
+        """
+
+        self._max_buffered = max(1, int(max_buffered))
+        self._buffer: Deque[Any] = deque()
+        self._closed = False
+        self._produced = 0
+        self._changed = asyncio.Condition()
+
+    @classmethod
+    def replay(cls, chunks: Iterable[Any]) -> "ChunkStream":
+        """Return a closed stream pre-filled with ``chunks``."""
+
+        chunks = list(chunks)
+        stream = cls(max_buffered=max(1, len(chunks)))
+        stream._buffer.extend(chunks)
+        stream._produced = len(chunks)
+        stream._closed = True
+        return stream
+
+    @property
+    def produced(self) -> int:
+        """Number of chunks accepted so far."""
+
+        return self._produced
+
+    @property
+    def closed(self) -> bool:
+        """Whether the producer side has finished."""
+
+        return self._closed
+
+    async def put(self, chunk: Any) -> None:
+        """Append a chunk, waiting while the buffer is full.
+
+        Args:
+            chunk: Chunk to deliver; dropped if the stream is closed.
+        """
+
+        async with self._changed:
+            await self._changed.wait_for(
+                lambda: self._closed or len(self._buffer) < self._max_buffered
+            )
+            if self._closed:
+                return
+            self._buffer.append(chunk)
+            self._produced += 1
+            self._changed.notify_all()
+
+    async def close(self) -> None:
+        """Mark the stream finished and wake any waiting producer or consumer."""
+
+        async with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        """Yield chunks in order until the stream is closed and drained."""
+
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: self._buffer or self._closed)
+                if not self._buffer:
+                    return
+                chunk = self._buffer.popleft()
+                self._changed.notify_all()
+            yield chunk
@@ -0,0 +1,70 @@
+"""Request deadlines carried as absolute wall-clock time in request metadata."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from chaos.domain.exceptions import DeadlineExceededError
+from chaos.domain.messages import Request, Response
+from chaos.domain.response_metadata_keys import DEADLINE_KEY
+
+DEADLINE_EXCEEDED_REASON = "deadline_exceeded"
+
+
+def with_timeout(request: Request, timeout_seconds: float) -> Request:
+    """Return a request copy whose deadline is at most ``timeout_seconds`` away.
+
+    An existing, earlier deadline is kept so nested budgets only ever shrink.
+
+    Args:
+        request: Request to bound.
+        timeout_seconds: Latency budget from now, in seconds.
+
+    Returns:
+        A shallow request copy with ``metadata["deadline"]`` set.
+    """
+
+    deadline = time.time() + timeout_seconds
+    existing = request.metadata.get(DEADLINE_KEY)
+    if isinstance(existing, (int, float)):
+        deadline = min(deadline, float(existing))
+    bounded = request.model_copy(deep=False)
+    bounded.metadata = dict(request.metadata)
+    bounded.metadata[DEADLINE_KEY] = deadline
+    return bounded
+
+
+def remaining_seconds(metadata: Mapping[str, Any]) -> Optional[float]:
+    """Return the budget left before the metadata's deadline.
+
+    Args:
+        metadata: Request metadata.
+
+    Returns:
+        Seconds until the deadline (negative once passed), or None when the
+        request has no deadline.
+    """
+
+    deadline = metadata.get(DEADLINE_KEY)
+    if not isinstance(deadline, (int, float)):
+        return None
+    return float(deadline) - time.time()
+
+
+def deadline_exceeded_response(details: Dict[str, Any]) -> Response:
+    """Build the standard failure for a missed or unmeetable deadline.
+
+    Args:
+        details: Diagnostic details (remaining/estimated budget, last failure).
+
+    Returns:
+        A failed Response with reason ``deadline_exceeded``.
+    """
+
+    return Response(
+        success=False,
+        reason=DEADLINE_EXCEEDED_REASON,
+        details=details,
+        error_type=DeadlineExceededError,
+    )
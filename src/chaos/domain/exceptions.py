@@ -32,3 +32,21 @@ class ContextLengthError(LLMError):
     """Prompt exceeded model context limits."""
 
     pass
+
+
+class DeadlineExceededError(ChaosError):
+    """Request deadline passed or cannot be met by the remaining budget."""
+
+    pass
+
+
+class BudgetExceededError(ChaosError):
+    """Estimated run cost or latency exceeds the configured budget."""
+
+    pass
+
+
+class CircuitOpenError(ChaosError):
+    """Block call rejected because its circuit breaker is open."""
+
+    pass
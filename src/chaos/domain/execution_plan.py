@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+from chaos.domain.messages import Response
+
+if TYPE_CHECKING:
+    from chaos.domain.block import Block
+
+
+@dataclass(frozen=True)
+class CompiledBranch:
+    """Conditional branch with its condition resolved to a callable."""
+
+    condition_name: str
+    condition: Callable[[Response], bool]
+    target: int
+
+
+@dataclass(frozen=True)
+class CompiledParallel:
+    """Parallel fan-out/fan-in with its reducer resolved to a callable."""
+
+    branches: Tuple[int, ...]
+    reducer_name: str
+    reducer: Callable[[Dict[str, Response]], Response]
+    target: Optional[int]
+    max_workers: int
+
+
+@dataclass(frozen=True)
+class CompiledChoice:
+    """Choice among equivalent successors, decided by estimates at run time."""
+
+    candidates: Tuple[int, ...]
+    objective: str
+
+
+@dataclass(frozen=True)
+class CompiledTransition:
+    """Outgoing transition of one node, addressed by node index.
+
+    Exactly one shape applies: ``parallel`` is set for fan-out, ``choice``
+    for estimate-driven selection, ``branches`` is non-empty for conditional
+    routing, otherwise ``target`` is the linear successor (None for a
+    terminal node). ``stream_buffer`` is set when the linear successor
+    consumes this node's chunks while it runs.
+    """
+
+    target: Optional[int] = None
+    stream_buffer: Optional[int] = None
+    branches: Tuple[CompiledBranch, ...] = ()
+    parallel: Optional[CompiledParallel] = None
+    choice: Optional[CompiledChoice] = None
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """Immutable, index-based form of a validated composite graph.
+
+    Built once per graph configuration so the execution loop does no dict
+    lookups, registry resolution, or membership checks per hop.
+    """
+
+    node_names: Tuple[str, ...]
+    nodes: Tuple["Block", ...]
+    entry: int
+    transitions: Tuple[CompiledTransition, ...]
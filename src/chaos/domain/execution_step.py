@@ -0,0 +1,224 @@
+"""Blocking operations shared by the synchronous and asynchronous block engines.
+
+Block execution logic is written once, as generators that ``yield`` an
+``ExecutionStep`` wherever they would block and receive the step's result
+back. ``drive`` performs each step by calling it in the current thread;
+``drive_async`` awaits it on the running event loop. Exceptions raised by a
+step are thrown into the generator at the ``yield``, so its ``try`` blocks
+behave identically under both drivers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import partial
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Generator,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+
+Steps = Generator["ExecutionStep[Any]", Any, T]
+"""Generator form of an operation: yields steps and returns its result."""
+
+Handle = Union["Future[Any]", "asyncio.Future[Any]"]
+"""A spawned step: a thread-backed Future (sync) or an asyncio Task (async)."""
+
+
+@dataclass(frozen=True)
+class ExecutionStep(Generic[T]):
+    """One blocking operation, in both calling conventions.
+
+    Attributes:
+        run: Performs the operation in the calling thread.
+        run_async: Returns an awaitable performing it on the event loop.
+    """
+
+    run: Callable[[], T]
+    run_async: Callable[[], Awaitable[T]]
+
+
+def drive(steps: Steps[T]) -> T:
+    """Run ``steps`` to completion, performing each step synchronously.
+
+    Args:
+        steps: Generator to drive.
+
+    Returns:
+        The generator's return value.
+    """
+
+    try:
+        step = next(steps)
+        while True:
+            try:
+                result = step.run()
+            except BaseException as exc:
+                step = steps.throw(exc)
+            else:
+                step = steps.send(result)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def drive_async(steps: Steps[T]) -> T:
+    """Run ``steps`` to completion, awaiting each step on the event loop.
+
+    Cancellation of the awaiting task is thrown into the generator like any
+    other exception, so its cleanup runs before the cancellation propagates.
+
+    Args:
+        steps: Generator to drive.
+
+    Returns:
+        The generator's return value.
+    """
+
+    try:
+        step = next(steps)
+        while True:
+            try:
+                result = await step.run_async()
+            except BaseException as exc:
+                step = steps.throw(exc)
+            else:
+                step = steps.send(result)
+    except StopIteration as stop:
+        return stop.value
+
+
+def blocking_step(function: Callable[..., T], *args: Any) -> ExecutionStep[T]:
+    """Wrap a blocking call; the async driver runs it in a worker thread."""
+
+    return ExecutionStep(
+        partial(function, *args), partial(asyncio.to_thread, function, *args)
+    )
+
+
+def gather_step(
+    operations: Sequence[Callable[[], Steps[T]]],
+    max_concurrency: int,
+    stop: Optional[Callable[[T], bool]] = None,
+) -> ExecutionStep[List[T]]:
+    """Run independent operations concurrently with bounded concurrency.
+
+    Operations run on a thread pool (sync) or as semaphore-bounded tasks
+    (async). Results are returned in input order. With ``stop``, the sync
+    driver returns at the first result (in input order) matching it and
+    cancels operations that have not started; the matching result is the
+    last one returned.
+
+    Args:
+        operations: Factories of the generators to run.
+        max_concurrency: Maximum number of operations in flight.
+        stop: Optional predicate ending the wait early.
+
+    Returns:
+        Step producing the operations' results.
+    """
+
+    workers = max(1, min(len(operations), int(max_concurrency)))
+
+    def run() -> List[T]:
+        results: List[T] = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(lambda op: drive(op()), op) for op in operations]
+            for future in futures:
+                results.append(future.result())
+                if stop is not None and stop(results[-1]):
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        return results
+
+    async def run_async() -> List[T]:
+        semaphore = asyncio.Semaphore(workers)
+
+        async def bounded(operation: Callable[[], Steps[T]]) -> T:
+            async with semaphore:
+                return await drive_async(operation())
+
+        return list(await asyncio.gather(*(bounded(op) for op in operations)))
+
+    return ExecutionStep(run, run_async)
+
+
+def spawn_step(step: ExecutionStep[T]) -> ExecutionStep[Handle]:
+    """Start ``step`` in the background and return a handle to it.
+
+    The sync driver runs the step on its own thread; the async driver runs it
+    as a task. Handles are awaited with ``wait_first_step``, read with
+    ``result()`` and stopped with ``cancel_step``.
+    """
+
+    def run() -> Handle:
+        future: Future[T] = Future()
+
+        def target() -> None:
+            try:
+                future.set_result(step.run())
+            except BaseException as exc:
+                future.set_exception(exc)
+
+        future.set_running_or_notify_cancel()
+        threading.Thread(target=target, name="chaos-step").start()
+        return future
+
+    async def run_async() -> Handle:
+        return asyncio.ensure_future(step.run_async())
+
+    return ExecutionStep(run, run_async)
+
+
+def wait_first_step(
+    handles: Collection[Handle], timeout: Optional[float]
+) -> ExecutionStep[Set[Handle]]:
+    """Wait until a spawned step finishes or ``timeout`` seconds pass.
+
+    Returns:
+        Step producing the finished handles (empty on timeout).
+    """
+
+    def run() -> Set[Handle]:
+        done, _ = wait(handles, timeout=timeout, return_when=FIRST_COMPLETED)
+        return set(done)
+
+    async def run_async() -> Set[Handle]:
+        done, _ = await asyncio.wait(
+            handles, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+        return set(done)
+
+    return ExecutionStep(run, run_async)
+
+
+def cancel_step(handles: Collection[Handle]) -> ExecutionStep[None]:
+    """Stop spawned steps that are still running.
+
+    Tasks are cancelled and awaited. Threads cannot be interrupted, so the
+    sync driver leaves them to finish in the background.
+    """
+
+    def run() -> None:
+        return None
+
+    async def run_async() -> None:
+        for handle in handles:
+            handle.cancel()
+        await asyncio.gather(*handles, return_exceptions=True)
+
+    return ExecutionStep(run, run_async)
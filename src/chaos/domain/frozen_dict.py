@@ -0,0 +1,57 @@
+from copy import deepcopy
+from typing import Any, Dict, Mapping, NoReturn
+
+
+class FrozenDict(dict):
+    """Read-only dict shared structurally between requests.
+
+    Composite execution hands the same payload/context object to every child
+    and retry instead of copying it per hop. Writers take a mutable copy first
+    (``frozen.thaw()``, ``dict(frozen)`` or ``copy.deepcopy(frozen)``), which
+    is the copy-on-write step. Freezing is shallow: nested values are shared,
+    as they were with the previous per-hop shallow copies.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, mapping: Mapping[str, Any]) -> "FrozenDict":
+        """Return ``mapping`` if already frozen, otherwise a frozen copy."""
+
+        if type(mapping) is cls:
+            return mapping  # type: ignore[return-value]
+        return cls(mapping)
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(
+            "FrozenDict is read-only; copy it with dict(...) before modifying"
+        )
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def copy(self) -> Dict[str, Any]:
+        """Return a mutable shallow copy."""
+
+        return dict(self)
+
+    def thaw(self) -> Dict[str, Any]:
+        """Return a mutable shallow copy as a plain dict."""
+
+        return dict(self)
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        # A deep copy shares nothing, so it is handed out mutable.
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self) -> tuple[type, tuple[Dict[str, Any]]]:
+        return (FrozenDict, (dict(self),))
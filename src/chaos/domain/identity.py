@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, cast
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 from chaos.domain.instructions import Instructions
+from chaos.domain.knowledge_search_weights import KnowledgeSearchWeights
 from chaos.domain.memory_config import MemoryConfig
 from chaos.domain.memory_persona_config import MemoryPersonaConfig
 from chaos.domain.profile import Profile
@@ -375,6 +376,14 @@ class Identity(BaseModel):
         description="Explicit list of forbidden knowledge domains.",
         json_schema_extra={"weight": 7},
     )
+    knowledge_search: KnowledgeSearchWeights = Field(
+        default_factory=KnowledgeSearchWeights,
+        description=(
+            "Rank fusion weights used when hybrid (lexical + vector) knowledge "
+            "search is enabled."
+        ),
+        json_schema_extra={"weight": 6},
+    )
     tool_whitelist: Optional[List[str]] = Field(
         default=None,
         description=(
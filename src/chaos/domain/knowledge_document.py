@@ -0,0 +1,38 @@
+import hashlib
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class KnowledgeDocument(BaseModel):
+    """
+    Represents a document queued for ingestion into the knowledge base.
+    """
+
+    content: str = Field(..., description="The document text to store.")
+    domain: str = Field(..., description="The domain label for access control.")
+    metadata: Dict[str, Any] = Field(
+        default_factory=dict, description="Additional metadata to attach."
+    )
+    id: Optional[str] = Field(
+        default=None,
+        description=(
+            "Optional explicit document id. When omitted, a content hash of the "
+            "domain and content is used so re-ingestion is idempotent."
+        ),
+    )
+
+    def resolve_id(self) -> str:
+        """
+        Returns the stable id used to store this document.
+
+        Returns:
+            The explicit id, or a SHA-256 hash of the domain and content.
+        """
+        if self.id:
+            return self.id
+        digest = hashlib.sha256()
+        digest.update(self.domain.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(self.content.encode("utf-8"))
+        return digest.hexdigest()
@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+
+
+class KnowledgeIngestionReport(BaseModel):
+    """
+    Summarizes the outcome of a bulk knowledge ingestion run.
+    """
+
+    submitted: int = Field(default=0, description="Documents received from the caller.")
+    written: int = Field(default=0, description="Documents added or upserted.")
+    skipped: int = Field(
+        default=0, description="Documents skipped because their id already existed."
+    )
+    failed: int = Field(default=0, description="Documents in batches that failed.")
+    batches: int = Field(default=0, description="Number of storage batches issued.")
+    duration_ms: float = Field(default=0.0, description="Wall-clock duration.")
+
+    @property
+    def docs_per_second(self) -> float:
+        """
+        Returns ingestion throughput over submitted documents.
+
+        Returns:
+            Documents processed per second, or 0.0 when no time elapsed.
+        """
+        if self.duration_ms <= 0:
+            return 0.0
+        return self.submitted / (self.duration_ms / 1000)
@@ -0,0 +1,26 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class KnowledgeSearchResult(BaseModel):
+    """
+    Represents a scored knowledge search hit.
+    """
+
+    id: str = Field(..., description="Stored document id.")
+    content: str = Field(..., description="The document text.")
+    domain: Optional[str] = Field(default=None, description="The document domain.")
+    score: float = Field(..., description="Fused relevance score; higher is better.")
+    vector_rank: Optional[int] = Field(
+        default=None, description="1-based rank in the vector results, if present."
+    )
+    lexical_rank: Optional[int] = Field(
+        default=None, description="1-based rank in the lexical results, if present."
+    )
+    distance: Optional[float] = Field(
+        default=None, description="Vector distance, if the hit came from Chroma."
+    )
+    bm25: Optional[float] = Field(
+        default=None, description="BM25 score (lower is better), if lexical."
+    )
@@ -0,0 +1,33 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class KnowledgeSearchWeights(BaseModel):
+    """
+    Defines reciprocal rank fusion weights for hybrid knowledge search.
+
+    Args:
+        vector: Weight applied to the vector (embedding) ranking.
+        lexical: Weight applied to the lexical (BM25) ranking.
+        rrf_k: Rank smoothing constant for reciprocal rank fusion.
+    """
+
+    vector: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="Weight for the vector similarity ranking in hybrid search.",
+        json_schema_extra={"weight": 6},
+    )
+    lexical: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="Weight for the BM25 lexical ranking in hybrid search.",
+        json_schema_extra={"weight": 6},
+    )
+    rrf_k: int = Field(
+        default=60,
+        ge=1,
+        description="Reciprocal rank fusion smoothing constant.",
+        json_schema_extra={"weight": 4},
+    )
+
+    model_config = ConfigDict(extra="forbid")
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+
+
+class KnowledgeSyncReport(BaseModel):
+    """
+    Summarizes a directory sync into the knowledge base.
+    """
+
+    scanned: int = Field(default=0, description="Source files found on disk.")
+    unchanged: int = Field(default=0, description="Files skipped as unchanged.")
+    added: int = Field(default=0, description="New files ingested.")
+    updated: int = Field(default=0, description="Changed files re-ingested.")
+    removed: int = Field(default=0, description="Files deleted since last sync.")
+    failed: int = Field(default=0, description="Files that could not be synced.")
+    chunks_written: int = Field(default=0, description="Chunks embedded.")
+    chunks_deleted: int = Field(default=0, description="Stale chunks deleted.")
+    duration_ms: float = Field(default=0.0, description="Wall-clock duration.")
@@ -1,11 +1,15 @@
+import asyncio
+import inspect
 from typing import Any, Dict, List, Optional, Type
 from uuid import uuid4
 
 from pydantic import BaseModel, SecretStr
 
+from chaos.cache.block_result_cache import BlockResultCache
 from chaos.config import Config
 from chaos.domain.block import Block
 from chaos.domain.block_estimate import BlockEstimate
+from chaos.domain.deadline import deadline_exceeded_response, remaining_seconds
 from chaos.domain.error_sanitizer import (
     build_exception_details,
     sanitize_error_details,
@@ -17,7 +21,7 @@ from chaos.domain.exceptions import (
     SchemaError,
 )
 from chaos.domain.messages import Request, Response
-from chaos.domain.policy import BubblePolicy, RecoveryPolicy
+from chaos.domain.policy import BubblePolicy, HedgePolicy, RecoveryPolicy
 from chaos.llm.litellm_stats_adapter import LiteLLMStatsAdapter
 from chaos.llm.llm_executor import LLMExecutor
 from chaos.llm.llm_request import LLMRequest
@@ -43,6 +47,9 @@ class LLMPrimitive(Block):
         stats_adapter: Optional[LiteLLMStatsAdapter] = None,
         llm_service: Optional[LLMExecutor] = None,
         output_retries: int = 2,
+        result_cache: Optional[BlockResultCache] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        single_flight: bool = False,
     ):
         """Initialize the LLM primitive.
 
@@ -56,10 +63,21 @@ class LLMPrimitive(Block):
             stats_adapter: Optional stats adapter for LLM estimation.
             llm_service: Optional LLM executor override.
             output_retries: Number of PydanticAI output validation retries.
+            result_cache: Optional result cache; only used at temperature 0.
+            hedge_policy: Optional policy hedging slow calls when the
+                primitive runs as a composite node.
+            single_flight: Share one model call between concurrent identical
+                requests (same prompt, model, temperature and schema).
         """
         self._config = config or Config()
         resolved_model = model or self._config.get_model_name()
-        super().__init__(name, side_effect_class="idempotent")
+        super().__init__(
+            name,
+            side_effect_class="idempotent",
+            result_cache=result_cache,
+            hedge_policy=hedge_policy,
+            single_flight=single_flight,
+        )
         self._system_prompt = system_prompt
         self._output_data_model = output_data_model
         self._model = resolved_model
@@ -75,29 +93,68 @@ class LLMPrimitive(Block):
 
     def _execute_primitive(self, request: Request) -> Response:
         """Execute the LLM call with the given request payload."""
+        prepared = self._prepare_llm_request(request)
+        if isinstance(prepared, Response):
+            return prepared
+        return self._map_llm_response(prepared, self._llm_service.execute(prepared))
+
+    async def _execute_primitive_async(self, request: Request) -> Response:
+        """Execute the LLM call without blocking the event loop.
+
+        Uses the executor's ``execute_async`` when it provides one; otherwise
+        the synchronous ``execute`` runs in a worker thread.
+        """
+        prepared = self._prepare_llm_request(request)
+        if isinstance(prepared, Response):
+            return prepared
+        execute_async = getattr(self._llm_service, "execute_async", None)
+        if inspect.iscoroutinefunction(execute_async):
+            llm_response = await execute_async(prepared)
+        else:
+            llm_response = await asyncio.to_thread(self._llm_service.execute, prepared)
+        return self._map_llm_response(prepared, llm_response)
+
+    def _prepare_llm_request(self, request: Request) -> LLMRequest | Response:
+        """Build the LLM request for a block request.
+
+        Args:
+            request: Block request driving the LLM call.
+
+        Returns:
+            The LLMRequest, or a failed Response for an invalid payload.
+        """
         try:
             prompt = self._coerce_payload(request.payload)
         except ValueError as exc:
             return self._failure_response("invalid_payload", exc, SchemaError)
 
-        messages = self._build_messages(prompt)
-        model = self._model
-        execution_id = self._build_execution_id()
         api_base, api_key = self._resolve_api_settings()
-
-        llm_request = self._build_llm_request(
+        return self._build_llm_request(
             request=request,
-            messages=messages,
-            model=model,
-            execution_id=execution_id,
+            messages=self._build_messages(prompt),
+            model=self._model,
+            execution_id=self._build_execution_id(),
             attempt=1,
             api_base=api_base,
             api_key=api_key,
+            timeout_seconds=remaining_seconds(request.metadata),
         )
-        llm_response = self._llm_service.execute(llm_request)
+
+    def _map_llm_response(
+        self, llm_request: LLMRequest, llm_response: LLMResponse
+    ) -> Response:
+        """Map an LLM response to a block Response with usage metadata.
+
+        Args:
+            llm_request: Request sent to the LLM executor.
+            llm_response: Executor response.
+
+        Returns:
+            A Response carrying data or the mapped failure.
+        """
         response_metadata: Dict[str, Any] = {
-            "model": model,
-            "llm.execution_id": execution_id,
+            "model": llm_request.model,
+            "llm.execution_id": llm_request.execution_id,
             "llm.attempt": llm_request.attempt,
         }
         if llm_response.usage:
@@ -117,10 +174,38 @@ class LLMPrimitive(Block):
                 success=True, data=llm_response.data, metadata=response_metadata
             )
 
+        if llm_request.timeout_seconds is not None:
+            remaining = remaining_seconds(llm_request.metadata)
+            if remaining is not None and remaining <= 0:
+                # The provider gave up because the deadline-derived timeout hit.
+                failure = deadline_exceeded_response(
+                    {
+                        "timeout_ms": llm_request.timeout_seconds * 1000,
+                        "llm_reason": llm_response.reason,
+                    }
+                )
+                failure.metadata.update(response_metadata)
+                return failure
         failure = self._map_llm_failure(llm_response)
         failure.metadata.update(response_metadata)
         return failure
 
+    def is_memoizable(self) -> bool:
+        """LLM calls are only deterministic enough to cache at temperature 0."""
+
+        return self._temperature == 0
+
+    def memo_key_extras(self) -> Dict[str, Any]:
+        """Return the model configuration that determines the output."""
+
+        schema = self._output_data_model
+        return {
+            "model": self._model,
+            "temperature": self._temperature,
+            "system_prompt": self._system_prompt,
+            "output_data_model": f"{schema.__module__}.{schema.__qualname__}",
+        }
+
     @property
     def block_type(self) -> str:
         """Return the stable block type identifier."""
@@ -156,12 +241,12 @@ class LLMPrimitive(Block):
             update={
                 "llm_calls": int(llm_calls) if isinstance(llm_calls, int) else 1,
                 "model": str(model) if model is not None else None,
-                "input_tokens": int(input_tokens)
-                if isinstance(input_tokens, int)
-                else None,
-                "output_tokens": int(output_tokens)
-                if isinstance(output_tokens, int)
-                else None,
+                "input_tokens": (
+                    int(input_tokens) if isinstance(input_tokens, int) else None
+                ),
+                "output_tokens": (
+                    int(output_tokens) if isinstance(output_tokens, int) else None
+                ),
                 "block_executions": 1,
             }
         )
@@ -193,6 +278,7 @@ class LLMPrimitive(Block):
         attempt: int,
         api_base: Optional[str],
         api_key: Optional[SecretStr],
+        timeout_seconds: Optional[float] = None,
     ) -> LLMRequest:
         """Build the internal LLM request payload.
 
@@ -204,6 +290,7 @@ class LLMPrimitive(Block):
             attempt: Internal attempt number for the LLM call.
             api_base: Optional API base for proxy routing.
             api_key: Optional API key for provider access.
+            timeout_seconds: Optional provider timeout (remaining deadline).
 
         Returns:
             An LLMRequest instance.
@@ -221,6 +308,7 @@ class LLMPrimitive(Block):
             metadata=metadata,
             api_base=api_base,
             api_key=api_key,
+            timeout_seconds=timeout_seconds,
         )
 
     def _build_prior_estimate(
@@ -0,0 +1,47 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class LtmFilter(BaseModel):
+    """
+    Structured bounds applied to long-term memory retrieval.
+
+    Timestamps are ISO-8601 strings compared lexically, matching how
+    ``ltm_entries.ts`` is stored.
+
+    Args:
+        ts_start: Inclusive lower timestamp bound.
+        ts_end: Exclusive upper timestamp bound.
+        kinds: Allowed event kinds.
+        visibilities: Allowed visibility categories.
+    """
+
+    ts_start: Optional[str] = Field(
+        default=None, description="Inclusive lower ISO timestamp bound."
+    )
+    ts_end: Optional[str] = Field(
+        default=None, description="Exclusive upper ISO timestamp bound."
+    )
+    kinds: Optional[List[str]] = Field(
+        default=None, description="Allowed event kinds; null allows all."
+    )
+    visibilities: Optional[List[str]] = Field(
+        default=None, description="Allowed visibility categories; null allows all."
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+    def is_unbounded(self) -> bool:
+        """
+        Returns whether the filter places no restriction on entries.
+
+        Returns:
+            True when every bound is unset.
+        """
+        return (
+            self.ts_start is None
+            and self.ts_end is None
+            and self.kinds is None
+            and self.visibilities is None
+        )
@@ -0,0 +1,212 @@
+from functools import partial
+from typing import Any, Dict, List
+
+from chaos.domain.block import Block
+from chaos.domain.execution_step import Steps, drive, drive_async, gather_step
+from chaos.domain.messages import Request, Response
+from chaos.domain.response_metadata_keys import (
+    MAP_FAILURE_COUNT_KEY,
+    MAP_INDEX_KEY,
+    MAP_ITEM_COUNT_KEY,
+)
+from chaos.stats.block_attempt_record import BlockAttemptRecord
+
+DEFAULT_MAP_CONCURRENCY = 8
+AGGREGATED_USAGE_KEYS = ("llm_calls", "input_tokens", "output_tokens", "cost_usd")
+
+
+def _is_usage_value(value: Any) -> bool:
+    """Return True for numeric usage values (counts and costs, not flags)."""
+
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class MapBlock(Block):
+    """Block that applies one child block to every element of a list payload.
+
+    Each element runs as its own child execution (own span, own recovery via the
+    child's policy stack) with at most ``max_concurrency`` items in flight.
+    Results keep input order; failed items are reported alongside them rather
+    than aborting the whole map unless ``allow_partial`` is disabled. The map
+    itself records a single aggregated attempt in the stats store.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        child: Block,
+        items_key: str = "items",
+        item_key: str = "item",
+        max_concurrency: int = DEFAULT_MAP_CONCURRENCY,
+        allow_partial: bool = True,
+        **kwargs: Any,
+    ):
+        """Initialize the map block.
+
+        Args:
+            name: Stable identifier for this block instance.
+            child: Block executed once per list element.
+            items_key: Payload key holding the input list.
+            item_key: Payload key each child request receives its element under.
+            max_concurrency: Maximum number of elements executed concurrently.
+            allow_partial: When False, any failed element fails the map.
+            **kwargs: Forwarded to Block (stats_store, registries, ...).
+        """
+        self._child = child
+        self._items_key = items_key
+        self._item_key = item_key
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._allow_partial = allow_partial
+        kwargs.setdefault("side_effect_class", child.side_effect_class)
+        super().__init__(name, **kwargs)
+
+    def build(self) -> None:
+        """Map blocks have no graph; the child is fixed at construction."""
+        pass
+
+    @property
+    def child(self) -> Block:
+        """Block applied to each list element."""
+        return self._child
+
+    def _execute_primitive(self, request: Request) -> Response:
+        """Run the child over the list payload on a bounded thread pool."""
+        return drive(self._map_steps(request))
+
+    async def _execute_primitive_async(self, request: Request) -> Response:
+        """Run the child over the list payload as semaphore-bounded tasks."""
+        return await drive_async(self._map_steps(request))
+
+    def _map_steps(self, request: Request) -> Steps[Response]:
+        """Execute the child once per element, with recovery, and aggregate.
+
+        Args:
+            request: Map request.
+
+        Returns:
+            The aggregated map response.
+        """
+        items = request.payload.get(self._items_key)
+        if not isinstance(items, list):
+            return self._invalid_payload_response()
+        if not items:
+            return self._aggregate(items, [])
+
+        responses = yield gather_step(
+            [
+                partial(
+                    self._child_steps,
+                    self._child,
+                    self._item_request(request, index, item),
+                    self._item_node_name(index),
+                )
+                for index, item in enumerate(items)
+            ],
+            self._max_concurrency,
+        )
+        return self._aggregate(items, responses)
+
+    def _item_request(self, request: Request, index: int, item: Any) -> Request:
+        """Build the per-element parent request the child request derives from.
+
+        The list itself is replaced by the single element so children never see
+        (or copy) the full input.
+
+        Args:
+            request: Map request.
+            index: Element position in the input list.
+            item: Element value.
+
+        Returns:
+            Request whose payload carries the element under ``item_key``.
+        """
+        payload = {
+            key: value
+            for key, value in request.payload.items()
+            if key != self._items_key
+        }
+        payload[self._item_key] = item
+        item_request = request.model_copy(deep=False)
+        item_request.payload = payload
+        item_request.metadata = dict(request.metadata)
+        item_request.metadata[MAP_INDEX_KEY] = index
+        return item_request
+
+    def _item_node_name(self, index: int) -> str:
+        """Return the node name recorded for an element's child execution."""
+        return f"{self._child.name}[{index}]"
+
+    def _aggregate(self, items: List[Any], responses: List[Response]) -> Response:
+        """Combine per-element responses into the map response.
+
+        Args:
+            items: Input list.
+            responses: Child responses in input order.
+
+        Returns:
+            Response whose data holds ordered ``results`` (None for failed
+            elements) and ``failures`` with index, reason, and details.
+        """
+        results: List[Any] = []
+        failures: List[Dict[str, Any]] = []
+        usage: Dict[str, float] = {}
+        for index, response in enumerate(responses):
+            for key in AGGREGATED_USAGE_KEYS:
+                value = response.metadata.get(key)
+                if _is_usage_value(value):
+                    usage[key] = usage.get(key, 0) + value
+            if response.success:
+                results.append(response.data)
+                continue
+            results.append(None)
+            failures.append(
+                {
+                    "index": index,
+                    "reason": response.reason,
+                    "details": response.details,
+                }
+            )
+
+        metadata: Dict[str, Any] = {
+            MAP_ITEM_COUNT_KEY: len(items),
+            MAP_FAILURE_COUNT_KEY: len(failures),
+            **usage,
+        }
+        data = {"results": results, "failures": failures}
+        if failures and not self._allow_partial:
+            first = responses[failures[0]["index"]]
+            return Response(
+                success=False,
+                reason="map_item_failed",
+                data=data,
+                details={"failures": failures},
+                error_type=first.error_type or Exception,
+                metadata=metadata,
+            )
+        return Response(success=True, data=data, metadata=metadata)
+
+    def _invalid_payload_response(self) -> Response:
+        """Build the failure returned when the payload holds no list."""
+        return Response(
+            success=False,
+            reason="invalid_payload",
+            details={"error": f"MapBlock payload '{self._items_key}' must be a list"},
+            error_type=ValueError,
+        )
+
+    def _build_attempt_record(
+        self, request: Request, response: Response, duration_ms: float
+    ) -> BlockAttemptRecord:
+        """Build one aggregated stats record covering every element."""
+
+        record = super()._build_attempt_record(request, response, duration_ms)
+        metadata = response.metadata
+        item_count = metadata.get(MAP_ITEM_COUNT_KEY)
+        update: Dict[str, Any] = {
+            key: metadata[key]
+            for key in AGGREGATED_USAGE_KEYS
+            if _is_usage_value(metadata.get(key))
+        }
+        if isinstance(item_count, int):
+            update["block_executions"] = 1 + item_count
+        return record.model_copy(update=update)
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, Dict, Literal
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -11,6 +11,7 @@ class RecoveryType(Enum):
     REPAIR = "REPAIR"
     DEBUG = "DEBUG"
     BUBBLE = "BUBBLE"
+    CIRCUIT_BREAKER = "CIRCUIT_BREAKER"
 
 
 class RecoveryPolicy(BaseModel):
@@ -45,3 +46,62 @@ class BubblePolicy(RecoveryPolicy):
     """Policy to escalate failure to the parent."""
 
     type: RecoveryType = RecoveryType.BUBBLE
+
+
+class CircuitBreakerPolicy(RecoveryPolicy):
+    """Policy to stop calling a block whose recent attempts mostly fail.
+
+    Breaker state is shared by every block with the same stats identity. Once
+    the failure rate over the last ``window_size`` attempts reaches
+    ``failure_rate_threshold`` (after at least ``min_calls`` attempts), the
+    circuit opens and attempts fail immediately with ``circuit_open``. After
+    ``cooldown_seconds`` the circuit half-opens and lets
+    ``half_open_max_calls`` trial attempts through; a success closes it and a
+    failure opens it again.
+    """
+
+    type: RecoveryType = RecoveryType.CIRCUIT_BREAKER
+    failure_rate_threshold: float = Field(
+        default=0.5, description="Failure rate that opens the circuit"
+    )
+    min_calls: int = Field(
+        default=5, description="Attempts required before the rate is evaluated"
+    )
+    window_size: int = Field(
+        default=20, description="Number of recent attempts considered"
+    )
+    cooldown_seconds: float = Field(
+        default=30.0, description="Time the circuit stays open before a trial"
+    )
+    half_open_max_calls: int = Field(
+        default=1, description="Trial attempts allowed while half-open"
+    )
+
+
+class HedgePolicy(BaseModel):
+    """Configuration for hedging slow attempts of side-effect-safe blocks.
+
+    When a composite runs a child with a hedge policy and the attempt has not
+    returned after the child's observed ``quantile`` latency, a duplicate
+    attempt is launched (up to ``max_hedges``) and the first successful
+    response wins. Only blocks with side-effect class ``none`` or
+    ``idempotent`` are hedged.
+    """
+
+    quantile: float = Field(
+        default=0.95, description="Latency quantile after which to hedge"
+    )
+    min_samples: int = Field(
+        default=20, description="Successful attempts required to trust the quantile"
+    )
+    max_hedges: int = Field(
+        default=1, description="Maximum duplicate attempts per logical attempt"
+    )
+    min_delay_ms: float = Field(
+        default=0.0, description="Lower bound on the hedge delay"
+    )
+    fallback_delay_ms: Optional[float] = Field(
+        default=None,
+        description="Hedge delay used without enough samples; None disables "
+        "hedging until stats exist",
+    )
@@ -1,5 +1,23 @@
-"""Response metadata keys used by composite blocks."""
+"""Response metadata keys used by the block runtime."""
 
 COMPOSITE_SOURCE_KEY = "source"
 COMPOSITE_NAME_KEY = "composite"
 COMPOSITE_LAST_NODE_KEY = "last_node"
+COMPOSITE_PARALLEL_BRANCHES_KEY = "parallel_branches"
+MAP_ITEM_COUNT_KEY = "map_items"
+MAP_FAILURE_COUNT_KEY = "map_failures"
+MAP_INDEX_KEY = "map_index"
+NODE_PATH_KEY = "node_path"
+CACHE_STATUS_KEY = "cache"
+CACHE_TIER_KEY = "cache_tier"
+CACHE_STATUS_HIT = "hit"
+CACHE_STATUS_MISS = "miss"
+DEADLINE_KEY = "deadline"
+BRANCH_DECISIONS_KEY = "branch_decisions"
+GRAPH_PATH_KEY = "graph_path"
+HEDGE_KEY = "hedge"
+HEDGE_COUNT_KEY = "hedges"
+HEDGE_WON_KEY = "hedge_won"
+WORKER_PID_KEY = "worker_pid"
+WORKER_DURATION_KEY = "worker_duration_ms"
+COALESCED_KEY = "coalesced"
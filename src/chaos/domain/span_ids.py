@@ -0,0 +1,42 @@
+import itertools
+import os
+import secrets
+
+SPAN_ID_MASK = (1 << 64) - 1
+
+
+class SpanIdAllocator:
+    """Allocates 64-bit span ids from a random base plus a counter.
+
+    Minting a ``uuid4`` per hop reads the OS entropy source and formats a
+    36-character string; this allocator only increments a counter. Ids are
+    16 hex characters (the OTel span id width) and unique within a process;
+    the random base keeps separate processes from sharing a sequence.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the allocator with a fresh random base."""
+
+        self.reseed()
+
+    def reseed(self) -> None:
+        """Pick a new random base and restart the counter."""
+
+        self._base = secrets.randbits(64)
+        self._counter = itertools.count(1)
+
+    def next_id(self) -> str:
+        """Return the next span id."""
+
+        return f"{(self._base + next(self._counter)) & SPAN_ID_MASK:016x}"
+
+
+_ALLOCATOR = SpanIdAllocator()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_ALLOCATOR.reseed)
+
+
+def new_span_id() -> str:
+    """Return a new process-unique span id."""
+
+    return _ALLOCATOR.next_id()
@@ -0,0 +1,139 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from chaos.domain.block_estimate import BlockEstimate
+from chaos.domain.exceptions import BudgetExceededError
+from chaos.domain.messages import Response
+
+
+class AdmissionController:
+    """Estimate-driven admission control for block runs.
+
+    A run is rejected outright when its estimated mean cost or latency exceeds
+    the per-run budget. When ``max_inflight_cost_usd`` is set, admitted runs
+    reserve their estimated cost; a run that would push the in-flight total
+    past the limit is queued until capacity frees up, for at most
+    ``queue_timeout_seconds`` (or the caller's deadline, if sooner).
+    """
+
+    def __init__(
+        self,
+        max_cost_usd: Optional[float] = None,
+        max_time_ms: Optional[float] = None,
+        max_inflight_cost_usd: Optional[float] = None,
+        queue_timeout_seconds: float = 0.0,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            max_cost_usd: Per-run estimated cost budget.
+            max_time_ms: Per-run estimated latency budget.
+            max_inflight_cost_usd: Budget for the estimated cost of all
+                concurrently admitted runs.
+            queue_timeout_seconds: Longest time a run waits for in-flight
+                capacity before it is rejected.
+        """
+
+        self._max_cost_usd = max_cost_usd
+        self._max_time_ms = max_time_ms
+        self._max_inflight_cost_usd = max_inflight_cost_usd
+        self._queue_timeout_seconds = max(0.0, queue_timeout_seconds)
+        self._inflight_cost_usd = 0.0
+        self._inflight_runs = 0
+        self._condition = threading.Condition()
+
+    @property
+    def inflight_cost_usd(self) -> float:
+        """Estimated cost of currently admitted runs."""
+        return self._inflight_cost_usd
+
+    def acquire(
+        self, estimate: BlockEstimate, max_wait_seconds: Optional[float] = None
+    ) -> Optional[Response]:
+        """Admit a run, waiting for in-flight capacity if needed.
+
+        Args:
+            estimate: Estimate of the run to admit.
+            max_wait_seconds: Optional cap on queueing time (remaining deadline).
+
+        Returns:
+            None when admitted (call ``release`` afterwards), otherwise a
+            failed Response explaining the rejection.
+        """
+
+        details: Dict[str, Any] = {
+            "block_name": estimate.block_name,
+            "estimated_cost_usd": estimate.cost_usd_mean,
+            "estimated_time_ms": estimate.time_ms_mean,
+            "estimate_source": estimate.estimate_source.value,
+        }
+        if (
+            self._max_cost_usd is not None
+            and estimate.cost_usd_mean > self._max_cost_usd
+        ):
+            return self._rejection(
+                "budget_exceeded", details, max_cost_usd=self._max_cost_usd
+            )
+        if self._max_time_ms is not None and estimate.time_ms_mean > self._max_time_ms:
+            return self._rejection(
+                "budget_exceeded", details, max_time_ms=self._max_time_ms
+            )
+
+        wait = self._queue_timeout_seconds
+        if max_wait_seconds is not None:
+            wait = max(0.0, min(wait, max_wait_seconds))
+        give_up_at = time.monotonic() + wait
+        cost = estimate.cost_usd_mean
+        with self._condition:
+            while not self._fits(cost):
+                remaining = give_up_at - time.monotonic()
+                if remaining <= 0:
+                    return self._rejection(
+                        "admission_timeout",
+                        details,
+                        max_inflight_cost_usd=self._max_inflight_cost_usd,
+                        inflight_cost_usd=self._inflight_cost_usd,
+                        queued_ms=wait * 1000,
+                    )
+                self._condition.wait(remaining)
+            self._inflight_cost_usd += cost
+            self._inflight_runs += 1
+        return None
+
+    def release(self, estimate: BlockEstimate) -> None:
+        """Return the capacity reserved by an admitted run.
+
+        Args:
+            estimate: The estimate passed to ``acquire``.
+        """
+
+        with self._condition:
+            self._inflight_runs -= 1
+            self._inflight_cost_usd = (
+                max(0.0, self._inflight_cost_usd - estimate.cost_usd_mean)
+                if self._inflight_runs
+                else 0.0
+            )
+            self._condition.notify_all()
+
+    def _fits(self, cost: float) -> bool:
+        """Return True if a run of ``cost`` fits the in-flight budget.
+
+        A lone run is always admitted so one expensive run cannot starve.
+        """
+
+        if self._max_inflight_cost_usd is None or self._inflight_runs == 0:
+            return True
+        return self._inflight_cost_usd + cost <= self._max_inflight_cost_usd
+
+    @staticmethod
+    def _rejection(reason: str, details: Dict[str, Any], **limits: Any) -> Response:
+        """Build the failure returned for a rejected run."""
+
+        return Response(
+            success=False,
+            reason=reason,
+            details={**details, **limits},
+            error_type=BudgetExceededError,
+        )
@@ -0,0 +1,150 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Optional
+
+from chaos.domain.exceptions import CircuitOpenError
+from chaos.domain.messages import Response
+from chaos.domain.policy import CircuitBreakerPolicy
+
+CIRCUIT_OPEN_REASON = "circuit_open"
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe failure-rate circuit breaker for one block identity.
+
+    Outcomes are kept in a sliding window of the most recent attempts. The
+    breaker opens when the window's failure rate reaches the policy threshold,
+    rejects calls during the cool-down, then admits a bounded number of trial
+    calls whose outcome closes or re-opens it.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        policy: CircuitBreakerPolicy,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            key: Identity of the protected block (used in rejection details).
+            policy: Thresholds and timings.
+            clock: Monotonic time source in seconds (injectable for tests).
+        """
+
+        self._key = key
+        self._policy = policy
+        self._clock = clock
+        self._outcomes: Deque[bool] = deque(maxlen=max(1, policy.window_size))
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: ``closed``, ``open`` or ``half_open``."""
+
+        with self._lock:
+            return self._current_state()
+
+    def before_call(self) -> Optional[Response]:
+        """Ask permission to call the protected block.
+
+        Returns:
+            None when the call may proceed, otherwise a ``circuit_open``
+            failure Response.
+        """
+
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return None
+            if state == HALF_OPEN and self._trial_calls < max(
+                1, self._policy.half_open_max_calls
+            ):
+                self._trial_calls += 1
+                return None
+            return self._rejection(state)
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of a call admitted by ``before_call``.
+
+        Args:
+            success: Whether the call succeeded.
+        """
+
+        with self._lock:
+            state = self._current_state()
+            if state == HALF_OPEN:
+                if success:
+                    self._close()
+                else:
+                    self._open()
+                return
+            self._outcomes.append(not success)
+            if state == CLOSED and self._should_open():
+                self._open()
+
+    def rejection(self) -> Optional[Response]:
+        """Return the ``circuit_open`` failure if the circuit is open, else None."""
+
+        with self._lock:
+            state = self._current_state()
+            return self._rejection(state) if state == OPEN else None
+
+    def _current_state(self) -> str:
+        """Return the state, moving from open to half-open after the cool-down."""
+
+        if (
+            self._state == OPEN
+            and self._clock() - self._opened_at >= self._policy.cooldown_seconds
+        ):
+            self._state = HALF_OPEN
+            self._trial_calls = 0
+        return self._state
+
+    def _should_open(self) -> bool:
+        """Return True if the windowed failure rate reaches the threshold."""
+
+        calls = len(self._outcomes)
+        if calls < max(1, self._policy.min_calls):
+            return False
+        return sum(self._outcomes) / calls >= self._policy.failure_rate_threshold
+
+    def _open(self) -> None:
+        """Open the circuit and start the cool-down."""
+
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._trial_calls = 0
+
+    def _close(self) -> None:
+        """Close the circuit and forget past outcomes."""
+
+        self._state = CLOSED
+        self._outcomes.clear()
+        self._trial_calls = 0
+
+    def _rejection(self, state: str) -> Response:
+        """Build the failure returned while the circuit rejects calls."""
+
+        retry_after = max(
+            0.0,
+            self._policy.cooldown_seconds - (self._clock() - self._opened_at),
+        )
+        return Response(
+            success=False,
+            reason=CIRCUIT_OPEN_REASON,
+            details={
+                "circuit": self._key,
+                "state": state,
+                "retry_after_seconds": retry_after,
+            },
+            error_type=CircuitOpenError,
+        )
@@ -0,0 +1,50 @@
+import threading
+from typing import Dict, Optional, Tuple
+
+from chaos.domain.policy import CircuitBreakerPolicy
+from chaos.engine.circuit_breaker import CircuitBreaker
+from chaos.stats.block_stats_identity import BlockStatsIdentity
+
+
+class CircuitBreakerRegistry:
+    """Process-wide registry of circuit breakers keyed by block identity."""
+
+    _registry: Dict[str, CircuitBreaker] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def key(identity: BlockStatsIdentity) -> str:
+        """Return the breaker key for a block identity."""
+
+        return f"{identity.block_type}:{identity.block_name}:{identity.version or ''}"
+
+    @classmethod
+    def get(cls, key: str) -> Optional[CircuitBreaker]:
+        """Return the breaker for ``key``, if one has been created."""
+
+        return cls._registry.get(key)
+
+    @classmethod
+    def get_or_create(
+        cls, key: str, policy: CircuitBreakerPolicy
+    ) -> Tuple[CircuitBreaker, bool]:
+        """Return the breaker for ``key``, creating it from ``policy`` if needed.
+
+        Returns:
+            Tuple of (breaker, whether it was created by this call).
+        """
+
+        with cls._lock:
+            breaker = cls._registry.get(key)
+            if breaker is not None:
+                return breaker, False
+            breaker = CircuitBreaker(key, policy)
+            cls._registry[key] = breaker
+            return breaker, True
+
+    @classmethod
+    def clear(cls) -> None:
+        """Clear the registry (useful for testing)."""
+
+        with cls._lock:
+            cls._registry.clear()
@@ -73,6 +73,7 @@ class ContextRetriever:
             query=query,
             whitelist=knowledge_whitelist,
             blacklist=knowledge_blacklist,
+            weights=self.identity.knowledge_search,
         )
         if knowledge_context:
             context_parts.append(f"Reference Knowledge: {knowledge_context}")
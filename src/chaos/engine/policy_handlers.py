@@ -4,6 +4,7 @@ from chaos.domain.error_sanitizer import build_exception_details
 from chaos.domain.messages import Request, Response
 from chaos.domain.policy import (
     BubblePolicy,
+    CircuitBreakerPolicy,
     DebugPolicy,
     RecoveryPolicy,
     RecoveryType,
@@ -32,6 +33,9 @@ class PolicyHandler:
             return PolicyHandler.debug(policy, request, failure)
         elif isinstance(policy, BubblePolicy):
             return PolicyHandler.bubble(failure)
+        elif isinstance(policy, CircuitBreakerPolicy):
+            # Breaker bookkeeping happens in the composite runtime.
+            return failure
         else:
             # Fallback for when type field matches but class doesn't (deserialization edge cases)
             # or just simple duck typing check
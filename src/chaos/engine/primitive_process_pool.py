@@ -0,0 +1,175 @@
+import multiprocessing
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from time import perf_counter
+from typing import Any, List, Optional, Tuple
+
+from chaos.domain.messages import Request, Response
+from chaos.stats.block_attempt_record import BlockAttemptRecord
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+from chaos.stats.store_registry import set_default_store
+from chaos.trace.sink_registry import set_default_sink
+
+WorkerResult = Tuple[Response, List[BlockAttemptRecord], int, float]
+
+WORKER_BLOCK_CACHE_SIZE = 64
+
+# Worker-side cache of unpickled blocks, keyed by the parent's worker key.
+_WORKER_BLOCKS: "OrderedDict[str, Any]" = OrderedDict()
+
+
+def _initialize_worker() -> None:
+    """Prepare a pool worker process.
+
+    Importing the block runtime here moves its import cost to warm-up. The
+    worker keeps no stats or traces of its own: attempts recorded by nested
+    blocks are forwarded to the parent with each result.
+    """
+
+    import chaos.domain.block  # noqa: F401
+
+    set_default_sink(None)
+    set_default_store(InMemoryBlockStatsStore())
+
+
+def _worker_pid() -> int:
+    """Return the worker's pid; used to start workers ahead of time."""
+
+    return os.getpid()
+
+
+def _execute_in_worker(key: str, payload: bytes, request: Request) -> WorkerResult:
+    """Run a block's ``_execute_primitive`` inside a pool worker.
+
+    Args:
+        key: Stable key of the block; unpickled blocks are cached under it.
+        payload: Pickled block snapshot.
+        request: Request to execute.
+
+    Returns:
+        Tuple of (response, attempts recorded by nested blocks, worker pid,
+        execution time in milliseconds).
+    """
+
+    block = _WORKER_BLOCKS.get(key)
+    if block is None:
+        block = pickle.loads(payload)
+        _WORKER_BLOCKS[key] = block
+        while len(_WORKER_BLOCKS) > WORKER_BLOCK_CACHE_SIZE:
+            _WORKER_BLOCKS.popitem(last=False)
+    else:
+        _WORKER_BLOCKS.move_to_end(key)
+    store = InMemoryBlockStatsStore()
+    set_default_store(store)
+    start = perf_counter()
+    response = block._execute_primitive(request)
+    duration_ms = (perf_counter() - start) * 1000
+    return response, store.drain(), os.getpid(), duration_ms
+
+
+class PrimitiveProcessPool:
+    """Process-wide pool running CPU-bound primitives in worker processes.
+
+    The pool is created on first use. Workers start with ``forkserver`` where
+    available (``spawn`` otherwise), so threads in the parent are never forked.
+    A pool broken by a crashed worker is replaced on the next submission.
+    """
+
+    _executor: Optional[ProcessPoolExecutor] = None
+    _max_workers: Optional[int] = None
+    _start_method: Optional[str] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def configure(
+        cls, max_workers: Optional[int] = None, start_method: Optional[str] = None
+    ) -> None:
+        """Set pool parameters, replacing any running pool.
+
+        Args:
+            max_workers: Worker process count; defaults to the CPU count.
+            start_method: Multiprocessing start method override.
+        """
+
+        cls.shutdown()
+        with cls._lock:
+            cls._max_workers = max_workers
+            cls._start_method = start_method
+
+    @classmethod
+    def max_workers(cls) -> int:
+        """Return the configured worker count."""
+
+        return max(1, cls._max_workers or os.cpu_count() or 1)
+
+    @classmethod
+    def executor(cls) -> ProcessPoolExecutor:
+        """Return the running pool, creating it if needed."""
+
+        with cls._lock:
+            if cls._executor is None:
+                method = cls._start_method or (
+                    "forkserver"
+                    if "forkserver" in multiprocessing.get_all_start_methods()
+                    else "spawn"
+                )
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=cls.max_workers(),
+                    mp_context=multiprocessing.get_context(method),
+                    initializer=_initialize_worker,
+                )
+            return cls._executor
+
+    @classmethod
+    def warm_up(cls) -> int:
+        """Start workers ahead of the first real task.
+
+        Returns:
+            Number of distinct worker processes that answered.
+        """
+
+        executor = cls.executor()
+        futures = [executor.submit(_worker_pid) for _ in range(cls.max_workers())]
+        return len({future.result() for future in futures})
+
+    @classmethod
+    def submit(cls, key: str, payload: bytes, request: Request) -> "Future[Any]":
+        """Queue a primitive execution on the pool.
+
+        Args:
+            key: Stable key of the block.
+            payload: Pickled block snapshot.
+            request: Request to execute.
+
+        Returns:
+            Future resolving to a ``WorkerResult``.
+        """
+
+        executor = cls.executor()
+        try:
+            return executor.submit(_execute_in_worker, key, payload, request)
+        except BrokenProcessPool:
+            cls._discard(executor)
+            return cls.executor().submit(_execute_in_worker, key, payload, request)
+
+    @classmethod
+    def shutdown(cls, wait: bool = True) -> None:
+        """Stop the pool's workers (a new pool starts on next use)."""
+
+        with cls._lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    @classmethod
+    def _discard(cls, executor: ProcessPoolExecutor) -> None:
+        """Forget ``executor`` if it is still the current pool."""
+
+        with cls._lock:
+            if cls._executor is executor:
+                cls._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,82 @@
+from typing import Callable, Dict
+
+from chaos.domain.messages import Response
+
+
+class ReducerRegistry:
+    """Registry for fan-in reducers used by parallel transitions."""
+
+    _registry: Dict[str, Callable[[Dict[str, Response]], Response]] = {}
+
+    @classmethod
+    def register(cls, name: str):
+        """Decorator to register a reducer function."""
+
+        def wrapper(func: Callable[[Dict[str, Response]], Response]):
+            cls._registry[name] = func
+            return func
+
+        return wrapper
+
+    @classmethod
+    def get(cls, name: str) -> Callable[[Dict[str, Response]], Response]:
+        """Retrieve a reducer function by name."""
+        if name not in cls._registry:
+            raise ValueError(f"Reducer function '{name}' not found in registry")
+        return cls._registry[name]
+
+    @classmethod
+    def clear(cls):
+        """Clear the registry (useful for testing).
+
+        Note:
+            Built-in reducers are re-registered after clearing.
+        """
+        cls._registry.clear()
+        _register_builtin_reducers()
+
+
+def collect_by_node(responses: Dict[str, Response]) -> Response:
+    """Join branch outputs into a mapping of node name to data.
+
+    Args:
+        responses: Successful branch responses keyed by node name, in
+            declaration order.
+
+    Returns:
+        A successful Response whose data maps node names to branch data.
+    """
+
+    return Response(
+        success=True,
+        data={node_name: response.data for node_name, response in responses.items()},
+    )
+
+
+def collect_as_list(responses: Dict[str, Response]) -> Response:
+    """Join branch outputs into a list ordered by branch declaration.
+
+    Args:
+        responses: Successful branch responses keyed by node name, in
+            declaration order.
+
+    Returns:
+        A successful Response whose data is the list of branch data.
+    """
+
+    return Response(
+        success=True, data=[response.data for response in responses.values()]
+    )
+
+
+def _register_builtin_reducers() -> None:
+    """Register built-in reducers.
+
+    This function is intentionally idempotent.
+    """
+
+    ReducerRegistry._registry.setdefault("collect", collect_by_node)
+    ReducerRegistry._registry.setdefault("list", collect_as_list)
+
+
+_register_builtin_reducers()
@@ -0,0 +1,82 @@
+import threading
+from concurrent.futures import Future
+from typing import Dict, Optional, Tuple
+
+from chaos.domain.messages import Response
+
+
+class SingleFlight:
+    """Process-wide table of in-flight executions keyed by block and request.
+
+    The first caller for a key becomes the leader and runs the work; callers
+    arriving while it runs join the leader's future instead of executing. A
+    future resolved with None means the leader gave up (it was cancelled)
+    and each follower should run on its own.
+    """
+
+    _inflight: Dict[str, "Future[Optional[Response]]"] = {}
+    _coalesced = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def join(cls, key: str) -> Tuple["Future[Optional[Response]]", bool]:
+        """Join the flight for ``key``, starting one if none is running.
+
+        Returns:
+            Tuple of (shared future, whether the caller is the leader).
+        """
+
+        with cls._lock:
+            future = cls._inflight.get(key)
+            if future is not None:
+                cls._coalesced += 1
+                return future, False
+            future = Future()
+            cls._inflight[key] = future
+            return future, True
+
+    @classmethod
+    def finish(
+        cls,
+        key: str,
+        future: "Future[Optional[Response]]",
+        response: Optional[Response] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """End a flight and wake its followers.
+
+        Args:
+            key: Flight key.
+            future: The leader's future.
+            response: Shared result; None tells followers to run themselves.
+            error: Exception to raise in followers instead of a result.
+        """
+
+        with cls._lock:
+            if cls._inflight.get(key) is future:
+                del cls._inflight[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(response)
+
+    @classmethod
+    def coalesced_count(cls) -> int:
+        """Number of calls served by joining another caller's flight."""
+
+        return cls._coalesced
+
+    @classmethod
+    def in_flight(cls) -> int:
+        """Number of flights currently running."""
+
+        with cls._lock:
+            return len(cls._inflight)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget running flights and reset the counter (useful for testing)."""
+
+        with cls._lock:
+            cls._inflight.clear()
+            cls._coalesced = 0
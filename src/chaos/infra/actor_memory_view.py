@@ -1,7 +1,8 @@
 """Actor-scoped memory view."""
 
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
+from chaos.domain.ltm_filter import LtmFilter
 from chaos.infra.memory_view import MemoryView
 
 if TYPE_CHECKING:
@@ -16,18 +17,26 @@ class ActorMemoryView(MemoryView):
     def __init__(self, container: "MemoryContainer") -> None:
         self.container = container
 
-    def retrieve(self, query: str, n_results: int = 5) -> List[str]:
+    def retrieve(
+        self,
+        query: str,
+        n_results: int = 5,
+        ltm_filter: Optional[LtmFilter] = None,
+    ) -> List[str]:
         """
         Retrieves actor memories.
 
         Args:
             query: The query string.
             n_results: Maximum results to return.
+            ltm_filter: Optional timestamp, kind, and visibility bounds.
 
         Returns:
             A list of memory snippets.
         """
-        return self.container.retrieve_for_personas(["actor"], query, n_results)
+        return self.container.retrieve_for_personas(
+            ["actor"], query, n_results, ltm_filter=ltm_filter
+        )
 
     def get_recent_stm_as_string(self, limit: int = 1) -> str:
         """
@@ -1,30 +1,185 @@
 import chromadb
+import hashlib
+import heapq
+import re
+import threading
 import uuid
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from time import perf_counter
+from typing import Iterable, Iterator, List, Literal, Optional, Dict, Any
 from chaos.config import Config
+from chaos.domain.knowledge_document import KnowledgeDocument
+from chaos.domain.knowledge_ingestion_report import KnowledgeIngestionReport
+from chaos.domain.knowledge_search_result import KnowledgeSearchResult
+from chaos.domain.knowledge_search_weights import KnowledgeSearchWeights
+from chaos.infra.knowledge_lexical_index import KnowledgeLexicalIndex
 from chaos.infra.utils import logger
 
+DEFAULT_INGEST_BATCH_SIZE = 128
+DEFAULT_SEARCH_WORKERS = 8
+DEFAULT_HYBRID_CANDIDATES = 20
+DEFAULT_PARTITION_REFRESH_SECONDS = 30.0
+READABLE_PARTITION_PATTERN = re.compile(
+    r"^[A-Za-z0-9](?:[A-Za-z0-9_-]{0,30}[A-Za-z0-9])?$"
+)
+
 
 class KnowledgeLibrary:
     """
     Manages the static knowledge base using ChromaDB.
+
+    By default every domain shares one collection and access control is applied
+    as a metadata filter. In partitioned mode each domain lives in its own
+    collection, so whitelisted searches only touch the allowed partitions and
+    blacklisted domains are never queried at all.
+
+    An optional lexical index mirrors every write so exact identifiers and
+    error strings can be matched alongside embedding similarity.
     """
 
-    def __init__(self, config: Config, collection_name: str = "knowledge_base"):
+    def __init__(
+        self,
+        config: Config,
+        collection_name: str = "knowledge_base",
+        partitioned: bool = False,
+        max_search_workers: int = DEFAULT_SEARCH_WORKERS,
+        lexical_index: Optional[KnowledgeLexicalIndex] = None,
+        partition_refresh_seconds: float = DEFAULT_PARTITION_REFRESH_SECONDS,
+    ):
         """
         Initializes the knowledge library backed by ChromaDB.
 
         Args:
             config: Application configuration providing the storage path.
-            collection_name: The Chroma collection name to use.
+            collection_name: The Chroma collection name (or partition prefix).
+            partitioned: Store each domain in its own collection.
+            max_search_workers: Maximum partitions queried in parallel.
+            lexical_index: Optional BM25 index enabling hybrid search.
+            partition_refresh_seconds: Minimum interval between partition
+                listings on the search path; partitions written through this
+                library are known immediately, those created elsewhere are
+                picked up within this interval.
         """
         self.chroma_client = chromadb.PersistentClient(
             path=str(config.get_chroma_db_path())
         )
-        self.collection = self.chroma_client.get_or_create_collection(
-            name=collection_name
+        self.collection_name = collection_name
+        self.partitioned = partitioned
+        self.max_search_workers = max(1, int(max_search_workers))
+        self.lexical_index = lexical_index
+        self.partition_refresh_seconds = partition_refresh_seconds
+        self._partitions: Dict[str, Any] = {}
+        self._partitions_lock = threading.Lock()
+        self._partitions_refreshed_at: Optional[float] = None
+        self.collection: Any = None
+        if partitioned:
+            self.refresh_partitions()
+        else:
+            self.collection = self.chroma_client.get_or_create_collection(
+                name=collection_name
+            )
+
+    @classmethod
+    def from_config(cls, config: Config) -> "KnowledgeLibrary":
+        """
+        Builds a library using the storage mode selected in configuration.
+
+        Args:
+            config: Application configuration.
+
+        Returns:
+            A library, partitioned and/or hybrid as configured.
+        """
+        lexical_index = None
+        if config.use_knowledge_hybrid_search():
+            lexical_index = KnowledgeLexicalIndex(
+                config.get_knowledge_lexical_index_path()
+            )
+        return cls(
+            config,
+            partitioned=config.use_knowledge_partitions(),
+            lexical_index=lexical_index,
         )
 
+    def partition_name(self, domain: str) -> str:
+        """
+        Returns the collection name used for a domain partition.
+
+        Domains that are not valid collection-name fragments are hashed.
+
+        Args:
+            domain: The domain label.
+
+        Returns:
+            The partition collection name.
+        """
+        if READABLE_PARTITION_PATTERN.match(domain):
+            suffix = domain
+        else:
+            suffix = hashlib.sha256(domain.encode("utf-8")).hexdigest()[:16]
+        return f"{self.collection_name}__{suffix}"
+
+    def refresh_partitions(self) -> None:
+        """
+        Reloads the domain partition map from the Chroma client.
+        """
+        prefix = f"{self.collection_name}__"
+        partitions: Dict[str, Any] = {}
+        self._partitions_refreshed_at = perf_counter()
+        try:
+            for collection in self.chroma_client.list_collections():
+                domain = (collection.metadata or {}).get("domain")
+                if collection.name.startswith(prefix) and domain:
+                    partitions[domain] = collection
+        except Exception as e:
+            logger.error(f"Failed to list KnowledgeLibrary partitions: {e}")
+            return
+        with self._partitions_lock:
+            self._partitions = partitions
+
+    def _refresh_stale_partitions(self) -> None:
+        """
+        Reloads the partition map if it is older than the refresh interval.
+        """
+        refreshed_at = self._partitions_refreshed_at
+        if (
+            refreshed_at is None
+            or perf_counter() - refreshed_at >= self.partition_refresh_seconds
+        ):
+            self.refresh_partitions()
+
+    def _collection_for_domain(self, domain: str, create: bool) -> Any:
+        """
+        Returns the collection storing a domain.
+
+        Args:
+            domain: The domain label.
+            create: Create the partition when it does not exist.
+
+        Returns:
+            The collection, or None when the partition does not exist.
+        """
+        if not self.partitioned:
+            return self.collection
+        with self._partitions_lock:
+            cached = self._partitions.get(domain)
+        if cached is not None:
+            return cached
+        name = self.partition_name(domain)
+        if create:
+            collection = self.chroma_client.get_or_create_collection(
+                name=name, metadata={"domain": domain}
+            )
+        else:
+            try:
+                collection = self.chroma_client.get_collection(name=name)
+            except Exception:
+                return None
+        with self._partitions_lock:
+            self._partitions[domain] = collection
+        return collection
+
     def add_document(
         self, content: str, domain: str, metadata: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -36,54 +191,230 @@ class KnowledgeLibrary:
             domain: The domain label for access control.
             metadata: Optional metadata to attach.
         """
-        if metadata is None:
-            metadata = {}
-
-        metadata["domain"] = domain
+        stored_metadata = {**(metadata or {}), "domain": domain}
+        doc_id = str(uuid.uuid4())
 
         try:
-            self.collection.add(
-                documents=[content], metadatas=[metadata], ids=[str(uuid.uuid4())]
+            collection = self._collection_for_domain(domain, create=True)
+            collection.add(
+                documents=[content],
+                metadatas=[stored_metadata],
+                ids=[doc_id],
             )
+            if self.lexical_index is not None:
+                self.lexical_index.upsert([(doc_id, domain, content)])
         except Exception as e:
             logger.error(f"Failed to add to KnowledgeLibrary: {e}")
 
+    def add_documents(
+        self,
+        documents: Iterable[KnowledgeDocument],
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+        on_conflict: Literal["skip", "upsert"] = "skip",
+    ) -> KnowledgeIngestionReport:
+        """
+        Adds documents in batches using deterministic content-hash ids.
+
+        Re-ingesting the same documents is idempotent: existing ids are either
+        skipped or overwritten depending on ``on_conflict``. Duplicate ids within
+        one call are collapsed to the first occurrence.
+
+        Args:
+            documents: Documents to ingest; consumed lazily.
+            batch_size: Maximum number of documents per storage call.
+            on_conflict: "skip" to leave existing ids untouched, "upsert" to
+                overwrite them.
+
+        Returns:
+            A report with counts and throughput for the run.
+        """
+        report = KnowledgeIngestionReport()
+        start_time = perf_counter()
+        seen_ids: set[str] = set()
+        for batch in self._iter_batches(documents, max(1, int(batch_size))):
+            report.submitted += len(batch)
+            groups: Dict[str, Dict[str, KnowledgeDocument]] = {}
+            for document in batch:
+                doc_id = document.resolve_id()
+                if doc_id in seen_ids:
+                    report.skipped += 1
+                    continue
+                seen_ids.add(doc_id)
+                group_key = document.domain if self.partitioned else ""
+                groups.setdefault(group_key, {})[doc_id] = document
+            for group_key, unique in groups.items():
+                self._write_batch(group_key, unique, on_conflict, report)
+        report.duration_ms = (perf_counter() - start_time) * 1000
+        logger.info(
+            "KnowledgeLibrary ingestion complete: "
+            f"{report.written} written, {report.skipped} skipped, "
+            f"{report.failed} failed in {report.duration_ms:.1f}ms "
+            f"({report.docs_per_second:.1f} docs/s)"
+        )
+        return report
+
+    def delete_documents(self, ids: Iterable[str], domain: Optional[str] = None) -> int:
+        """
+        Deletes documents by id.
+
+        Args:
+            ids: Document ids to delete.
+            domain: Optional domain owning the ids. In partitioned mode this
+                limits the delete to one partition; otherwise all are scanned.
+
+        Returns:
+            The number of ids submitted for deletion, or 0 on failure.
+        """
+        id_list = list(ids)
+        if not id_list:
+            return 0
+        try:
+            if not self.partitioned:
+                collections = [self.collection]
+            elif domain is not None:
+                collections = [self._collection_for_domain(domain, create=False)]
+            else:
+                self.refresh_partitions()
+                with self._partitions_lock:
+                    collections = list(self._partitions.values())
+            for collection in collections:
+                if collection is not None:
+                    collection.delete(ids=id_list)
+            if self.lexical_index is not None:
+                self.lexical_index.delete(id_list)
+        except Exception as e:
+            logger.error(f"Failed to delete from KnowledgeLibrary: {e}")
+            return 0
+        return len(id_list)
+
+    def _write_batch(
+        self,
+        domain: str,
+        batch: Dict[str, KnowledgeDocument],
+        on_conflict: Literal["skip", "upsert"],
+        report: KnowledgeIngestionReport,
+    ) -> None:
+        """
+        Writes one batch of unique documents and updates the report.
+
+        Skipped documents are still mirrored into the lexical index so that an
+        index attached to an existing knowledge base is backfilled on re-ingest.
+
+        Args:
+            domain: Domain shared by the batch in partitioned mode.
+            batch: Mapping of resolved id to document.
+            on_conflict: Conflict strategy for existing ids.
+            report: Report updated in place.
+        """
+        try:
+            collection = self._collection_for_domain(domain, create=True)
+            lexical_rows = [
+                (doc_id, document.domain, document.content)
+                for doc_id, document in batch.items()
+            ]
+            if on_conflict == "skip":
+                existing = collection.get(ids=list(batch), include=[])
+                for doc_id in existing.get("ids") or []:
+                    if batch.pop(doc_id, None) is not None:
+                        report.skipped += 1
+                if not batch:
+                    self._index_lexical(lexical_rows)
+                    return
+            ids = list(batch)
+            contents = [batch[doc_id].content for doc_id in ids]
+            metadatas = [
+                {**batch[doc_id].metadata, "domain": batch[doc_id].domain}
+                for doc_id in ids
+            ]
+            report.batches += 1
+            if on_conflict == "upsert":
+                collection.upsert(documents=contents, metadatas=metadatas, ids=ids)
+            else:
+                collection.add(documents=contents, metadatas=metadatas, ids=ids)
+            report.written += len(ids)
+        except Exception as e:
+            report.failed += len(batch)
+            logger.error(f"Failed to add batch to KnowledgeLibrary: {e}")
+            return
+        self._index_lexical(lexical_rows)
+
+    def _index_lexical(self, rows: List[tuple[str, str, str]]) -> None:
+        """
+        Mirrors stored documents into the lexical index, if attached.
+
+        Args:
+            rows: (id, domain, content) triples.
+        """
+        if self.lexical_index is None:
+            return
+        try:
+            self.lexical_index.upsert(rows)
+        except Exception as e:
+            logger.error(f"Failed to update KnowledgeLibrary lexical index: {e}")
+
+    @staticmethod
+    def _iter_batches(
+        documents: Iterable[KnowledgeDocument], batch_size: int
+    ) -> Iterator[List[KnowledgeDocument]]:
+        """
+        Yields fixed-size batches from an iterable of documents.
+
+        Args:
+            documents: Documents to batch.
+            batch_size: Maximum documents per batch.
+
+        Yields:
+            Lists of up to ``batch_size`` documents.
+        """
+        iterator = iter(documents)
+        while batch := list(islice(iterator, batch_size)):
+            yield batch
+
     def search(
         self,
         query: str,
         n_results: int = 3,
         whitelist: Optional[List[str]] = None,
         blacklist: Optional[List[str]] = None,
+        weights: Optional[KnowledgeSearchWeights] = None,
     ) -> List[str]:
         """
         Searches for knowledge, adhering to access control.
 
+        When a lexical index is attached the vector and BM25 rankings are fused
+        (see ``search_scored``); otherwise this is a pure vector search.
+
         Args:
             query: The search query string.
             n_results: Maximum number of documents to return.
             whitelist: Allowed domain list.
             blacklist: Forbidden domain list.
+            weights: Optional rank fusion weights for hybrid search.
 
         Returns:
             A list of matching document strings.
         """
-        where_filter = {}
-
-        # Access Control Logic
-        if whitelist is not None:
-            where_filter["domain"] = {"$in": whitelist}
-        elif blacklist is not None:
-            where_filter["domain"] = {"$nin": blacklist}
+        if self.lexical_index is not None:
+            return [
+                result.content
+                for result in self.search_scored(
+                    query, n_results, whitelist, blacklist, weights
+                )
+            ]
 
-        # If where_filter is empty, pass None to avoid Chroma error if strictly typed?
-        # Chroma expects None if no filter.
-        final_where = where_filter if where_filter else None
+        if self.partitioned:
+            return [
+                hit[2]
+                for hit in self._search_partitions(
+                    query, n_results, whitelist, blacklist
+                )
+            ]
 
         try:
             results = self.collection.query(
                 query_texts=[query],
                 n_results=n_results,
-                where=final_where,  # type: ignore
+                where=self._where_filter(whitelist, blacklist),  # type: ignore
             )
 
             if results and results["documents"]:
@@ -92,3 +423,262 @@ class KnowledgeLibrary:
         except Exception as e:
             logger.error(f"Failed to search KnowledgeLibrary: {e}")
             return []
+
+    def search_scored(
+        self,
+        query: str,
+        n_results: int = 3,
+        whitelist: Optional[List[str]] = None,
+        blacklist: Optional[List[str]] = None,
+        weights: Optional[KnowledgeSearchWeights] = None,
+    ) -> List[KnowledgeSearchResult]:
+        """
+        Runs hybrid search and returns scored results.
+
+        Vector and lexical candidates are retrieved in parallel and merged with
+        weighted reciprocal rank fusion: ``score = sum(w / (rrf_k + rank))``.
+        Without a lexical index only the vector ranking contributes.
+
+        Args:
+            query: The search query string.
+            n_results: Maximum number of results to return.
+            whitelist: Allowed domain list.
+            blacklist: Forbidden domain list.
+            weights: Rank fusion weights; defaults to equal weighting.
+
+        Returns:
+            Results ordered by fused score, best first.
+        """
+        weights = weights or KnowledgeSearchWeights()
+        candidates = max(n_results, DEFAULT_HYBRID_CANDIDATES)
+        lexical_index = self.lexical_index if weights.lexical > 0 else None
+        if lexical_index is None:
+            vector_hits = self._vector_hits(query, candidates, whitelist, blacklist)
+            lexical_hits: List[tuple[str, str, str, float]] = []
+        else:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                vector_future = pool.submit(
+                    self._vector_hits, query, candidates, whitelist, blacklist
+                )
+                lexical_future = pool.submit(
+                    self._lexical_hits,
+                    lexical_index,
+                    query,
+                    candidates,
+                    whitelist,
+                    blacklist,
+                )
+                vector_hits = vector_future.result()
+                lexical_hits = lexical_future.result()
+
+        fused: Dict[str, KnowledgeSearchResult] = {}
+        for rank, (distance, doc_id, content, domain) in enumerate(vector_hits, 1):
+            result = fused.setdefault(
+                doc_id,
+                KnowledgeSearchResult(
+                    id=doc_id, content=content, domain=domain, score=0.0
+                ),
+            )
+            result.score += weights.vector / (weights.rrf_k + rank)
+            result.vector_rank = rank
+            result.distance = distance
+        for rank, (doc_id, domain, content, bm25) in enumerate(lexical_hits, 1):
+            result = fused.setdefault(
+                doc_id,
+                KnowledgeSearchResult(
+                    id=doc_id, content=content, domain=domain, score=0.0
+                ),
+            )
+            result.score += weights.lexical / (weights.rrf_k + rank)
+            result.lexical_rank = rank
+            result.bm25 = bm25
+        ranked = sorted(fused.values(), key=lambda result: (-result.score, result.id))
+        return ranked[:n_results]
+
+    @staticmethod
+    def _where_filter(
+        whitelist: Optional[List[str]], blacklist: Optional[List[str]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Builds the Chroma metadata filter for domain access control.
+
+        Args:
+            whitelist: Allowed domain list.
+            blacklist: Forbidden domain list.
+
+        Returns:
+            The where filter, or None when unrestricted.
+        """
+        if whitelist is not None:
+            return {"domain": {"$in": whitelist}}
+        if blacklist is not None:
+            return {"domain": {"$nin": blacklist}}
+        return None
+
+    def _vector_hits(
+        self,
+        query: str,
+        n_results: int,
+        whitelist: Optional[List[str]],
+        blacklist: Optional[List[str]],
+    ) -> List[tuple[float, str, str, Optional[str]]]:
+        """
+        Retrieves vector candidates ordered by distance.
+
+        Args:
+            query: The search query string.
+            n_results: Maximum number of candidates.
+            whitelist: Allowed domain list.
+            blacklist: Forbidden domain list.
+
+        Returns:
+            (distance, id, document, domain) tuples; empty on failure.
+        """
+        if self.partitioned:
+            return self._search_partitions(query, n_results, whitelist, blacklist)
+        try:
+            results = self.collection.query(
+                query_texts=[query],
+                n_results=n_results,
+                where=self._where_filter(whitelist, blacklist),  # type: ignore
+                include=["documents", "distances", "metadatas"],
+            )
+        except Exception as e:
+            logger.error(f"Failed to search KnowledgeLibrary: {e}")
+            return []
+        return self._unpack_query(results, None)
+
+    @staticmethod
+    def _lexical_hits(
+        lexical_index: KnowledgeLexicalIndex,
+        query: str,
+        n_results: int,
+        whitelist: Optional[List[str]],
+        blacklist: Optional[List[str]],
+    ) -> List[tuple[str, str, str, float]]:
+        """
+        Retrieves BM25 candidates, logging instead of raising on failure.
+
+        Args:
+            lexical_index: The lexical index to query.
+            query: The search query string.
+            n_results: Maximum number of candidates.
+            whitelist: Allowed domain list.
+            blacklist: Forbidden domain list.
+
+        Returns:
+            (id, domain, document, bm25) tuples; empty on failure.
+        """
+        try:
+            return lexical_index.search(query, n_results, whitelist, blacklist)
+        except Exception as e:
+            logger.error(f"Failed to search KnowledgeLibrary lexical index: {e}")
+            return []
+
+    def _search_partitions(
+        self,
+        query: str,
+        n_results: int,
+        whitelist: Optional[List[str]],
+        blacklist: Optional[List[str]],
+    ) -> List[tuple[float, str, str, Optional[str]]]:
+        """
+        Fans a query out to the permitted partitions and merges by distance.
+
+        Args:
+            query: The search query string.
+            n_results: Maximum number of documents to return.
+            whitelist: Allowed domain list; only these partitions are queried.
+            blacklist: Forbidden domain list; these partitions are skipped.
+
+        Returns:
+            The closest (distance, id, document, domain) hits across partitions.
+        """
+        if whitelist is not None:
+            partitions = [
+                (domain, collection)
+                for domain in dict.fromkeys(whitelist)
+                if (collection := self._collection_for_domain(domain, create=False))
+                is not None
+            ]
+        else:
+            self._refresh_stale_partitions()
+            forbidden = set(blacklist or [])
+            with self._partitions_lock:
+                partitions = [
+                    (domain, collection)
+                    for domain, collection in self._partitions.items()
+                    if domain not in forbidden
+                ]
+        if not partitions:
+            return []
+
+        if len(partitions) == 1:
+            hits = self._query_partition(*partitions[0], query, n_results)
+        else:
+            workers = min(self.max_search_workers, len(partitions))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(
+                    lambda partition: self._query_partition(
+                        *partition, query, n_results
+                    ),
+                    partitions,
+                )
+                hits = [hit for partition_hits in results for hit in partition_hits]
+        return heapq.nsmallest(n_results, hits, key=lambda hit: hit[0])
+
+    @classmethod
+    def _query_partition(
+        cls, domain: str, collection: Any, query: str, n_results: int
+    ) -> List[tuple[float, str, str, Optional[str]]]:
+        """
+        Queries a single partition.
+
+        Args:
+            domain: The partition domain.
+            collection: The partition collection.
+            query: The search query string.
+            n_results: Maximum number of documents to return.
+
+        Returns:
+            (distance, id, document, domain) tuples; empty on failure.
+        """
+        try:
+            results = collection.query(
+                query_texts=[query],
+                n_results=n_results,
+                include=["documents", "distances"],
+            )
+        except Exception as e:
+            logger.error(f"Failed to search KnowledgeLibrary partition: {e}")
+            return []
+        return cls._unpack_query(results, domain)
+
+    @staticmethod
+    def _unpack_query(
+        results: Any, domain: Optional[str]
+    ) -> List[tuple[float, str, str, Optional[str]]]:
+        """
+        Flattens a single-query Chroma result into hit tuples.
+
+        Args:
+            results: The Chroma query result.
+            domain: Domain to report, or None to read it from metadatas.
+
+        Returns:
+            (distance, id, document, domain) tuples in result order.
+        """
+        results = results or {}
+        ids = (results.get("ids") or [[]])[0]
+        documents = (results.get("documents") or [[]])[0]
+        distances = (results.get("distances") or [[]])[0]
+        metadatas = (results.get("metadatas") or [[]])[0] or []
+        hits = []
+        for index, (doc_id, document, distance) in enumerate(
+            zip(ids, documents, distances)
+        ):
+            hit_domain = domain
+            if hit_domain is None and index < len(metadatas):
+                hit_domain = (metadatas[index] or {}).get("domain")
+            hits.append((distance, doc_id, document, hit_domain))
+        return hits
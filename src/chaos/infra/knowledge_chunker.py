@@ -0,0 +1,116 @@
+"""Heading- and window-based text chunking for knowledge ingestion."""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+HEADING_PATTERN = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$")
+DEFAULT_MAX_TOKENS = 400
+DEFAULT_OVERLAP_TOKENS = 50
+
+
+@dataclass(frozen=True)
+class TextChunk:
+    """
+    Represents one chunk of a source document.
+    """
+
+    index: int
+    heading: Optional[str]
+    content: str
+
+
+class KnowledgeChunker:
+    """
+    Splits documents into chunks sized for embedding.
+
+    Markdown is first split on headings so chunks do not straddle sections;
+    any section longer than ``max_tokens`` is then split into overlapping
+    windows. Tokens are approximated by whitespace-separated words.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+    ) -> None:
+        """
+        Initializes the chunker.
+
+        Args:
+            max_tokens: Maximum approximate tokens per chunk.
+            overlap_tokens: Tokens repeated between consecutive windows.
+        """
+        self.max_tokens = max(1, int(max_tokens))
+        self.overlap_tokens = min(max(0, int(overlap_tokens)), self.max_tokens - 1)
+
+    def chunk(self, text: str, markdown: bool = True) -> List[TextChunk]:
+        """
+        Splits text into chunks.
+
+        Args:
+            text: The document text.
+            markdown: Whether to split on markdown headings first.
+
+        Returns:
+            Ordered chunks; empty sections are dropped.
+        """
+        sections = self._split_sections(text) if markdown else [(None, text)]
+        chunks: List[TextChunk] = []
+        for heading, body in sections:
+            for window in self._split_windows(body):
+                chunks.append(
+                    TextChunk(index=len(chunks), heading=heading, content=window)
+                )
+        return chunks
+
+    def _split_sections(self, text: str) -> List[tuple[Optional[str], str]]:
+        """
+        Splits markdown into (heading, section text) pairs.
+
+        Args:
+            text: Markdown text.
+
+        Returns:
+            Sections in document order; section text includes its heading line.
+        """
+        sections: List[tuple[Optional[str], str]] = []
+        heading: Optional[str] = None
+        lines: List[str] = []
+        in_fence = False
+        for line in text.splitlines():
+            if line.lstrip().startswith("```"):
+                in_fence = not in_fence
+            match = None if in_fence else HEADING_PATTERN.match(line)
+            if match:
+                sections.append((heading, "\n".join(lines)))
+                heading = match.group(1)
+                lines = [line]
+                continue
+            lines.append(line)
+        sections.append((heading, "\n".join(lines)))
+        return [(h, body) for h, body in sections if body.strip()]
+
+    def _split_windows(self, text: str) -> List[str]:
+        """
+        Splits a section into overlapping token windows.
+
+        Args:
+            text: Section text.
+
+        Returns:
+            The section unchanged if it fits, otherwise window strings.
+        """
+        stripped = text.strip()
+        if not stripped:
+            return []
+        words = stripped.split()
+        if len(words) <= self.max_tokens:
+            return [stripped]
+        step = self.max_tokens - self.overlap_tokens
+        windows: List[str] = []
+        for start in range(0, len(words), step):
+            windows.append(" ".join(words[start : start + self.max_tokens]))
+            if start + self.max_tokens >= len(words):
+                break
+        return windows
@@ -0,0 +1,144 @@
+"""SQLite FTS5 lexical index maintained alongside the knowledge base."""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class KnowledgeLexicalIndex:
+    """
+    BM25 full-text index over knowledge documents.
+
+    Vector search misses exact identifiers such as API names and error strings;
+    this index complements it with token matching. Underscores are treated as
+    token characters so identifiers like ``max_steps`` stay whole.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """
+        Initializes the index backed by SQLite FTS5.
+
+        Args:
+            db_path: Path to the SQLite database file.
+        """
+        self.db_path = db_path
+        if str(db_path) != ":memory:":
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self.connection:
+            self.connection.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS knowledge_fts USING fts5(
+                  doc_id UNINDEXED,
+                  domain UNINDEXED,
+                  content,
+                  tokenize = "unicode61 tokenchars '_'"
+                )
+                """)
+
+    def close(self) -> None:
+        """
+        Closes the underlying SQLite connection.
+        """
+        self.connection.close()
+
+    def upsert(self, documents: Iterable[tuple[str, str, str]]) -> None:
+        """
+        Inserts or replaces documents in the index.
+
+        Args:
+            documents: (id, domain, content) triples.
+        """
+        rows = list(documents)
+        if not rows:
+            return
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "DELETE FROM knowledge_fts WHERE doc_id = ?",
+                [(doc_id,) for doc_id, _, _ in rows],
+            )
+            self.connection.executemany(
+                "INSERT INTO knowledge_fts (doc_id, domain, content) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def delete(self, ids: Iterable[str]) -> None:
+        """
+        Removes documents from the index.
+
+        Args:
+            ids: Document ids to remove.
+        """
+        id_list = list(ids)
+        if not id_list:
+            return
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "DELETE FROM knowledge_fts WHERE doc_id = ?",
+                [(doc_id,) for doc_id in id_list],
+            )
+
+    def search(
+        self,
+        query: str,
+        n_results: int,
+        whitelist: Optional[List[str]] = None,
+        blacklist: Optional[List[str]] = None,
+    ) -> List[tuple[str, str, str, float]]:
+        """
+        Ranks documents by BM25 against the query tokens.
+
+        Args:
+            query: Free-text query; tokens are OR-ed together.
+            n_results: Maximum number of hits.
+            whitelist: Allowed domain list.
+            blacklist: Forbidden domain list.
+
+        Returns:
+            (id, domain, content, bm25) tuples, best first. BM25 scores are
+            negative and lower is better, as reported by FTS5.
+        """
+        expression = self.match_expression(query)
+        if expression is None or whitelist == []:
+            return []
+        sql = (
+            "SELECT doc_id, domain, content, bm25(knowledge_fts) AS score "
+            "FROM knowledge_fts WHERE knowledge_fts MATCH ?"
+        )
+        params: list[object] = [expression]
+        domains = whitelist if whitelist is not None else blacklist
+        if domains:
+            placeholders = ",".join(["?"] * len(domains))
+            operator = "IN" if whitelist is not None else "NOT IN"
+            sql += f" AND domain {operator} ({placeholders})"
+            params.extend(domains)
+        sql += " ORDER BY score LIMIT ?"
+        params.append(n_results)
+        with self._lock:
+            rows = self.connection.execute(sql, params).fetchall()
+        return [
+            (row["doc_id"], row["domain"], row["content"], row["score"]) for row in rows
+        ]
+
+    @staticmethod
+    def match_expression(query: str) -> Optional[str]:
+        """
+        Builds a safe FTS5 MATCH expression from free text.
+
+        Args:
+            query: Free-text query.
+
+        Returns:
+            Quoted tokens joined with OR, or None when the query has no tokens.
+        """
+        tokens = list(dict.fromkeys(TOKEN_PATTERN.findall(query)))
+        if not tokens:
+            return None
+        return " OR ".join(f'"{token}"' for token in tokens)
@@ -0,0 +1,98 @@
+"""Persistent manifest of files synced into the knowledge base."""
+
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+from chaos.infra.utils import logger
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ManifestEntry:
+    """
+    Sync state for a single source file.
+    """
+
+    mtime_ns: int
+    size: int
+    sha256: str
+    chunk_ids: List[str] = field(default_factory=list)
+
+
+class KnowledgeManifest:
+    """
+    Tracks (path, mtime, size, hash, chunk ids) for a synced directory.
+
+    The manifest lets a sync skip files whose stat is unchanged without reading
+    them, and delete exactly the chunks belonging to changed or removed files.
+    """
+
+    def __init__(self, path: Path, entries: Dict[str, ManifestEntry]) -> None:
+        """
+        Initializes a manifest.
+
+        Args:
+            path: Location of the manifest JSON file.
+            entries: Mapping of relative file path to sync state.
+        """
+        self.path = path
+        self.entries = entries
+
+    @classmethod
+    def load(cls, path: Path) -> "KnowledgeManifest":
+        """
+        Loads a manifest from disk, starting empty when missing or invalid.
+
+        Args:
+            path: Location of the manifest JSON file.
+
+        Returns:
+            The loaded manifest.
+        """
+        if not path.exists():
+            return cls(path, {})
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            if payload.get("version") != MANIFEST_VERSION:
+                raise ValueError(f"unsupported version {payload.get('version')}")
+            entries = {
+                rel_path: ManifestEntry(**entry)
+                for rel_path, entry in payload.get("files", {}).items()
+            }
+        except Exception as exc:
+            logger.warning(f"Ignoring invalid knowledge manifest {path}: {exc}")
+            return cls(path, {})
+        return cls(path, entries)
+
+    def save(self) -> None:
+        """
+        Atomically writes the manifest to disk.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": MANIFEST_VERSION,
+            "files": {
+                rel_path: asdict(entry)
+                for rel_path, entry in sorted(self.entries.items())
+            },
+        }
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                delete=False,
+                dir=self.path.parent,
+                mode="w",
+                encoding="utf-8",
+            ) as tmp_file:
+                json.dump(payload, tmp_file)
+                temp_path = Path(tmp_file.name)
+            os.replace(temp_path, self.path)
+        except Exception:
+            if temp_path and temp_path.exists():
+                temp_path.unlink()
+            raise
@@ -0,0 +1,264 @@
+"""Incremental directory sync into the knowledge base."""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from chaos.domain.knowledge_document import KnowledgeDocument
+from chaos.domain.knowledge_sync_report import KnowledgeSyncReport
+from chaos.infra.knowledge import KnowledgeLibrary
+from chaos.infra.knowledge_chunker import KnowledgeChunker
+from chaos.infra.knowledge_manifest import KnowledgeManifest, ManifestEntry
+from chaos.infra.utils import logger
+
+SYNC_SUFFIXES = frozenset({".md", ".markdown", ".txt"})
+MARKDOWN_SUFFIXES = frozenset({".md", ".markdown"})
+DEFAULT_SYNC_WORKERS = 4
+
+
+@dataclass
+class FileSyncResult:
+    """
+    Outcome of reading, hashing, and chunking one source file.
+    """
+
+    rel_path: str
+    entry: Optional[ManifestEntry] = None
+    documents: List[KnowledgeDocument] = field(default_factory=list)
+    content_changed: bool = True
+    error: Optional[str] = None
+
+
+class KnowledgeSync:
+    """
+    Syncs a directory of markdown/text files into a knowledge domain.
+
+    Files whose size and mtime match the manifest are skipped without being
+    read. Changed files are read, hashed, and chunked on a worker pool; only
+    chunks that did not exist before are embedded, and chunks belonging to
+    changed or deleted files are removed.
+    """
+
+    def __init__(
+        self,
+        library: KnowledgeLibrary,
+        chunker: Optional[KnowledgeChunker] = None,
+        max_workers: int = DEFAULT_SYNC_WORKERS,
+    ) -> None:
+        """
+        Initializes the sync pipeline.
+
+        Args:
+            library: Knowledge library receiving the chunks.
+            chunker: Optional chunker override.
+            max_workers: Worker threads used to read and chunk files.
+        """
+        self.library = library
+        self.chunker = chunker or KnowledgeChunker()
+        self.max_workers = max(1, int(max_workers))
+
+    def sync(self, root: Path, domain: str, manifest_path: Path) -> KnowledgeSyncReport:
+        """
+        Brings the knowledge domain in line with the directory contents.
+
+        Manifest changes are only persisted once the matching writes and
+        deletes succeed, so a failed sync is retried in full next time.
+
+        Args:
+            root: Directory to sync.
+            domain: Knowledge domain assigned to every chunk.
+            manifest_path: Manifest file tracking this root/domain pair.
+
+        Returns:
+            A report describing what changed.
+        """
+        start_time = perf_counter()
+        root = root.resolve()
+        manifest = KnowledgeManifest.load(manifest_path)
+        report = KnowledgeSyncReport()
+        files = self._scan(root)
+        report.scanned = len(files)
+
+        pending: List[tuple[str, Path]] = []
+        for rel_path, path in files.items():
+            entry = manifest.entries.get(rel_path)
+            try:
+                stat = path.stat()
+            except OSError:
+                pending.append((rel_path, path))
+                continue
+            if (
+                entry is not None
+                and entry.mtime_ns == stat.st_mtime_ns
+                and entry.size == stat.st_size
+            ):
+                report.unchanged += 1
+            else:
+                pending.append((rel_path, path))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(
+                pool.map(
+                    lambda item: self._process_file(
+                        root, domain, item[0], item[1], manifest.entries.get(item[0])
+                    ),
+                    pending,
+                )
+            )
+
+        new_documents: List[KnowledgeDocument] = []
+        stale_ids: List[str] = []
+        updates: Dict[str, ManifestEntry] = {}
+        added = updated = 0
+        for result in results:
+            if result.error is not None or result.entry is None:
+                logger.error(f"Failed to sync {result.rel_path}: {result.error}")
+                report.failed += 1
+                continue
+            previous = manifest.entries.get(result.rel_path)
+            if not result.content_changed:
+                manifest.entries[result.rel_path] = result.entry
+                report.unchanged += 1
+                continue
+            old_ids = set(previous.chunk_ids) if previous else set()
+            new_ids = set(result.entry.chunk_ids)
+            new_documents.extend(
+                document for document in result.documents if document.id not in old_ids
+            )
+            stale_ids.extend(sorted(old_ids - new_ids))
+            updates[result.rel_path] = result.entry
+            if previous is None:
+                added += 1
+            else:
+                updated += 1
+
+        removed = sorted(set(manifest.entries) - set(files))
+        for rel_path in removed:
+            stale_ids.extend(manifest.entries[rel_path].chunk_ids)
+
+        ingestion = self.library.add_documents(new_documents, on_conflict="upsert")
+        report.chunks_written = ingestion.written
+        deleted = 0
+        if ingestion.failed == 0:
+            deleted = self.library.delete_documents(stale_ids, domain=domain)
+        if ingestion.failed or deleted != len(stale_ids):
+            report.failed += added + updated + len(removed)
+        else:
+            manifest.entries.update(updates)
+            for rel_path in removed:
+                del manifest.entries[rel_path]
+            report.added = added
+            report.updated = updated
+            report.removed = len(removed)
+            report.chunks_deleted = deleted
+        manifest.save()
+        report.duration_ms = (perf_counter() - start_time) * 1000
+        return report
+
+    def _scan(self, root: Path) -> Dict[str, Path]:
+        """
+        Lists syncable files under a root, skipping hidden paths.
+
+        Args:
+            root: Directory to scan.
+
+        Returns:
+            Mapping of POSIX relative path to absolute path.
+        """
+        files: Dict[str, Path] = {}
+        for path in sorted(root.rglob("*")):
+            rel = path.relative_to(root)
+            if any(part.startswith(".") for part in rel.parts):
+                continue
+            if path.suffix.lower() in SYNC_SUFFIXES and path.is_file():
+                files[rel.as_posix()] = path
+        return files
+
+    def _process_file(
+        self,
+        root: Path,
+        domain: str,
+        rel_path: str,
+        path: Path,
+        previous: Optional[ManifestEntry],
+    ) -> FileSyncResult:
+        """
+        Reads, hashes, and chunks one file.
+
+        Args:
+            root: Synced root directory.
+            domain: Knowledge domain for the chunks.
+            rel_path: POSIX path relative to the root.
+            path: Absolute file path.
+            previous: Manifest entry from the previous sync, if any.
+
+        Returns:
+            The file result; chunks are omitted when content is unchanged.
+        """
+        try:
+            stat = path.stat()
+            raw = path.read_bytes()
+        except OSError as exc:
+            return FileSyncResult(rel_path=rel_path, error=str(exc))
+
+        sha256 = hashlib.sha256(raw).hexdigest()
+        if previous is not None and previous.sha256 == sha256:
+            return FileSyncResult(
+                rel_path=rel_path,
+                entry=ManifestEntry(
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                    sha256=sha256,
+                    chunk_ids=list(previous.chunk_ids),
+                ),
+                content_changed=False,
+            )
+
+        text = raw.decode("utf-8", errors="replace")
+        markdown = path.suffix.lower() in MARKDOWN_SUFFIXES
+        documents: Dict[str, KnowledgeDocument] = {}
+        for chunk in self.chunker.chunk(text, markdown=markdown):
+            chunk_id = self._chunk_id(domain, rel_path, chunk.content)
+            if chunk_id in documents:
+                continue
+            metadata = {"source": rel_path, "chunk": chunk.index}
+            if chunk.heading:
+                metadata["heading"] = chunk.heading
+            documents[chunk_id] = KnowledgeDocument(
+                id=chunk_id, content=chunk.content, domain=domain, metadata=metadata
+            )
+        return FileSyncResult(
+            rel_path=rel_path,
+            entry=ManifestEntry(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                sha256=sha256,
+                chunk_ids=list(documents),
+            ),
+            documents=list(documents.values()),
+        )
+
+    @staticmethod
+    def _chunk_id(domain: str, rel_path: str, content: str) -> str:
+        """
+        Builds a stable chunk id scoped to domain and source file.
+
+        The path is relative to the synced root, so moving the root or
+        syncing another checkout keeps existing ids.
+
+        Args:
+            domain: Knowledge domain.
+            rel_path: POSIX path relative to the root.
+            content: Chunk text.
+
+        Returns:
+            A SHA-256 hex digest.
+        """
+        digest = hashlib.sha256()
+        for part in (domain, rel_path, content):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections import deque
 import json
+import math
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 from uuid import uuid4
 
@@ -11,6 +12,7 @@ import chromadb
 
 from chaos.config import Config
 from chaos.domain import Identity
+from chaos.domain.ltm_filter import LtmFilter
 from chaos.domain.memory_event_kind import MemoryEventKind
 from chaos.infra.raw_memory_store import RawMemoryStore
 from chaos.infra.utils import logger
@@ -22,6 +24,9 @@ if TYPE_CHECKING:
 VISIBILITY_EXTERNAL = "external"
 STM_MAX_LINES = 50
 EVENT_KINDS = set(MemoryEventKind)
+LTM_PUSHDOWN_MAX_IDS = 500
+LTM_POSTFILTER_MIN_SELECTIVITY = 0.5
+LTM_POSTFILTER_MAX_CANDIDATES = 200
 
 
 class MemoryContainer:
@@ -195,7 +200,11 @@ class MemoryContainer:
         self._recent_loop_ids[persona].append(loop_id)
 
     def retrieve_for_personas(
-        self, personas: Iterable[str], query: str, n_results: int = 5
+        self,
+        personas: Iterable[str],
+        query: str,
+        n_results: int = 5,
+        ltm_filter: Optional[LtmFilter] = None,
     ) -> List[str]:
         """
         Retrieves vector memories for the given personas.
@@ -204,6 +213,7 @@ class MemoryContainer:
             personas: Persona names to query.
             query: Query string.
             n_results: Max results per persona.
+            ltm_filter: Optional timestamp, kind, and visibility bounds.
 
         Returns:
             A list of memory snippets.
@@ -214,15 +224,17 @@ class MemoryContainer:
             if not collection:
                 continue
             try:
+                if ltm_filter is not None and not ltm_filter.is_unbounded():
+                    results.extend(
+                        self._retrieve_filtered(
+                            persona, collection, query, n_results, ltm_filter
+                        )
+                    )
+                    continue
                 response = collection.query(
                     query_texts=[query],
                     n_results=n_results,
-                    where={
-                        "$and": [
-                            {"agent_id": {"$eq": self.agent_id}},
-                            {"persona": {"$eq": persona}},
-                        ]
-                    },
+                    where=self._persona_where(persona),
                 )
                 documents = response.get("documents") if response else None
                 if documents and documents[0]:
@@ -231,6 +243,104 @@ class MemoryContainer:
                 logger.error(f"Failed to retrieve from LTM: {exc}")
         return results
 
+    def _persona_where(self, persona: str) -> Dict[str, Any]:
+        """
+        Builds the Chroma filter scoping a query to this agent and persona.
+
+        Args:
+            persona: The persona name.
+
+        Returns:
+            The Chroma where filter.
+        """
+        return {
+            "$and": [
+                {"agent_id": {"$eq": self.agent_id}},
+                {"persona": {"$eq": persona}},
+            ]
+        }
+
+    def _retrieve_filtered(
+        self,
+        persona: str,
+        collection: Any,
+        query: str,
+        n_results: int,
+        ltm_filter: LtmFilter,
+    ) -> List[str]:
+        """
+        Retrieves memories within filter bounds using the SQLite index.
+
+        Matching entries are counted on the indexed ``ltm_entries`` columns
+        first. Narrow filters push the candidate ids down into the vector
+        query; broad filters (or too many ids) over-fetch from Chroma in
+        proportion to the estimated selectivity and keep the hits SQLite
+        confirms.
+
+        Args:
+            persona: The persona name.
+            collection: The persona LTM collection.
+            query: Query string.
+            n_results: Max results to return.
+            ltm_filter: Timestamp, kind, and visibility bounds.
+
+        Returns:
+            Matching memory snippets, most similar first.
+        """
+        matched = self.raw_store.count_ltm_entries(self.agent_id, [persona], ltm_filter)
+        if matched == 0:
+            return []
+        total = self.raw_store.count_ltm_entries(self.agent_id, [persona])
+        selectivity = matched / max(total, matched)
+
+        if (
+            matched <= LTM_PUSHDOWN_MAX_IDS
+            and selectivity < LTM_POSTFILTER_MIN_SELECTIVITY
+        ):
+            candidate_ids = self.raw_store.list_filtered_ltm_ids(
+                self.agent_id, [persona], ltm_filter, limit=LTM_PUSHDOWN_MAX_IDS
+            )
+            logger.debug(
+                f"LTM filter pushdown for {persona}: {len(candidate_ids)} ids "
+                f"(selectivity {selectivity:.3f})"
+            )
+            response = collection.query(
+                query_texts=[query],
+                ids=candidate_ids,
+                n_results=min(n_results, len(candidate_ids)),
+                where=self._persona_where(persona),
+            )
+            documents = (response or {}).get("documents") or [[]]
+            return list(documents[0])
+
+        fetch = min(
+            max(n_results, math.ceil(n_results / selectivity)),
+            LTM_POSTFILTER_MAX_CANDIDATES,
+        )
+        logger.debug(
+            f"LTM filter post-filter for {persona}: fetching {fetch} candidates "
+            f"(selectivity {selectivity:.3f})"
+        )
+        where = self._persona_where(persona)
+        for key, values in (
+            ("kind", ltm_filter.kinds),
+            ("visibility", ltm_filter.visibilities),
+        ):
+            if values is not None:
+                where["$and"].append({key: {"$in": list(values)}})
+        response = collection.query(query_texts=[query], n_results=fetch, where=where)
+        ids = ((response or {}).get("ids") or [[]])[0]
+        documents = ((response or {}).get("documents") or [[]])[0]
+        allowed = set(
+            self.raw_store.list_filtered_ltm_ids(
+                self.agent_id, [persona], ltm_filter, candidate_ids=ids
+            )
+        )
+        kept = [
+            document for doc_id, document in zip(ids, documents) if doc_id in allowed
+        ]
+        return kept[:n_results]
+
     def get_recent_stm_as_string(self, personas: Iterable[str], limit: int = 1) -> str:
         """
         Returns recent STM summaries as a formatted string.
@@ -1,7 +1,9 @@
 """Abstract memory view interface."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
+
+from chaos.domain.ltm_filter import LtmFilter
 
 
 class MemoryView(ABC):
@@ -10,13 +12,19 @@ class MemoryView(ABC):
     """
 
     @abstractmethod
-    def retrieve(self, query: str, n_results: int = 5) -> List[str]:
+    def retrieve(
+        self,
+        query: str,
+        n_results: int = 5,
+        ltm_filter: Optional[LtmFilter] = None,
+    ) -> List[str]:
         """
         Retrieves LTM snippets for the given query.
 
         Args:
             query: The query string.
             n_results: Maximum results to return.
+            ltm_filter: Optional timestamp, kind, and visibility bounds.
 
         Returns:
             A list of memory snippets.
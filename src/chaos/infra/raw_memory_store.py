@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 from uuid import uuid4
 
+from chaos.domain.ltm_filter import LtmFilter
 from chaos.domain.memory_event_kind import MemoryEventKind
 from chaos.infra.utils import logger
 
@@ -147,6 +148,18 @@ class RawMemoryStore:
                   ON ltm_entries(agent_id, persona, loop_id)
                 """
             )
+            self.connection.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_ltm_agent_persona_kind_ts
+                  ON ltm_entries(agent_id, persona, kind, ts)
+                """
+            )
+            self.connection.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_ltm_agent_persona_visibility_ts
+                  ON ltm_entries(agent_id, persona, visibility, ts)
+                """
+            )
             self.connection.execute(
                 """
                 CREATE TABLE IF NOT EXISTS stm_entries (
@@ -370,6 +383,104 @@ class RawMemoryStore:
         ).fetchall()
         return [row["id"] for row in rows]
 
+    @staticmethod
+    def _ltm_filter_clause(
+        agent_id: str, personas: List[str], ltm_filter: Optional[LtmFilter]
+    ) -> tuple[str, List[Any]]:
+        """
+        Builds a WHERE clause over the indexed ``ltm_entries`` columns.
+
+        Args:
+            agent_id: The agent identifier.
+            personas: Persona values to include.
+            ltm_filter: Optional timestamp, kind, and visibility bounds.
+
+        Returns:
+            The SQL clause and its parameters.
+        """
+        placeholders = ",".join(["?"] * len(personas))
+        clauses = ["agent_id = ?", f"persona IN ({placeholders})"]
+        params: List[Any] = [agent_id, *personas]
+        if ltm_filter is not None:
+            if ltm_filter.ts_start is not None:
+                clauses.append("ts >= ?")
+                params.append(ltm_filter.ts_start)
+            if ltm_filter.ts_end is not None:
+                clauses.append("ts < ?")
+                params.append(ltm_filter.ts_end)
+            for column, values in (
+                ("kind", ltm_filter.kinds),
+                ("visibility", ltm_filter.visibilities),
+            ):
+                if values is not None:
+                    clauses.append(f"{column} IN ({','.join(['?'] * len(values))})")
+                    params.extend(values)
+        return " AND ".join(clauses), params
+
+    def count_ltm_entries(
+        self,
+        agent_id: str,
+        personas: Iterable[str],
+        ltm_filter: Optional[LtmFilter] = None,
+    ) -> int:
+        """
+        Counts LTM entries matching a filter.
+
+        Args:
+            agent_id: The agent identifier.
+            personas: Persona values to include.
+            ltm_filter: Optional timestamp, kind, and visibility bounds.
+
+        Returns:
+            The number of matching entries.
+        """
+        persona_list = list(personas)
+        if not persona_list:
+            return 0
+        clause, params = self._ltm_filter_clause(agent_id, persona_list, ltm_filter)
+        row = self.connection.execute(
+            f"SELECT COUNT(*) AS total FROM ltm_entries WHERE {clause}", params
+        ).fetchone()
+        return int(row["total"])
+
+    def list_filtered_ltm_ids(
+        self,
+        agent_id: str,
+        personas: Iterable[str],
+        ltm_filter: Optional[LtmFilter] = None,
+        limit: Optional[int] = None,
+        candidate_ids: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """
+        Lists LTM ids matching a filter, newest first.
+
+        Args:
+            agent_id: The agent identifier.
+            personas: Persona values to include.
+            ltm_filter: Optional timestamp, kind, and visibility bounds.
+            limit: Optional maximum number of ids.
+            candidate_ids: Optional ids to restrict the check to.
+
+        Returns:
+            Matching LTM entry identifiers.
+        """
+        persona_list = list(personas)
+        if not persona_list:
+            return []
+        clause, params = self._ltm_filter_clause(agent_id, persona_list, ltm_filter)
+        if candidate_ids is not None:
+            candidate_list = list(candidate_ids)
+            if not candidate_list:
+                return []
+            clause += f" AND id IN ({','.join(['?'] * len(candidate_list))})"
+            params.extend(candidate_list)
+        query = f"SELECT id FROM ltm_entries WHERE {clause} ORDER BY ts DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        rows = self.connection.execute(query, params).fetchall()
+        return [row["id"] for row in rows]
+
     def create_stm_entry(
         self,
         agent_id: str,
@@ -0,0 +1 @@
+"""Checkpoint ledgers for resumable composite runs."""
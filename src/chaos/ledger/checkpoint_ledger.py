@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from chaos.ledger.graph_checkpoint import GraphCheckpoint
+
+
+class CheckpointLedger(ABC):
+    """Interface for persisting and restoring composite run checkpoints.
+
+    Checkpoints are scoped by run, composite name and the composite's node
+    path within the run, so a composite reused at several positions of one
+    run (or as map items or parallel branches) keeps separate checkpoints.
+    """
+
+    @abstractmethod
+    def save(self, checkpoint: GraphCheckpoint) -> None:
+        """Append a checkpoint for its run.
+
+        Args:
+            checkpoint: Checkpoint to persist.
+        """
+
+    @abstractmethod
+    def latest(
+        self, run_id: str, block_name: str, node_path: str = ""
+    ) -> Optional[GraphCheckpoint]:
+        """Return the most recent checkpoint of a composite within a run.
+
+        Args:
+            run_id: Run identifier.
+            block_name: Composite block that owns the checkpoints.
+            node_path: Node path of the composite in the run; empty for the
+                run's root composite.
+
+        Returns:
+            The latest checkpoint, or None if there is none.
+        """
+
+    @abstractmethod
+    def clear(
+        self, run_id: str, block_name: Optional[str] = None, node_path: str = ""
+    ) -> None:
+        """Delete checkpoints of a run.
+
+        Args:
+            run_id: Run identifier.
+            block_name: Composite whose checkpoints at ``node_path`` are
+                deleted; None deletes every checkpoint of the run.
+            node_path: Node path of the composite in the run.
+        """
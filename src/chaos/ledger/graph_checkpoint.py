@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field
+
+from chaos.domain.messages import Response
+
+
+class GraphCheckpoint(BaseModel):
+    """State of a composite run after one successfully completed node.
+
+    The graph loop only carries its position, its step count, and the last
+    successful response between hops, so this is everything needed to resume.
+    Only unfinished runs have checkpoints: a composite discards its
+    checkpoints once its terminal node succeeds.
+    """
+
+    run_id: str = Field(description="Run the checkpoint belongs to")
+    block_name: str = Field(description="Composite block that owns the run")
+    node_path: str = Field(
+        default="",
+        description="Node path of the composite in the run; empty for the root",
+    )
+    node_name: str = Field(description="Node that completed successfully")
+    next_node: str = Field(description="Node to run next")
+    steps: int = Field(description="Graph steps consumed so far")
+    response: Response = Field(description="Successful response of the node")
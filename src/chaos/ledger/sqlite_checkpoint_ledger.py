@@ -0,0 +1,147 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from chaos.ledger.checkpoint_ledger import CheckpointLedger
+from chaos.ledger.graph_checkpoint import GraphCheckpoint
+
+
+class SqliteCheckpointLedger(CheckpointLedger):
+    """Checkpoint ledger backed by a local SQLite database.
+
+    Checkpoints are appended per completed node and survive process crashes,
+    so an interrupted run can be resumed by ``run_id``. Composites clear their
+    checkpoints when they succeed, so only unfinished runs are retained;
+    ``retention_seconds`` additionally expires checkpoints of runs that are
+    never resumed.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        retention_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the ledger and create its schema.
+
+        Args:
+            path: SQLite database file.
+            retention_seconds: Age after which checkpoints are deleted on the
+                next save; None keeps them until their run is cleared.
+            clock: Wall-clock source in seconds (injectable for tests).
+        """
+
+        self._path = path
+        self._retention_seconds = retention_seconds
+        self._clock = clock
+        if str(path) != ":memory:":
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS graph_checkpoints (
+                  id INTEGER PRIMARY KEY AUTOINCREMENT,
+                  run_id TEXT NOT NULL,
+                  block_name TEXT NOT NULL,
+                  node_path TEXT NOT NULL,
+                  node_name TEXT NOT NULL,
+                  steps INTEGER NOT NULL,
+                  created_at REAL NOT NULL,
+                  checkpoint_json TEXT NOT NULL
+                )
+                """)
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS graph_checkpoints_scope "
+                "ON graph_checkpoints (run_id, block_name, node_path)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS graph_checkpoints_created "
+                "ON graph_checkpoints (created_at)"
+            )
+
+    def save(self, checkpoint: GraphCheckpoint) -> None:
+        """Append a checkpoint and expire checkpoints past the retention age.
+
+        Args:
+            checkpoint: Checkpoint to persist.
+        """
+
+        now = self._clock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO graph_checkpoints "
+                "(run_id, block_name, node_path, node_name, steps, created_at, "
+                "checkpoint_json) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    checkpoint.run_id,
+                    checkpoint.block_name,
+                    checkpoint.node_path,
+                    checkpoint.node_name,
+                    checkpoint.steps,
+                    now,
+                    checkpoint.model_dump_json(),
+                ),
+            )
+            if self._retention_seconds is not None:
+                self._connection.execute(
+                    "DELETE FROM graph_checkpoints WHERE created_at < ?",
+                    (now - self._retention_seconds,),
+                )
+
+    def latest(
+        self, run_id: str, block_name: str, node_path: str = ""
+    ) -> Optional[GraphCheckpoint]:
+        """Return the most recent checkpoint of a composite within a run.
+
+        Args:
+            run_id: Run identifier.
+            block_name: Composite block that owns the checkpoints.
+            node_path: Node path of the composite in the run; empty for the
+                run's root composite.
+
+        Returns:
+            The latest checkpoint, or None if there is none.
+        """
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT checkpoint_json FROM graph_checkpoints "
+                "WHERE run_id = ? AND block_name = ? AND node_path = ? "
+                "ORDER BY id DESC LIMIT 1",
+                (run_id, block_name, node_path),
+            ).fetchone()
+        if row is None:
+            return None
+        return GraphCheckpoint.model_validate_json(row[0])
+
+    def clear(
+        self, run_id: str, block_name: Optional[str] = None, node_path: str = ""
+    ) -> None:
+        """Delete checkpoints of a run.
+
+        Args:
+            run_id: Run identifier.
+            block_name: Composite whose checkpoints at ``node_path`` are
+                deleted; None deletes every checkpoint of the run.
+            node_path: Node path of the composite in the run.
+        """
+
+        with self._lock, self._connection:
+            if block_name is None:
+                self._connection.execute(
+                    "DELETE FROM graph_checkpoints WHERE run_id = ?", (run_id,)
+                )
+            else:
+                self._connection.execute(
+                    "DELETE FROM graph_checkpoints "
+                    "WHERE run_id = ? AND block_name = ? AND node_path = ?",
+                    (run_id, block_name, node_path),
+                )
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+
+        self._connection.close()
@@ -23,5 +23,8 @@ class LLMRequest(BaseModel):
     api_key: Optional[SecretStr] = Field(
         default=None, description="Optional API key for provider access."
     )
+    timeout_seconds: Optional[float] = Field(
+        default=None, description="Provider timeout derived from the deadline."
+    )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
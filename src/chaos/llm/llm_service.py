@@ -79,33 +79,77 @@ class LLMService:
             )
             return LLMResponse.success(data=data, raw_output=None, usage=usage)
         except Exception as exc:
-            if is_known_llm_error(exc):
-                mapping = map_llm_error(exc)
-                return LLMResponse.failure(
-                    status=mapping.status,
-                    reason=mapping.reason,
-                    error_type=mapping.error_type,
-                    error_details=mapping.details,
-                )
-            metadata = request.metadata or {}
-            logger.exception(
-                "Unexpected LLM execution error",
-                extra={
-                    "request_id": metadata.get("id"),
-                    "trace_id": metadata.get("trace_id"),
-                    "run_id": metadata.get("run_id"),
-                    "span_id": metadata.get("span_id"),
-                    "execution_id": request.execution_id,
-                    "llm_attempt": request.attempt,
-                    "model": request.model,
-                },
+            return self._failure_from_exception(request, exc)
+
+    async def execute_async(self, request: LLMRequest) -> LLMResponse:
+        """Execute the LLM call on the running event loop.
+
+        Uses PydanticAI's native async ``Agent.run`` so many concurrent calls
+        share one event loop instead of one thread each.
+
+        Args:
+            request: LLM request to execute.
+
+        Returns:
+            LLMResponse containing success or failure information.
+        """
+
+        try:
+            system_prompt, user_prompt = self._render_prompts(request.messages)
+            data, usage = await self._run_agent_async(
+                request=request,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
             )
+            return LLMResponse.success(data=data, raw_output=None, usage=usage)
+        except Exception as exc:
+            return self._failure_from_exception(request, exc)
+
+    def _failure_from_exception(
+        self, request: LLMRequest, exc: Exception
+    ) -> LLMResponse:
+        """Map an exception raised during execution to a failed LLMResponse.
+
+        Args:
+            request: LLM request that failed.
+            exc: Raised exception.
+
+        Returns:
+            A failed LLMResponse.
+        """
+
+        if is_known_llm_error(exc):
+            mapping = map_llm_error(exc)
             return LLMResponse.failure(
-                status=ResponseStatus.MECHANICAL_ERROR,
-                reason="internal_error",
-                error_type=type(exc),
-                error_details=build_exception_details(exc),
+                status=mapping.status,
+                reason=mapping.reason,
+                error_type=mapping.error_type,
+                error_details=mapping.details,
             )
+        logger.exception(
+            "Unexpected LLM execution error", extra=self._log_extra(request)
+        )
+        return LLMResponse.failure(
+            status=ResponseStatus.MECHANICAL_ERROR,
+            reason="internal_error",
+            error_type=type(exc),
+            error_details=build_exception_details(exc),
+        )
+
+    @staticmethod
+    def _log_extra(request: LLMRequest) -> Dict[str, Any]:
+        """Build structured logging fields for a request."""
+
+        metadata = request.metadata or {}
+        return {
+            "request_id": metadata.get("id"),
+            "trace_id": metadata.get("trace_id"),
+            "run_id": metadata.get("run_id"),
+            "span_id": metadata.get("span_id"),
+            "execution_id": request.execution_id,
+            "llm_attempt": request.attempt,
+            "model": request.model,
+        }
 
     def _render_prompts(
         self, messages: List[Dict[str, str]]
@@ -162,42 +206,80 @@ class LLMService:
             Tuple of (validated_data, usage_dict).
         """
 
-        model = self._build_model(request)
-        resolved_system_prompt = system_prompt or ""
-        agent = self._get_or_create_agent(
-            model=model,
-            system_prompt=resolved_system_prompt,
-            output_type=request.output_data_model,
-        )
-        metadata = request.metadata or {}
-        logger.info(
-            "LLM request start",
-            extra={
-                "request_id": metadata.get("id"),
-                "trace_id": metadata.get("trace_id"),
-                "run_id": metadata.get("run_id"),
-                "span_id": metadata.get("span_id"),
-                "execution_id": request.execution_id,
-                "llm_attempt": request.attempt,
-                "model": request.model,
-            },
-        )
+        agent = self._prepare_agent(request, system_prompt)
+        logger.info("LLM request start", extra=self._log_extra(request))
         result = agent.run_sync(
             user_prompt,
-            model_settings=ModelSettings(temperature=request.temperature),
+            model_settings=self._model_settings(request),
         )
-        logger.info(
-            "LLM request complete",
-            extra={
-                "request_id": metadata.get("id"),
-                "trace_id": metadata.get("trace_id"),
-                "run_id": metadata.get("run_id"),
-                "span_id": metadata.get("span_id"),
-                "execution_id": request.execution_id,
-                "llm_attempt": request.attempt,
-                "model": request.model,
-            },
+        logger.info("LLM request complete", extra=self._log_extra(request))
+        return self._parse_result(result)
+
+    async def _run_agent_async(
+        self,
+        request: LLMRequest,
+        system_prompt: Optional[str],
+        user_prompt: str,
+    ) -> tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Async counterpart of ``_run_agent`` using ``Agent.run``.
+
+        Args:
+            request: Internal LLMRequest.
+            system_prompt: Optional system prompt.
+            user_prompt: User prompt content.
+
+        Returns:
+            Tuple of (validated_data, usage_dict).
+        """
+
+        agent = self._prepare_agent(request, system_prompt)
+        logger.info("LLM request start", extra=self._log_extra(request))
+        result = await agent.run(
+            user_prompt,
+            model_settings=self._model_settings(request),
         )
+        logger.info("LLM request complete", extra=self._log_extra(request))
+        return self._parse_result(result)
+
+    @staticmethod
+    def _model_settings(request: LLMRequest) -> ModelSettings:
+        """Build per-call model settings, including the provider timeout."""
+
+        settings = ModelSettings(temperature=request.temperature)
+        if request.timeout_seconds is not None:
+            settings["timeout"] = request.timeout_seconds
+        return settings
+
+    def _prepare_agent(
+        self, request: LLMRequest, system_prompt: Optional[str]
+    ) -> Agent:
+        """Resolve the model and cached agent for a request.
+
+        Args:
+            request: Internal LLMRequest.
+            system_prompt: Optional system prompt.
+
+        Returns:
+            The PydanticAI agent to run.
+        """
+
+        model = self._build_model(request)
+        return self._get_or_create_agent(
+            model=model,
+            system_prompt=system_prompt or "",
+            output_type=request.output_data_model,
+        )
+
+    @staticmethod
+    def _parse_result(result: Any) -> tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Extract validated output data and usage from an agent run result.
+
+        Args:
+            result: PydanticAI run result.
+
+        Returns:
+            Tuple of (validated_data, usage_dict).
+        """
 
         output = result.output
         if isinstance(output, BaseModel):
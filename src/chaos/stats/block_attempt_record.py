@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -37,3 +37,27 @@ class BlockAttemptRecord(BaseModel):
     block_executions: Optional[int] = Field(
         default=None, description="Number of block executions within this attempt."
     )
+    cache_hit: Optional[bool] = Field(
+        default=None,
+        description="True when served from the result cache, False for a "
+        "cached miss, None when memoization was not in effect.",
+    )
+    path: Optional[List[str]] = Field(
+        default=None,
+        description="Composite node names executed by the run, in order; the "
+        "transitions taken are consecutive pairs.",
+    )
+    hedge: Optional[bool] = Field(
+        default=None,
+        description="True for a duplicate attempt launched by hedging.",
+    )
+    hedge_cancelled: Optional[bool] = Field(
+        default=None,
+        description="True when a hedged attempt was cancelled because another "
+        "attempt won.",
+    )
+    coalesced: Optional[bool] = Field(
+        default=None,
+        description="True when the attempt shared a concurrent identical "
+        "attempt's result instead of executing.",
+    )
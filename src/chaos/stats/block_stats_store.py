@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 
 from chaos.domain.block_estimate import BlockEstimate
 from chaos.stats.block_attempt_record import BlockAttemptRecord
@@ -25,3 +26,24 @@ class BlockStatsStore(ABC):
         Returns:
             A BlockEstimate for the given request.
         """
+
+    def records(self, identity: BlockStatsIdentity) -> List[BlockAttemptRecord]:
+        """Return recorded attempts for a block, oldest first.
+
+        Stores that cannot enumerate attempts return an empty list; graph
+        estimates then fall back to structural transition probabilities.
+
+        Args:
+            identity: Stable block identity metadata.
+        Returns:
+            Attempt records for the block.
+        """
+
+        return []
+
+    def flush(self) -> None:
+        """Persist any buffered attempts.
+
+        Stores that write synchronously (or keep nothing on disk) have
+        nothing to do.
+        """
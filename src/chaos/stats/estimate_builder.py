@@ -20,10 +20,20 @@ def build_estimate_from_records(
         prior: Prior estimate used when data is missing.
 
     Returns:
-        A BlockEstimate built from records with fallbacks to priors.
+        A BlockEstimate built from records with fallbacks to priors. Records
+        served from the result cache, coalesced with another attempt, or
+        cancelled as losing hedged attempts are ignored.
     """
 
-    record_list: List[BlockAttemptRecord] = list(records)
+    # Cache hits, coalesced followers and cancelled hedge losers did no
+    # complete work and would drag latency/cost toward zero.
+    record_list: List[BlockAttemptRecord] = [
+        record
+        for record in records
+        if record.cache_hit is not True
+        and record.coalesced is not True
+        and record.hedge_cancelled is not True
+    ]
     sample_size = len(record_list)
     if sample_size == 0:
         return prior
@@ -65,11 +75,11 @@ def build_estimate_from_records(
         time_ms_std=time_std,
         cost_usd_mean=cost_mean if cost_values else prior.cost_usd_mean,
         cost_usd_std=cost_std if cost_values else prior.cost_usd_std,
-        expected_llm_calls=llm_calls_mean
-        if llm_call_values
-        else prior.expected_llm_calls,
-        expected_block_executions=block_exec_mean
-        if block_exec_values
-        else prior.expected_block_executions,
+        expected_llm_calls=(
+            llm_calls_mean if llm_call_values else prior.expected_llm_calls
+        ),
+        expected_block_executions=(
+            block_exec_mean if block_exec_values else prior.expected_block_executions
+        ),
         notes=notes,
     )
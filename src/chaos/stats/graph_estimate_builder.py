@@ -0,0 +1,256 @@
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from chaos.domain.block_estimate import (
+    BlockEstimate,
+    EstimateConfidence,
+    EstimateSource,
+)
+from chaos.domain.execution_plan import ExecutionPlan
+from chaos.stats.block_attempt_record import BlockAttemptRecord
+from chaos.stats.block_stats_identity import BlockStatsIdentity
+
+_CONFIDENCE_ORDER = (
+    EstimateConfidence.LOW,
+    EstimateConfidence.MEDIUM,
+    EstimateConfidence.HIGH,
+)
+_FLOW_EPSILON = 1e-9
+
+
+def count_transitions(
+    paths: Iterable[Sequence[str]],
+) -> Dict[str, Dict[Optional[str], int]]:
+    """Count observed transitions from recorded composite paths.
+
+    Args:
+        paths: Node names executed by past runs, in order.
+
+    Returns:
+        Mapping of node name -> successor name (None when the run ended
+        there) -> number of times that transition was taken.
+    """
+
+    counts: Dict[str, Dict[Optional[str], int]] = {}
+    for path in paths:
+        if not path:
+            continue
+        successors: List[Optional[str]] = list(path[1:])
+        successors.append(None)
+        for node, successor in zip(path, successors):
+            per_node = counts.setdefault(node, {})
+            per_node[successor] = per_node.get(successor, 0) + 1
+    return counts
+
+
+def expected_attempts(records: Iterable[BlockAttemptRecord]) -> float:
+    """Return the mean number of attempts per execution of a block.
+
+    Args:
+        records: Attempt records of the block.
+
+    Returns:
+        Attempts per first attempt (1.0 without data). Cache hits, hedged
+        duplicates and cancelled hedge losers are ignored.
+    """
+
+    total = 0
+    first = 0
+    for record in records:
+        if (
+            record.cache_hit is True
+            or record.hedge is True
+            or record.hedge_cancelled is True
+        ):
+            continue
+        total += 1
+        if record.attempt == 1:
+            first += 1
+    return total / first if first else 1.0
+
+
+def expected_visits(
+    plan: ExecutionPlan,
+    transitions: Dict[str, Dict[Optional[str], int]],
+    max_steps: int,
+) -> List[float]:
+    """Return the expected number of visits of every node in one run.
+
+    Observed transition frequencies are used where available; otherwise
+    successors are weighted structurally (linear targets with probability 1,
+    conditional and choice successors uniformly). Probability mass is
+    propagated for at most ``max_steps`` hops, mirroring the runtime bound.
+
+    Args:
+        plan: Compiled graph plan.
+        transitions: Observed transition counts (see ``count_transitions``).
+        max_steps: Maximum number of graph steps per run.
+
+    Returns:
+        Expected visits per node index; parallel branch nodes are visited
+        once per visit of their fan-out node.
+    """
+
+    successors = [
+        _successors(plan, index, transitions) for index in range(len(plan.nodes))
+    ]
+    visits = [0.0] * len(plan.nodes)
+    flow = [0.0] * len(plan.nodes)
+    flow[plan.entry] = 1.0
+    for _ in range(max_steps):
+        if sum(flow) < _FLOW_EPSILON:
+            break
+        next_flow = [0.0] * len(plan.nodes)
+        for index, mass in enumerate(flow):
+            if mass == 0.0:
+                continue
+            visits[index] += mass
+            parallel = plan.transitions[index].parallel
+            if parallel is not None:
+                for branch in parallel.branches:
+                    visits[branch] += mass
+            for successor, probability in successors[index]:
+                next_flow[successor] += mass * probability
+        flow = next_flow
+    return visits
+
+
+def build_graph_estimate(
+    identity: BlockStatsIdentity,
+    plan: ExecutionPlan,
+    components: Dict[str, BlockEstimate],
+    retry_factors: Dict[str, float],
+    paths: Sequence[Sequence[str]],
+    max_steps: int,
+    sample_size: int,
+) -> BlockEstimate:
+    """Combine child estimates into a composite estimate by walking the graph.
+
+    Each node contributes its per-attempt estimate times its expected visits
+    and expected attempts per visit. Parallel branches contribute the slowest
+    branch to time and every branch to cost. Standard deviations assume
+    independent executions.
+
+    Args:
+        identity: Composite identity.
+        plan: Compiled graph plan.
+        components: Per-attempt estimate of each node, by node name.
+        retry_factors: Expected attempts per visit, by node name.
+        paths: Paths recorded by past runs of the composite.
+        max_steps: Maximum number of graph steps per run.
+        sample_size: Number of recorded runs of the composite.
+
+    Returns:
+        A BlockEstimate whose ``components`` hold each node's estimate with
+        ``expected_block_executions`` scaled to one composite run.
+    """
+
+    visits = expected_visits(plan, count_transitions(paths), max_steps)
+    branch_nodes = {
+        branch
+        for transition in plan.transitions
+        if transition.parallel is not None
+        for branch in transition.parallel.branches
+    }
+
+    executions: Dict[int, float] = {}
+    breakdown: Dict[str, BlockEstimate] = {}
+    for index, name in enumerate(plan.node_names):
+        estimate = components[name]
+        executions[index] = visits[index] * retry_factors.get(name, 1.0)
+        breakdown[name] = estimate.model_copy(
+            update={
+                "expected_block_executions": executions[index]
+                * estimate.expected_block_executions
+            }
+        )
+
+    time_mean = time_var = cost_mean = cost_var = llm_calls = block_executions = 0.0
+    for index, name in enumerate(plan.node_names):
+        estimate = components[name]
+        runs = executions[index]
+        cost_mean += runs * estimate.cost_usd_mean
+        cost_var += runs * estimate.cost_usd_std**2
+        llm_calls += runs * estimate.expected_llm_calls
+        block_executions += runs * estimate.expected_block_executions
+        if index not in branch_nodes:
+            time_mean += runs * estimate.time_ms_mean
+            time_var += runs * estimate.time_ms_std**2
+        parallel = plan.transitions[index].parallel
+        if parallel is not None and visits[index] > 0:
+            slowest = max(
+                parallel.branches,
+                key=lambda branch: (
+                    retry_factors.get(plan.node_names[branch], 1.0)
+                    * components[plan.node_names[branch]].time_ms_mean
+                ),
+            )
+            branch_estimate = components[plan.node_names[slowest]]
+            branch_runs = visits[index] * retry_factors.get(
+                plan.node_names[slowest], 1.0
+            )
+            time_mean += branch_runs * branch_estimate.time_ms_mean
+            time_var += branch_runs * branch_estimate.time_ms_std**2
+
+    visited = [
+        components[name]
+        for index, name in enumerate(plan.node_names)
+        if visits[index] > 0
+    ]
+    any_stats = any(
+        estimate.estimate_source == EstimateSource.STATS for estimate in visited
+    )
+    confidence = min(
+        (estimate.confidence for estimate in visited),
+        key=_CONFIDENCE_ORDER.index,
+        default=EstimateConfidence.LOW,
+    )
+    return BlockEstimate(
+        block_name=identity.block_name,
+        block_type=identity.block_type,
+        version=identity.version,
+        estimate_source=EstimateSource.STATS if any_stats else EstimateSource.PRIOR,
+        confidence=confidence,
+        sample_size=sample_size,
+        time_ms_mean=time_mean,
+        time_ms_std=math.sqrt(time_var),
+        cost_usd_mean=cost_mean,
+        cost_usd_std=math.sqrt(cost_var),
+        expected_llm_calls=llm_calls,
+        expected_block_executions=block_executions,
+        components=breakdown,
+        notes=["graph_walk", f"observed_paths={len(paths)}"],
+    )
+
+
+def _successors(
+    plan: ExecutionPlan,
+    index: int,
+    transitions: Dict[str, Dict[Optional[str], int]],
+) -> List[Tuple[int, float]]:
+    """Return (successor index, probability) pairs for one node."""
+
+    transition = plan.transitions[index]
+    if transition.parallel is not None:
+        target = transition.parallel.target
+        return [] if target is None else [(target, 1.0)]
+
+    observed = transitions.get(plan.node_names[index])
+    if observed:
+        index_of = {name: position for position, name in enumerate(plan.node_names)}
+        total = sum(observed.values())
+        return [
+            (index_of[name], count / total)
+            for name, count in observed.items()
+            if name is not None and name in index_of
+        ]
+
+    if transition.choice is not None:
+        targets = list(transition.choice.candidates)
+    elif transition.branches:
+        targets = list(dict.fromkeys(branch.target for branch in transition.branches))
+    elif transition.target is not None:
+        targets = [transition.target]
+    else:
+        return []
+    return [(target, 1.0 / len(targets)) for target in targets]
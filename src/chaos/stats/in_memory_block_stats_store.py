@@ -39,6 +39,23 @@ class InMemoryBlockStatsStore(BlockStatsStore):
         prior = BlockEstimate.from_prior(identity)
         return build_estimate_from_records(identity, relevant, prior)
 
+    def records(self, identity: BlockStatsIdentity) -> List[BlockAttemptRecord]:
+        """Return recorded attempts for a block, oldest first.
+
+        Args:
+            identity: Stable block identity metadata.
+        Returns:
+            A copy of the block's attempt records.
+        """
+
+        return list(self._index.get(self._identity_key(identity), []))
+
+    def drain(self) -> List[BlockAttemptRecord]:
+        """Return every recorded attempt, oldest first, and clear the store."""
+
+        records, self._records, self._index = self._records, [], {}
+        return records
+
     def _add_to_index(self, record: BlockAttemptRecord) -> None:
         """Add a record to the in-memory index."""
 
@@ -1,6 +1,9 @@
+import atexit
 import json
 import logging
 import os
+import threading
+import weakref
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -12,18 +15,39 @@ from chaos.stats.estimate_builder import build_estimate_from_records
 
 logger = logging.getLogger(__name__)
 
+_OPEN_STORES: "weakref.WeakSet[JsonBlockStatsStore]" = weakref.WeakSet()
+
+
+def _close_open_stores() -> None:
+    """Flush every live store's pending records at interpreter exit."""
+
+    for store in list(_OPEN_STORES):
+        store.close()
+
+
+atexit.register(_close_open_stores)
+
 
 class JsonBlockStatsStore(BlockStatsStore):
-    """JSON-backed stats store for block execution attempts."""
+    """JSON-backed stats store for block execution attempts.
+
+    Attempts are indexed in memory as soon as they are recorded, so estimates
+    see them immediately, but the journal is written by a background writer
+    that batches every attempt recorded within ``flush_interval_seconds`` into
+    one append. Pending attempts are written by ``flush``, ``close`` and at
+    interpreter exit.
+    """
 
     DEFAULT_MAX_RECORDS = 5000
     DEFAULT_MAX_FILE_BYTES = 5_000_000
+    DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
 
     def __init__(
         self,
         path: Path,
         max_records: int = DEFAULT_MAX_RECORDS,
         max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
     ) -> None:
         """Initialize the store with a JSON file path.
 
@@ -31,32 +55,92 @@ class JsonBlockStatsStore(BlockStatsStore):
             path: Path to the JSON file used for persistence.
             max_records: Maximum number of records to keep in memory/on disk.
             max_file_bytes: Maximum size of the journal before compaction.
+            flush_interval_seconds: How long the background writer collects
+                attempts before appending them. Zero writes every attempt
+                synchronously.
         """
 
         self._path = path
         self._max_records = max(0, int(max_records))
         self._max_file_bytes = max(0, int(max_file_bytes))
+        self._flush_interval = max(0.0, float(flush_interval_seconds))
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._pending: List[BlockAttemptRecord] = []
+        self._compact_pending = False
+        self._closed = False
         self._records = self._load()
         self._apply_retention()
         self._index: Dict[Tuple[str, str, Optional[str]], List[BlockAttemptRecord]] = {}
         self._rebuild_index()
+        _OPEN_STORES.add(self)
 
     def record_attempt(self, record: BlockAttemptRecord) -> None:
-        """Record a block execution attempt and persist to JSON.
+        """Record a block execution attempt and queue it for the journal.
+
+        Safe to call from concurrently executing blocks. The record is indexed
+        immediately; the file write happens on the background writer.
 
         Args:
             record: Attempt record to store.
         """
 
-        self._records.append(record)
-        trimmed = self._apply_retention()
-        if trimmed:
-            self._rebuild_index()
-        else:
-            self._add_to_index(record)
-        self._append_record(record)
-        if trimmed or self._should_compact():
-            self._compact_records()
+        with self._lock:
+            self._records.append(record)
+            if self._apply_retention():
+                self._rebuild_index()
+                self._compact_pending = True
+            else:
+                self._add_to_index(record)
+            self._pending.append(record)
+            write_now = self._closed or self._flush_interval <= 0
+            if not write_now:
+                self._ensure_writer()
+        if write_now:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending attempts to the journal, compacting it if needed.
+
+        Write failures are logged and the batch is dropped; recording never
+        raises into block execution.
+        """
+
+        with self._flush_lock:
+            with self._lock:
+                compact = self._compact_pending or self._should_compact()
+                if not self._pending and not compact:
+                    return
+                batch = list(self._records) if compact else self._pending
+                self._pending = []
+                self._compact_pending = False
+            try:
+                if compact:
+                    self._compact_records(batch)
+                else:
+                    self._append_records(batch)
+            except OSError:
+                logger.exception(
+                    "Failed to write block stats",
+                    extra={"path": str(self._path), "records": len(batch)},
+                )
+
+    def close(self) -> None:
+        """Stop the background writer and flush pending attempts.
+
+        Attempts recorded after ``close`` are written synchronously.
+        """
+
+        with self._lock:
+            self._closed = True
+            writer = self._writer
+        self._stop.set()
+        if writer is not None and writer is not threading.current_thread():
+            writer.join()
+        self.flush()
+        _OPEN_STORES.discard(self)
 
     def estimate(self, identity: BlockStatsIdentity) -> BlockEstimate:
         """Estimate execution cost/latency using stored attempts.
@@ -67,10 +151,23 @@ class JsonBlockStatsStore(BlockStatsStore):
             A BlockEstimate based on JSON records.
         """
 
-        relevant = self._index.get(self._identity_key(identity), [])
+        with self._lock:
+            relevant = list(self._index.get(self._identity_key(identity), []))
         prior = BlockEstimate.from_prior(identity)
         return build_estimate_from_records(identity, relevant, prior)
 
+    def records(self, identity: BlockStatsIdentity) -> List[BlockAttemptRecord]:
+        """Return retained attempts for a block, oldest first.
+
+        Args:
+            identity: Stable block identity metadata.
+        Returns:
+            A copy of the block's attempt records.
+        """
+
+        with self._lock:
+            return list(self._index.get(self._identity_key(identity), []))
+
     def _load(self) -> List[BlockAttemptRecord]:
         """Load attempt records from disk.
 
@@ -102,27 +199,55 @@ class JsonBlockStatsStore(BlockStatsStore):
             )
             return []
 
-    def _append_record(self, record: BlockAttemptRecord) -> None:
-        """Append a record to the journal file."""
+    def _ensure_writer(self) -> None:
+        """Start the background writer if it is not running (caller holds lock)."""
+
+        if self._writer is not None and self._writer.is_alive():
+            return
+        self._writer = threading.Thread(
+            target=self._run_writer, name="block-stats-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _run_writer(self) -> None:
+        """Flush once per interval until no attempts are pending.
+
+        The writer exits when idle so an unused store holds no thread; the
+        next recorded attempt starts a new one.
+        """
+
+        while True:
+            self._stop.wait(self._flush_interval)
+            self.flush()
+            with self._lock:
+                if not self._pending or self._closed:
+                    self._writer = None
+                    return
+
+    def _append_records(self, records: List[BlockAttemptRecord]) -> None:
+        """Append records to the journal file in a single write."""
 
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        serialized = json.dumps(record.model_dump(), sort_keys=True)
         with self._path.open("a", encoding="utf-8") as handle:
-            handle.write(serialized)
-            handle.write("\n")
+            handle.write(self._serialize(records))
         self._apply_permissions()
 
-    def _compact_records(self) -> None:
-        """Rewrite the journal with retained records."""
+    def _compact_records(self, records: List[BlockAttemptRecord]) -> None:
+        """Rewrite the journal with the retained records."""
 
         self._path.parent.mkdir(parents=True, exist_ok=True)
         with self._path.open("w", encoding="utf-8") as handle:
-            for record in self._records:
-                serialized = json.dumps(record.model_dump(), sort_keys=True)
-                handle.write(serialized)
-                handle.write("\n")
+            handle.write(self._serialize(records))
         self._apply_permissions()
 
+    @staticmethod
+    def _serialize(records: List[BlockAttemptRecord]) -> str:
+        """Render records as JSON lines."""
+
+        return "".join(
+            json.dumps(record.model_dump(), sort_keys=True) + "\n" for record in records
+        )
+
     def _apply_permissions(self) -> None:
         """Restrict stats file permissions."""
 
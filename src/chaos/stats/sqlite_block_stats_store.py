@@ -0,0 +1,179 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from chaos.domain.block_estimate import BlockEstimate
+from chaos.stats.block_attempt_record import BlockAttemptRecord
+from chaos.stats.block_stats_identity import BlockStatsIdentity
+from chaos.stats.block_stats_store import BlockStatsStore
+from chaos.stats.estimate_builder import build_estimate_from_records
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteBlockStatsStore(BlockStatsStore):
+    """SQLite-backed stats store for block execution attempts.
+
+    Attempts are rows indexed by (block_name, block_type, version, ts), so
+    opening the store reads nothing and every estimate is an indexed range
+    query over one block's history. Retention is per block identity:
+    frequently executed blocks cannot evict the history of rare ones.
+    Estimates can be limited to the most recent ``window_size`` attempts
+    and/or those recorded within the last ``window_seconds``.
+    """
+
+    DEFAULT_MAX_RECORDS_PER_BLOCK = 1000
+
+    def __init__(
+        self,
+        path: Path,
+        max_records_per_block: int = DEFAULT_MAX_RECORDS_PER_BLOCK,
+        window_size: Optional[int] = None,
+        window_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the store and create its schema.
+
+        Args:
+            path: SQLite database file (``:memory:`` for a private database).
+            max_records_per_block: Attempts retained per block identity; zero
+                or less keeps everything.
+            window_size: Default number of most recent attempts used for
+                estimates; None uses every retained attempt.
+            window_seconds: Default age limit in seconds for attempts used in
+                estimates; None applies no age limit.
+            clock: Wall-clock source in seconds (injectable for tests).
+        """
+
+        self._path = path
+        self._max_records = int(max_records_per_block)
+        self._window_size = window_size
+        self._window_seconds = window_seconds
+        self._clock = clock
+        if str(path) != ":memory:":
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            if str(path) != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+                self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS block_attempts (
+                  id INTEGER PRIMARY KEY AUTOINCREMENT,
+                  block_name TEXT NOT NULL,
+                  block_type TEXT NOT NULL,
+                  version TEXT NOT NULL,
+                  ts REAL NOT NULL,
+                  record_json TEXT NOT NULL
+                )
+                """)
+            self._connection.execute("""
+                CREATE INDEX IF NOT EXISTS block_attempts_identity_ts
+                ON block_attempts (block_name, block_type, version, ts)
+                """)
+
+    def record_attempt(self, record: BlockAttemptRecord) -> None:
+        """Insert an attempt and trim its block's history to the retention size.
+
+        Write failures are logged; recording never raises into block
+        execution.
+
+        Args:
+            record: Attempt record to store.
+        """
+
+        key = (record.block_name, record.block_type, record.version or "")
+        try:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "INSERT INTO block_attempts "
+                    "(block_name, block_type, version, ts, record_json) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (*key, self._clock(), json.dumps(record.model_dump())),
+                )
+                if self._max_records > 0:
+                    self._connection.execute(
+                        "DELETE FROM block_attempts WHERE id IN ("
+                        "SELECT id FROM block_attempts "
+                        "WHERE block_name = ? AND block_type = ? AND version = ? "
+                        "ORDER BY ts DESC, id DESC LIMIT -1 OFFSET ?)",
+                        (*key, self._max_records),
+                    )
+        except sqlite3.Error:
+            logger.exception(
+                "Failed to write block stats",
+                extra={"path": str(self._path), "block_name": record.block_name},
+            )
+
+    def estimate(self, identity: BlockStatsIdentity) -> BlockEstimate:
+        """Estimate execution cost/latency from the block's windowed history.
+
+        Args:
+            identity: Stable block identity metadata.
+        Returns:
+            A BlockEstimate based on the attempts inside the default window.
+        """
+
+        prior = BlockEstimate.from_prior(identity)
+        return build_estimate_from_records(identity, self.records(identity), prior)
+
+    def records(
+        self,
+        identity: BlockStatsIdentity,
+        last_n: Optional[int] = None,
+        within_seconds: Optional[float] = None,
+    ) -> List[BlockAttemptRecord]:
+        """Return a block's attempts inside a window, oldest first.
+
+        Args:
+            identity: Stable block identity metadata.
+            last_n: Keep only the most recent attempts; defaults to the
+                store's ``window_size``.
+            within_seconds: Keep only attempts recorded this recently;
+                defaults to the store's ``window_seconds``.
+        Returns:
+            Attempt records for the block.
+        """
+
+        last_n = self._window_size if last_n is None else last_n
+        within_seconds = (
+            self._window_seconds if within_seconds is None else within_seconds
+        )
+        since = (
+            float("-inf") if within_seconds is None else self._clock() - within_seconds
+        )
+        limit = -1 if last_n is None else max(0, int(last_n))
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT record_json FROM block_attempts "
+                "WHERE block_name = ? AND block_type = ? AND version = ? "
+                "AND ts >= ? ORDER BY ts DESC, id DESC LIMIT ?",
+                (
+                    identity.block_name,
+                    identity.block_type,
+                    identity.version or "",
+                    since,
+                    limit,
+                ),
+            ).fetchall()
+        records: List[BlockAttemptRecord] = []
+        for (payload,) in reversed(rows):
+            try:
+                records.append(BlockAttemptRecord.model_validate_json(payload))
+            except ValueError:
+                logger.warning(
+                    "Skipping invalid block stats record",
+                    extra={"path": str(self._path)},
+                )
+        return records
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+
+        with self._lock:
+            self._connection.close()
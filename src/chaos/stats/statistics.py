@@ -1,5 +1,5 @@
 from math import sqrt
-from typing import Iterable, Tuple
+from typing import Iterable, Sequence, Tuple
 
 from chaos.domain.block_estimate import EstimateConfidence
 
@@ -33,6 +33,26 @@ def mean_std(values: Iterable[float]) -> Tuple[float, float]:
     return mean_value, sqrt(variance)
 
 
+def quantile(values: Sequence[float], q: float) -> float:
+    """Compute a quantile with linear interpolation between order statistics.
+
+    Args:
+        values: Numeric values.
+        q: Quantile in [0, 1].
+
+    Returns:
+        The interpolated quantile. Returns 0.0 if empty.
+    """
+
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = min(max(q, 0.0), 1.0) * (len(ordered) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
 def confidence_from_sample_size(sample_size: int) -> EstimateConfidence:
     """Return a confidence label based on sample size.
 
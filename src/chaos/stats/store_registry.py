@@ -3,14 +3,21 @@ from typing import Optional
 from chaos.config import Config
 from chaos.stats.block_stats_store import BlockStatsStore
 from chaos.stats.json_block_stats_store import JsonBlockStatsStore
+from chaos.stats.sqlite_block_stats_store import SqliteBlockStatsStore
 
 _DEFAULT_STORE: Optional[BlockStatsStore] = None
 
 
 def _build_default_store() -> BlockStatsStore:
-    """Create the default stats store lazily."""
+    """Create the default stats store lazily from the configured backend."""
 
     config = Config.load()
+    if config.use_sqlite_block_stats():
+        return SqliteBlockStatsStore(
+            config.get_block_stats_db_path(),
+            window_size=config.block_stats_window_size,
+            window_seconds=config.block_stats_window_seconds,
+        )
     return JsonBlockStatsStore(config.get_block_stats_path())
 
 
@@ -25,9 +32,13 @@ def get_default_store() -> BlockStatsStore:
 def set_default_store(store: BlockStatsStore) -> None:
     """Replace the default block stats store.
 
+    The previous store is flushed so attempts it buffered are not lost.
+
     Args:
         store: The new default stats store.
     """
 
     global _DEFAULT_STORE
+    if _DEFAULT_STORE is not None and _DEFAULT_STORE is not store:
+        _DEFAULT_STORE.flush()
     _DEFAULT_STORE = store
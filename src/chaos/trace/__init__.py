@@ -0,0 +1 @@
+"""Span tracing and OpenTelemetry JSON export for block executions."""
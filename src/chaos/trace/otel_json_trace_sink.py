@@ -0,0 +1,191 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List
+
+from chaos.trace.trace_sink import TraceSink
+from chaos.trace.trace_span import TraceSpan
+
+logger = logging.getLogger(__name__)
+
+SCOPE_NAME = "chaos.block"
+SERVICE_NAME = "chaos"
+
+
+class OtelJsonTraceSink(TraceSink):
+    """Writes each run's spans to ``<directory>/<run_id>.json`` as OTLP/JSON.
+
+    Spans are buffered per run and written when the run's root span finishes
+    (``run_root``, or a span without a parent), so a run costs one file
+    write. The root's own parent may be a caller's span outside the run. At
+    most ``max_pending_runs`` unfinished runs are buffered; beyond that the
+    oldest is written as it stands. The file holds
+    a single ``ExportTraceServiceRequest`` body, which OpenTelemetry
+    collectors and most trace viewers import directly. Spans that arrive
+    after their run was written (e.g. a hedged loser still draining) and
+    resumed runs are merged into the existing file.
+    """
+
+    DEFAULT_MAX_WRITTEN_RUNS = 1024
+    DEFAULT_MAX_PENDING_RUNS = 1024
+
+    def __init__(
+        self,
+        directory: Path,
+        max_written_runs: int = DEFAULT_MAX_WRITTEN_RUNS,
+        max_pending_runs: int = DEFAULT_MAX_PENDING_RUNS,
+    ) -> None:
+        """Initialize the sink.
+
+        Args:
+            directory: Directory receiving one JSON file per run.
+            max_written_runs: Number of recently written runs remembered so
+                late spans are merged immediately instead of buffered.
+            max_pending_runs: Number of unfinished runs buffered before the
+                oldest is written without waiting for its root span.
+        """
+
+        self._directory = Path(directory)
+        self._max_written_runs = max(1, int(max_written_runs))
+        self._max_pending_runs = max(1, int(max_pending_runs))
+        self._lock = threading.Lock()
+        self._pending: "OrderedDict[str, List[TraceSpan]]" = OrderedDict()
+        self._written: "OrderedDict[str, None]" = OrderedDict()
+
+    @property
+    def directory(self) -> Path:
+        """Directory receiving trace files."""
+
+        return self._directory
+
+    def path_for(self, run_id: str) -> Path:
+        """Return the trace file path for ``run_id``."""
+
+        return self._directory / f"{run_id}.json"
+
+    def record_span(self, span: TraceSpan) -> None:
+        """Buffer a span and write its run once the root span finishes.
+
+        Args:
+            span: Finished span to record.
+        """
+
+        with self._lock:
+            spans = self._pending.setdefault(span.run_id, [])
+            spans.append(span)
+            root = span.run_root is True or span.parent_span_id is None
+            if root or span.run_id in self._written:
+                self._flush(span.run_id)
+            while len(self._pending) > self._max_pending_runs:
+                run_id = next(iter(self._pending))
+                logger.warning(
+                    "Exporting unfinished trace run",
+                    extra={"run_id": run_id, "spans": len(self._pending[run_id])},
+                )
+                self._flush(run_id)
+
+    def load(self, run_id: str) -> List[TraceSpan]:
+        """Return the exported spans for ``run_id``, oldest start first.
+
+        Args:
+            run_id: Run to load.
+
+        Returns:
+            Spans read from the run's trace file.
+
+        Raises:
+            FileNotFoundError: If no trace was exported for the run.
+        """
+
+        return self.read(self.path_for(run_id))
+
+    @staticmethod
+    def read(path: Path) -> List[TraceSpan]:
+        """Return the spans stored in an OTLP/JSON trace file.
+
+        Args:
+            path: Trace file to read.
+
+        Returns:
+            Spans ordered by start time.
+        """
+
+        with Path(path).open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        spans = [
+            TraceSpan.from_otlp(span)
+            for resource in payload.get("resourceSpans", [])
+            for scope in resource.get("scopeSpans", [])
+            for span in scope.get("spans", [])
+        ]
+        return sorted(spans, key=lambda span: span.start_time_unix_nano)
+
+    @staticmethod
+    def to_otlp(spans: List[TraceSpan]) -> Dict[str, Any]:
+        """Return ``spans`` as an OTLP/JSON ``ExportTraceServiceRequest`` body."""
+
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": SERVICE_NAME},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": SCOPE_NAME},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def _flush(self, run_id: str) -> None:
+        """Write a buffered run and remember it for late spans (lock held)."""
+
+        spans = self._pending.pop(run_id)
+        self._written[run_id] = None
+        self._written.move_to_end(run_id)
+        while len(self._written) > self._max_written_runs:
+            self._written.popitem(last=False)
+        self._write(run_id, spans)
+
+    def _write(self, run_id: str, spans: List[TraceSpan]) -> None:
+        """Merge ``spans`` into the run's trace file and replace it atomically."""
+
+        path = self.path_for(run_id)
+        temp_path = None
+        try:
+            merged = {span.span_id: span for span in self._read_existing(path)}
+            merged.update((span.span_id, span) for span in spans)
+            ordered = sorted(merged.values(), key=lambda s: s.start_time_unix_nano)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                delete=False, dir=path.parent, mode="w", encoding="utf-8"
+            ) as tmp_file:
+                json.dump(self.to_otlp(ordered), tmp_file)
+                temp_path = Path(tmp_file.name)
+            os.replace(temp_path, path)
+        except Exception:
+            if temp_path and temp_path.exists():
+                temp_path.unlink()
+            logger.exception(
+                "Failed to export trace",
+                extra={"run_id": run_id, "path": str(path), "spans": len(spans)},
+            )
+
+    def _read_existing(self, path: Path) -> List[TraceSpan]:
+        """Return spans already exported to ``path``, if it exists."""
+
+        if not path.exists():
+            return []
+        return self.read(path)
@@ -0,0 +1,36 @@
+from typing import Optional
+
+from chaos.config import Config
+from chaos.trace.otel_json_trace_sink import OtelJsonTraceSink
+from chaos.trace.trace_sink import TraceSink
+
+_UNSET = object()
+_DEFAULT_SINK: object = _UNSET
+
+
+def _build_default_sink() -> Optional[TraceSink]:
+    """Create the default trace sink lazily; None when tracing is disabled."""
+
+    config = Config.load()
+    if not config.use_tracing():
+        return None
+    return OtelJsonTraceSink(config.get_trace_dir())
+
+
+def get_default_sink() -> Optional[TraceSink]:
+    """Return the default trace sink, or None when tracing is disabled."""
+    global _DEFAULT_SINK
+    if _DEFAULT_SINK is _UNSET:
+        _DEFAULT_SINK = _build_default_sink()
+    return _DEFAULT_SINK  # type: ignore[return-value]
+
+
+def set_default_sink(sink: Optional[TraceSink]) -> None:
+    """Replace the default trace sink.
+
+    Args:
+        sink: The new default sink, or None to disable tracing.
+    """
+
+    global _DEFAULT_SINK
+    _DEFAULT_SINK = sink
@@ -0,0 +1,57 @@
+from typing import Dict, List, Optional
+
+from chaos.trace.trace_span import TraceSpan
+
+
+class SpanTree:
+    """Parent/child view over the spans of one run."""
+
+    def __init__(self, spans: List[TraceSpan]) -> None:
+        """Index ``spans`` by parent.
+
+        Spans whose parent is missing from the run (for example the caller's
+        own span) are treated as roots.
+
+        Args:
+            spans: Spans of a single run.
+        """
+
+        ordered = sorted(spans, key=lambda span: span.start_time_unix_nano)
+        known = {span.span_id for span in ordered}
+        self._children: Dict[Optional[str], List[TraceSpan]] = {}
+        for span in ordered:
+            parent = span.parent_span_id if span.parent_span_id in known else None
+            self._children.setdefault(parent, []).append(span)
+
+    @property
+    def roots(self) -> List[TraceSpan]:
+        """Top-level spans, oldest first."""
+
+        return list(self._children.get(None, []))
+
+    def children(self, span: TraceSpan) -> List[TraceSpan]:
+        """Return the direct children of ``span``, oldest first."""
+
+        return list(self._children.get(span.span_id, []))
+
+    def critical_path(self, root: TraceSpan) -> List[TraceSpan]:
+        """Return the chain of spans that determined when ``root`` finished.
+
+        From ``root``, repeatedly follow the child that ended last: every
+        earlier-ending sibling (a parallel branch, a failed attempt that was
+        retried) finished in time and did not hold its parent up.
+
+        Args:
+            root: Span to start from.
+
+        Returns:
+            Spans from ``root`` down to a leaf.
+        """
+
+        path = [root]
+        children = self.children(root)
+        while children:
+            last = max(children, key=lambda span: span.end_time_unix_nano)
+            path.append(last)
+            children = self.children(last)
+        return path
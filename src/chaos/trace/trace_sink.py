@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+from chaos.trace.trace_span import TraceSpan
+
+
+class TraceSink(ABC):
+    """Interface for receiving finished block spans."""
+
+    @abstractmethod
+    def record_span(self, span: TraceSpan) -> None:
+        """Accept a finished span.
+
+        Called once per block attempt, from whichever thread or event loop
+        finished it; implementations must be thread-safe and should not block
+        for long.
+
+        Args:
+            span: Finished span to record.
+        """
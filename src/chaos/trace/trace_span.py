@@ -0,0 +1,198 @@
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from chaos.stats.block_attempt_record import BlockAttemptRecord
+
+STATUS_CODE_OK = 1
+STATUS_CODE_ERROR = 2
+
+# OTLP attribute key -> (TraceSpan field, OTLP value type).
+_ATTRIBUTES = (
+    ("chaos.run_id", "run_id", "stringValue"),
+    ("chaos.block.name", "block_name", "stringValue"),
+    ("chaos.block.type", "block_type", "stringValue"),
+    ("chaos.node.name", "node_name", "stringValue"),
+    ("chaos.attempt", "attempt", "intValue"),
+    ("chaos.reason", "reason", "stringValue"),
+    ("chaos.error_type", "error_type", "stringValue"),
+    ("chaos.hedge", "hedge", "boolValue"),
+    ("chaos.cache_hit", "cache_hit", "boolValue"),
+    ("chaos.run_root", "run_root", "boolValue"),
+    ("chaos.llm_calls", "llm_calls", "intValue"),
+    ("chaos.cost_usd", "cost_usd", "doubleValue"),
+    ("gen_ai.request.model", "model", "stringValue"),
+    ("gen_ai.usage.input_tokens", "input_tokens", "intValue"),
+    ("gen_ai.usage.output_tokens", "output_tokens", "intValue"),
+)
+
+
+def otel_trace_id(trace_id: str) -> str:
+    """Return ``trace_id`` as a 32-character hex OTel trace id.
+
+    UUIDs map to their hex form; any other string is hashed so the same run
+    always lands on the same trace id.
+    """
+
+    compact = trace_id.replace("-", "").lower()
+    if len(compact) == 32 and all(char in "0123456789abcdef" for char in compact):
+        return compact
+    return hashlib.sha256(trace_id.encode("utf-8")).hexdigest()[:32]
+
+
+class TraceSpan(BaseModel):
+    """A finished block attempt with wall-clock bounds, ready for export."""
+
+    trace_id: str = Field(description="32-character hex trace identifier.")
+    run_id: str = Field(description="Run identifier for the trace.")
+    span_id: str = Field(description="16-character hex span identifier.")
+    parent_span_id: Optional[str] = Field(
+        default=None, description="Parent span identifier, if any."
+    )
+    block_name: str = Field(description="Stable block instance name.")
+    block_type: str = Field(description="Stable block type identifier.")
+    node_name: Optional[str] = Field(default=None, description="Composite node name.")
+    attempt: int = Field(default=1, description="Attempt index for this span.")
+    start_time_unix_nano: int = Field(description="Start time in Unix nanoseconds.")
+    end_time_unix_nano: int = Field(description="End time in Unix nanoseconds.")
+    success: bool = Field(description="Whether the attempt succeeded.")
+    reason: Optional[str] = Field(default=None, description="Failure reason label.")
+    error_type: Optional[str] = Field(
+        default=None, description="Failure error type classifier."
+    )
+    hedge: Optional[bool] = Field(
+        default=None, description="True for a duplicate attempt launched by hedging."
+    )
+    cache_hit: Optional[bool] = Field(
+        default=None, description="Result cache status, when memoized."
+    )
+    run_root: Optional[bool] = Field(
+        default=None,
+        description="True for the run's top-level execution, whose parent (if "
+        "any) is the caller's own span.",
+    )
+    model: Optional[str] = Field(default=None, description="Model identifier, if any.")
+    input_tokens: Optional[int] = Field(
+        default=None, description="Input token count, if available."
+    )
+    output_tokens: Optional[int] = Field(
+        default=None, description="Output token count, if available."
+    )
+    llm_calls: Optional[int] = Field(
+        default=None, description="Number of LLM calls made by this attempt."
+    )
+    cost_usd: Optional[float] = Field(default=None, description="Actual cost in USD.")
+
+    @property
+    def duration_ms(self) -> float:
+        """Span duration in milliseconds."""
+
+        return (self.end_time_unix_nano - self.start_time_unix_nano) / 1_000_000
+
+    @property
+    def name(self) -> str:
+        """Display name: the node name inside a composite, else the block name."""
+
+        return self.node_name or self.block_name
+
+    @classmethod
+    def from_record(
+        cls,
+        record: BlockAttemptRecord,
+        end_time_unix_nano: int,
+        run_root: Optional[bool] = None,
+    ) -> "TraceSpan":
+        """Build a span from a recorded attempt that ended at ``end_time_unix_nano``.
+
+        Args:
+            record: Attempt record produced by the block.
+            end_time_unix_nano: Wall-clock end time in Unix nanoseconds.
+            run_root: True if the attempt is the run's top-level execution.
+
+        Returns:
+            TraceSpan covering the attempt's duration.
+        """
+
+        start = end_time_unix_nano - int(record.duration_ms * 1_000_000)
+        return cls(
+            trace_id=otel_trace_id(record.trace_id),
+            run_id=record.run_id,
+            span_id=record.span_id,
+            parent_span_id=record.parent_span_id,
+            block_name=record.block_name,
+            block_type=record.block_type,
+            node_name=record.node_name,
+            attempt=record.attempt,
+            start_time_unix_nano=start,
+            end_time_unix_nano=end_time_unix_nano,
+            success=record.success,
+            reason=record.reason,
+            error_type=record.error_type,
+            hedge=record.hedge,
+            cache_hit=record.cache_hit,
+            run_root=run_root,
+            model=record.model,
+            input_tokens=record.input_tokens,
+            output_tokens=record.output_tokens,
+            llm_calls=record.llm_calls,
+            cost_usd=record.cost_usd,
+        )
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Return the span in the OTLP/JSON ``Span`` shape."""
+
+        attributes: List[Dict[str, Any]] = []
+        for key, field, value_type in _ATTRIBUTES:
+            value = getattr(self, field)
+            if value is None:
+                continue
+            if value_type == "intValue":
+                value = str(value)
+            attributes.append({"key": key, "value": {value_type: value}})
+        status: Dict[str, Any] = {
+            "code": STATUS_CODE_OK if self.success else STATUS_CODE_ERROR
+        }
+        if not self.success and self.reason:
+            status["message"] = self.reason
+        span: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_time_unix_nano),
+            "endTimeUnixNano": str(self.end_time_unix_nano),
+            "attributes": attributes,
+            "status": status,
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        return span
+
+    @classmethod
+    def from_otlp(cls, span: Dict[str, Any]) -> "TraceSpan":
+        """Rebuild a span from its OTLP/JSON form (see ``to_otlp``)."""
+
+        fields = {field: value_type for _, field, value_type in _ATTRIBUTES}
+        by_key = {key: field for key, field, _ in _ATTRIBUTES}
+        values: Dict[str, Any] = {}
+        for attribute in span.get("attributes", []):
+            field = by_key.get(attribute.get("key"))
+            if field is None:
+                continue
+            value = attribute.get("value", {}).get(fields[field])
+            if value is not None:
+                values[field] = int(value) if fields[field] == "intValue" else value
+        values.setdefault("run_id", "")
+        values.setdefault("block_name", span.get("name", ""))
+        values.setdefault("block_type", "")
+        status = span.get("status", {})
+        return cls(
+            trace_id=span["traceId"],
+            span_id=span["spanId"],
+            parent_span_id=span.get("parentSpanId") or None,
+            start_time_unix_nano=int(span["startTimeUnixNano"]),
+            end_time_unix_nano=int(span["endTimeUnixNano"]),
+            success=status.get("code") != STATUS_CODE_ERROR,
+            **values,
+        )
@@ -0,0 +1,234 @@
+import asyncio
+
+from pydantic import BaseModel
+
+from chaos.cache.block_result_cache import BlockResultCache
+from chaos.cache.cache_key import build_cache_key
+from chaos.cache.sqlite_result_store import SqliteResultStore
+from chaos.domain.block import Block
+from chaos.domain.llm_primitive import LLMPrimitive
+from chaos.domain.messages import Request, Response
+from chaos.llm.llm_request import LLMRequest
+from chaos.llm.llm_response import LLMResponse
+from chaos.stats.block_stats_identity import BlockStatsIdentity
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingBlock(Block):
+    """Primitive counting real executions."""
+
+    def __init__(self, name: str, **kwargs):
+        super().__init__(name=name, **kwargs)
+        self.calls = 0
+
+    def _execute_primitive(self, request: Request) -> Response:
+        self.calls += 1
+        if request.payload.get("fail"):
+            return Response(success=False, reason="nope")
+        return Response(success=True, data={"echo": request.payload.get("x")})
+
+    def build(self) -> None:
+        pass
+
+
+class CompositeStub(Block):
+    def build(self) -> None:
+        pass
+
+
+class Schema(BaseModel):
+    response: str
+
+
+IDENTITY = BlockStatsIdentity(block_name="b", block_type="T")
+
+
+def test_cache_key_is_canonical():
+    """Ignores key order, includes extras, and rejects unhashable inputs."""
+    key = build_cache_key(IDENTITY, {"a": 1, "b": 2}, {})
+    assert key == build_cache_key(IDENTITY, {"b": 2, "a": 1}, {})
+    assert key != build_cache_key(IDENTITY, {"a": 1, "b": 2}, {}, {"model": "m"})
+    assert key != build_cache_key(IDENTITY, {"a": 1, "b": 2}, {"c": 1})
+    rich = {"s": {3, 1}, "raw": b"\x01", "t": int, "m": Schema(response="x")}
+    assert build_cache_key(IDENTITY, rich, {}) == build_cache_key(IDENTITY, rich, {})
+    assert build_cache_key(IDENTITY, {"o": object()}, {}) is None
+
+
+def test_memory_tier_lru_ttl_and_metadata():
+    """Evicts least recently used entries, expires by TTL, strips correlation."""
+    clock = FakeClock()
+    cache = BlockResultCache(max_entries=2, ttl_seconds=10, clock=clock)
+    cache.put("a", "b", Response(success=True, data=1, metadata={"span_id": "s"}))
+    cache.put("b", "b", Response(success=True, data=2, metadata={"model": "m"}))
+    cache.put("fail", "b", Response(success=False))
+    assert cache.get("a").data == 1
+    cache.put("c", "b", Response(success=True, data=3))
+
+    assert cache.get("b") is None
+    hit = cache.get("a")
+    assert hit.metadata["cache"] == "hit"
+    assert hit.metadata["cache_tier"] == "memory"
+    assert "span_id" not in hit.metadata
+    hit.metadata["x"] = 1
+    assert "x" not in cache.get("a").metadata
+    assert len(cache) == 2
+
+    clock.now += 11
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_persistent_tier_survives_restart(tmp_path, caplog):
+    """Serves entries from SQLite across cache instances and handles errors."""
+    clock = FakeClock()
+    path = tmp_path / "results.sqlite"
+    first_store = SqliteResultStore(path)
+    first = BlockResultCache(ttl_seconds=5, persistent=first_store, clock=clock)
+    first.put("k", "b", Response(success=True, data={"v": 1}))
+    first.put("bad", "b", Response(success=True, data={"v": object()}))
+    assert "Failed to persist" in caplog.text
+    first_store.close()
+
+    store = SqliteResultStore(path)
+    second = BlockResultCache(persistent=store, clock=clock)
+    hit = second.get("k")
+    assert hit.data == {"v": 1}
+    assert hit.metadata["cache_tier"] == "sqlite"
+    assert second.get("k").metadata["cache_tier"] == "memory"
+    assert second.get("missing") is None
+
+    store.put("corrupt", "b", "not json", None)
+    assert second.get("corrupt") is None
+
+    clock.now += 6
+    assert BlockResultCache(persistent=store, clock=clock).get("k") is None
+    store.put("old", "b", "{}", clock.now - 1)
+    store.put("new", "b", "{}", None)
+    assert store.purge_expired(clock.now) == 1
+    store.close()
+
+
+def test_hits_do_not_share_mutable_data():
+    """Mutating the stored or a served response never changes later hits."""
+    cache = BlockResultCache()
+    original = Response(success=True, data={"x": [1]})
+    cache.put("k", "b", original)
+    original.data["x"].append(2)
+    hit = cache.get("k")
+    assert hit.data == {"x": [1]}
+    hit.data["x"].append(3)
+    assert cache.get("k").data == {"x": [1]}
+
+
+def test_persistent_tier_restores_model_data(tmp_path, caplog):
+    """Pydantic data keeps its type through SQLite; lossy data is not persisted."""
+    store = SqliteResultStore(tmp_path / "results.sqlite")
+    BlockResultCache(persistent=store).put(
+        "model", "b", Response(success=True, data=Schema(response="x"))
+    )
+    BlockResultCache(persistent=store).put(
+        "tuple", "b", Response(success=True, data=(1, 2))
+    )
+    assert "tuple data cannot be restored" in caplog.text
+
+    cache = BlockResultCache(persistent=store)
+    hit = cache.get("model")
+    assert hit.metadata["cache_tier"] == "sqlite"
+    assert hit.data == Schema(response="x")
+    assert cache.get("model").data == Schema(response="x")
+    assert cache.get("tuple") is None
+    store.close()
+
+
+def test_block_memoization_hits_misses_and_stats():
+    """Serves repeated side-effect-free executions from the cache."""
+    stats = InMemoryBlockStatsStore()
+    cache = BlockResultCache()
+    block = CountingBlock("pure", stats_store=stats, result_cache=cache)
+
+    miss = block.execute(Request(payload={"x": 1}))
+    hit = block.execute(Request(payload={"x": 1}))
+    other = block.execute(Request(payload={"x": 2}))
+    failure = block.execute(Request(payload={"fail": True}))
+    block.execute(Request(payload={"fail": True}))
+
+    assert block.calls == 4
+    assert (miss.metadata["cache"], hit.metadata["cache"]) == ("miss", "hit")
+    assert hit.data == miss.data
+    assert hit.metadata["span_id"] != miss.metadata["span_id"]
+    assert other.metadata["cache"] == "miss"
+    assert failure.success is False
+    assert [r.cache_hit for r in stats._records] == [False, True, False, False, False]
+    estimate = stats.estimate(block.stats_identity())
+    assert estimate.sample_size == 4
+
+    hit_async = asyncio.run(block.execute_async(Request(payload={"x": 2})))
+    assert hit_async.metadata["cache"] == "hit"
+
+    side_effects = CountingBlock(
+        "io", side_effect_class="idempotent", result_cache=BlockResultCache()
+    )
+    side_effects.execute(Request())
+    assert "cache" not in side_effects.execute(Request()).metadata
+    assert side_effects.calls == 2
+
+
+def test_composite_does_not_inherit_child_cache_status():
+    """Reports the composite's own cache status, not its child's."""
+    cache = BlockResultCache()
+    child = CountingBlock("child", result_cache=cache)
+    child.execute(Request(payload={"x": 1}))
+    composite = CompositeStub("graph", nodes={"child": child}, entry_point="child")
+
+    response = composite.execute(Request(payload={"x": 1}))
+
+    assert child.calls == 1
+    assert "cache" not in response.metadata
+
+
+def test_llm_primitive_memoizes_only_at_temperature_zero():
+    """Caches deterministic LLM calls keyed by model configuration."""
+
+    class Service:
+        calls = 0
+
+        def execute(self, request: LLMRequest) -> LLMResponse:
+            Service.calls += 1
+            return LLMResponse.success(data={"response": "ok"}, raw_output=None)
+
+    cache = BlockResultCache()
+    stats = InMemoryBlockStatsStore()
+
+    def build(temperature: float, prompt: str = "sys") -> LLMPrimitive:
+        block = LLMPrimitive(
+            name="llm",
+            system_prompt=prompt,
+            output_data_model=Schema,
+            model="m",
+            temperature=temperature,
+            llm_service=Service(),
+            result_cache=cache,
+        )
+        block._stats_store = stats
+        return block
+
+    request = Request(payload={"prompt": "hi"})
+    build(0.0).execute(request)
+    assert build(0.0).execute(request).metadata["cache"] == "hit"
+    build(0.0, prompt="other").execute(request)
+    build(0.7).execute(request)
+    build(0.7).execute(request)
+
+    assert Service.calls == 4
+    hit_record = stats._records[1]
+    assert hit_record.cache_hit is True
+    assert hit_record.llm_calls == 0
@@ -0,0 +1,24 @@
+from typing import Iterator
+
+import pytest
+
+from chaos.stats import store_registry
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+
+
+@pytest.fixture(autouse=True)
+def isolated_default_stats_store(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[InMemoryBlockStatsStore]:
+    """
+    Replaces the default block stats store with an in-memory store per test.
+
+    Blocks built without an explicit ``stats_store`` would otherwise record
+    into ``.chaos/db/block_stats.json`` in the working directory.
+
+    Yields:
+        The in-memory store used as the default for the test.
+    """
+    store = InMemoryBlockStatsStore()
+    monkeypatch.setattr(store_registry, "_DEFAULT_STORE", store)
+    yield store
@@ -0,0 +1,256 @@
+"""Tests for the native asyncio execution path of blocks."""
+
+import asyncio
+
+import chaos.domain.block as block_module
+from chaos.domain.block import Block
+from chaos.domain.messages import Request, Response
+from chaos.domain.policy import (
+    BubblePolicy,
+    RecoveryPolicy,
+    RepairPolicy,
+    RetryPolicy,
+)
+from chaos.engine.conditions import ConditionRegistry
+from chaos.engine.registry import RepairRegistry
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+
+
+class SleepyBlock(Block):
+    """Leaf block with a native async primitive that yields to the loop."""
+
+    def __init__(self, name: str, store=None):
+        super().__init__(name=name, stats_store=store)
+        self.active = 0
+        self.peak = 0
+
+    def _execute_primitive(self, request: Request):
+        raise AssertionError("sync primitive used on the async path")
+
+    async def _execute_primitive_async(self, request: Request):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return Response(success=True, data=f"{self.name}:{request.payload.get('x')}")
+
+    def build(self) -> None:
+        pass
+
+
+class EchoBlock(Block):
+    """Sync-only leaf block returning fixed data."""
+
+    def __init__(self, name: str, data: object = "ok", store=None):
+        super().__init__(name=name, stats_store=store)
+        self._data = data
+
+    def _execute_primitive(self, request: Request):
+        return Response(success=True, data=self._data)
+
+    def build(self) -> None:
+        pass
+
+
+class FailingBlock(Block):
+    """Leaf block failing a fixed number of times with configurable policies."""
+
+    def __init__(
+        self,
+        name: str,
+        failures: int,
+        policies: list[RecoveryPolicy],
+        side_effect_class: str = "idempotent",
+    ):
+        super().__init__(name=name, side_effect_class=side_effect_class)
+        self.failures = failures
+        self.policies = policies
+        self.payloads: list[object] = []
+
+    def _execute_primitive(self, request: Request):
+        self.payloads.append(request.payload)
+        if len(self.payloads) <= self.failures:
+            return Response(success=False, reason="flaky", error_type=ValueError)
+        return Response(success=True, data="recovered")
+
+    def get_policy_stack(self, error_type) -> list[RecoveryPolicy]:
+        return self.policies
+
+    def build(self) -> None:
+        pass
+
+
+class ExplodingBlock(Block):
+    """Leaf block raising from its primitive."""
+
+    def _execute_primitive(self, request: Request):
+        raise RuntimeError("boom")
+
+    def build(self) -> None:
+        pass
+
+
+class CompositeStub(Block):
+    def build(self) -> None:
+        pass
+
+
+def _composite(nodes, transitions, entry_point="start", **kwargs) -> Block:
+    return CompositeStub(
+        "graph",
+        nodes=nodes,
+        entry_point=entry_point,
+        transitions=transitions,
+        **kwargs,
+    )
+
+
+def test_execute_async_runs_graphs_concurrently_on_one_loop():
+    """Many composite runs overlap on the loop and record the same stats."""
+    store = InMemoryBlockStatsStore()
+    leaf = SleepyBlock("leaf", store)
+    composite = _composite(
+        {"start": EchoBlock("start", store=store), "leaf": leaf},
+        {"start": [{"condition": "default", "target": "leaf"}]},
+        stats_store=store,
+    )
+
+    async def run_all():
+        return await asyncio.gather(
+            *(composite.execute_async(Request(payload={"x": i})) for i in range(20))
+        )
+
+    responses = asyncio.run(run_all())
+
+    assert [r.data for r in responses] == [f"leaf:{i}" for i in range(20)]
+    assert leaf.peak > 1
+    assert all("duration_ms" in r.metadata for r in responses)
+    assert len(store._records) == 60
+    assert composite.state.name == "READY"
+
+
+def test_execute_async_parallel_transition_and_default_primitive():
+    """Fans out branches as tasks and runs sync primitives in threads."""
+    branches = {name: SleepyBlock(name) for name in ("a", "b", "c")}
+    composite = _composite(
+        {"start": EchoBlock("start"), **branches, "end": EchoBlock("end", "done")},
+        {"start": {"parallel": ["a", "b", "c"], "reducer": "list"}},
+    )
+    response = asyncio.run(composite.execute_async(Request(payload={"x": 1})))
+    assert response.data == ["a:1", "b:1", "c:1"]
+
+    failing = _composite(
+        {
+            "start": EchoBlock("start"),
+            "a": SleepyBlock("a"),
+            "bad": ExplodingBlock("bad"),
+        },
+        {"start": {"parallel": ["a", "bad"], "target": "a", "max_workers": 1}},
+    )
+    assert asyncio.run(failing.execute_async(Request())).reason == "internal_error"
+
+    chained = _composite(
+        {
+            "start": EchoBlock("start"),
+            "a": SleepyBlock("a"),
+            "end": EchoBlock("end", "done"),
+        },
+        {"start": {"parallel": ["a"], "target": "end"}},
+    )
+    assert asyncio.run(chained.execute_async(Request())).data == "done"
+
+
+def test_execute_async_retry_uses_asyncio_sleep(monkeypatch):
+    """Retries with a non-blocking sleep and never calls time.sleep."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    def blocking_sleep(delay):
+        raise AssertionError("blocking sleep on the event loop")
+
+    monkeypatch.setattr(block_module.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(block_module, "sleep", blocking_sleep)
+    child = FailingBlock("child", 2, [RetryPolicy(max_attempts=3, delay_seconds=0.5)])
+    composite = _composite({"start": child}, {})
+
+    response = asyncio.run(composite.execute_async(Request()))
+
+    assert response.data == "recovered"
+    assert delays == [0.5, 0.5]
+
+
+def test_execute_async_repair_and_custom_policies():
+    """Applies repair, custom, and unsafe-retry rules like the sync path."""
+
+    @RepairRegistry.register("async_fix")
+    def fix(request: Request, failure: Response) -> Request:
+        return request.model_copy(update={"payload": {"fixed": True}})
+
+    try:
+        child = FailingBlock("child", 1, [RepairPolicy(repair_function="async_fix")])
+        response = asyncio.run(
+            _composite({"start": child}, {}).execute_async(Request())
+        )
+        assert response.data == "recovered"
+        assert child.payloads[-1] == {"fixed": True}
+    finally:
+        RepairRegistry.clear()
+
+    missing = FailingBlock("child", 1, [RepairPolicy(repair_function="missing")])
+    response = asyncio.run(_composite({"start": missing}, {}).execute_async(Request()))
+    assert response.reason == "repair_execution_failed"
+
+    bubbling = FailingBlock("child", 5, [BubblePolicy(), RetryPolicy()])
+    response = asyncio.run(_composite({"start": bubbling}, {}).execute_async(Request()))
+    assert response.reason == "flaky"
+    assert len(bubbling.payloads) == 1
+
+    unsafe = FailingBlock(
+        "child",
+        1,
+        [RetryPolicy(), RepairPolicy(repair_function="add_validation_feedback")],
+        side_effect_class="non_idempotent",
+    )
+    response = asyncio.run(_composite({"start": unsafe}, {}).execute_async(Request()))
+    assert response.reason == "unsafe_to_retry"
+    assert len(unsafe.payloads) == 1
+
+
+def test_execute_async_graph_failures():
+    """Surfaces graph errors and exceptions with the sync failure reasons."""
+    invalid = _composite({"start": EchoBlock("start")}, {}, entry_point="missing")
+    assert asyncio.run(invalid.execute_async(Request())).reason == "invalid_graph"
+
+    loop = _composite(
+        {"start": EchoBlock("start"), "next": EchoBlock("next")},
+        {"start": "next", "next": "start"},
+        max_steps=3,
+    )
+    assert asyncio.run(loop.execute_async(Request())).reason == "max_steps_exceeded"
+
+    fan = _composite(
+        {"start": EchoBlock("start"), "a": EchoBlock("a"), "b": EchoBlock("b")},
+        {"start": {"parallel": ["a", "b"]}},
+        max_steps=2,
+    )
+    assert asyncio.run(fan.execute_async(Request())).reason == "max_steps_exceeded"
+
+    ConditionRegistry.register("async_never")(lambda response: False)
+    try:
+        no_match = _composite(
+            {"start": EchoBlock("start"), "next": EchoBlock("next")},
+            {"start": [{"condition": "async_never", "target": "next"}]},
+        )
+        response = asyncio.run(no_match.execute_async(Request()))
+        assert response.reason == "no_transition"
+    finally:
+        ConditionRegistry._registry.pop("async_never", None)
+
+    child_failure = _composite({"start": FailingBlock("child", 1, [])}, {})
+    assert asyncio.run(child_failure.execute_async(Request())).reason == "flaky"
+
+    response = asyncio.run(ExplodingBlock("leaf").execute_async(Request()))
+    assert response.reason == "internal_error"
+    assert response.error_type is RuntimeError
@@ -0,0 +1,109 @@
+"""Tests for Block.execute_many batch execution."""
+
+import asyncio
+import time
+
+from chaos.domain.block import Block
+from chaos.domain.messages import Request, Response
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+
+
+class SleepyBlock(Block):
+    """Primitive sleeping for ``payload["delay"]`` and failing on demand."""
+
+    def __init__(self, name: str):
+        super().__init__(name=name, stats_store=InMemoryBlockStatsStore())
+        self.executed: list[int] = []
+
+    def _execute_primitive(self, request: Request) -> Response:
+        time.sleep(request.payload.get("delay", 0))
+        self.executed.append(request.payload["i"])
+        if request.payload.get("fail"):
+            return Response(success=False, reason="boom", error_type=ValueError)
+        return Response(success=True, data=request.payload["i"])
+
+    async def _execute_primitive_async(self, request: Request) -> Response:
+        await asyncio.sleep(request.payload.get("delay", 0))
+        self.executed.append(request.payload["i"])
+        if request.payload.get("fail"):
+            return Response(success=False, reason="boom", error_type=ValueError)
+        return Response(success=True, data=request.payload["i"])
+
+    def build(self) -> None:
+        pass
+
+
+def make_requests(count: int, delay: float = 0.0, fail: int = -1) -> list[Request]:
+    return [
+        Request(payload={"i": i, "delay": delay * (count - i), "fail": i == fail})
+        for i in range(count)
+    ]
+
+
+def test_execute_many_orders_results_and_shares_trace():
+    """Returns input order, one trace id, distinct run ids, unmutated inputs."""
+    block = SleepyBlock("sleepy")
+    requests = make_requests(5, delay=0.01)
+    requests[0].metadata["run_id"] = "fixed"
+
+    responses = block.execute_many(requests, max_concurrency=5)
+
+    assert [r.data for r in responses] == [0, 1, 2, 3, 4]
+    assert len({r.metadata["trace_id"] for r in responses}) == 1
+    assert len({r.metadata["run_id"] for r in responses}) == 5
+    assert responses[0].metadata["run_id"] == "fixed"
+    assert "trace_id" not in requests[1].metadata
+    assert block.execute_many([]) == []
+    assert block.execute_many(requests[:1], trace_id="t")[0].metadata["trace_id"] == "t"
+
+
+def test_execute_many_scales_with_concurrency():
+    """Runs requests concurrently instead of serially."""
+    block = SleepyBlock("sleepy")
+    requests = [Request(payload={"i": i, "delay": 0.05}) for i in range(8)]
+
+    start = time.perf_counter()
+    block.execute_many(requests, max_concurrency=8)
+
+    assert time.perf_counter() - start < 0.05 * 8 / 2
+
+
+def test_execute_many_fail_fast_and_collect_all():
+    """Collect-all runs everything; fail-fast skips requests not yet started."""
+    block = SleepyBlock("sleepy")
+
+    collected = block.execute_many(make_requests(4, fail=1), max_concurrency=1)
+    assert [r.success for r in collected] == [True, False, True, True]
+    assert collected[1].reason == "boom"
+
+    block.executed.clear()
+    fast = block.execute_many(
+        make_requests(4, fail=1), max_concurrency=1, fail_fast=True
+    )
+    assert [r.reason for r in fast] == [
+        None,
+        "boom",
+        "batch_cancelled",
+        "batch_cancelled",
+    ]
+    assert fast[2].details == {"index": 2}
+    assert fast[3].metadata["trace_id"] == fast[0].metadata["trace_id"]
+    assert block.executed == [0, 1]
+
+
+def test_execute_many_async_matches_sync_semantics():
+    """Async batches keep order, share the trace, and honor fail-fast."""
+    block = SleepyBlock("sleepy")
+
+    responses = asyncio.run(
+        block.execute_many_async(make_requests(4, delay=0.01), max_concurrency=4)
+    )
+    assert [r.data for r in responses] == [0, 1, 2, 3]
+    assert len({r.metadata["trace_id"] for r in responses}) == 1
+
+    fast = asyncio.run(
+        block.execute_many_async(
+            make_requests(3, fail=0), max_concurrency=1, fail_fast=True
+        )
+    )
+    assert [r.reason for r in fast] == ["boom", "batch_cancelled", "batch_cancelled"]
@@ -309,3 +309,39 @@ def test_repair_increments_attempt_and_uses_child_envelope() -> None:
         assert "span_id" in response.metadata
     finally:
         RepairRegistry.clear()
+
+
+def test_composite_compiles_plan_once_and_recompiles_on_set_graph():
+    """Resolves conditions once per graph and indexes nodes in the plan."""
+    lookups: list[str] = []
+
+    class CountingRegistry(ConditionRegistry):
+        @classmethod
+        def get(cls, name: str):
+            lookups.append(name)
+            return super().get(name)
+
+    a = AlwaysSuccessBlock("a")
+    b = AlwaysSuccessBlock("b", data="done")
+    composite = CompositeBlockStub(
+        name="graph",
+        nodes={"a": a, "b": b},
+        entry_point="a",
+        transitions={"a": [{"condition": "default", "target": "b"}]},
+        condition_registry=CountingRegistry,
+    )
+
+    for _ in range(3):
+        assert composite.execute(Request()).data == "done"
+    plan = composite._plan
+    assert plan.node_names == ("a", "b")
+    assert plan.entry == 0
+    assert plan.transitions[0].branches[0].target == 1
+    assert plan.transitions[1].target is None
+    # One lookup while validating, one while compiling; none per hop.
+    assert len(lookups) == 2
+
+    composite.set_graph({"a": a, "b": b}, entry_point="b", transitions={"b": "a"})
+    assert composite._plan is None
+    assert composite.execute(Request()).data == "ok"
+    assert composite._plan.transitions[1].target == 0
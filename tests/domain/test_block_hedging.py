@@ -0,0 +1,146 @@
+"""Tests for hedged child attempts."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from chaos.domain.block import Block
+from chaos.domain.deadline import with_timeout
+from chaos.domain.messages import Request, Response
+from chaos.domain.policy import HedgePolicy
+from chaos.stats.block_attempt_record import BlockAttemptRecord
+from chaos.stats.graph_estimate_builder import expected_attempts
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+from chaos.stats.statistics import quantile
+
+
+class SlowFirstBlock(Block):
+    """Leaf block whose n-th call sleeps ``delays[n]`` seconds."""
+
+    def __init__(self, delays, **kwargs):
+        kwargs.setdefault("hedge_policy", HedgePolicy(fallback_delay_ms=30))
+        super().__init__(name="slow", stats_store=InMemoryBlockStatsStore(), **kwargs)
+        self.delays = list(delays)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _next_delay(self) -> float:
+        with self._lock:
+            self.calls += 1
+            return self.delays[self.calls - 1] if self.calls <= len(self.delays) else 0
+
+    def _execute_primitive(self, request: Request) -> Response:
+        time.sleep(self._next_delay())
+        return Response(success=True, data=self.calls)
+
+    async def _execute_primitive_async(self, request: Request) -> Response:
+        await asyncio.sleep(self._next_delay())
+        return Response(success=True, data=self.calls)
+
+    def build(self) -> None:
+        pass
+
+
+class Pipeline(Block):
+    def build(self) -> None:
+        pass
+
+
+def wrap(child: Block) -> Block:
+    return Pipeline(
+        "pipeline",
+        nodes={"call": child},
+        entry_point="call",
+        stats_store=InMemoryBlockStatsStore(),
+    )
+
+
+def records(block: Block) -> list[BlockAttemptRecord]:
+    return block._stats_store.records(block.stats_identity())
+
+
+def test_slow_primary_is_hedged_and_both_attempts_recorded():
+    """A duplicate launched after the hedge delay wins; both spans are kept."""
+    child = SlowFirstBlock([0.5, 0.0])
+
+    start = time.perf_counter()
+    response = wrap(child).execute(Request())
+
+    assert time.perf_counter() - start < 0.4
+    assert response.success is True
+    assert response.metadata["hedges"] == 1
+    assert "hedge_won" not in response.metadata
+
+    deadline = time.monotonic() + 2
+    while len(records(child)) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    attempts = records(child)
+    assert [r.hedge for r in attempts] == [True, None]
+    assert len({r.span_id for r in attempts}) == 2
+    assert len({r.parent_span_id for r in attempts}) == 1
+
+
+def test_async_hedge_cancels_the_loser():
+    """The losing attempt is cancelled and recorded as such."""
+    child = SlowFirstBlock([5.0, 0.0])
+
+    start = time.perf_counter()
+    response = asyncio.run(wrap(child).execute_async(Request()))
+
+    assert time.perf_counter() - start < 1.0
+    assert response.metadata["hedges"] == 1
+    reasons = sorted(
+        (r.reason or "ok", bool(r.hedge), r.hedge_cancelled) for r in records(child)
+    )
+    assert reasons == [("cancelled", False, True), ("ok", True, None)]
+    estimate = child._stats_store.estimate(child.stats_identity())
+    assert estimate.sample_size == 1
+    assert expected_attempts(records(child)) == 1.0
+
+
+def test_single_flight_hedge_does_not_coalesce_onto_the_primary():
+    """With single_flight the duplicate still runs instead of waiting."""
+    child = SlowFirstBlock([0.5, 0.0], single_flight=True)
+
+    start = time.perf_counter()
+    response = wrap(child).execute(Request())
+
+    assert time.perf_counter() - start < 0.4
+    assert response.success is True
+    assert response.metadata["hedges"] == 1
+    assert child.calls == 2
+    assert "coalesced" not in response.metadata
+
+
+def test_hedge_delay_uses_observed_quantile():
+    """The delay comes from the child's recorded latency once data exists."""
+    child = SlowFirstBlock([], hedge_policy=HedgePolicy(min_samples=3, quantile=0.5))
+    pipeline = wrap(child)
+    request = Request()
+    assert pipeline._hedge_delay_seconds(child, request) is None
+
+    for duration in (10.0, 20.0, 30.0, 400.0):
+        child._record_attempt(request, Response(success=True), duration)
+    # The quantile is cached until the refresh interval passes.
+    assert pipeline._hedge_delay_seconds(child, request) is None
+    child.HEDGE_DELAY_REFRESH_SECONDS = 0.0
+    assert pipeline._hedge_delay_seconds(child, request) == pytest.approx(0.025)
+    assert pipeline._hedge_delay_seconds(child, with_timeout(request, 0.01)) is None
+
+    assert quantile([], 0.95) == 0.0
+    assert quantile([1.0, 2.0, 3.0, 4.0, 5.0], 0.95) == pytest.approx(4.8)
+
+
+def test_unsafe_or_fast_children_are_not_hedged():
+    """Non-idempotent children never hedge; fast primaries need no duplicate."""
+    unsafe = SlowFirstBlock([0.1], side_effect_class="non_idempotent")
+    response = wrap(unsafe).execute(Request())
+    assert "hedges" not in response.metadata
+    assert unsafe.calls == 1
+
+    fast = SlowFirstBlock([0.0])
+    response = wrap(fast).execute(Request())
+    assert "hedges" not in response.metadata
+    assert fast.calls == 1
@@ -0,0 +1,209 @@
+"""Tests for parallel fan-out/fan-in transitions in composite blocks."""
+
+import threading
+
+from chaos.domain.block import Block
+from chaos.domain.messages import Request, Response
+from chaos.domain.policy import RecoveryPolicy, RetryPolicy
+from chaos.domain.response_metadata_keys import (
+    COMPOSITE_LAST_NODE_KEY,
+    COMPOSITE_PARALLEL_BRANCHES_KEY,
+)
+from chaos.engine.reducers import ReducerRegistry
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+
+
+class BarrierBlock(Block):
+    """Leaf block that only succeeds when all parties run concurrently."""
+
+    def __init__(self, name: str, barrier: threading.Barrier, store=None):
+        super().__init__(name=name, stats_store=store)
+        self._barrier = barrier
+        self.parent_span_ids: list[str] = []
+
+    def _execute_primitive(self, request: Request):
+        self.parent_span_ids.append(request.metadata["parent_span_id"])
+        self._barrier.wait(timeout=5)
+        return Response(success=True, data=f"{self.name}:{request.payload['x']}")
+
+    def build(self) -> None:
+        pass
+
+
+class EchoBlock(Block):
+    """Leaf block returning fixed data."""
+
+    def __init__(self, name: str, data: object = "ok", store=None):
+        super().__init__(name=name, stats_store=store)
+        self._data = data
+        self.calls = 0
+
+    def _execute_primitive(self, request: Request):
+        self.calls += 1
+        return Response(success=True, data=self._data)
+
+    def build(self) -> None:
+        pass
+
+
+class FlakyBlock(Block):
+    """Leaf block failing a fixed number of times before succeeding."""
+
+    def __init__(self, name: str, failures: int, store=None):
+        super().__init__(name=name, stats_store=store)
+        self.failures = failures
+        self.attempts = 0
+
+    def _execute_primitive(self, request: Request):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            return Response(success=False, reason="flaky")
+        return Response(success=True, data="recovered")
+
+    def get_policy_stack(self, error_type) -> list[RecoveryPolicy]:
+        return [RetryPolicy(max_attempts=2)]
+
+    def build(self) -> None:
+        pass
+
+
+class CompositeStub(Block):
+    def build(self) -> None:
+        pass
+
+
+def test_parallel_branches_run_concurrently_and_join():
+    """Runs branches at once, reduces by node name, and continues to target."""
+    store = InMemoryBlockStatsStore()
+    barrier = threading.Barrier(3)
+    branches = {name: BarrierBlock(name, barrier, store) for name in ("a", "b", "c")}
+    start = EchoBlock("start", store=store)
+    end = EchoBlock("end", data="done", store=store)
+    composite = CompositeStub(
+        "fan",
+        nodes={"start": start, **branches, "end": end},
+        entry_point="start",
+        transitions={"start": {"parallel": ["a", "b", "c"], "target": "end"}},
+        stats_store=store,
+    )
+
+    response = composite.execute(Request(payload={"x": 1}))
+
+    assert response.success is True
+    assert response.data == "done"
+    assert end.calls == 1
+    span_id = response.metadata["span_id"]
+    assert all(block.parent_span_ids == [span_id] for block in branches.values())
+    recorded = [record.block_name for record in store._records]
+    assert sorted(recorded) == ["a", "b", "c", "end", "fan", "start"]
+
+
+def test_parallel_terminal_fan_in_uses_named_reducer():
+    """Returns the reduced response with branch metadata when terminal."""
+    composite = CompositeStub(
+        "fan",
+        nodes={
+            "start": EchoBlock("start"),
+            "a": EchoBlock("a", data=1),
+            "b": EchoBlock("b", data=2),
+        },
+        entry_point="start",
+        transitions={
+            "start": {"parallel": ["b", "a"], "reducer": "list", "max_workers": 1}
+        },
+    )
+
+    response = composite.execute(Request())
+
+    assert response.success is True
+    assert response.data == [2, 1]
+    assert response.metadata[COMPOSITE_PARALLEL_BRANCHES_KEY] == ["b", "a"]
+    assert response.metadata[COMPOSITE_LAST_NODE_KEY] == "start"
+
+    default = CompositeStub(
+        "fan",
+        nodes={"start": EchoBlock("start"), "a": EchoBlock("a", data=1)},
+        entry_point="start",
+        transitions={"start": {"parallel": ["a"]}},
+    )
+    assert default.execute(Request()).data == {"a": 1}
+
+
+def test_parallel_branch_recovery_and_failure():
+    """Applies per-branch recovery and returns the first unrecovered failure."""
+    flaky = FlakyBlock("flaky", failures=1)
+    composite = CompositeStub(
+        "fan",
+        nodes={"start": EchoBlock("start"), "flaky": flaky, "ok": EchoBlock("ok")},
+        entry_point="start",
+        transitions={"start": {"parallel": ["flaky", "ok"]}},
+    )
+    response = composite.execute(Request())
+    assert response.success is True
+    assert response.data == {"flaky": "recovered", "ok": "ok"}
+    assert flaky.attempts == 2
+
+    broken = FlakyBlock("broken", failures=5)
+    composite = CompositeStub(
+        "fan",
+        nodes={"start": EchoBlock("start"), "broken": broken, "ok": EchoBlock("ok")},
+        entry_point="start",
+        transitions={"start": {"parallel": ["ok", "broken"]}},
+    )
+    response = composite.execute(Request())
+    assert response.success is False
+    assert response.reason == "flaky"
+    assert broken.attempts == 2
+
+
+def test_parallel_reducer_errors_and_step_limit():
+    """Reports reducer failures and counts branches toward max_steps."""
+
+    @ReducerRegistry.register("explode")
+    def explode(responses):
+        raise RuntimeError("boom")
+
+    nodes = {"start": EchoBlock("start"), "a": EchoBlock("a"), "b": EchoBlock("b")}
+    try:
+        composite = CompositeStub(
+            "fan",
+            nodes=nodes,
+            entry_point="start",
+            transitions={"start": {"parallel": ["a", "b"], "reducer": "explode"}},
+        )
+        response = composite.execute(Request())
+        assert response.reason == "reducer_execution_error"
+        assert response.details["reducer"] == "explode"
+    finally:
+        ReducerRegistry.clear()
+
+    limited = CompositeStub(
+        "fan",
+        nodes=nodes,
+        entry_point="start",
+        transitions={"start": {"parallel": ["a", "b"]}},
+        max_steps=2,
+    )
+    assert limited.execute(Request()).reason == "max_steps_exceeded"
+
+
+def test_parallel_transition_validation():
+    """Rejects malformed parallel transitions before execution."""
+    nodes = {"start": EchoBlock("start"), "a": EchoBlock("a"), "b": EchoBlock("b")}
+    cases = [
+        ({"start": {"parallel": []}}, "invalid_graph"),
+        ({"start": {"parallel": ["a", "a"]}}, "invalid_graph"),
+        ({"start": {"parallel": ["missing"]}}, "invalid_graph"),
+        ({"start": {"parallel": ["a"]}, "a": "b"}, "invalid_graph"),
+        ({"start": {"parallel": ["a"], "target": "missing"}}, "invalid_graph"),
+        ({"start": {"parallel": ["a"], "max_workers": 0}}, "invalid_graph"),
+        ({"start": {"parallel": ["a"], "reducer": "nope"}}, "reducer_resolution_error"),
+    ]
+    for transitions, reason in cases:
+        composite = CompositeStub(
+            "fan", nodes=nodes, entry_point="start", transitions=transitions
+        )
+        response = composite.execute(Request())
+        assert response.success is False
+        assert response.reason == reason, transitions
+        assert nodes["a"].calls == 0
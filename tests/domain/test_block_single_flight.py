@@ -0,0 +1,158 @@
+"""Tests for single-flight coalescing of identical concurrent executions."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from chaos.domain.block import Block
+from chaos.domain.deadline import with_timeout
+from chaos.domain.messages import Request, Response
+from chaos.engine.single_flight import SingleFlight
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+
+
+class SlowBlock(Block):
+    """Leaf that sleeps, counts its executions, and can fail or raise."""
+
+    def __init__(self, delay=0.1, outcome="ok", **kwargs):
+        kwargs.setdefault("single_flight", True)
+        super().__init__(name="slow", stats_store=InMemoryBlockStatsStore(), **kwargs)
+        self.delay = delay
+        self.outcome = outcome
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _count(self) -> None:
+        with self._lock:
+            self.calls += 1
+
+    def _result(self) -> Response:
+        if self.outcome == "raise":
+            raise RuntimeError("boom")
+        if self.outcome == "fail":
+            return Response(success=False, reason="upstream")
+        return Response(success=True, data={"answer": 42})
+
+    def _execute_primitive(self, request: Request) -> Response:
+        self._count()
+        time.sleep(self.delay)
+        return self._result()
+
+    async def _execute_primitive_async(self, request: Request) -> Response:
+        self._count()
+        await asyncio.sleep(self.delay)
+        return self._result()
+
+    def build(self) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def clear_flights():
+    SingleFlight.clear()
+    yield
+    SingleFlight.clear()
+
+
+def request() -> Request:
+    return Request(payload={"prompt": "same"})
+
+
+def test_concurrent_identical_calls_share_one_attempt():
+    """One execution serves every caller; each keeps its own correlation."""
+    block = SlowBlock()
+
+    responses = block.execute_many([request() for _ in range(4)], max_concurrency=4)
+
+    assert block.calls == 1
+    assert all(r.data == {"answer": 42} for r in responses)
+    assert sum(bool(r.metadata.get("coalesced")) for r in responses) == 3
+    assert len({r.metadata["span_id"] for r in responses}) == 4
+    assert len({r.metadata["run_id"] for r in responses}) == 4
+    assert SingleFlight.coalesced_count() == 3
+    assert SingleFlight.in_flight() == 0
+
+    records = block._stats_store.records(block.stats_identity())
+    assert sorted(bool(r.coalesced) for r in records) == [False, True, True, True]
+    assert block.estimate_execution(request()).sample_size == 1
+
+
+def test_async_callers_coalesce_and_distinct_inputs_do_not():
+    """Identical async calls coalesce; other inputs and unsafe blocks run."""
+    block = SlowBlock(delay=0.05)
+
+    async def scenario():
+        return await asyncio.gather(
+            block.execute_async(request()),
+            block.execute_async(request()),
+            block.execute_async(Request(payload={"prompt": "other"})),
+        )
+
+    responses = asyncio.run(scenario())
+    assert block.calls == 2
+    assert [bool(r.metadata.get("coalesced")) for r in responses] == [
+        False,
+        True,
+        False,
+    ]
+
+    for unsafe in (
+        SlowBlock(delay=0.05, side_effect_class="non_idempotent"),
+        SlowBlock(delay=0.05, single_flight=False),
+    ):
+        unsafe.execute_many([request(), request()], max_concurrency=2)
+        assert unsafe.calls == 2
+        assert unsafe.is_coalescable() is False
+
+
+def test_leader_failures_are_shared():
+    """Followers receive the leader's failure; a raised error fails them too."""
+    failing = SlowBlock(outcome="fail")
+    responses = failing.execute_many([request(), request()], max_concurrency=2)
+    assert [r.reason for r in responses] == ["upstream", "upstream"]
+    assert failing.calls == 1
+
+    raising = SlowBlock(outcome="raise")
+    responses = raising.execute_many([request(), request()], max_concurrency=2)
+    assert [r.reason for r in responses] == ["internal_error", "internal_error"]
+    assert raising.calls == 1
+
+
+def test_follower_deadline_and_cancelled_leader():
+    """Followers honour their own deadline; a cancelled leader frees them."""
+    block = SlowBlock(delay=0.2)
+
+    async def deadline_scenario():
+        leader = asyncio.ensure_future(block.execute_async(request()))
+        await asyncio.sleep(0.01)
+        follower = await block.execute_async(with_timeout(request(), 0.02))
+        return follower, await leader
+
+    follower, leader = asyncio.run(deadline_scenario())
+    assert follower.reason == "deadline_exceeded"
+    assert leader.success is True
+
+    def sync_follower():
+        thread = threading.Thread(target=block.execute, args=(request(),))
+        thread.start()
+        time.sleep(0.02)
+        response = block.execute(with_timeout(request(), 0.02))
+        thread.join()
+        return response
+
+    assert sync_follower().reason == "deadline_exceeded"
+
+    block.calls = 0
+
+    async def cancel_scenario():
+        leader = asyncio.ensure_future(block.execute_async(request()))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(block.execute_async(request()))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(cancel_scenario()).success is True
+    assert block.calls == 2
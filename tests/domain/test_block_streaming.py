@@ -0,0 +1,200 @@
+"""Tests for streaming partial outputs between graph nodes."""
+
+import asyncio
+import time
+
+from chaos.domain.block import Block
+from chaos.domain.chunk_stream import ChunkStream
+from chaos.domain.messages import Request, Response
+from chaos.domain.policy import RetryPolicy
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+
+
+class Producer(Block):
+    """Streams ``chunks`` with a pause between them; can fail once mid-stream."""
+
+    def __init__(self, chunks=("a", "b", "c"), pause=0.05, fail_once=False):
+        super().__init__(name="producer", stats_store=InMemoryBlockStatsStore())
+        self.chunks = chunks
+        self.pause = pause
+        self.fail_once = fail_once
+        self.finished_at = None
+
+    async def _stream_primitive_async(self, request: Request):
+        for position, chunk in enumerate(self.chunks):
+            if position:
+                await asyncio.sleep(self.pause)
+            yield chunk
+            if self.fail_once and position == 0:
+                self.fail_once = False
+                raise RuntimeError("provider dropped the stream")
+        self.finished_at = time.perf_counter()
+
+    def build(self) -> None:
+        pass
+
+    def get_policy_stack(self, error_type):
+        return [RetryPolicy(max_attempts=2)]
+
+
+class Consumer(Block):
+    """Upper-cases every chunk it receives."""
+
+    def __init__(self, fail_once=False, pause=0.0):
+        super().__init__(name="consumer", stats_store=InMemoryBlockStatsStore())
+        self.fail_once = fail_once
+        self.pause = pause
+        self.first_chunk_at = None
+        self.seen = []
+
+    async def _consume_stream_async(self, request: Request, chunks: ChunkStream):
+        received = []
+        async for chunk in chunks:
+            if self.first_chunk_at is None:
+                self.first_chunk_at = time.perf_counter()
+            received.append(chunk)
+            await asyncio.sleep(self.pause)
+        self.seen.append(received)
+        if self.fail_once:
+            self.fail_once = False
+            return Response(success=False, reason="flaky")
+        return Response(success=True, data="".join(received).upper())
+
+    def build(self) -> None:
+        pass
+
+    def get_policy_stack(self, error_type):
+        return [RetryPolicy(max_attempts=2)]
+
+
+class Pipeline(Block):
+    def build(self) -> None:
+        pass
+
+
+def build_pipeline(producer, consumer, **transition):
+    return Pipeline(
+        "pipeline",
+        nodes={"produce": producer, "consume": consumer},
+        entry_point="produce",
+        transitions={"produce": {"stream": "consume", **transition}},
+        stats_store=InMemoryBlockStatsStore(),
+    )
+
+
+def reasons(block):
+    return [r.reason for r in block._stats_store.records(block.stats_identity())]
+
+
+def test_consumer_starts_before_producer_finishes():
+    """Chunks flow to the consumer while the producer is still generating."""
+    producer, consumer = Producer(), Consumer()
+
+    response = asyncio.run(build_pipeline(producer, consumer).execute_async(Request()))
+
+    assert response.success is True
+    assert response.data == "ABC"
+    assert response.metadata["graph_path"] == ["produce", "consume"]
+    assert consumer.first_chunk_at < producer.finished_at
+    assert reasons(producer) == [None]
+    assert reasons(consumer) == [None]
+
+
+def test_sync_execution_pipes_on_a_private_loop():
+    """execute runs the streamed pair too; a lone producer assembles its chunks."""
+    producer, consumer = Producer(pause=0), Consumer()
+
+    assert build_pipeline(producer, consumer).execute(Request()).data == "ABC"
+    assert Producer(pause=0).execute(Request()).data == "abc"
+    assert Producer(chunks=(1, 2), pause=0).execute(Request()).data == [1, 2]
+
+
+def test_sync_execution_inside_a_running_event_loop():
+    """Sync execute of streaming nodes still works when called from async code."""
+
+    async def scenario():
+        pipeline = build_pipeline(Producer(pause=0), Consumer())
+        return pipeline.execute(Request()), Producer(pause=0).execute(Request())
+
+    piped, lone = asyncio.run(scenario())
+
+    assert (piped.success, piped.data) == (True, "ABC")
+    assert (lone.success, lone.data) == (True, "abc")
+
+
+def test_chunk_stream_backpressure_and_close():
+    """Producers wait while the buffer is full; close unblocks and drops."""
+
+    async def scenario():
+        stream = ChunkStream(max_buffered=1)
+        await stream.put(1)
+        blocked = asyncio.ensure_future(stream.put(2))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        iterator = stream.__aiter__()
+        assert await iterator.__anext__() == 1
+        await asyncio.wait_for(blocked, 1)
+        await stream.close()
+        await stream.put(3)
+        assert [chunk async for chunk in iterator] == [2]
+        assert (stream.produced, stream.closed) == (2, True)
+        assert [chunk async for chunk in ChunkStream.replay(["x", "y"])] == ["x", "y"]
+
+    asyncio.run(scenario())
+
+
+def test_slow_consumer_bounds_buffered_chunks():
+    """With buffer=1 the producer never runs more than one chunk ahead."""
+    producer = Producer(chunks=tuple("abcdef"), pause=0)
+    consumer = Consumer(pause=0.02)
+
+    start = time.perf_counter()
+    response = asyncio.run(
+        build_pipeline(producer, consumer, buffer=1).execute_async(Request())
+    )
+
+    assert response.data == "ABCDEF"
+    assert producer.finished_at - start >= 0.02 * 4
+
+
+def test_producer_failure_recovers_and_replays_to_consumer():
+    """A failed stream is retried without streaming; the consumer gets a replay."""
+    producer, consumer = Producer(fail_once=True, pause=0), Consumer()
+
+    response = asyncio.run(build_pipeline(producer, consumer).execute_async(Request()))
+
+    assert response.data == "ABC"
+    assert reasons(producer) == ["internal_error", None]
+    assert reasons(consumer) == ["cancelled", None]
+    assert consumer.seen == [["abc"]]
+
+
+def test_consumer_failure_is_retried_with_replay():
+    """Consumer recovery re-reads the producer's final output."""
+    producer, consumer = Producer(pause=0), Consumer(fail_once=True)
+
+    response = asyncio.run(build_pipeline(producer, consumer).execute_async(Request()))
+
+    assert response.data == "ABC"
+    assert consumer.seen == [["a", "b", "c"], ["abc"]]
+
+
+def test_stream_transitions_are_validated():
+    """Both ends must opt in and the buffer must be positive."""
+    plain = Pipeline("plain", nodes={"x": Pipeline("x")}, entry_point="x")
+    cases = [
+        build_pipeline(Producer(), Producer()),
+        build_pipeline(Consumer(), Consumer()),
+        build_pipeline(Producer(), Consumer(), buffer=0),
+        Pipeline(
+            "missing",
+            nodes={"produce": Producer()},
+            entry_point="produce",
+            transitions={"produce": {"stream": "nowhere"}},
+        ),
+    ]
+    for pipeline in cases:
+        assert pipeline.execute(Request()).reason == "invalid_graph"
+    assert plain.supports_streaming() is False
+    assert plain.accepts_stream() is False
@@ -0,0 +1,242 @@
+"""Tests for request deadline propagation and enforcement."""
+
+import asyncio
+import time
+
+from pydantic import BaseModel
+
+from chaos.domain.block import Block
+from chaos.domain.deadline import remaining_seconds, with_timeout
+from chaos.domain.exceptions import DeadlineExceededError
+from chaos.domain.llm_primitive import LLMPrimitive
+from chaos.domain.messages import Request, Response
+from chaos.domain.policy import RecoveryPolicy, RetryPolicy
+from chaos.llm.llm_request import LLMRequest
+from chaos.llm.llm_response import LLMResponse
+from chaos.llm.response_status import ResponseStatus
+from chaos.stats.block_attempt_record import BlockAttemptRecord
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+
+
+class RecordingBlock(Block):
+    """Leaf block recording requests; optionally failing with retries."""
+
+    def __init__(self, name: str, fail: bool = False, **kwargs):
+        kwargs.setdefault("stats_store", InMemoryBlockStatsStore())
+        super().__init__(name=name, **kwargs)
+        self.seen: list[Request] = []
+        self._fail = fail
+        self.policies: list[RecoveryPolicy] = []
+
+    def _execute_primitive(self, request: Request) -> Response:
+        self.seen.append(request)
+        if self._fail:
+            return Response(success=False, reason="flaky", error_type=ValueError)
+        return Response(success=True, data=self.name)
+
+    def get_policy_stack(self, error_type) -> list[RecoveryPolicy]:
+        return self.policies
+
+    def build(self) -> None:
+        pass
+
+
+class SlowAsyncBlock(Block):
+    def __init__(self, name: str, error: Exception | None = None):
+        super().__init__(name=name, stats_store=InMemoryBlockStatsStore())
+        self._error = error
+
+    async def _execute_primitive_async(self, request: Request) -> Response:
+        if self._error is not None:
+            raise self._error
+        await asyncio.sleep(1)
+        return Response(success=True)
+
+    def build(self) -> None:
+        pass
+
+
+class Graph(Block):
+    def build(self) -> None:
+        pass
+
+
+class Schema(BaseModel):
+    response: str
+
+
+def test_with_timeout_only_shrinks_the_budget():
+    """Keeps an earlier deadline and leaves the input request untouched."""
+    request = Request()
+    assert remaining_seconds(request.metadata) is None
+
+    bounded = with_timeout(request, 10)
+    tighter = with_timeout(bounded, 1)
+    assert 0 < remaining_seconds(tighter.metadata) <= 1
+    assert (
+        with_timeout(tighter, 60).metadata["deadline"] == tighter.metadata["deadline"]
+    )
+    assert "deadline" not in request.metadata
+
+
+def test_expired_deadline_rejects_without_work_or_stats():
+    """Fails fast with deadline_exceeded and records no attempt."""
+    stats = InMemoryBlockStatsStore()
+    block = RecordingBlock("leaf", stats_store=stats)
+
+    response = block.execute(Request(metadata={"deadline": time.time() - 1}))
+
+    assert response.reason == "deadline_exceeded"
+    assert response.error_type is DeadlineExceededError
+    assert response.details["remaining_ms"] < 0
+    assert "trace_id" in response.metadata
+    assert block.seen == []
+    assert stats._records == []
+
+
+def test_stats_estimate_predicting_overrun_fails_fast():
+    """Rejects when the stats-backed mean exceeds the remaining budget."""
+    stats = InMemoryBlockStatsStore()
+    block = RecordingBlock("leaf", stats_store=stats)
+
+    assert block.execute(with_timeout(Request(), 0.05)).success is True
+    for _ in range(3):
+        stats.record_attempt(
+            BlockAttemptRecord(
+                trace_id="t",
+                run_id="r",
+                span_id="s",
+                block_name="leaf",
+                block_type="RecordingBlock",
+                attempt=1,
+                success=True,
+                duration_ms=500.0,
+            )
+        )
+
+    # The estimate is cached; it only sees the new stats once refreshed.
+    assert block.execute(with_timeout(Request(), 0.05)).success is True
+    block.DEADLINE_ESTIMATE_REFRESH_SECONDS = 0.0
+    rejected = block.execute(with_timeout(Request(), 0.05))
+    assert rejected.reason == "deadline_exceeded"
+    assert rejected.details["estimated_ms"] > 300
+    assert block.execute(with_timeout(Request(), 5)).success is True
+
+
+def test_composite_propagates_deadline_and_stops_retries():
+    """Children inherit the deadline; retries are not scheduled past it."""
+    ok = RecordingBlock("ok")
+    flaky = RecordingBlock("flaky", fail=True)
+    flaky.policies = [RetryPolicy(max_attempts=10, delay_seconds=0.1)]
+    graph = Graph(
+        "graph",
+        stats_store=InMemoryBlockStatsStore(),
+        nodes={"ok": ok, "flaky": flaky},
+        entry_point="ok",
+        transitions={"ok": "flaky"},
+    )
+    request = with_timeout(Request(), 0.25)
+
+    start = time.perf_counter()
+    response = graph.execute(request)
+
+    assert time.perf_counter() - start < 0.25
+    assert ok.seen[0].metadata["deadline"] == request.metadata["deadline"]
+    assert response.reason == "deadline_exceeded"
+    assert response.details["last_failure_reason"] == "flaky"
+    assert 1 < len(flaky.seen) < 4
+
+    flaky.seen.clear()
+    expired = graph.execute(Request(metadata={"deadline": time.time() - 1}))
+    assert expired.reason == "deadline_exceeded"
+    assert flaky.seen == []
+
+
+def test_async_primitive_is_cancelled_at_deadline():
+    """Async execution cancels primitive work when the deadline passes."""
+    block = SlowAsyncBlock("slow")
+
+    start = time.perf_counter()
+    response = asyncio.run(block.execute_async(with_timeout(Request(), 0.05)))
+
+    assert time.perf_counter() - start < 0.5
+    assert response.reason == "deadline_exceeded"
+    assert "timeout_ms" in response.details
+
+    failing = SlowAsyncBlock("own_timeout", error=TimeoutError("provider"))
+    other = asyncio.run(failing.execute_async(with_timeout(Request(), 5)))
+    assert other.reason == "internal_error"
+
+    retried = RecordingBlock("flaky", fail=True)
+    retried.policies = [RetryPolicy(max_attempts=5, delay_seconds=0.1)]
+    graph = Graph(
+        "graph",
+        nodes={"flaky": retried},
+        entry_point="flaky",
+        stats_store=InMemoryBlockStatsStore(),
+    )
+    response = asyncio.run(graph.execute_async(with_timeout(Request(), 0.15)))
+    assert response.reason == "deadline_exceeded"
+    assert len(retried.seen) == 2
+
+
+def test_llm_primitive_turns_deadline_into_provider_timeout():
+    """Forwards the remaining budget and reports timeouts past the deadline."""
+
+    class Service:
+        def __init__(self) -> None:
+            self.requests: list[LLMRequest] = []
+
+        def execute(self, request: LLMRequest) -> LLMResponse:
+            self.requests.append(request)
+            time.sleep(0.06)
+            return LLMResponse.failure(
+                status=ResponseStatus.MECHANICAL_ERROR,
+                reason="llm_execution_failed",
+                error_type=Exception,
+            )
+
+    service = Service()
+    block = LLMPrimitive(
+        name="llm",
+        system_prompt="sys",
+        output_data_model=Schema,
+        model="m",
+        llm_service=service,
+    )
+    block._stats_store = InMemoryBlockStatsStore()
+
+    response = block.execute(with_timeout(Request(payload={"prompt": "hi"}), 0.05))
+
+    assert 0 < service.requests[0].timeout_seconds <= 0.05
+    assert response.reason == "deadline_exceeded"
+    assert response.details["llm_reason"] == "llm_execution_failed"
+
+    unbounded = block.execute(Request(payload={"prompt": "hi"}))
+    assert service.requests[1].timeout_seconds is None
+    assert unbounded.reason == "llm_execution_failed"
+
+
+def test_only_the_root_estimates_against_the_deadline(monkeypatch):
+    """Child hops skip the estimate; the root's graph estimate covers them."""
+    leaf = RecordingBlock("leaf")
+    graph = Graph(
+        "graph",
+        stats_store=InMemoryBlockStatsStore(),
+        nodes={"leaf": leaf},
+        entry_point="leaf",
+        transitions={},
+    )
+    calls: list[str] = []
+    estimate = Block.estimate_execution
+
+    def counting_estimate(self, request):
+        calls.append(self.name)
+        return estimate(self, request)
+
+    monkeypatch.setattr(Block, "estimate_execution", counting_estimate)
+
+    assert graph.execute(with_timeout(Request(), 5)).success is True
+    assert calls == ["graph", "leaf"]
+    assert graph.execute(with_timeout(Request(), 5)).success is True
+    assert calls == ["graph", "leaf"]
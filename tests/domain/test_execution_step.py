@@ -0,0 +1,78 @@
+"""Tests for the step drivers shared by the sync and async block engines."""
+
+import asyncio
+
+import pytest
+
+from chaos.domain.execution_step import (
+    ExecutionStep,
+    blocking_step,
+    cancel_step,
+    drive,
+    drive_async,
+    gather_step,
+    spawn_step,
+    wait_first_step,
+)
+
+
+def _failing() -> int:
+    raise ValueError("boom")
+
+
+async def _failing_async() -> int:
+    raise ValueError("boom")
+
+
+def _steps(log):
+    """Yield a step that fails, handle the error, then a blocking step."""
+    try:
+        yield ExecutionStep(_failing, _failing_async)
+    except ValueError as exc:
+        log.append(str(exc))
+    value = yield blocking_step(int, "41")
+    return value + 1
+
+
+def test_drivers_send_results_and_throw_step_errors():
+    """Both drivers return the same result and raise into the generator."""
+    sync_log, async_log = [], []
+
+    assert drive(_steps(sync_log)) == 42
+    assert asyncio.run(drive_async(_steps(async_log))) == 42
+    assert sync_log == async_log == ["boom"]
+
+
+def _item(value):
+    if value == "fail":
+        raise ValueError(value)
+    return value
+    yield
+
+
+def test_gather_step_keeps_order_and_stops_early_in_sync_mode():
+    """Results keep input order; ``stop`` truncates the sync results."""
+    operations = [lambda value=value: _item(value) for value in (1, 2, 3)]
+    step = gather_step(operations, max_concurrency=2, stop=lambda value: value == 2)
+
+    assert step.run() == [1, 2]
+    assert asyncio.run(step.run_async()) == [1, 2, 3]
+    assert gather_step([], max_concurrency=4).run() == []
+
+
+def _race(step):
+    """Spawn ``step``, wait for it, and return its outcome."""
+    handle = yield spawn_step(step)
+    done = yield wait_first_step([handle], None)
+    yield cancel_step([handle])
+    return done.pop().result()
+
+
+def test_spawned_step_errors_surface_through_the_handle():
+    """A failing spawned step re-raises from ``result()`` in both modes."""
+    step = ExecutionStep(_failing, _failing_async)
+
+    with pytest.raises(ValueError, match="boom"):
+        drive(_race(step))
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(drive_async(_race(step)))
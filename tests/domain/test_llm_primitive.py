@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import pytest
@@ -331,3 +332,47 @@ def test_llm_primitive_records_llm_usage_in_attempt_record() -> None:
     assert record.llm_calls == 3
     assert record.input_tokens == 10
     assert record.output_tokens == 20
+
+
+class AsyncStubLLMService(StubLLMService):
+    """Stub exposing a native async execute."""
+
+    async def execute_async(self, request: LLMRequest) -> LLMResponse:
+        self.async_calls = getattr(self, "async_calls", 0) + 1
+        return self.execute(request)
+
+
+def test_llm_primitive_execute_async_prefers_native_async() -> None:
+    """Uses execute_async when available and falls back to a worker thread."""
+    success = LLMResponse.success(
+        data={"response": "hi"}, raw_output=None, usage={"requests": 1}
+    )
+    native = AsyncStubLLMService(success)
+    sync_only = StubLLMService(success)
+    blocks = [
+        LLMPrimitive(
+            name=f"llm_{index}",
+            system_prompt="sys",
+            output_data_model=MockSchema,
+            llm_service=service,
+            stats_adapter=None,
+        )
+        for index, service in enumerate((native, sync_only))
+    ]
+
+    async def run_all():
+        return await asyncio.gather(
+            *(
+                block.execute_async(Request(payload={"prompt": "hello"}))
+                for block in blocks
+            ),
+            blocks[0].execute_async(Request(payload={"x": 42})),
+        )
+
+    native_response, thread_response, invalid = asyncio.run(run_all())
+
+    assert native.async_calls == 1
+    assert native_response.data == {"response": "hi"}
+    assert native_response.metadata["llm_calls"] == 1
+    assert thread_response.data == {"response": "hi"}
+    assert invalid.reason == "invalid_payload"
@@ -0,0 +1,130 @@
+"""Tests for the map block."""
+
+import asyncio
+import threading
+
+from chaos.domain.block import Block
+from chaos.domain.map_block import MapBlock
+from chaos.domain.messages import Request, Response
+from chaos.domain.policy import RecoveryPolicy, RetryPolicy
+from chaos.domain.response_metadata_keys import (
+    MAP_FAILURE_COUNT_KEY,
+    MAP_INDEX_KEY,
+    MAP_ITEM_COUNT_KEY,
+)
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+
+
+class SquareBlock(Block):
+    """Leaf block squaring its item, failing odd items a fixed number of times."""
+
+    def __init__(self, name: str, store=None, odd_failures: int = 0):
+        super().__init__(name=name, stats_store=store, side_effect_class="idempotent")
+        self.odd_failures = odd_failures
+        self.attempts: dict[int, int] = {}
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self.seen: list[Request] = []
+
+    def _execute_primitive(self, request: Request):
+        item = request.payload["item"]
+        with self._lock:
+            self.seen.append(request)
+            self.attempts[item] = self.attempts.get(item, 0) + 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            threading.Event().wait(0.01)
+            if item % 2 and self.attempts[item] <= self.odd_failures:
+                return Response(success=False, reason="odd", error_type=ValueError)
+            return Response(
+                success=True,
+                data=item * item,
+                metadata={"llm_calls": 1, "cost_usd": 0.25},
+            )
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def get_policy_stack(self, error_type) -> list[RecoveryPolicy]:
+        return [RetryPolicy(max_attempts=2)]
+
+    def build(self) -> None:
+        pass
+
+
+def test_map_block_ordered_results_bounded_concurrency_and_stats():
+    """Runs items with a concurrency cap and records one aggregated attempt."""
+    store = InMemoryBlockStatsStore()
+    child = SquareBlock("square", store, odd_failures=1)
+    block = MapBlock("mapper", child, max_concurrency=3, stats_store=store)
+
+    response = block.execute(
+        Request(payload={"items": list(range(10)), "shared": "ctx"})
+    )
+
+    assert response.success is True
+    assert response.data == {"results": [i * i for i in range(10)], "failures": []}
+    assert response.metadata[MAP_ITEM_COUNT_KEY] == 10
+    assert response.metadata["llm_calls"] == 10
+    assert response.metadata["cost_usd"] == 2.5
+    assert 1 < child.peak <= 3
+    assert child.attempts[1] == 2
+    assert block.side_effect_class == child.side_effect_class
+    assert block.child is child
+
+    first = child.seen[0]
+    assert "items" not in first.payload
+    assert first.payload["shared"] == "ctx"
+    assert first.metadata["parent_span_id"] == response.metadata["span_id"]
+    assert sorted(r.metadata[MAP_INDEX_KEY] for r in child.seen)[:2] == [0, 1]
+
+    map_records = [r for r in store._records if r.block_name == "mapper"]
+    item_records = [r for r in store._records if r.block_name == "square"]
+    assert len(map_records) == 1
+    assert map_records[0].block_executions == 11
+    assert map_records[0].llm_calls == 10
+    assert map_records[0].cost_usd == 2.5
+    assert len(item_records) == 15
+    assert "square[3]" in {r.node_name for r in item_records}
+
+
+def test_map_block_reports_failures_and_strict_mode():
+    """Keeps partial results by default and fails when partial is disallowed."""
+    child = SquareBlock("square", odd_failures=5)
+    response = MapBlock("mapper", child).execute(Request(payload={"items": [1, 2]}))
+
+    assert response.success is True
+    assert response.data["results"] == [None, 4]
+    assert response.data["failures"] == [{"index": 0, "reason": "odd", "details": {}}]
+    assert response.metadata[MAP_FAILURE_COUNT_KEY] == 1
+
+    strict = MapBlock(
+        "strict", SquareBlock("square", odd_failures=5), allow_partial=False
+    )
+    response = strict.execute(Request(payload={"values": [2, 3]}))
+    assert response.reason == "invalid_payload"
+    response = strict.execute(Request(payload={"items": [2, 3]}))
+    assert response.success is False
+    assert response.reason == "map_item_failed"
+    assert response.error_type is ValueError
+    assert response.details["failures"][0]["index"] == 1
+
+    empty = MapBlock("mapper", SquareBlock("square")).execute(
+        Request(payload={"items": []})
+    )
+    assert empty.data == {"results": [], "failures": []}
+
+
+def test_map_block_async_matches_sync():
+    """Runs items as bounded tasks on the event loop."""
+    child = SquareBlock("square", odd_failures=1)
+    block = MapBlock("mapper", child, item_key="item", max_concurrency=2)
+
+    response = asyncio.run(block.execute_async(Request(payload={"items": [1, 2, 3]})))
+
+    assert response.data == {"results": [1, 4, 9], "failures": []}
+    assert child.peak <= 2
+    invalid = asyncio.run(block.execute_async(Request(payload={})))
+    assert invalid.reason == "invalid_payload"
@@ -0,0 +1,97 @@
+"""Tests for copy-on-write request propagation and span id allocation."""
+
+import copy
+import pickle
+
+import pytest
+
+from chaos.domain.block import Block
+from chaos.domain.frozen_dict import FrozenDict
+from chaos.domain.messages import Request, Response
+from chaos.domain.span_ids import SpanIdAllocator, new_span_id
+
+
+class CaptureBlock(Block):
+    """Leaf block recording the requests it receives."""
+
+    def __init__(self, name: str):
+        super().__init__(name=name)
+        self.seen: list[Request] = []
+
+    def _execute_primitive(self, request: Request):
+        self.seen.append(request)
+        return Response(success=True)
+
+    def build(self) -> None:
+        pass
+
+
+class CompositeStub(Block):
+    def build(self) -> None:
+        pass
+
+
+def test_frozen_dict_is_read_only_and_copies_on_write():
+    """Rejects in-place mutation and hands out mutable copies."""
+    frozen = FrozenDict({"a": [1]})
+
+    for mutate in (
+        lambda d: d.__setitem__("b", 1),
+        lambda d: d.__delitem__("a"),
+        lambda d: d.update(b=1),
+        lambda d: d.pop("a"),
+        lambda d: d.setdefault("b", 1),
+        lambda d: d.clear(),
+        lambda d: d.popitem(),
+    ):
+        with pytest.raises(TypeError):
+            mutate(frozen)
+    with pytest.raises(TypeError):
+        frozen |= {"b": 1}
+
+    thawed = frozen.copy()
+    thawed["b"] = 2
+    assert type(thawed) is dict
+    assert frozen == {"a": [1]}
+    assert FrozenDict.of(frozen) is frozen
+    assert copy.copy(frozen) is frozen
+    deep = copy.deepcopy(frozen)
+    assert deep == frozen and deep["a"] is not frozen["a"]
+    assert type(deep) is dict and type(frozen.thaw()) is dict
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert Request(payload=frozen).model_dump()["payload"] == {"a": [1]}
+
+
+def test_child_requests_share_payload_and_context():
+    """Children and siblings share the frozen payload/context objects."""
+    a, b = CaptureBlock("a"), CaptureBlock("b")
+    composite = CompositeStub(
+        "graph", nodes={"a": a, "b": b}, entry_point="a", transitions={"a": "b"}
+    )
+    payload = {"prompt": "hi"}
+    request = Request(payload=payload, context={"docs": ["x"]})
+
+    response = composite.execute(request)
+
+    first, second = a.seen[0], b.seen[0]
+    assert first.payload is second.payload
+    assert first.context is second.context
+    assert isinstance(first.payload, FrozenDict)
+    assert first.payload == payload
+    assert first.metadata["parent_span_id"] == response.metadata["span_id"]
+    assert first.metadata["span_id"] != second.metadata["span_id"]
+    assert type(request.payload) is dict
+
+
+def test_span_id_allocator_is_unique_and_reseedable():
+    """Allocates 16-hex ids without repeats and restarts after reseed."""
+    allocator = SpanIdAllocator()
+    ids = {allocator.next_id() for _ in range(1000)}
+    assert len(ids) == 1000
+    assert all(len(span_id) == 16 for span_id in ids)
+    int(next(iter(ids)), 16)
+
+    allocator._base = (1 << 64) - 1
+    allocator.reseed()
+    assert allocator.next_id() not in ids
+    assert new_span_id() != new_span_id()
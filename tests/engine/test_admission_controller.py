@@ -0,0 +1,158 @@
+"""Tests for estimate-driven admission control and branch selection."""
+
+import asyncio
+import threading
+import time
+
+from chaos.domain.block import Block
+from chaos.domain.block_estimate import BlockEstimate
+from chaos.domain.deadline import with_timeout
+from chaos.domain.exceptions import BudgetExceededError
+from chaos.domain.messages import Request, Response
+from chaos.engine.admission_controller import AdmissionController
+from chaos.stats.block_stats_identity import BlockStatsIdentity
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+
+
+class EstimatedBlock(Block):
+    """Leaf block with a fixed estimate."""
+
+    def __init__(self, name: str, time_ms: float, cost_usd: float, **kwargs):
+        kwargs.setdefault("stats_store", InMemoryBlockStatsStore())
+        super().__init__(name=name, **kwargs)
+        self._time_ms = time_ms
+        self._cost_usd = cost_usd
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def estimate_execution(self, request: Request) -> BlockEstimate:
+        if self._time_ms < 0:
+            raise RuntimeError("no estimate")
+        return estimate(self.name, self._time_ms, self._cost_usd)
+
+    def _execute_primitive(self, request: Request) -> Response:
+        self.calls += 1
+        self.release.wait(2)
+        return Response(success=True, data=self.name)
+
+    def build(self) -> None:
+        pass
+
+
+class Graph(Block):
+    def build(self) -> None:
+        pass
+
+
+def estimate(name: str, time_ms: float, cost_usd: float) -> BlockEstimate:
+    return BlockEstimate.from_prior(
+        BlockStatsIdentity(block_name=name, block_type="T"),
+        time_ms_mean=time_ms,
+        cost_usd_mean=cost_usd,
+    )
+
+
+def test_controller_rejects_runs_over_per_run_budgets():
+    """Rejects estimates above the cost or latency budget."""
+    controller = AdmissionController(max_cost_usd=0.1, max_time_ms=1000)
+
+    over_cost = controller.acquire(estimate("b", 10, 0.5))
+    over_time = controller.acquire(estimate("b", 5000, 0.01))
+
+    assert over_cost.reason == "budget_exceeded"
+    assert over_cost.error_type is BudgetExceededError
+    assert over_cost.details["max_cost_usd"] == 0.1
+    assert over_time.details["max_time_ms"] == 1000
+    assert controller.acquire(estimate("b", 10, 0.01)) is None
+    assert controller.inflight_cost_usd == 0.01
+
+
+def test_controller_queues_until_inflight_capacity_frees():
+    """Queues runs over the in-flight budget and times out when still full."""
+    controller = AdmissionController(
+        max_inflight_cost_usd=1.0, queue_timeout_seconds=0.05
+    )
+    big = estimate("b", 10, 0.8)
+    assert controller.acquire(big) is None
+    assert controller.acquire(big).reason == "admission_timeout"
+
+    timed_out = controller.acquire(estimate("b", 10, 0.5), max_wait_seconds=0.01)
+    assert timed_out.reason == "admission_timeout"
+
+    queued = AdmissionController(max_inflight_cost_usd=1.0, queue_timeout_seconds=2)
+    assert queued.acquire(big) is None
+    threading.Timer(0.05, queued.release, args=(big,)).start()
+    start = time.perf_counter()
+    assert queued.acquire(big) is None
+    assert time.perf_counter() - start >= 0.04
+    queued.release(big)
+    assert queued.inflight_cost_usd == 0.0
+
+
+def test_block_admission_rejects_and_releases():
+    """Blocks consult the controller before running and release afterwards."""
+    controller = AdmissionController(max_cost_usd=1.0, max_inflight_cost_usd=1.0)
+    cheap = EstimatedBlock("cheap", 10, 0.6, admission_controller=controller)
+    pricey = EstimatedBlock("pricey", 10, 5.0, admission_controller=controller)
+
+    rejected = pricey.execute(Request())
+    assert rejected.reason == "budget_exceeded"
+    assert "trace_id" in rejected.metadata
+    assert pricey.calls == 0
+    assert asyncio.run(pricey.execute_async(Request())).reason == "budget_exceeded"
+    assert asyncio.run(cheap.execute_async(Request())).success is True
+
+    cheap.release.clear()
+    worker = threading.Thread(target=cheap.execute, args=(Request(),))
+    worker.start()
+    time.sleep(0.05)
+    assert controller.inflight_cost_usd == 0.6
+    assert cheap.execute(Request()).reason == "admission_timeout"
+    cheap.release.set()
+    worker.join()
+    assert controller.inflight_cost_usd == 0.0
+    assert cheap.execute(Request()).success is True
+
+
+def test_choice_transition_picks_by_objective_and_deadline():
+    """Chooses the best successor by estimate and records the decision."""
+    nodes = {
+        "start": EstimatedBlock("start", 1, 0),
+        "fast": EstimatedBlock("fast", 100, 0.5),
+        "cheap": EstimatedBlock("cheap", 5000, 0.01),
+        "broken": EstimatedBlock("broken", -1, 0),
+    }
+
+    def build(objective: str) -> Graph:
+        return Graph(
+            "router",
+            nodes=nodes,
+            entry_point="start",
+            transitions={
+                "start": {"choose": ["broken", "fast", "cheap"], "objective": objective}
+            },
+            stats_store=InMemoryBlockStatsStore(),
+        )
+
+    by_cost = build("cost").execute(Request())
+    assert by_cost.data == "cheap"
+    decision = by_cost.metadata["branch_decisions"][0]
+    assert decision["node"] == "start"
+    assert decision["selected"] == "cheap"
+    assert set(decision["candidates"]) == {"fast", "cheap"}
+
+    assert build("time").execute(Request()).data == "fast"
+    assert build("cost").execute(with_timeout(Request(), 1)).data == "fast"
+
+
+def test_choice_transition_validation():
+    """Rejects empty candidate lists, unknown nodes and objectives."""
+    nodes = {"a": EstimatedBlock("a", 1, 0), "b": EstimatedBlock("b", 1, 0)}
+    for transition in (
+        {"choose": []},
+        {"choose": ["missing"]},
+        {"choose": ["b"], "objective": "vibes"},
+    ):
+        graph = Graph("g", nodes=nodes, entry_point="a", transitions={"a": transition})
+        assert graph.execute(Request()).reason == "invalid_graph"
@@ -0,0 +1,150 @@
+"""Tests for the circuit breaker recovery policy."""
+
+import asyncio
+import time
+
+import pytest
+
+from chaos.domain.block import Block
+from chaos.domain.exceptions import CircuitOpenError
+from chaos.domain.messages import Request, Response
+from chaos.domain.policy import CircuitBreakerPolicy, RetryPolicy
+from chaos.engine.circuit_breaker import CircuitBreaker
+from chaos.engine.circuit_breaker_registry import CircuitBreakerRegistry
+from chaos.engine.policy_handlers import PolicyHandler
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FlakyBlock(Block):
+    """Leaf block failing while ``down`` is set."""
+
+    def __init__(self, name: str, policy: CircuitBreakerPolicy):
+        super().__init__(
+            name=name,
+            side_effect_class="none",
+            stats_store=InMemoryBlockStatsStore(),
+        )
+        self.policy = policy
+        self.down = True
+        self.calls = 0
+
+    def _execute_primitive(self, request: Request) -> Response:
+        self.calls += 1
+        if self.down:
+            return Response(success=False, reason="provider_down")
+        return Response(success=True, data="ok")
+
+    def build(self) -> None:
+        pass
+
+    def get_policy_stack(self, error_type):
+        return [self.policy, RetryPolicy(max_attempts=3)]
+
+
+class Pipeline(Block):
+    def build(self) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def clear_breakers():
+    CircuitBreakerRegistry.clear()
+    yield
+    CircuitBreakerRegistry.clear()
+
+
+def build_pipeline(cooldown_seconds: float = 60.0):
+    policy = CircuitBreakerPolicy(min_calls=2, cooldown_seconds=cooldown_seconds)
+    child = FlakyBlock("provider", policy)
+    pipeline = Pipeline(
+        "pipeline",
+        nodes={"call": child},
+        entry_point="call",
+        stats_store=InMemoryBlockStatsStore(),
+    )
+    return pipeline, child
+
+
+def test_breaker_states_window_and_half_open_trials():
+    """Opens on the windowed failure rate, then admits bounded trials."""
+    clock = FakeClock()
+    policy = CircuitBreakerPolicy(
+        min_calls=4, window_size=4, cooldown_seconds=10, half_open_max_calls=1
+    )
+    breaker = CircuitBreaker("b", policy, clock=clock)
+
+    for success in (True, True, False, True):
+        assert breaker.before_call() is None
+        breaker.record(success)
+    assert breaker.state == "closed"
+    breaker.record(False)
+    assert breaker.state == "open"
+
+    rejection = breaker.before_call()
+    assert rejection.reason == "circuit_open"
+    assert rejection.error_type is CircuitOpenError
+    assert rejection.details["retry_after_seconds"] == 10
+
+    clock.now = 10
+    assert breaker.before_call() is None
+    assert breaker.before_call().details["state"] == "half_open"
+    breaker.record(False)
+    assert breaker.state == "open"
+
+    clock.now = 20
+    assert breaker.rejection() is None
+    assert breaker.before_call() is None
+    breaker.record(True)
+    assert breaker.state == "closed"
+    assert breaker.before_call() is None
+
+
+def test_open_circuit_skips_retries_and_fails_fast():
+    """Stops retrying once open and rejects later runs without executing."""
+    pipeline, child = build_pipeline()
+
+    first = pipeline.execute(Request())
+    assert first.success is False
+    assert first.reason == "circuit_open"
+    assert child.calls == 2
+
+    start = time.perf_counter()
+    second = pipeline.execute(Request())
+    assert second.reason == "circuit_open"
+    assert child.calls == 2
+    assert time.perf_counter() - start < 0.5
+
+    other, other_child = build_pipeline()
+    assert other.execute(Request()).reason == "circuit_open"
+    assert other_child.calls == 0
+
+
+def test_half_open_trial_closes_circuit_async():
+    """A successful trial after the cool-down closes the shared circuit."""
+    pipeline, child = build_pipeline(cooldown_seconds=0.05)
+    assert asyncio.run(pipeline.execute_async(Request())).reason == "circuit_open"
+
+    time.sleep(0.06)
+    child.down = False
+    response = asyncio.run(pipeline.execute_async(Request()))
+
+    assert response.success is True
+    assert child.calls == 3
+    key = CircuitBreakerRegistry.key(child.stats_identity())
+    assert CircuitBreakerRegistry.get(key).state == "closed"
+
+
+def test_policy_handler_passes_failure_through():
+    """The standalone handler leaves breaker bookkeeping to the runtime."""
+    failure = Response(success=False, reason="x")
+    policy = CircuitBreakerPolicy()
+    block, _ = build_pipeline()
+    assert PolicyHandler.handle(policy, block, Request(), failure) is failure
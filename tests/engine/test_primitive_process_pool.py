@@ -0,0 +1,156 @@
+"""Tests for running CPU-bound primitives in the shared process pool."""
+
+import asyncio
+import os
+import pickle
+
+import pytest
+
+from chaos.domain.block import Block
+from chaos.domain.messages import Request, Response
+from chaos.engine import primitive_process_pool
+from chaos.engine.primitive_process_pool import PrimitiveProcessPool
+from chaos.stats import store_registry
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+from chaos.trace import sink_registry
+
+
+class Inner(Block):
+    """Nested block executed inside the worker; records to the default store."""
+
+    def build(self) -> None:
+        pass
+
+
+class Scorer(Block):
+    """Pure-Python scoring work, optionally running a nested block."""
+
+    def __init__(self, name: str = "scorer", nested: bool = False, **kwargs):
+        kwargs.setdefault("stats_store", InMemoryBlockStatsStore())
+        super().__init__(name=name, cpu_bound=True, **kwargs)
+        self.nested = nested
+        self.held = [Inner("held", stats_store=InMemoryBlockStatsStore())]
+        self.offset = 0
+
+    def _execute_primitive(self, request: Request) -> Response:
+        action = request.payload.get("action")
+        if action == "raise":
+            raise ValueError("bad input")
+        if action == "crash":
+            os._exit(1)
+        if self.nested:
+            Inner("inner").execute(request)
+            self.held[0].execute(request)
+        score = self.offset + sum(i * i for i in range(request.payload.get("n", 1000)))
+        return Response(success=True, data={"score": score, "pid": os.getpid()})
+
+    def build(self) -> None:
+        pass
+
+
+class Pipeline(Block):
+    def build(self) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True, scope="module")
+def pool():
+    PrimitiveProcessPool.configure(max_workers=2)
+    yield PrimitiveProcessPool
+    PrimitiveProcessPool.shutdown()
+
+
+def test_parallel_cpu_bound_nodes_run_in_workers(pool):
+    """Both branches run outside the parent; attempts land in the parent store."""
+    assert pool.warm_up() >= 1
+    store = InMemoryBlockStatsStore()
+    left, right = Scorer("left", stats_store=store), Scorer("right", stats_store=store)
+    pipeline = Pipeline(
+        "pipeline",
+        nodes={"start": Pipeline("start"), "left": left, "right": right},
+        entry_point="start",
+        transitions={"start": {"parallel": ["left", "right"]}},
+        stats_store=store,
+    )
+
+    response = pipeline.execute(Request(payload={"n": 20_000}))
+
+    assert response.success is True
+    scores = response.data
+    assert {item["score"] for item in scores.values()} == {
+        sum(i * i for i in range(20_000))
+    }
+    assert os.getpid() not in {item["pid"] for item in scores.values()}
+    assert len(store.records(left.stats_identity())) == 1
+    assert left.cpu_bound is True
+    assert "worker_pid" not in response.metadata
+
+
+def test_nested_attempts_are_routed_to_their_own_stores(pool, monkeypatch):
+    """Worker-recorded attempts go to the store each nested block records to."""
+    default = InMemoryBlockStatsStore()
+    monkeypatch.setattr(store_registry, "_DEFAULT_STORE", default)
+    store = InMemoryBlockStatsStore()
+    scorer = Scorer(nested=True, stats_store=store)
+
+    response = asyncio.run(scorer.execute_async(Request(payload={"n": 10})))
+
+    assert response.success is True
+    assert response.metadata["worker_pid"] != os.getpid()
+    assert response.metadata["worker_duration_ms"] >= 0
+    inner = default.records(Inner("inner").stats_identity())
+    assert len(inner) == 1
+    assert inner[0].trace_id == response.metadata["trace_id"]
+    held = scorer.held[0]
+    assert len(held._stats_store.records(held.stats_identity())) == 1
+    assert [record.block_name for record in store._records] == ["scorer"]
+
+
+def test_worker_snapshot_is_reused_until_invalidated(pool):
+    """Attribute changes reach workers only after invalidating the snapshot."""
+    scorer = Scorer()
+    request = Request(payload={"n": 3})
+    assert scorer.execute(request).data["score"] == 5
+
+    scorer.offset = 100
+    assert scorer.execute(request).data["score"] == 5
+
+    scorer.invalidate_worker_snapshot()
+    assert scorer.execute(request).data["score"] == 105
+
+
+def test_worker_errors_become_failures_and_pool_recovers(pool):
+    """Exceptions and crashed workers fail the attempt, not the caller."""
+    scorer = Scorer()
+
+    raised = scorer.execute(Request(payload={"action": "raise"}))
+    assert raised.reason == "internal_error"
+    assert raised.error_type is ValueError
+
+    crashed = scorer.execute(Request(payload={"action": "crash"}))
+    assert crashed.reason == "internal_error"
+
+    assert scorer.execute(Request(payload={"n": 10})).success is True
+
+
+def test_worker_entry_points_cache_unpickled_blocks(monkeypatch):
+    """Workers reuse unpickled blocks by key and evict the oldest."""
+    monkeypatch.setattr(store_registry, "_DEFAULT_STORE", None)
+    monkeypatch.setattr(sink_registry, "_DEFAULT_SINK", sink_registry._UNSET)
+    monkeypatch.setattr(primitive_process_pool, "WORKER_BLOCK_CACHE_SIZE", 1)
+    monkeypatch.setattr(
+        primitive_process_pool, "_WORKER_BLOCKS", primitive_process_pool.OrderedDict()
+    )
+    primitive_process_pool._initialize_worker()
+    assert sink_registry.get_default_sink() is None
+
+    payload = pickle.dumps(Scorer(nested=True, stats_store=None))
+    request = Request(payload={"n": 3})
+    run = primitive_process_pool._execute_in_worker
+    response, records, pid, _ = run("a", payload, request)
+    assert (response.data["score"], pid) == (5, os.getpid())
+    assert [record.block_name for record in records] == ["inner"]
+    run("a", b"unused once cached", request)
+    run("b", payload, request)
+    assert list(primitive_process_pool._WORKER_BLOCKS) == ["b"]
+    assert primitive_process_pool._worker_pid() == os.getpid()
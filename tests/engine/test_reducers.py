@@ -0,0 +1,30 @@
+import pytest
+
+from chaos.domain.messages import Response
+from chaos.engine.reducers import ReducerRegistry, collect_as_list, collect_by_node
+
+
+def test_reducer_registry_register_and_clear() -> None:
+    """Registers custom reducers and keeps built-ins after clear."""
+
+    @ReducerRegistry.register("custom")
+    def custom(responses):
+        return Response(success=True, data=len(responses))
+
+    assert ReducerRegistry.get("custom") is custom
+    ReducerRegistry.clear()
+    with pytest.raises(ValueError):
+        ReducerRegistry.get("custom")
+    assert ReducerRegistry.get("collect") is collect_by_node
+    assert ReducerRegistry.get("list") is collect_as_list
+
+
+def test_builtin_reducers_preserve_branch_order() -> None:
+    """Joins branch data in declaration order."""
+    responses = {
+        "b": Response(success=True, data=2),
+        "a": Response(success=True, data=1),
+    }
+
+    assert collect_by_node(responses).data == {"b": 2, "a": 1}
+    assert collect_as_list(responses).data == [2, 1]
@@ -0,0 +1,269 @@
+"""Tests for checkpointing and resuming composite runs."""
+
+import asyncio
+
+import pytest
+
+from chaos.domain.block import Block
+from chaos.domain.messages import Request, Response
+from chaos.ledger.graph_checkpoint import GraphCheckpoint
+from chaos.ledger.sqlite_checkpoint_ledger import SqliteCheckpointLedger
+
+
+class StepBlock(Block):
+    """Leaf block counting executions; fails while ``crash`` is set."""
+
+    def __init__(self, name: str, data: object = None):
+        super().__init__(name=name)
+        self.calls = 0
+        self.crash = False
+        self._data = data if data is not None else name
+
+    def _execute_primitive(self, request: Request) -> Response:
+        self.calls += 1
+        if self.crash:
+            return Response(success=False, reason="crash")
+        return Response(success=True, data=self._data)
+
+    def build(self) -> None:
+        pass
+
+
+class Pipeline(Block):
+    def build(self) -> None:
+        pass
+
+
+@pytest.fixture
+def ledger():
+    ledger = SqliteCheckpointLedger(":memory:")
+    yield ledger
+    ledger.close()
+
+
+def build_pipeline(ledger, names=("a", "b", "c"), **kwargs):
+    nodes = {name: StepBlock(name) for name in names}
+    pipeline = Pipeline(
+        "pipeline",
+        nodes=nodes,
+        entry_point=names[0],
+        transitions=dict(zip(names, names[1:])),
+        checkpoint_ledger=ledger,
+        **kwargs,
+    )
+    return pipeline, nodes
+
+
+def test_resume_continues_after_last_completed_node(tmp_path):
+    """A crashed run resumes at the failed node without re-running earlier ones."""
+    path = tmp_path / "ledger.sqlite"
+    ledger = SqliteCheckpointLedger(path)
+    pipeline, nodes = build_pipeline(ledger)
+    nodes["b"].crash = True
+
+    failed = pipeline.execute(Request(payload={"x": 1}))
+    run_id = failed.metadata["run_id"]
+    assert failed.success is False
+    assert ledger.latest(run_id, "pipeline").node_name == "a"
+    ledger.close()
+
+    restarted = SqliteCheckpointLedger(path)
+    pipeline, nodes = build_pipeline(restarted)
+    resumed = pipeline.execute(Request(payload={"x": 1}), resume_run_id=run_id)
+
+    assert resumed.success is True
+    assert resumed.data == "c"
+    assert resumed.metadata["run_id"] == run_id
+    assert [nodes[name].calls for name in "abc"] == [0, 1, 1]
+    assert restarted.latest(run_id, "pipeline") is None
+    restarted.close()
+
+
+def test_fresh_runs_and_unknown_runs_start_at_entry(ledger):
+    """Fresh executions discard stale checkpoints; unknown runs start over."""
+    pipeline, nodes = build_pipeline(ledger)
+
+    first = pipeline.execute(Request(metadata={"run_id": "r1"}))
+    assert first.success is True
+    pipeline.execute(Request(metadata={"run_id": "r1"}))
+    assert nodes["a"].calls == 2
+
+    pipeline.execute(Request(), resume_run_id="unknown")
+    assert nodes["a"].calls == 3
+
+    plain, plain_nodes = build_pipeline(None)
+    assert plain.execute(Request(), resume_run_id="r1").success is True
+    assert plain_nodes["a"].calls == 1
+
+
+def test_resume_keeps_step_budget_and_rejects_stale_checkpoints(ledger):
+    """Steps consumed before the crash count toward max_steps after resume."""
+    pipeline, nodes = build_pipeline(ledger, max_steps=2)
+    nodes["b"].crash = True
+    pipeline.execute(Request(metadata={"run_id": "r"}))
+    nodes["b"].crash = False
+
+    resumed = pipeline.execute(Request(), resume_run_id="r")
+    assert resumed.reason == "max_steps_exceeded"
+
+    ledger.save(
+        GraphCheckpoint(
+            run_id="r",
+            block_name="pipeline",
+            node_name="a",
+            next_node="removed",
+            steps=1,
+            response=Response(success=True),
+        )
+    )
+    stale = pipeline.execute(Request(), resume_run_id="r")
+    assert stale.reason == "invalid_checkpoint"
+    assert stale.details["next_node"] == "removed"
+
+
+def test_checkpoint_failures_do_not_fail_the_run(ledger, caplog):
+    """Unserializable responses are logged and the run still succeeds."""
+    pipeline = Pipeline(
+        "pipeline",
+        nodes={"a": StepBlock("a", data=object()), "b": StepBlock("b")},
+        entry_point="a",
+        transitions={"a": "b"},
+        checkpoint_ledger=ledger,
+    )
+
+    response = pipeline.execute(Request(metadata={"run_id": "r"}))
+
+    assert response.success is True
+    assert "Failed to save graph checkpoint" in caplog.text
+    assert ledger.latest("r", "pipeline") is None
+
+    ledger.close()
+    assert pipeline.execute(Request(metadata={"run_id": "r"})).success is True
+    assert "Failed to clear graph checkpoints" in caplog.text
+
+
+def test_async_resume_matches_sync(ledger):
+    """execute_async honors resume_run_id like execute."""
+    pipeline, nodes = build_pipeline(ledger)
+    nodes["c"].crash = True
+    asyncio.run(pipeline.execute_async(Request(metadata={"run_id": "r"})))
+    nodes["c"].crash = False
+
+    resumed = asyncio.run(pipeline.execute_async(Request(), resume_run_id="r"))
+
+    assert resumed.data == "c"
+    assert [nodes[name].calls for name in "abc"] == [1, 1, 2]
+
+
+class CrashOnCall(StepBlock):
+    """Leaf block failing on its ``crash_on``-th execution only."""
+
+    def __init__(self, name: str, crash_on: int):
+        super().__init__(name)
+        self._crash_on = crash_on
+
+    def _execute_primitive(self, request: Request) -> Response:
+        self.crash = self.calls + 1 == self._crash_on
+        return super()._execute_primitive(request)
+
+
+def _checkpoint_count(ledger) -> int:
+    return ledger._connection.execute(
+        "SELECT COUNT(*) FROM graph_checkpoints"
+    ).fetchone()[0]
+
+
+def test_reused_composite_checkpoints_are_scoped_by_node_path(ledger):
+    """A composite used at two nodes keeps per-path checkpoints; success clears the run."""
+    inner = Pipeline(
+        "inner",
+        nodes={"a": StepBlock("a"), "b": CrashOnCall("b", crash_on=2)},
+        entry_point="a",
+        transitions={"a": "b"},
+        checkpoint_ledger=ledger,
+    )
+    outer = Pipeline(
+        "outer",
+        nodes={"x": inner, "y": inner},
+        entry_point="x",
+        transitions={"x": "y"},
+        checkpoint_ledger=ledger,
+    )
+
+    failed = outer.execute(Request(metadata={"run_id": "r"}))
+
+    assert failed.success is False
+    assert ledger.latest("r", "inner", "x") is None
+    assert ledger.latest("r", "inner", "y").node_name == "a"
+    assert ledger.latest("r", "inner", "y").node_path == "y"
+    assert ledger.latest("r", "outer").next_node == "y"
+
+    resumed = outer.execute(Request(), resume_run_id="r")
+
+    assert resumed.success is True
+    assert resumed.metadata["last_node"] == "y"
+    assert _checkpoint_count(ledger) == 0
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_resume_continues_inside_a_nested_composite(ledger, use_async):
+    """A run that stopped inside a nested composite resumes at its failed node."""
+    leaves = {"a": StepBlock("a"), "x": StepBlock("x"), "y": CrashOnCall("y", 1)}
+    leaves["b"] = StepBlock("b")
+    inner = Pipeline(
+        "inner",
+        nodes={"x": leaves["x"], "y": leaves["y"]},
+        entry_point="x",
+        transitions={"x": "y"},
+        checkpoint_ledger=ledger,
+    )
+    outer = Pipeline(
+        "outer",
+        nodes={"a": leaves["a"], "inner": inner, "b": leaves["b"]},
+        entry_point="a",
+        transitions={"a": "inner", "inner": "b"},
+        checkpoint_ledger=ledger,
+    )
+
+    def run(request, resume_run_id=None):
+        if use_async:
+            return asyncio.run(outer.execute_async(request, resume_run_id))
+        return outer.execute(request, resume_run_id)
+
+    failed = run(Request(metadata={"run_id": "r"}))
+    assert failed.success is False
+    assert ledger.latest("r", "inner", "inner").node_name == "x"
+
+    resumed = run(Request(), resume_run_id="r")
+
+    assert resumed.success is True
+    assert [leaves[name].calls for name in "axyb"] == [1, 1, 2, 1]
+    assert _checkpoint_count(ledger) == 0
+
+
+def test_retention_expires_checkpoints_of_abandoned_runs():
+    """Checkpoints older than retention_seconds are deleted on the next save."""
+    now = [0.0]
+    ledger = SqliteCheckpointLedger(
+        ":memory:", retention_seconds=10, clock=lambda: now[0]
+    )
+
+    def checkpoint(run_id: str) -> GraphCheckpoint:
+        return GraphCheckpoint(
+            run_id=run_id,
+            block_name="pipeline",
+            node_name="a",
+            next_node="b",
+            steps=1,
+            response=Response(success=True),
+        )
+
+    ledger.save(checkpoint("old"))
+    now[0] = 11.0
+    ledger.save(checkpoint("new"))
+
+    assert ledger.latest("old", "pipeline") is None
+    assert ledger.latest("new", "pipeline").run_id == "new"
+    ledger.clear("new", "other")
+    assert _checkpoint_count(ledger) == 1
+    ledger.close()
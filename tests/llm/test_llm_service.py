@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from pydantic import BaseModel, SecretStr
 
@@ -398,3 +400,74 @@ def test_llm_error_mapper_context_message() -> None:
     mapping = map_llm_error(err)
 
     assert mapping.reason == "context_length_error"
+
+
+def test_llm_service_execute_async_maps_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """execute_async awaits the async agent runner and maps failures."""
+    service = LLMService()
+    outcomes = iter([None, RateLimitError("Too many requests")])
+
+    async def fake_run_agent_async(*, request, system_prompt, user_prompt):
+        error = next(outcomes)
+        if error is not None:
+            raise error
+        assert (system_prompt, user_prompt) == ("sys", "hello")
+        return {"response": "ok"}, None
+
+    monkeypatch.setattr(service, "_run_agent_async", fake_run_agent_async)
+
+    ok = asyncio.run(service.execute_async(_build_request()))
+    limited = asyncio.run(service.execute_async(_build_request()))
+
+    assert ok.status == ResponseStatus.SUCCESS
+    assert ok.data == {"response": "ok"}
+    assert limited.reason == "rate_limit_error"
+
+
+def test_llm_service_run_agent_async_uses_agent_run(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Awaits Agent.run instead of run_sync on the async path."""
+    service = LLMService()
+
+    class FakeResult:
+        output = {"response": "ok"}
+
+        def usage(self):
+            return object()
+
+    class FakeAgent:
+        def __init__(self, model, system_prompt, output_type, output_retries):
+            pass
+
+        def run_sync(self, user_prompt, model_settings):
+            raise AssertionError("sync path used")
+
+        async def run(self, user_prompt, model_settings):
+            assert user_prompt == "hello"
+            return FakeResult()
+
+    monkeypatch.setattr("chaos.llm.llm_service.Agent", FakeAgent)
+    monkeypatch.setattr(
+        "chaos.llm.llm_service.OpenAIChatModel", lambda *a, **k: object()
+    )
+
+    data, usage = asyncio.run(
+        service._run_agent_async(
+            request=_build_request(), system_prompt=None, user_prompt="hello"
+        )
+    )
+
+    assert data == {"response": "ok"}
+    assert usage is None
+
+
+def test_llm_service_model_settings_forward_deadline_timeout() -> None:
+    """Passes the deadline-derived timeout to the provider settings."""
+    request = _build_request()
+    assert "timeout" not in LLMService._model_settings(request)
+
+    bounded = request.model_copy(update={"timeout_seconds": 1.5})
+    assert LLMService._model_settings(bounded) == {"temperature": 0.0, "timeout": 1.5}
@@ -141,6 +141,7 @@ def test_json_store_roundtrip(tmp_path) -> None:
         block_executions=1,
     )
     store.record_attempt(record)
+    store.flush()
 
     reloaded = JsonBlockStatsStore(path)
     estimate = reloaded.estimate(identity)
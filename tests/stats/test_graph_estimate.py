@@ -0,0 +1,175 @@
+"""Tests for graph-walking composite estimates."""
+
+import pytest
+
+from chaos.domain.block import Block
+from chaos.domain.block_estimate import EstimateSource
+from chaos.domain.messages import Request, Response
+from chaos.engine.conditions import ConditionRegistry
+from chaos.stats.block_attempt_record import BlockAttemptRecord
+from chaos.stats.graph_estimate_builder import count_transitions, expected_attempts
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+
+
+class LeafBlock(Block):
+    """Primitive returning its payload."""
+
+    def __init__(self, name: str):
+        super().__init__(name=name, stats_store=InMemoryBlockStatsStore())
+
+    def _execute_primitive(self, request: Request) -> Response:
+        return Response(success=True, data=request.payload)
+
+    def build(self) -> None:
+        pass
+
+
+class Pipeline(Block):
+    def build(self) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def wants_b_condition():
+    ConditionRegistry.register("wants_b")(
+        lambda response: bool(response.data and response.data.get("b"))
+    )
+    yield
+    ConditionRegistry._registry.pop("wants_b", None)
+
+
+def record(
+    block: Block,
+    duration_ms: float = 10.0,
+    cost_usd: float = 0.0,
+    attempt: int = 1,
+    path=None,
+    cache_hit: bool = False,
+) -> BlockAttemptRecord:
+    identity = block.stats_identity()
+    entry = BlockAttemptRecord(
+        trace_id="t",
+        run_id="r",
+        span_id="s",
+        block_name=identity.block_name,
+        block_type=identity.block_type,
+        attempt=attempt,
+        success=True,
+        duration_ms=duration_ms,
+        cost_usd=cost_usd,
+        llm_calls=0,
+        block_executions=1,
+        cache_hit=cache_hit,
+        path=path,
+    )
+    block._stats_store.record_attempt(entry)
+    return entry
+
+
+def build_branching():
+    nodes = {name: LeafBlock(name) for name in "ABC"}
+    pipeline = Pipeline(
+        "pipeline",
+        nodes=nodes,
+        entry_point="A",
+        transitions={
+            "A": [
+                {"condition": "wants_b", "target": "B"},
+                {"condition": "default", "target": "C"},
+            ]
+        },
+        stats_store=InMemoryBlockStatsStore(),
+    )
+    return pipeline, nodes
+
+
+def test_transition_counts_and_expected_attempts():
+    """Counts consecutive pairs and terminal nodes; ignores cache hits."""
+    counts = count_transitions([["A", "B"], ["A", "C"], ["A", "B"], []])
+    assert counts == {"A": {"B": 2, "C": 1}, "B": {None: 2}, "C": {None: 1}}
+
+    leaf = LeafBlock("leaf")
+    records = [
+        record(leaf, attempt=1),
+        record(leaf, attempt=2),
+        record(leaf, attempt=1, cache_hit=True),
+    ]
+    assert expected_attempts(records) == 2.0
+    assert expected_attempts([]) == 1.0
+
+
+def test_composite_execution_records_path():
+    """Attempt records and the final response carry the nodes taken."""
+    pipeline, _ = build_branching()
+
+    response = pipeline.execute(Request(payload={"b": True}))
+    pipeline.execute(Request(payload={}))
+
+    assert response.metadata["graph_path"] == ["A", "B"]
+    paths = [r.path for r in pipeline._stats_store.records(pipeline.stats_identity())]
+    assert paths == [["A", "B"], ["A", "C"]]
+
+
+def test_estimate_weights_children_by_learned_transitions_and_retries():
+    """Observed branch frequencies and retry rates scale child estimates."""
+    pipeline, nodes = build_branching()
+    record(nodes["A"], duration_ms=10, cost_usd=0.01)
+    for attempt in (1, 2, 1):
+        record(nodes["B"], duration_ms=100, cost_usd=0.1, attempt=attempt)
+    record(nodes["C"], duration_ms=20, cost_usd=0.02)
+    for path in (["A", "B"], ["A", "B"], ["A", "B"], ["A", "C"]):
+        record(pipeline, path=path)
+
+    estimate = pipeline.estimate_execution(Request())
+
+    assert estimate.estimate_source == EstimateSource.STATS
+    assert estimate.sample_size == 4
+    assert estimate.time_ms_mean == pytest.approx(10 + 0.75 * 1.5 * 100 + 0.25 * 20)
+    assert estimate.cost_usd_mean == pytest.approx(0.01 + 0.75 * 1.5 * 0.1 + 0.005)
+    assert estimate.expected_block_executions == pytest.approx(1 + 1.125 + 0.25)
+    assert set(estimate.components) == {"A", "B", "C"}
+    assert estimate.components["B"].expected_block_executions == pytest.approx(1.125)
+    assert estimate.components["B"].time_ms_mean == 100
+    assert "graph_walk" in estimate.notes
+
+
+def test_cold_graph_uses_structure_parallel_and_step_bound():
+    """Unseen graphs split branches uniformly; parallel time takes the slowest."""
+    pipeline, _ = build_branching()
+    cold = pipeline.estimate_execution(Request())
+    assert cold.estimate_source == EstimateSource.PRIOR
+    assert cold.time_ms_mean == pytest.approx(20.0)
+
+    nodes = {name: LeafBlock(name) for name in ("start", "a", "b", "end")}
+    record(nodes["a"], duration_ms=50, cost_usd=0.1)
+    record(nodes["b"], duration_ms=200, cost_usd=0.2)
+    fan_out = Pipeline(
+        "fan_out",
+        nodes=nodes,
+        entry_point="start",
+        transitions={"start": {"parallel": ["a", "b"], "target": "end"}},
+        stats_store=InMemoryBlockStatsStore(),
+    )
+    estimate = fan_out.estimate_execution(Request())
+    assert estimate.time_ms_mean == pytest.approx(10 + 200 + 10)
+    assert estimate.cost_usd_mean == pytest.approx(0.3)
+
+    loop = Pipeline(
+        "loop",
+        nodes={"A": LeafBlock("A")},
+        entry_point="A",
+        transitions={"A": "A"},
+        max_steps=5,
+        stats_store=InMemoryBlockStatsStore(),
+    )
+    assert loop.estimate_execution(Request()).expected_block_executions == 5
+
+    outer = Pipeline(
+        "outer",
+        nodes={"inner": fan_out},
+        entry_point="inner",
+        stats_store=InMemoryBlockStatsStore(),
+    )
+    nested = outer.estimate_execution(Request())
+    assert nested.time_ms_mean == pytest.approx(estimate.time_ms_mean)
+    assert nested.components["inner"].components is not None
@@ -10,7 +10,9 @@ import pytest
 from chaos.domain.block_estimate import EstimateSource
 from chaos.stats.block_attempt_record import BlockAttemptRecord
 from chaos.stats.block_stats_identity import BlockStatsIdentity
-from chaos.stats.json_block_stats_store import JsonBlockStatsStore
+from chaos.stats import store_registry
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+from chaos.stats.json_block_stats_store import JsonBlockStatsStore, _close_open_stores
 
 
 def _build_record(attempt: int = 1) -> BlockAttemptRecord:
@@ -138,6 +140,7 @@ def test_json_store_compacts_on_retention(tmp_path: Path) -> None:
 
     store.record_attempt(_build_record(attempt=1))
     store.record_attempt(_build_record(attempt=2))
+    store.flush()
 
     lines = [line for line in path.read_text(encoding="utf-8").splitlines() if line]
     assert len(lines) == 1
@@ -145,15 +148,32 @@ def test_json_store_compacts_on_retention(tmp_path: Path) -> None:
     assert payload["attempt"] == 2
 
 
-def test_json_store_compacts_on_size(tmp_path: Path) -> None:
+def test_json_store_compacts_on_size(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Compacts when the file exceeds the size limit."""
     path = tmp_path / "stats.json"
     store = JsonBlockStatsStore(path, max_records=10, max_file_bytes=1)
+    compactions = []
+    compact_records = store._compact_records
+    monkeypatch.setattr(
+        store,
+        "_compact_records",
+        lambda records: compactions.append(len(records)) or compact_records(records),
+    )
 
     store.record_attempt(_build_record(attempt=1))
+    store.flush()
+    assert compactions == []
+    # A stale line only a rewrite drops; appending would keep all three.
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(path.read_text(encoding="utf-8"))
+    store.record_attempt(_build_record(attempt=2))
+    store.flush()
 
+    assert compactions == [2]
     lines = [line for line in path.read_text(encoding="utf-8").splitlines() if line]
-    assert len(lines) == 1
+    assert [json.loads(line)["attempt"] for line in lines] == [1, 2]
 
 
 def test_json_store_compact_stat_failure(
@@ -184,3 +204,86 @@ def test_json_store_chmod_failure(
     monkeypatch.setattr("chaos.stats.json_block_stats_store.os.chmod", raise_os_error)
 
     store.record_attempt(_build_record())
+    store.flush()
+    assert path.exists()
+
+
+def _lines(path: Path) -> list[str]:
+    if not path.exists():
+        return []
+    return [line for line in path.read_text(encoding="utf-8").splitlines() if line]
+
+
+def test_json_store_batches_writes_in_background(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Attempts are indexed at once and appended together by the writer."""
+    path = tmp_path / "stats.json"
+    store = JsonBlockStatsStore(path, flush_interval_seconds=0.05)
+    writes = []
+    append = store._append_records
+    monkeypatch.setattr(
+        store,
+        "_append_records",
+        lambda batch: writes.append(len(batch)) or append(batch),
+    )
+
+    for attempt in range(3):
+        store.record_attempt(_build_record(attempt=attempt + 1))
+
+    assert store.estimate(_build_identity()).sample_size == 3
+    assert _lines(path) == []
+    writer = store._writer
+    writer.join(timeout=2)
+    assert writes == [3]
+    assert len(_lines(path)) == 3
+    assert store._writer is None
+
+
+def test_json_store_close_and_atexit_flush(tmp_path: Path) -> None:
+    """Pending attempts are written on close and by the exit hook."""
+    path = tmp_path / "stats.json"
+    store = JsonBlockStatsStore(path, flush_interval_seconds=60)
+    store.record_attempt(_build_record())
+    _close_open_stores()
+    assert len(_lines(path)) == 1
+
+    store.record_attempt(_build_record(attempt=2))
+    assert len(_lines(path)) == 2
+
+    sync_path = tmp_path / "sync.json"
+    sync = JsonBlockStatsStore(sync_path, flush_interval_seconds=0)
+    sync.record_attempt(_build_record())
+    assert len(_lines(sync_path)) == 1
+    assert sync._writer is None
+
+
+def test_json_store_write_failure_is_logged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed flush drops the batch without raising."""
+    store = JsonBlockStatsStore(tmp_path / "stats.json", flush_interval_seconds=0)
+
+    def fail(_records) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "_append_records", fail)
+    store.record_attempt(_build_record())
+
+    assert store._pending == []
+    assert store.estimate(_build_identity()).sample_size == 1
+
+
+def test_replacing_default_store_flushes_previous(tmp_path: Path) -> None:
+    """set_default_store flushes the store it replaces."""
+    path = tmp_path / "stats.json"
+    store = JsonBlockStatsStore(path, flush_interval_seconds=60)
+    previous = store_registry._DEFAULT_STORE
+    try:
+        store_registry.set_default_store(store)
+        store.record_attempt(_build_record())
+        store_registry.set_default_store(InMemoryBlockStatsStore())
+        assert len(_lines(path)) == 1
+    finally:
+        store_registry._DEFAULT_STORE = previous
+        store.close()
@@ -0,0 +1,138 @@
+"""Tests for the SQLite-backed block stats store."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from chaos.domain.block_estimate import EstimateSource
+from chaos.stats import store_registry
+from chaos.stats.block_attempt_record import BlockAttemptRecord
+from chaos.stats.block_stats_identity import BlockStatsIdentity
+from chaos.stats.sqlite_block_stats_store import SqliteBlockStatsStore
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _build_record(
+    block_name: str = "block", attempt: int = 1, duration_ms: float = 10.0
+) -> BlockAttemptRecord:
+    return BlockAttemptRecord(
+        trace_id="trace",
+        run_id="run",
+        span_id="span",
+        block_name=block_name,
+        block_type="test",
+        attempt=attempt,
+        success=True,
+        duration_ms=duration_ms,
+    )
+
+
+def _identity(block_name: str = "block") -> BlockStatsIdentity:
+    return BlockStatsIdentity(block_name=block_name, block_type="test", version=None)
+
+
+def test_sqlite_store_persists_and_retains_per_block(tmp_path: Path) -> None:
+    """History survives reopening; retention is counted per block identity."""
+    path = tmp_path / "stats.sqlite"
+    store = SqliteBlockStatsStore(path, max_records_per_block=3)
+    store.record_attempt(_build_record("rare", duration_ms=50.0))
+    for attempt in range(10):
+        store.record_attempt(_build_record("hot", attempt=attempt))
+    store.close()
+
+    reopened = SqliteBlockStatsStore(path, max_records_per_block=3)
+    assert [r.attempt for r in reopened.records(_identity("hot"))] == [7, 8, 9]
+    assert [r.duration_ms for r in reopened.records(_identity("rare"))] == [50.0]
+    estimate = reopened.estimate(_identity("rare"))
+    assert estimate.estimate_source == EstimateSource.STATS
+    assert estimate.sample_size == 1
+    assert reopened.estimate(_identity("missing")).sample_size == 0
+
+    plan = reopened._connection.execute(
+        "EXPLAIN QUERY PLAN SELECT record_json FROM block_attempts "
+        "WHERE block_name = 'hot' AND block_type = 'test' AND version = '' "
+        "AND ts >= 0 ORDER BY ts DESC"
+    ).fetchall()
+    assert "block_attempts_identity_ts" in str(plan)
+
+
+def test_sqlite_store_windows_by_count_and_age() -> None:
+    """Estimates use the last N attempts and/or those within T seconds."""
+    clock = FakeClock()
+    store = SqliteBlockStatsStore(
+        Path(":memory:"), max_records_per_block=0, window_size=2, clock=clock
+    )
+    for attempt, duration in enumerate([100.0, 10.0, 20.0]):
+        store.record_attempt(_build_record(attempt=attempt, duration_ms=duration))
+        clock.now += 60
+
+    assert [r.attempt for r in store.records(_identity())] == [1, 2]
+    assert store.estimate(_identity()).sample_size == 2
+    assert len(store.records(_identity(), last_n=10)) == 3
+    assert [
+        r.attempt for r in store.records(_identity(), last_n=10, within_seconds=90)
+    ] == [2]
+
+    aged = SqliteBlockStatsStore(Path(":memory:"), window_seconds=30, clock=clock)
+    aged.record_attempt(_build_record())
+    clock.now += 31
+    assert aged.estimate(_identity()).sample_size == 0
+
+
+def test_sqlite_store_skips_invalid_rows_and_logs_write_errors(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Corrupt rows are skipped and write failures never raise."""
+    store = SqliteBlockStatsStore(Path(":memory:"))
+    store.record_attempt(_build_record())
+    with store._connection:
+        store._connection.execute(
+            "INSERT INTO block_attempts "
+            "(block_name, block_type, version, ts, record_json) "
+            "VALUES ('block', 'test', '', 0, ?)",
+            (json.dumps({"bad": True}),),
+        )
+    assert len(store.records(_identity(), within_seconds=1e12)) == 1
+
+    store.close()
+    store.record_attempt(_build_record())
+    assert "Failed to write block stats" in caplog.text
+    with pytest.raises(sqlite3.ProgrammingError):
+        store._connection.execute("SELECT 1")
+
+
+def test_default_store_uses_configured_sqlite_backend(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The registry builds a SQLite store when the config selects it."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "chaos_dir": str(tmp_path),
+                "block_stats_backend": "sqlite",
+                "block_stats_window_size": 5,
+            }
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr("chaos.config.DEFAULT_CONFIG_PATH", config_path)
+    monkeypatch.setattr(store_registry, "_DEFAULT_STORE", None)
+
+    store = store_registry.get_default_store()
+
+    assert isinstance(store, SqliteBlockStatsStore)
+    assert store._window_size == 5
+    assert (tmp_path / "db" / "block_stats.sqlite").exists()
+    store.close()
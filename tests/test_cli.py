@@ -3,7 +3,10 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from chaos.config import Config
-from chaos.cli.main import app
+from chaos.cli.main import _knowledge_manifest_path, app
+from chaos.domain.knowledge_sync_report import KnowledgeSyncReport
+from chaos.trace.otel_json_trace_sink import OtelJsonTraceSink
+from chaos.trace.trace_span import TraceSpan
 
 runner = CliRunner()
 
@@ -83,3 +86,99 @@ def test_dream(mock_agent, mock_config_provider):
     assert "Dreamt" in result.stdout
     mock_agent.return_value.dream.assert_called()
     mock_agent.return_value.close.assert_called_once()
+
+
+@patch("chaos.cli.main.ConfigProvider")
+@patch("chaos.cli.main.KnowledgeLibrary")
+@patch("chaos.cli.main.KnowledgeSync")
+def test_knowledge_sync(mock_sync, mock_library, mock_config_provider, tmp_path):
+    """Routes CLI knowledge sync to the sync pipeline."""
+    mock_config_provider.return_value.load.return_value = Config(chaos_dir=tmp_path)
+    mock_sync.return_value.sync.return_value = KnowledgeSyncReport(
+        scanned=2, added=2, chunks_written=3
+    )
+    result = runner.invoke(
+        app, ["knowledge", "sync", str(tmp_path), "--domain", "docs", "-w", "2"]
+    )
+    assert result.exit_code == 0
+    assert "Synced 2 files into 'docs'" in result.stdout
+    mock_sync.assert_called_once_with(
+        mock_library.from_config.return_value, max_workers=2
+    )
+    directory, domain, manifest_path = mock_sync.return_value.sync.call_args.args
+    assert (directory, domain) == (tmp_path, "docs")
+    assert manifest_path.parent == tmp_path / "db" / "knowledge_manifests"
+    assert manifest_path.name.startswith("docs-")
+
+
+def test_knowledge_manifest_path_stays_in_manifest_dir(tmp_path):
+    """Domains with separators are slugified; the hash keeps them distinct."""
+    config = Config(chaos_dir=tmp_path)
+    manifest_dir = config.get_knowledge_manifest_dir()
+    paths = [
+        _knowledge_manifest_path(tmp_path, domain, config)
+        for domain in ("a/b", "a_b", "../x")
+    ]
+    assert all(path.parent == manifest_dir for path in paths)
+    assert paths[0].name.startswith("a_b-")
+    assert paths[0] != paths[1]
+    assert paths[2].name.startswith("_x-")
+
+
+@patch("chaos.cli.main.ConfigProvider")
+@patch("chaos.cli.main.KnowledgeLibrary")
+@patch("chaos.cli.main.KnowledgeSync")
+def test_knowledge_sync_failures(
+    mock_sync, mock_library, mock_config_provider, tmp_path
+):
+    """Exits non-zero when files fail or the sync raises."""
+    mock_config_provider.return_value.load.return_value = Config(chaos_dir=tmp_path)
+    mock_sync.return_value.sync.return_value = KnowledgeSyncReport(failed=1)
+    result = runner.invoke(app, ["knowledge", "sync", str(tmp_path), "-d", "docs"])
+    assert result.exit_code == 1
+
+    mock_sync.return_value.sync.side_effect = Exception("boom")
+    result = runner.invoke(app, ["knowledge", "sync", str(tmp_path), "-d", "docs"])
+    assert result.exit_code == 1
+    assert "boom" in result.stdout
+
+
+@patch("chaos.cli.main.ConfigProvider")
+def test_trace_show(mock_config_provider, tmp_path):
+    """Prints the span tree with durations and the critical path."""
+    mock_config_provider.return_value.load.return_value = Config(chaos_dir=tmp_path)
+    sink = OtelJsonTraceSink(tmp_path / "traces")
+
+    def span(span_id, name, parent, start, end, success=True, **extra):
+        return TraceSpan(
+            trace_id="0" * 32,
+            run_id="run-1",
+            span_id=span_id,
+            parent_span_id=parent,
+            block_name=name,
+            block_type="Block",
+            start_time_unix_nano=start * 1_000_000,
+            end_time_unix_nano=end * 1_000_000,
+            success=success,
+            **extra,
+        )
+
+    sink.record_span(span("b", "fast", "a", 0, 5))
+    sink.record_span(
+        span("c", "slow", "a", 0, 40, input_tokens=12, output_tokens=4, hedge=True)
+    )
+    sink.record_span(span("a", "root", None, 0, 41, success=False, reason="flaky"))
+
+    result = runner.invoke(app, ["trace", "show", "run-1"])
+    assert result.exit_code == 0
+    assert "fast #1 5.0ms ok" in result.stdout
+    assert "tokens=12/4" in result.stdout
+    assert "Critical path: root (41.0ms) -> slow (40.0ms)" in result.stdout
+
+    result = runner.invoke(app, ["trace", "show", "missing", "--dir", str(tmp_path)])
+    assert result.exit_code == 1
+    assert "no trace exported for run missing" in result.stdout
+
+    (tmp_path / "bad.json").write_text("{")
+    result = runner.invoke(app, ["trace", "show", "bad", "--dir", str(tmp_path)])
+    assert result.exit_code == 1
@@ -17,7 +17,19 @@ def test_config_load_defaults(tmp_path: Path) -> None:
     assert config.get_chroma_db_path() == Path(".chaos") / "db" / "chroma"
     assert config.get_raw_db_path() == Path(".chaos") / "db" / "raw.sqlite"
     assert config.get_block_stats_path() == (Path(".chaos") / "db" / "block_stats.json")
+    assert config.get_block_stats_db_path() == (
+        Path(".chaos") / "db" / "block_stats.sqlite"
+    )
+    assert config.use_sqlite_block_stats() is False
+    assert config.get_knowledge_manifest_dir() == (
+        Path(".chaos") / "db" / "knowledge_manifests"
+    )
+    assert config.get_knowledge_lexical_index_path() == (
+        Path(".chaos") / "db" / "knowledge_fts.sqlite"
+    )
     assert config.use_litellm_proxy() is False
+    assert config.use_knowledge_partitions() is False
+    assert config.use_knowledge_hybrid_search() is False
     assert config.get_litellm_proxy_url() is None
     assert config.get_litellm_proxy_api_key() is None
 
@@ -126,7 +138,9 @@ def test_config_resolves_relative_paths(tmp_path: Path) -> None:
         {
           "chroma_db_path": "db/custom",
           "raw_db_path": "db/raw.sqlite",
-          "block_stats_path": "db/block_stats.json"
+          "block_stats_path": "db/block_stats.json",
+          "knowledge_manifest_dir": "db/manifests",
+          "knowledge_lexical_index_path": "db/fts.sqlite"
         }
         """,
         encoding="utf-8",
@@ -137,6 +151,10 @@ def test_config_resolves_relative_paths(tmp_path: Path) -> None:
     assert config.get_chroma_db_path() == Path(".chaos") / "db" / "custom"
     assert config.get_raw_db_path() == Path(".chaos") / "db" / "raw.sqlite"
     assert config.get_block_stats_path() == (Path(".chaos") / "db" / "block_stats.json")
+    assert config.get_knowledge_manifest_dir() == Path(".chaos") / "db" / "manifests"
+    assert config.get_knowledge_lexical_index_path() == (
+        Path(".chaos") / "db" / "fts.sqlite"
+    )
 
 
 def test_config_rejects_unknown_fields(tmp_path: Path) -> None:
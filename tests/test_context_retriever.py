@@ -38,6 +38,7 @@ def test_retrieve_includes_ltm_and_knowledge() -> None:
         query="query",
         whitelist=["allowed"],
         blacklist=["blocked"],
+        weights=identity.knowledge_search,
     )
 
 
@@ -58,4 +59,5 @@ def test_subconscious_ignores_knowledge_filters() -> None:
         query="query",
         whitelist=None,
         blacklist=None,
+        weights=identity.knowledge_search,
     )
@@ -105,6 +105,7 @@ def test_recall(mock_graph, mock_llm, mock_deps):
         query="Help me",
         whitelist=mock_deps["identity"].knowledge_whitelist,
         blacklist=mock_deps["identity"].knowledge_blacklist,
+        weights=mock_deps["identity"].knowledge_search,
     )
 
 
@@ -130,6 +131,7 @@ def test_recall_subconscious_full_access(mock_graph, mock_llm, mock_deps):
         query="Help me",
         whitelist=None,
         blacklist=None,
+        weights=mock_deps["identity"].knowledge_search,
     )
 
 
@@ -6,7 +6,11 @@ from unittest.mock import MagicMock, patch, call
 from chaos.config import Config
 from chaos.infra.file_read_tool import MAX_READ_BYTES
 from chaos.infra.file_write_tool import MAX_WRITE_BYTES
+from chaos.domain.knowledge_document import KnowledgeDocument
+from chaos.domain.knowledge_ingestion_report import KnowledgeIngestionReport
+from chaos.domain.knowledge_search_weights import KnowledgeSearchWeights
 from chaos.infra.knowledge import KnowledgeLibrary
+from chaos.infra.knowledge_lexical_index import KnowledgeLexicalIndex
 from chaos.infra.tools import ToolLibrary, FileReadTool, FileWriteTool
 
 # --- KnowledgeLibrary Tests ---
@@ -71,6 +75,391 @@ def test_knowledge_error_handling(mock_chroma):
     lib.add_document("c", "d")
 
 
+@patch("chaos.infra.knowledge.chromadb.PersistentClient")
+def test_knowledge_add_document_does_not_mutate_metadata(mock_chroma):
+    """Leaves the caller's metadata dict untouched."""
+    mock_chroma.return_value.get_or_create_collection.return_value = MagicMock()
+    config = MagicMock(spec=Config)
+    config.get_chroma_db_path.return_value = "/tmp/chroma"
+    metadata = {"meta": "data"}
+
+    KnowledgeLibrary(config=config).add_document("content", "domainA", metadata)
+
+    assert metadata == {"meta": "data"}
+
+
+@patch("chaos.infra.knowledge.chromadb.PersistentClient")
+def test_knowledge_add_documents_batches_with_stable_ids(mock_chroma):
+    """Batches adds and derives deterministic ids from content."""
+    mock_collection = MagicMock()
+    mock_collection.get.return_value = {"ids": []}
+    mock_chroma.return_value.get_or_create_collection.return_value = mock_collection
+    config = MagicMock(spec=Config)
+    config.get_chroma_db_path.return_value = "/tmp/chroma"
+    metadata = {"source": "a.md"}
+    docs = [
+        KnowledgeDocument(content=f"doc {i}", domain="d1", metadata=metadata)
+        for i in range(5)
+    ]
+
+    lib = KnowledgeLibrary(config=config)
+    report = lib.add_documents(iter(docs), batch_size=2)
+
+    assert report.submitted == 5
+    assert report.written == 5
+    assert report.batches == 3
+    assert report.duration_ms > 0
+    assert report.docs_per_second > 0
+    assert mock_collection.add.call_count == 3
+    first = mock_collection.add.call_args_list[0].kwargs
+    assert first["ids"] == [docs[0].resolve_id(), docs[1].resolve_id()]
+    assert first["metadatas"][0] == {"source": "a.md", "domain": "d1"}
+    assert metadata == {"source": "a.md"}
+    assert (
+        docs[0].resolve_id()
+        == KnowledgeDocument(content="doc 0", domain="d1").resolve_id()
+    )
+    assert (
+        docs[0].resolve_id()
+        != KnowledgeDocument(content="doc 0", domain="d2").resolve_id()
+    )
+
+
+@patch("chaos.infra.knowledge.chromadb.PersistentClient")
+def test_knowledge_add_documents_skips_existing_and_duplicates(mock_chroma):
+    """Skips ids already stored and duplicates within the same call."""
+    mock_collection = MagicMock()
+    mock_chroma.return_value.get_or_create_collection.return_value = mock_collection
+    config = MagicMock(spec=Config)
+    config.get_chroma_db_path.return_value = "/tmp/chroma"
+    existing = KnowledgeDocument(content="old", domain="d1")
+    fresh = KnowledgeDocument(content="new", domain="d1", id="explicit")
+    mock_collection.get.return_value = {"ids": [existing.resolve_id()]}
+
+    lib = KnowledgeLibrary(config=config)
+    report = lib.add_documents([existing, fresh, fresh])
+
+    assert report.submitted == 3
+    assert report.written == 1
+    assert report.skipped == 2
+    mock_collection.add.assert_called_once()
+    assert mock_collection.add.call_args.kwargs["ids"] == ["explicit"]
+
+    mock_collection.add.reset_mock()
+    report = lib.add_documents([existing])
+    assert report.skipped == 1
+    assert report.batches == 0
+    mock_collection.add.assert_not_called()
+
+
+@patch("chaos.infra.knowledge.chromadb.PersistentClient")
+def test_knowledge_add_documents_upsert_and_failure(mock_chroma):
+    """Upserts without existence checks and counts failed batches."""
+    mock_collection = MagicMock()
+    mock_chroma.return_value.get_or_create_collection.return_value = mock_collection
+    config = MagicMock(spec=Config)
+    config.get_chroma_db_path.return_value = "/tmp/chroma"
+    docs = [KnowledgeDocument(content="a", domain="d1")]
+
+    lib = KnowledgeLibrary(config=config)
+    report = lib.add_documents(docs, on_conflict="upsert")
+    assert report.written == 1
+    mock_collection.get.assert_not_called()
+    mock_collection.upsert.assert_called_once()
+
+    mock_collection.upsert.side_effect = Exception("db error")
+    report = lib.add_documents(docs, on_conflict="upsert")
+    assert report.failed == 1
+    assert report.written == 0
+
+    assert lib.add_documents([]).docs_per_second >= 0.0
+    assert KnowledgeIngestionReport(submitted=3).docs_per_second == 0.0
+
+
+@patch("chaos.infra.knowledge.chromadb.PersistentClient")
+def test_knowledge_delete_documents(mock_chroma):
+    """Deletes by id and reports zero on storage errors."""
+    mock_collection = MagicMock()
+    mock_chroma.return_value.get_or_create_collection.return_value = mock_collection
+    config = MagicMock(spec=Config)
+    config.get_chroma_db_path.return_value = "/tmp/chroma"
+
+    lib = KnowledgeLibrary(config=config)
+    assert lib.delete_documents([]) == 0
+    mock_collection.delete.assert_not_called()
+    assert lib.delete_documents(iter(["a", "b"])) == 2
+    mock_collection.delete.assert_called_once_with(ids=["a", "b"])
+
+    mock_collection.delete.side_effect = Exception("db error")
+    assert lib.delete_documents(["a"]) == 0
+
+
+def _partition(name, domain, documents=None, distances=None):
+    collection = MagicMock()
+    collection.name = name
+    collection.metadata = {"domain": domain}
+    collection.query.return_value = {
+        "ids": [[f"id-{document}" for document in documents or []]],
+        "documents": [documents or []],
+        "distances": [distances or []],
+    }
+    return collection
+
+
+@patch("chaos.infra.knowledge.chromadb.PersistentClient")
+def test_knowledge_partitioned_search_fans_out(mock_chroma):
+    """Queries only permitted partitions and merges hits by distance."""
+    d1 = _partition("knowledge_base__d1", "d1", ["a1", "a2"], [0.1, 0.5])
+    d2 = _partition("knowledge_base__d2", "d2", ["b1"], [0.3])
+    d3 = _partition("knowledge_base__d3", "d3", ["c1"], [0.05])
+    other = _partition("other_collection", "d4", ["x"], [0.0])
+    client = mock_chroma.return_value
+    client.list_collections.return_value = [d1, d2, d3, other]
+    client.get_collection.side_effect = Exception("missing")
+    config = MagicMock(spec=Config)
+    config.get_chroma_db_path.return_value = "/tmp/chroma"
+
+    lib = KnowledgeLibrary(config=config, partitioned=True, max_search_workers=2)
+
+    assert lib.collection is None
+    client.get_or_create_collection.assert_not_called()
+    assert lib.search("q", n_results=3) == ["c1", "a1", "b1"]
+    assert lib.search("q", whitelist=["d1", "d2", "d1", "missing"]) == [
+        "a1",
+        "b1",
+        "a2",
+    ]
+    d3.query.reset_mock()
+    assert lib.search("q", n_results=2, blacklist=["d3"]) == ["a1", "b1"]
+    d3.query.assert_not_called()
+    other.query.assert_not_called()
+    assert lib.search("q", whitelist=["d2"]) == ["b1"]
+    assert lib.search("q", whitelist=[]) == []
+    d1.query.assert_called_with(
+        query_texts=["q"], n_results=2, include=["documents", "distances"]
+    )
+
+    d1.query.side_effect = Exception("db error")
+    assert lib.search("q", whitelist=["d1", "d2"]) == ["b1"]
+
+
+@patch("chaos.infra.knowledge.chromadb.PersistentClient")
+def test_knowledge_partition_listing_is_rate_limited(mock_chroma):
+    """Searches reuse the partition map until the refresh interval passes."""
+    d1 = _partition("knowledge_base__d1", "d1", ["a1"], [0.1])
+    d2 = _partition("knowledge_base__d2", "d2", ["b1"], [0.2])
+    client = mock_chroma.return_value
+    client.list_collections.return_value = [d1]
+    config = MagicMock(spec=Config)
+    config.get_chroma_db_path.return_value = "/tmp/chroma"
+
+    lib = KnowledgeLibrary(config=config, partitioned=True)
+    client.list_collections.return_value = [d1, d2]
+    assert lib.search("q") == ["a1"]
+    assert lib.search("q") == ["a1"]
+    assert client.list_collections.call_count == 1
+
+    lib.partition_refresh_seconds = 0
+    assert lib.search("q") == ["a1", "b1"]
+    assert client.list_collections.call_count == 2
+
+
+@patch("chaos.infra.knowledge.chromadb.PersistentClient")
+def test_knowledge_partitioned_writes_route_by_domain(mock_chroma):
+    """Creates one collection per domain and routes adds and deletes."""
+    client = mock_chroma.return_value
+    client.list_collections.return_value = []
+    created = {}
+
+    def get_or_create(name, metadata=None):
+        return created.setdefault(name, _partition(name, metadata["domain"]))
+
+    client.get_or_create_collection.side_effect = get_or_create
+    config = MagicMock(spec=Config)
+    config.get_chroma_db_path.return_value = "/tmp/chroma"
+
+    lib = KnowledgeLibrary(config=config, partitioned=True)
+    lib.add_document("text", "d1")
+    report = lib.add_documents(
+        [
+            KnowledgeDocument(content="x", domain="d1"),
+            KnowledgeDocument(content="y", domain="team docs/v2"),
+        ],
+        on_conflict="upsert",
+    )
+
+    hashed = lib.partition_name("team docs/v2")
+    assert hashed.startswith("knowledge_base__") and " " not in hashed
+    assert set(created) == {"knowledge_base__d1", hashed}
+    assert report.written == 2
+    assert report.batches == 2
+    created["knowledge_base__d1"].add.assert_called_once()
+    created[hashed].upsert.assert_called_once()
+
+    assert lib.delete_documents(["id1"], domain="d1") == 1
+    created["knowledge_base__d1"].delete.assert_called_once_with(ids=["id1"])
+    client.list_collections.return_value = list(created.values())
+    assert lib.delete_documents(["id2"]) == 1
+    created[hashed].delete.assert_called_once_with(ids=["id2"])
+
+    # A failed refresh keeps the previously known partitions.
+    client.list_collections.side_effect = Exception("db error")
+    assert lib.search("q", blacklist=["d1"]) == []
+    created[hashed].query.assert_called_once()
+    created["knowledge_base__d1"].query.assert_not_called()
+
+
+def test_knowledge_lexical_index_matches_identifiers(tmp_path):
+    """Ranks exact identifier matches with BM25 and honors domain filters."""
+    index = KnowledgeLexicalIndex(tmp_path / "fts" / "index.sqlite")
+    index.upsert(
+        [
+            ("a", "api", "Call set_max_steps before run."),
+            ("b", "api", "The agent loop runs steps."),
+            ("c", "errors", "ValueError: max_steps must be positive"),
+        ]
+    )
+    index.upsert([("b", "api", "Unrelated prose.")])
+
+    hits = index.search("max_steps", 5)
+    assert [hit[0] for hit in hits] == ["c"]
+    assert hits[0][1:3] == ("errors", "ValueError: max_steps must be positive")
+    assert hits[0][3] < 0
+    assert [hit[0] for hit in index.search("set_max_steps run", 5)] == ["a"]
+    assert index.search("max_steps", 5, whitelist=["api"]) == []
+    assert index.search("max_steps", 5, blacklist=["errors"]) == []
+    assert index.search("max_steps", 5, whitelist=[]) == []
+    assert index.search('"; DROP --', 5) == []
+    assert index.search("?!", 5) == []
+    assert KnowledgeLexicalIndex.match_expression("a b a") == '"a" OR "b"'
+
+    index.delete(["c"])
+    index.delete([])
+    index.upsert([])
+    assert index.search("max_steps", 5) == []
+    index.close()
+
+
+@patch("chaos.infra.knowledge.chromadb.PersistentClient")
+def test_knowledge_hybrid_search_fuses_rankings(mock_chroma, tmp_path):
+    """Fuses vector and BM25 rankings with weighted reciprocal rank fusion."""
+    mock_collection = MagicMock()
+    mock_chroma.return_value.get_or_create_collection.return_value = mock_collection
+    mock_collection.get.return_value = {"ids": []}
+    mock_collection.query.return_value = {
+        "ids": [["v1", "shared"]],
+        "documents": [["semantic hit", "ERR_TIMEOUT retry guide"]],
+        "distances": [[0.1, 0.4]],
+        "metadatas": [[{"domain": "d1"}, {"domain": "d1"}]],
+    }
+    config = MagicMock(spec=Config)
+    config.get_chroma_db_path.return_value = "/tmp/chroma"
+    index = KnowledgeLexicalIndex(tmp_path / "fts.sqlite")
+    lib = KnowledgeLibrary(config=config, lexical_index=index)
+
+    lib.add_documents(
+        [
+            KnowledgeDocument(
+                id="shared", content="ERR_TIMEOUT retry guide", domain="d1"
+            ),
+            KnowledgeDocument(
+                id="lex", content="ERR_TIMEOUT raised by client", domain="d2"
+            ),
+        ]
+    )
+    results = lib.search_scored("ERR_TIMEOUT", n_results=3)
+
+    assert [r.id for r in results] == ["shared", "v1", "lex"]
+    assert (results[0].vector_rank, results[0].lexical_rank) == (2, 1)
+    assert results[0].score == pytest.approx(1 / 62 + 1 / 61)
+    assert results[1].distance == 0.1 and results[1].domain == "d1"
+    assert results[2].bm25 is not None and results[2].vector_rank is None
+    assert lib.search("ERR_TIMEOUT", n_results=1) == ["ERR_TIMEOUT retry guide"]
+    assert mock_collection.query.call_args.kwargs["n_results"] == 20
+    assert mock_collection.query.call_args.kwargs["include"] == [
+        "documents",
+        "distances",
+        "metadatas",
+    ]
+
+    vector_only = KnowledgeSearchWeights(lexical=0.0)
+    assert [r.id for r in lib.search_scored("ERR_TIMEOUT", 3, weights=vector_only)] == [
+        "v1",
+        "shared",
+    ]
+    lexical_heavy = KnowledgeSearchWeights(vector=0.1, lexical=5.0)
+    assert lib.search("ERR_TIMEOUT", 1, blacklist=["d1"], weights=lexical_heavy) == [
+        "ERR_TIMEOUT raised by client"
+    ]
+
+    mock_collection.query.side_effect = Exception("db error")
+    assert [r.id for r in lib.search_scored("ERR_TIMEOUT", 3)] == ["shared", "lex"]
+    index.close()
+    assert lib.search_scored("ERR_TIMEOUT", 3) == []
+
+
+@patch("chaos.infra.knowledge.chromadb.PersistentClient")
+def test_knowledge_lexical_index_mirrors_writes(mock_chroma):
+    """Keeps the lexical index in sync with adds, skips, and deletes."""
+    mock_collection = MagicMock()
+    mock_chroma.return_value.get_or_create_collection.return_value = mock_collection
+    config = MagicMock(spec=Config)
+    config.get_chroma_db_path.return_value = "/tmp/chroma"
+    index = MagicMock(spec=KnowledgeLexicalIndex)
+    lib = KnowledgeLibrary(config=config, lexical_index=index)
+
+    lib.add_document("text", "d1")
+    doc_id = mock_collection.add.call_args.kwargs["ids"][0]
+    index.upsert.assert_called_once_with([(doc_id, "d1", "text")])
+
+    document = KnowledgeDocument(id="x", content="y", domain="d1")
+    mock_collection.get.return_value = {"ids": ["x"]}
+    lib.add_documents([document])
+    index.upsert.assert_called_with([("x", "d1", "y")])
+
+    mock_collection.upsert.side_effect = Exception("db error")
+    index.upsert.reset_mock()
+    lib.add_documents([document], on_conflict="upsert")
+    index.upsert.assert_not_called()
+
+    mock_collection.upsert.side_effect = None
+    index.upsert.side_effect = Exception("index error")
+    assert lib.add_documents([document], on_conflict="upsert").written == 1
+
+    assert lib.delete_documents(["x"]) == 1
+    index.delete.assert_called_once_with(["x"])
+
+
+@patch("chaos.infra.knowledge.chromadb.PersistentClient")
+def test_knowledge_partitioned_hybrid_search(mock_chroma, tmp_path):
+    """Reports partition domains for vector hits in hybrid mode."""
+    d1 = _partition("knowledge_base__d1", "d1", ["alpha"], [0.2])
+    mock_chroma.return_value.list_collections.return_value = [d1]
+    config = MagicMock(spec=Config)
+    config.get_chroma_db_path.return_value = "/tmp/chroma"
+    index = KnowledgeLexicalIndex(tmp_path / "fts.sqlite")
+    lib = KnowledgeLibrary(config=config, partitioned=True, lexical_index=index)
+
+    results = lib.search_scored("alpha")
+
+    assert [(r.id, r.domain, r.vector_rank) for r in results] == [("id-alpha", "d1", 1)]
+    index.close()
+
+
+@patch("chaos.infra.knowledge.chromadb.PersistentClient")
+def test_knowledge_from_config(mock_chroma, tmp_path):
+    """Attaches a lexical index only when hybrid search is enabled."""
+    config = Config(chaos_dir=tmp_path, knowledge_hybrid_search=True)
+    lib = KnowledgeLibrary.from_config(config)
+    assert isinstance(lib.lexical_index, KnowledgeLexicalIndex)
+    assert (tmp_path / "db" / "knowledge_fts.sqlite").exists()
+    lib.lexical_index.close()
+
+    assert (
+        KnowledgeLibrary.from_config(Config(chaos_dir=tmp_path)).lexical_index is None
+    )
+
+
 # --- ToolLibrary Tests ---
 
 
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from chaos.config import Config
+from chaos.domain.ltm_filter import LtmFilter
 from chaos.domain.memory_event_kind import MemoryEventKind
 from chaos.domain import Identity
 from chaos.infra.memory import MemoryContainer
@@ -350,3 +351,80 @@ def test_create_loop_id(memory_deps):
     loop_id = mem.create_loop_id()
 
     assert isinstance(loop_id, str)
+
+
+def test_retrieve_filtered_pushes_down_ids(memory_deps):
+    """Pushes narrow SQLite-prefiltered id sets into the vector query."""
+    mem = MemoryContainer(
+        agent_id="agent",
+        identity=memory_deps["identity"],
+        config=memory_deps["config"],
+    )
+    raw = memory_deps["raw"].return_value
+    raw.count_ltm_entries.side_effect = lambda agent, personas, f=None: (
+        2 if f else 100
+    )
+    raw.list_filtered_ltm_ids.return_value = ["l1", "l2"]
+    memory_deps["actor_collection"].query.return_value = {"documents": [["hit"]]}
+    ltm_filter = LtmFilter(kinds=["tool_output"], ts_start="2024-01-01")
+
+    assert mem.actor_view().retrieve("query", ltm_filter=ltm_filter) == ["hit"]
+    memory_deps["actor_collection"].query.assert_called_once_with(
+        query_texts=["query"],
+        ids=["l1", "l2"],
+        n_results=2,
+        where={
+            "$and": [
+                {"agent_id": {"$eq": "agent"}},
+                {"persona": {"$eq": "actor"}},
+            ]
+        },
+    )
+
+    raw.count_ltm_entries.side_effect = lambda agent, personas, f=None: 0
+    assert mem.actor_view().retrieve("query", ltm_filter=ltm_filter) == []
+    assert memory_deps["actor_collection"].query.call_count == 1
+
+    memory_deps["actor_collection"].query.reset_mock()
+    assert mem.actor_view().retrieve("query", ltm_filter=LtmFilter()) == ["hit"]
+    assert "ids" not in memory_deps["actor_collection"].query.call_args.kwargs
+
+
+def test_retrieve_filtered_post_filters_broad_sets(memory_deps):
+    """Over-fetches by selectivity and keeps SQLite-confirmed hits for broad sets."""
+    mem = MemoryContainer(
+        agent_id="agent",
+        identity=memory_deps["identity"],
+        config=memory_deps["config"],
+    )
+    raw = memory_deps["raw"].return_value
+    raw.count_ltm_entries.side_effect = lambda agent, personas, f=None: (
+        800 if f else 1000
+    )
+    raw.list_filtered_ltm_ids.return_value = ["a", "c"]
+    collection = memory_deps["actor_collection"]
+    collection.query.return_value = {
+        "ids": [["a", "b", "c"]],
+        "documents": [["doc-a", "doc-b", "doc-c"]],
+    }
+    ltm_filter = LtmFilter(visibilities=["external"], ts_start="2024-01-01")
+
+    assert mem.retrieve_for_personas(["actor"], "q", 1, ltm_filter) == ["doc-a"]
+    kwargs = collection.query.call_args.kwargs
+    assert kwargs["n_results"] == 2
+    assert {"visibility": {"$in": ["external"]}} in kwargs["where"]["$and"]
+    assert raw.list_filtered_ltm_ids.call_args.kwargs["candidate_ids"] == [
+        "a",
+        "b",
+        "c",
+    ]
+
+    raw.count_ltm_entries.side_effect = lambda agent, personas, f=None: 5000
+    assert mem.retrieve_for_personas(["actor"], "q", 5, ltm_filter) == [
+        "doc-a",
+        "doc-c",
+    ]
+    assert collection.query.call_args.kwargs["n_results"] == 5
+
+    collection.query.side_effect = Exception("db error")
+    assert mem.retrieve_for_personas(["actor"], "q", 5, ltm_filter) == []
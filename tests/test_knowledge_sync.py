@@ -0,0 +1,197 @@
+"""Tests for incremental knowledge directory sync."""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import pytest
+
+from chaos.domain.knowledge_document import KnowledgeDocument
+from chaos.domain.knowledge_ingestion_report import KnowledgeIngestionReport
+from chaos.infra.knowledge_chunker import KnowledgeChunker
+from chaos.infra.knowledge_manifest import KnowledgeManifest, ManifestEntry
+from chaos.infra.knowledge_sync import KnowledgeSync
+
+
+class FakeKnowledgeLibrary:
+    """In-memory stand-in for KnowledgeLibrary."""
+
+    def __init__(self) -> None:
+        self.documents: Dict[str, KnowledgeDocument] = {}
+        self.add_calls = 0
+        self.fail_adds = False
+        self.fail_deletes = False
+
+    def add_documents(
+        self, documents: Iterable[KnowledgeDocument], on_conflict: str = "skip"
+    ) -> KnowledgeIngestionReport:
+        docs = list(documents)
+        self.add_calls += 1
+        if self.fail_adds and docs:
+            return KnowledgeIngestionReport(submitted=len(docs), failed=len(docs))
+        for doc in docs:
+            self.documents[doc.resolve_id()] = doc
+        return KnowledgeIngestionReport(submitted=len(docs), written=len(docs))
+
+    def delete_documents(self, ids: Iterable[str], domain: Optional[str] = None) -> int:
+        id_list = list(ids)
+        if self.fail_deletes and id_list:
+            return 0
+        for doc_id in id_list:
+            self.documents.pop(doc_id, None)
+        return len(id_list)
+
+    def sources(self) -> set[str]:
+        return {doc.metadata["source"] for doc in self.documents.values()}
+
+
+def _touch(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_chunker_splits_headings_and_windows():
+    """Splits markdown by headings and long sections into windows."""
+    chunker = KnowledgeChunker(max_tokens=12, overlap_tokens=2)
+    text = "intro text\n# Title\none two\n```\n# not a heading\n```\n## Sub\n" + (
+        "w " * 20
+    )
+
+    chunks = chunker.chunk(text)
+
+    assert [c.heading for c in chunks] == [None, "Title", "Sub", "Sub"]
+    assert chunks[0].content == "intro text"
+    assert "# not a heading" in chunks[1].content
+    assert chunks[2].content == "## Sub " + " ".join(["w"] * 10)
+    assert chunks[3].content == " ".join(["w"] * 12)
+    assert [c.index for c in chunks] == [0, 1, 2, 3]
+    assert chunker.chunk("# Only\n", markdown=True)[0].content == "# Only"
+    assert chunker.chunk("# plain", markdown=False)[0].heading is None
+    assert chunker.chunk("   ") == []
+
+
+def test_manifest_round_trip_and_invalid(tmp_path):
+    """Persists entries atomically and ignores unreadable manifests."""
+    path = tmp_path / "m" / "manifest.json"
+    assert KnowledgeManifest.load(path).entries == {}
+
+    manifest = KnowledgeManifest(path, {"a.md": ManifestEntry(1, 2, "h", ["c"])})
+    manifest.save()
+    loaded = KnowledgeManifest.load(path)
+    assert loaded.entries == {"a.md": ManifestEntry(1, 2, "h", ["c"])}
+    assert list(path.parent.iterdir()) == [path]
+
+    path.write_text(json.dumps({"version": 99, "files": {}}), encoding="utf-8")
+    assert KnowledgeManifest.load(path).entries == {}
+    path.write_text("not json", encoding="utf-8")
+    assert KnowledgeManifest.load(path).entries == {}
+
+
+def test_manifest_save_cleans_temp_on_failure(tmp_path, monkeypatch):
+    """Removes the temp file when the atomic replace fails."""
+    path = tmp_path / "manifest.json"
+
+    def fail_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        KnowledgeManifest(path, {}).save()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sync_is_incremental(tmp_path):
+    """Only re-embeds changed files and deletes chunks of removed files."""
+    docs = tmp_path / "docs"
+    _touch(docs / "a.md", "# A\nalpha")
+    _touch(docs / "sub" / "b.txt", "beta")
+    _touch(docs / "ignored.py", "print()")
+    _touch(docs / ".hidden" / "c.md", "hidden")
+    manifest_path = tmp_path / "manifest.json"
+    library = FakeKnowledgeLibrary()
+    sync = KnowledgeSync(library, max_workers=2)
+
+    report = sync.sync(docs, "d1", manifest_path)
+    assert (report.scanned, report.added, report.chunks_written) == (2, 2, 2)
+    assert library.sources() == {"a.md", "sub/b.txt"}
+    assert all(doc.domain == "d1" for doc in library.documents.values())
+
+    report = sync.sync(docs, "d1", manifest_path)
+    assert report.unchanged == 2
+    assert report.chunks_written == 0
+
+    # Touch without changing content: re-hashed but not re-embedded.
+    os.utime(docs / "a.md", ns=(1, 1))
+    report = sync.sync(docs, "d1", manifest_path)
+    assert report.unchanged == 2
+    assert report.updated == 0
+    assert KnowledgeManifest.load(manifest_path).entries["a.md"].mtime_ns == 1
+
+    _touch(docs / "a.md", "# A\nalpha\n# B\nbravo")
+    (docs / "sub" / "b.txt").unlink()
+    report = sync.sync(docs, "d1", manifest_path)
+    assert (report.updated, report.removed) == (1, 1)
+    assert report.chunks_written == 1
+    assert report.chunks_deleted == 1
+    assert library.sources() == {"a.md"}
+    assert sorted(
+        doc.metadata.get("heading") for doc in library.documents.values()
+    ) == [
+        "A",
+        "B",
+    ]
+
+
+def test_sync_keeps_chunk_ids_when_root_moves(tmp_path):
+    """Chunk ids depend on the relative path, not on where the root lives."""
+    library = FakeKnowledgeLibrary()
+    sync = KnowledgeSync(library)
+    for checkout in ("one", "two"):
+        _touch(tmp_path / checkout / "a.md", "# A\nalpha")
+        sync.sync(tmp_path / checkout, "d1", tmp_path / f"{checkout}.json")
+
+    assert len(library.documents) == 1
+    assert (
+        KnowledgeManifest.load(tmp_path / "one.json").entries["a.md"].chunk_ids
+        == KnowledgeManifest.load(tmp_path / "two.json").entries["a.md"].chunk_ids
+    )
+
+
+def test_sync_retries_after_failed_writes(tmp_path):
+    """Keeps the previous manifest state when writes or deletes fail."""
+    docs = tmp_path / "docs"
+    _touch(docs / "a.md", "alpha")
+    manifest_path = tmp_path / "manifest.json"
+    library = FakeKnowledgeLibrary()
+    sync = KnowledgeSync(library)
+
+    library.fail_adds = True
+    report = sync.sync(docs, "d1", manifest_path)
+    assert report.failed == 1
+    assert report.added == 0
+    assert KnowledgeManifest.load(manifest_path).entries == {}
+
+    library.fail_adds = False
+    assert sync.sync(docs, "d1", manifest_path).added == 1
+
+    (docs / "a.md").unlink()
+    library.fail_deletes = True
+    report = sync.sync(docs, "d1", manifest_path)
+    assert report.failed == 1
+    assert "a.md" in KnowledgeManifest.load(manifest_path).entries
+
+
+def test_sync_reports_unreadable_files(tmp_path, monkeypatch):
+    """Counts files that cannot be read as failures."""
+    docs = tmp_path / "docs"
+    _touch(docs / "a.md", "alpha")
+    library = FakeKnowledgeLibrary()
+
+    def fail_read(self):
+        raise OSError("denied")
+
+    monkeypatch.setattr(Path, "read_bytes", fail_read)
+    report = KnowledgeSync(library).sync(docs, "d1", tmp_path / "m.json")
+    assert report.failed == 1
+    assert library.documents == {}
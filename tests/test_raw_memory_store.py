@@ -3,6 +3,7 @@
 from pathlib import Path
 from unittest.mock import MagicMock
 
+from chaos.domain.ltm_filter import LtmFilter
 from chaos.domain.memory_event_kind import MemoryEventKind
 from chaos.infra.raw_memory_store import RawMemoryStore
 
@@ -114,3 +115,49 @@ def test_raw_memory_store_embed_status_error(tmp_path: Path) -> None:
     store = RawMemoryStore(db_path)
     store.close()
     store.update_ltm_embed_status("ltm", "embedded")
+
+
+def test_raw_memory_store_filters_ltm_entries(tmp_path: Path) -> None:
+    """Counts and lists LTM ids by timestamp, kind, and visibility."""
+    db_path = tmp_path / "raw.sqlite"
+    with RawMemoryStore(db_path) as store:
+        ids = {}
+        for kind, visibility in [
+            (MemoryEventKind.USER_INPUT, "external"),
+            (MemoryEventKind.TOOL_OUTPUT, "internal"),
+            (MemoryEventKind.FEEDBACK, "external"),
+        ]:
+            _, ltm_id, ts = store.record_event(
+                agent_id="agent",
+                persona="actor",
+                loop_id="loop-1",
+                kind=kind,
+                visibility=visibility,
+                content=kind.value,
+            )
+            ids[kind] = (ltm_id, ts)
+        tool_id, tool_ts = ids[MemoryEventKind.TOOL_OUTPUT]
+
+        assert store.count_ltm_entries("agent", ["actor"]) == 3
+        assert store.count_ltm_entries("agent", []) == 0
+        tool_filter = LtmFilter(kinds=["tool_output"], ts_start=tool_ts)
+        assert store.count_ltm_entries("agent", ["actor"], tool_filter) == 1
+        assert store.list_filtered_ltm_ids("agent", ["actor"], tool_filter) == [tool_id]
+        external = LtmFilter(visibilities=["external"], ts_end="9999")
+        assert store.list_filtered_ltm_ids("agent", ["actor"], external, limit=1) == [
+            ids[MemoryEventKind.FEEDBACK][0]
+        ]
+        assert (
+            store.list_filtered_ltm_ids(
+                "agent", ["actor"], external, candidate_ids=[tool_id]
+            )
+            == []
+        )
+        assert store.list_filtered_ltm_ids("agent", ["actor"], candidate_ids=[]) == []
+        assert store.list_filtered_ltm_ids("agent", [], external) == []
+        plan = store.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM ltm_entries "
+            "WHERE agent_id = ? AND persona = ? AND kind = ? AND ts >= ?",
+            ("agent", "actor", "tool_output", tool_ts),
+        ).fetchall()
+        assert "idx_ltm_agent_persona_kind_ts" in " ".join(row[3] for row in plan)
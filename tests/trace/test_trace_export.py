@@ -0,0 +1,213 @@
+"""Tests for span tracing and OpenTelemetry JSON export."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from chaos.config import Config
+from chaos.domain.block import Block
+from chaos.domain.messages import Request, Response
+from chaos.domain.policy import RetryPolicy
+from chaos.stats.in_memory_block_stats_store import InMemoryBlockStatsStore
+from chaos.trace import sink_registry
+from chaos.trace.otel_json_trace_sink import OtelJsonTraceSink
+from chaos.trace.span_tree import SpanTree
+from chaos.trace.trace_span import TraceSpan, otel_trace_id
+
+
+class TokenBlock(Block):
+    """Leaf block reporting token usage; fails its first ``failures`` calls."""
+
+    def __init__(self, name: str, failures: int = 0):
+        super().__init__(name=name, stats_store=InMemoryBlockStatsStore())
+        self.failures = failures
+
+    def _execute_primitive(self, request: Request) -> Response:
+        if self.failures:
+            self.failures -= 1
+            return Response(success=False, reason="flaky")
+        return Response(success=True, data=self.name)
+
+    def _build_attempt_record(self, request, response, duration_ms):
+        record = super()._build_attempt_record(request, response, duration_ms)
+        return record.model_copy(update={"input_tokens": 7, "output_tokens": 3})
+
+    def build(self) -> None:
+        pass
+
+    def get_policy_stack(self, error_type):
+        return [RetryPolicy(max_attempts=2, delay_seconds=0)]
+
+
+class Pipeline(Block):
+    def build(self) -> None:
+        pass
+
+
+@pytest.fixture
+def sink(tmp_path):
+    sink = OtelJsonTraceSink(tmp_path)
+    sink_registry.set_default_sink(sink)
+    yield sink
+    sink_registry.set_default_sink(None)
+
+
+def run_pipeline() -> Response:
+    pipeline = Pipeline(
+        "pipeline",
+        nodes={"draft": TokenBlock("drafter", failures=1), "review": TokenBlock("r")},
+        entry_point="draft",
+        transitions={"draft": "review"},
+        stats_store=InMemoryBlockStatsStore(),
+    )
+    return pipeline.execute(Request())
+
+
+def test_run_is_exported_as_otlp_json(sink):
+    """One file per run with OTLP structure, attempts, outcome and tokens."""
+    response = run_pipeline()
+    run_id = response.metadata["run_id"]
+
+    payload = json.loads(sink.path_for(run_id).read_text())
+    scope = payload["resourceSpans"][0]["scopeSpans"][0]
+    assert scope["scope"]["name"] == "chaos.block"
+    spans = {(s["name"], s["status"]["code"]): s for s in scope["spans"]}
+    assert set(spans) == {("pipeline", 1), ("draft", 2), ("draft", 1), ("review", 1)}
+    failed = spans[("draft", 2)]
+    assert failed["status"]["message"] == "flaky"
+    assert failed["traceId"] == otel_trace_id(response.metadata["trace_id"])
+    assert failed["parentSpanId"] == response.metadata["span_id"]
+    attributes = {a["key"]: a["value"] for a in spans[("draft", 1)]["attributes"]}
+    assert attributes["chaos.attempt"] == {"intValue": "2"}
+    assert attributes["gen_ai.usage.input_tokens"] == {"intValue": "7"}
+    assert int(failed["endTimeUnixNano"]) >= int(failed["startTimeUnixNano"])
+
+    loaded = sink.load(run_id)
+    assert len(loaded) == 4
+    assert {span.run_id for span in loaded} == {run_id}
+    assert loaded[0].name == "pipeline"
+
+
+def test_critical_path_follows_last_finishing_children(sink):
+    """The path skips the failed attempt and ends at the last node."""
+    run_id = run_pipeline().metadata["run_id"]
+    tree = SpanTree(sink.load(run_id))
+
+    (root,) = tree.roots
+    assert [span.name for span in tree.children(root)] == ["draft", "draft", "review"]
+    assert [span.name for span in tree.critical_path(root)] == ["pipeline", "review"]
+
+
+def test_late_spans_merge_into_written_run(tmp_path):
+    """Spans arriving after the root are merged into the existing file."""
+    sink = OtelJsonTraceSink(tmp_path, max_written_runs=1)
+
+    def span(span_id, parent=None, end=2_000):
+        return TraceSpan(
+            trace_id=otel_trace_id("not-a-uuid"),
+            run_id="run",
+            span_id=span_id,
+            parent_span_id=parent,
+            block_name="b",
+            block_type="Block",
+            start_time_unix_nano=1_000,
+            end_time_unix_nano=end,
+            success=True,
+        )
+
+    sink.record_span(span("child", parent="root"))
+    assert not sink.path_for("run").exists()
+    sink.record_span(span("root"))
+    sink.record_span(span("late", parent="root", end=3_000))
+
+    loaded = sink.load("run")
+    assert {s.span_id for s in loaded} == {"root", "child", "late"}
+    assert loaded[0].trace_id == otel_trace_id("not-a-uuid")
+    assert len(loaded[0].trace_id) == 32
+    tree = SpanTree(loaded)
+    (root,) = tree.roots
+    assert [s.span_id for s in tree.critical_path(root)] == ["root", "late"]
+    assert loaded[0].duration_ms == pytest.approx(0.001)
+
+
+def test_run_under_a_caller_span_is_exported(sink):
+    """A root with the caller's parent_span_id still completes its run."""
+    pipeline = Pipeline(
+        "pipeline",
+        nodes={"draft": TokenBlock("drafter")},
+        entry_point="draft",
+        stats_store=InMemoryBlockStatsStore(),
+    )
+
+    pipeline.execute(Request(metadata={"run_id": "r2", "parent_span_id": "up"}))
+
+    loaded = sink.load("r2")
+    assert {span.name: span.run_root for span in loaded} == {
+        "pipeline": True,
+        "draft": None,
+    }
+    assert not sink._pending
+    (root,) = SpanTree(loaded).roots
+    assert root.parent_span_id == "up"
+
+
+def test_unfinished_runs_are_bounded(tmp_path):
+    """Past max_pending_runs the oldest unfinished run is written as is."""
+    sink = OtelJsonTraceSink(tmp_path, max_pending_runs=1)
+
+    def child(run_id):
+        return TraceSpan(
+            trace_id=otel_trace_id(run_id),
+            run_id=run_id,
+            span_id=f"{run_id}-child",
+            parent_span_id="never-finished",
+            block_name="b",
+            block_type="Block",
+            start_time_unix_nano=1_000,
+            end_time_unix_nano=2_000,
+            success=True,
+        )
+
+    sink.record_span(child("old"))
+    sink.record_span(child("new"))
+
+    assert list(sink._pending) == ["new"]
+    assert [span.span_id for span in sink.load("old")] == ["old-child"]
+
+
+def test_export_failures_do_not_fail_the_run(tmp_path):
+    """A broken sink or unwritable directory only logs."""
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    sink_registry.set_default_sink(OtelJsonTraceSink(blocker))
+    try:
+        assert run_pipeline().success is True
+        with patch.object(TraceSpan, "from_record", side_effect=RuntimeError("x")):
+            assert run_pipeline().success is True
+    finally:
+        sink_registry.set_default_sink(None)
+
+
+def test_default_sink_follows_config(tmp_path):
+    """Tracing is off unless enabled in Config; the sink is built once."""
+    enabled = Config(chaos_dir=tmp_path, tracing_enabled=True)
+    assert enabled.get_trace_dir() == tmp_path / "traces"
+    assert Config(chaos_dir=tmp_path, trace_dir=Path("t")).get_trace_dir() == (
+        tmp_path / "t"
+    )
+
+    previous = sink_registry._DEFAULT_SINK
+    try:
+        sink_registry._DEFAULT_SINK = sink_registry._UNSET
+        with patch.object(sink_registry.Config, "load", return_value=enabled):
+            sink = sink_registry.get_default_sink()
+            assert isinstance(sink, OtelJsonTraceSink)
+            assert sink.directory == tmp_path / "traces"
+            assert sink_registry.get_default_sink() is sink
+        sink_registry._DEFAULT_SINK = sink_registry._UNSET
+        with patch.object(sink_registry.Config, "load", return_value=Config()):
+            assert sink_registry.get_default_sink() is None
+    finally:
+        sink_registry._DEFAULT_SINK = previous